@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC GUID Micro-Benchmarks
+==================================
+
+Measures the throughput, in GUIDs per second, of the functions of
+`django_bim.utils.guid` against straightforward implementations: the
+uncompiled `re.match` validator the package used before, and a per-character
+base64 codec working on `uuid.UUID` objects.
+
+Usage:
+    python bin/benchmark_guid.py [--count 100000] [--repeat 5]
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import argparse
+import os
+import re
+import sys
+import timeit
+import uuid
+from typing import Callable
+
+# Import | Libraries
+
+# Import | Local Modules
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"),
+)
+
+from django_bim.utils.guid import (  # noqa E402
+    IFC_GUID_ALPHABET,
+    from_uuid,
+    new,
+    new_default,
+    new_many,
+    to_uuid,
+    validate_many,
+)
+from django_bim.utils.validate_ifc_guid import validate_ifc_guid  # noqa E402
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def _regex_validator(value: str) -> None:
+    """
+    The validator as it was: an uncompiled `re.match` per value.
+    """
+    if not isinstance(value, str) or not re.match(
+        pattern=r"^[0-3][0-9A-Za-z_$]{21}$",
+        string=value,
+    ):
+        raise ValueError(value)
+
+
+def _naive_from_uuid(value: uuid.UUID) -> str:
+    """
+    Encode a UUID one base64 digit at a time.
+    """
+    number = value.int
+    characters = []
+    for _ in range(22):
+        number, digit = divmod(number, 64)
+        characters.append(IFC_GUID_ALPHABET[digit])
+    return "".join(reversed(characters))
+
+
+def _naive_to_uuid(guid: str) -> uuid.UUID:
+    """
+    Decode a GUID one base64 digit at a time.
+    """
+    number = 0
+    for character in guid:
+        number = number * 64 + IFC_GUID_ALPHABET.index(character)
+    return uuid.UUID(int=number)
+
+
+def _measure(
+    label: str,
+    function: Callable[[], object],
+    count: int,
+    repeat: int,
+) -> None:
+    """
+    Print the best throughput of `repeat` runs handling `count` GUIDs each.
+    """
+    best = min(timeit.repeat(function, number=1, repeat=repeat))
+    print(f"{label:<44} {count / best:>14,.0f} GUIDs/s")
+
+
+def main() -> None:
+    """
+    Run the benchmarks.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args()
+    count, repeat = options.count, options.repeat
+
+    guids = new_many(count)
+    uuids = [to_uuid(guid) for guid in guids]
+    assert [_naive_from_uuid(value) for value in uuids[:100]] == guids[:100]
+
+    print("Validation")
+    _measure(
+        "re.match per value (previous)",
+        lambda: [_regex_validator(guid) for guid in guids],
+        count, repeat,
+    )
+    _measure(
+        "validate_ifc_guid per value",
+        lambda: [validate_ifc_guid(guid) for guid in guids],
+        count, repeat,
+    )
+    _measure(
+        "validate_many",
+        lambda: validate_many(guids),
+        count, repeat,
+    )
+
+    print("Creation")
+    _measure(
+        "uuid4 + per-digit encoding",
+        lambda: [_naive_from_uuid(uuid.uuid4()) for _ in range(count)],
+        count, repeat,
+    )
+    _measure(
+        "new",
+        lambda: [new() for _ in range(count)],
+        count, repeat,
+    )
+    _measure(
+        "new_many",
+        lambda: new_many(count),
+        count, repeat,
+    )
+    _measure(
+        "new_default (field default)",
+        lambda: [new_default() for _ in range(count)],
+        count, repeat,
+    )
+
+    print("Conversion")
+    _measure(
+        "per-digit to UUID",
+        lambda: [_naive_to_uuid(guid) for guid in guids],
+        count, repeat,
+    )
+    _measure(
+        "to_uuid",
+        lambda: [to_uuid(guid) for guid in guids],
+        count, repeat,
+    )
+    _measure(
+        "per-digit from UUID",
+        lambda: [_naive_from_uuid(value) for value in uuids],
+        count, repeat,
+    )
+    _measure(
+        "from_uuid",
+        lambda: [from_uuid(value) for value in uuids],
+        count, repeat,
+    )
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
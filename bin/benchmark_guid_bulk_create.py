@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC GUID Bulk Write Benchmarks
+=======================================
+
+Measures `bulk_create` and `filter(global_id__in=...)` on a model with an
+`IfcGloballyUniqueIdField`, with the per-value validation of the field and
+inside `trusted_guids()` after a single `validate_many` call, which is what
+the STEP importer does.
+
+The benchmark runs against an in-memory SQLite database, so the figures
+isolate the Python overhead of preparing the values.
+
+Usage:
+    python bin/benchmark_guid_bulk_create.py [--count 100000] [--repeat 3]
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import argparse
+import os
+import sys
+import time
+from typing import Callable
+
+# Import | Libraries
+import django
+from django.conf import settings
+
+# Import | Local Modules
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"),
+)
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def _setup() -> type:
+    """
+    Configure Django and create the benchmark table.
+    """
+    settings.configure(
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            },
+        },
+        INSTALLED_APPS=[],
+    )
+    django.setup()
+
+    from django.db import connection, models
+
+    from django_bim.fields.model.field_model_ifc_guid import (
+        IfcGloballyUniqueIdField,
+    )
+
+    class BenchmarkRoot(models.Model):
+        global_id = IfcGloballyUniqueIdField()
+
+        class Meta:
+            app_label = "benchmark"
+
+    with connection.schema_editor() as editor:
+        editor.create_model(BenchmarkRoot)
+    return BenchmarkRoot
+
+
+def _measure(
+    label: str,
+    function: Callable[[], object],
+    reset: Callable[[], object],
+    count: int,
+    repeat: int,
+) -> float:
+    """
+    Print and return the best throughput of `repeat` runs.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        reset()
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<44} {count / best:>14,.0f} rows/s")
+    return count / best
+
+
+def main() -> None:
+    """
+    Run the benchmarks.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    options = parser.parse_args()
+    count, repeat = options.count, options.repeat
+
+    model = _setup()
+
+    from django_bim.fields.model.field_model_ifc_guid import trusted_guids
+    from django_bim.utils.guid import new_many, validate_many
+
+    guids = new_many(count)
+    lookup = guids[:min(count, 30_000)]
+
+    def reset() -> None:
+        model.objects.all().delete()
+
+    def create() -> None:
+        model.objects.bulk_create(
+            [model(global_id=guid) for guid in guids],
+            batch_size=1000,
+        )
+
+    def create_trusted() -> None:
+        instances = [model(global_id=guid) for guid in guids]
+        validate_many([instance.global_id for instance in instances])
+        with trusted_guids():
+            model.objects.bulk_create(instances, batch_size=1000)
+
+    def lookup_query() -> None:
+        model.objects.filter(global_id__in=lookup)
+
+    def lookup_trusted() -> None:
+        with trusted_guids():
+            model.objects.filter(global_id__in=lookup)
+
+    print("bulk_create")
+    validated = _measure("validated per value", create, reset, count, repeat)
+    trusted = _measure(
+        "validate_many + trusted_guids",
+        create_trusted, reset, count, repeat,
+    )
+    print(f"{'speed-up':<44} {trusted / validated:>14.2f}x")
+
+    print("filter(global_id__in=...)")
+    validated = _measure(
+        "validated per value", lookup_query, reset, len(lookup), repeat,
+    )
+    trusted = _measure(
+        "trusted_guids", lookup_trusted, reset, len(lookup), repeat,
+    )
+    print(f"{'speed-up':<44} {trusted / validated:>14.2f}x")
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides Placement Hierarchy Query Benchmarks
+=============================================
+
+Measures fetching every placement nested under a placement of a generated
+hierarchy, with the three strategies available for
+`IfcLocalPlacementModel`:
+- naive traversal: one `related_placements` query per placement,
+- `descendants_of` with a recursive common table expression,
+- `descendants_of` joining the closure table
+  (`DJANGO_BIM_PLACEMENT_CLOSURE`).
+
+The benchmark runs against an in-memory SQLite database, so the figures
+leave out the network round trips that make the naive traversal even
+slower on a database server.
+
+Usage:
+    python bin/benchmark_placement_closure.py [--count 20000] [--fanout 4]
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import argparse
+import os
+import sys
+import time
+from typing import Callable
+
+# Import | Libraries
+import django
+from django.conf import settings
+from django.test.utils import override_settings
+
+# Import | Local Modules
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"),
+)
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def _setup() -> tuple[type, type]:
+    """
+    Configure Django and create the placement tables.
+    """
+    settings.configure(
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            },
+        },
+        INSTALLED_APPS=["django_bim"],
+    )
+    django.setup()
+
+    from django.db import connection
+
+    from django_bim.models.ifc.placement import (
+        IfcLocalPlacementClosureModel,
+        IfcLocalPlacementModel,
+    )
+
+    with connection.schema_editor() as editor:
+        editor.create_model(IfcLocalPlacementModel)
+        editor.create_model(IfcLocalPlacementClosureModel)
+    return IfcLocalPlacementModel, IfcLocalPlacementClosureModel
+
+
+def _populate(model: type, count: int, fanout: int) -> list[int]:
+    """
+    Create a balanced hierarchy of `count` placements and return their
+    primary keys in breadth-first order.
+    """
+    model.objects.bulk_create(
+        [model(placement_id=f"p{index}") for index in range(count)],
+        batch_size=5000,
+    )
+    pks = list(model.objects.order_by("pk").values_list("pk", flat=True))
+    placements = [
+        model(pk=pk, relative_placement_id=pks[(index - 1) // fanout])
+        for index, pk in enumerate(pks)
+        if index
+    ]
+    model.objects.bulk_update(
+        placements, ["relative_placement"], batch_size=5000,
+    )
+    return pks
+
+
+def _naive_descendants(model: type, root: int) -> list[int]:
+    """
+    Walk the hierarchy from Python, one query per placement.
+    """
+    found = []
+    pending = [root]
+    while pending:
+        children = list(
+            model.objects.filter(relative_placement=pending.pop())
+            .values_list("pk", flat=True)
+        )
+        found.extend(children)
+        pending.extend(children)
+    return found
+
+
+def _measure(
+    label: str,
+    function: Callable[[], list],
+    repeat: int,
+) -> float:
+    """
+    Print and return the best duration of `repeat` runs.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = len(function())
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<36} {rows:>8} rows {best * 1000:>10.1f} ms")
+    return best
+
+
+def main() -> None:
+    """
+    Run the benchmarks.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--fanout", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    options = parser.parse_args()
+
+    model, closure = _setup()
+    pks = _populate(model, options.count, options.fanout)
+
+    started = time.perf_counter()
+    rows = closure.rebuild()
+    print(
+        f"closure rebuild: {rows} rows in "
+        f"{(time.perf_counter() - started) * 1000:.1f} ms"
+    )
+
+    # The root, and a placement with a subtree of a few hundred rows
+    for root in (pks[0], pks[options.fanout + 1]):
+        print(f"descendants of placement {root}")
+        naive = _measure(
+            "naive traversal",
+            lambda: _naive_descendants(model, root),
+            options.repeat,
+        )
+        with override_settings(DJANGO_BIM_PLACEMENT_CLOSURE=False):
+            recursive = _measure(
+                "descendants_of (recursive CTE)",
+                lambda: list(model.objects.descendants_of(root)
+                             .values_list("pk", flat=True)),
+                options.repeat,
+            )
+        with override_settings(DJANGO_BIM_PLACEMENT_CLOSURE=True):
+            indexed = _measure(
+                "descendants_of (closure table)",
+                lambda: list(model.objects.descendants_of(root)
+                             .values_list("pk", flat=True)),
+                options.repeat,
+            )
+        print(
+            f"{'speed-up over naive':<36} "
+            f"CTE {naive / recursive:.1f}x, closure {naive / indexed:.1f}x"
+        )
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
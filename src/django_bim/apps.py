@@ -23,15 +23,39 @@ that control various aspects of the application's behavior in a Django project.
 # =============================================================================
 
 # Import | Standard Library
-# from typing import Dict, List, Union
+from typing import Any
 
 # Import | Libraries
 from django.apps import AppConfig
+from django.core.signals import request_started
 from django.utils.translation import gettext_lazy as _
 
 # Import | Local Modules
 
 
+# =============================================================================
+# Variables
+# =============================================================================
+
+# Dispatch id of the receiver warming the caches on the first request
+_FIRST_REQUEST_UID = "django_bim_actor_content_types"
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def _warm_on_first_request(sender: Any = None, **kwargs: Any) -> None:
+    """
+    Warm the content type cache of the actor models when the first request
+    starts, and stop receiving `request_started`.
+    """
+    from .fields.model.actor import warm_actor_content_types
+
+    request_started.disconnect(dispatch_uid=_FIRST_REQUEST_UID)
+    warm_actor_content_types()
+
+
 # =============================================================================
 # Classes
 # =============================================================================
@@ -58,10 +82,10 @@ class DjangoBimConfig(AppConfig):
     """
 
     # Full Python path to the application
-    name = "django-bim"
+    name = "django_bim"
 
     # Short name for the application, used in relation naming
-    label = "django-bim"
+    label = "django_bim"
 
     # Human-readable name for the application
     verbose_name = _("Django BIM")
@@ -69,3 +93,15 @@ class DjangoBimConfig(AppConfig):
     # Specifies the type of primary key to use by default for models in
     # this application
     default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self) -> None:
+        """
+        Warm the content type cache of the actor models when the first
+        request starts, as the database should not be queried while the
+        apps are loading.
+        """
+        # Cache hits without a query once warm
+        request_started.connect(
+            _warm_on_first_request,
+            dispatch_uid=_FIRST_REQUEST_UID,
+        )
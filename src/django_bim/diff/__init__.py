@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Diff Module
+======================
+
+This module compares stored revisions of a project (see
+`IfcProjectRevisionModel.capture`) with set operations run by the
+database, and streams the added, removed and modified entities with their
+per-attribute deltas.
+
+Available Functions:
+- diff_revisions: Returns the `RevisionDiff` of two revisions.
+
+Available Classes:
+- RevisionDiff: Streams the changes and counts them.
+- RevisionDiffSummary: The numbers of changed entities.
+- EntityChange: A change of an entity.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Local Modules
+from .revision_diff import (
+    EntityChange,
+    RevisionDiff,
+    RevisionDiffSummary,
+    diff_revisions,
+)
+
+
+# =============================================================================
+# Module Level Variables
+# =============================================================================
+
+__all__ = [
+    "EntityChange",
+    "RevisionDiff",
+    "RevisionDiffSummary",
+    "diff_revisions",
+]
@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides Revision Diff Class
+============================
+
+This module compares two stored revisions of a project (see
+`IfcProjectRevisionModel`) in the database.
+
+The entities of a revision are keyed by `(global_id, digest, container)`,
+where the digest was computed from the stored attributes and referenced
+rows when the revision was captured.
+Set operations on these key streams, run by the database with `EXCEPT`
+over the `(revision, global_id)` index, find the changed entities without
+loading the unchanged ones:
+
+- `new EXCEPT old` on the keys: the added and modified entities,
+- `new EXCEPT old` and `old EXCEPT new` on the global ids: the added and
+  removed entities.
+
+Changed entities are streamed in global id order. Each batch is resolved
+with two indexed lookups into added or modified entities, and the stored
+attributes of both sides give the modified ones their per-attribute
+deltas. Revisions with equal rollups are equal and not read at all.
+
+Usage:
+    diff = diff_revisions(tuesday, today)
+    print(diff.summary())
+    for change in diff:
+        print(change.global_id, change.action, change.changes)
+
+Note:
+    `EXCEPT` requires PostgreSQL, SQLite, Oracle or MySQL 8.0.31+.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+from typing import Any, Iterator, NamedTuple, Optional
+
+# Import | Libraries
+from django.db import models
+
+# Import | Local Modules
+from ..enums import IfcChangeActionEnum
+from ..models.ifc.revision.model_ifc_project_revision import (
+    IfcProjectRevisionModel,
+)
+from ..models.ifc.revision.model_ifc_revision_entity import (
+    IfcRevisionEntityModel,
+)
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "EntityChange",
+    "RevisionDiff",
+    "RevisionDiffSummary",
+    "diff_revisions",
+]
+
+DEFAULT_BATCH_SIZE = 500
+
+ADDED = IfcChangeActionEnum.ADDED.name
+MODIFIED = IfcChangeActionEnum.MODIFIED.name
+DELETED = IfcChangeActionEnum.DELETED.name
+
+# Key of the delta of the container in `EntityChange.changes`
+CONTAINER = "container"
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def diff_revisions(
+    old: IfcProjectRevisionModel,
+    new: IfcProjectRevisionModel,
+    **kwargs: Any,
+) -> "RevisionDiff":
+    """
+    Compare two revisions of a project.
+
+    Parameters:
+        old (IfcProjectRevisionModel): The earlier revision.
+        new (IfcProjectRevisionModel): The later revision.
+        **kwargs: Passed on to `RevisionDiff`.
+
+    Returns:
+        RevisionDiff: The lazy difference of the revisions.
+    """
+    return RevisionDiff(old, new, **kwargs)
+
+
+# Functions | Helpers
+# =============================================================================
+
+def _delta(old: dict, new: dict) -> dict[str, tuple[Any, Any]]:
+    """
+    Return the `(old, new)` values of the keys whose values differ.
+    """
+    return {
+        name: (old.get(name), new.get(name))
+        for name in sorted(old.keys() | new.keys())
+        if old.get(name) != new.get(name)
+    }
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class EntityChange(NamedTuple):
+    """
+    Entity Change Class
+    ===================
+
+    A change of an entity between two revisions.
+
+    Attributes:
+        global_id (str): The global id of the entity.
+        action (str): `ADDED`, `MODIFIED` or `DELETED`, as the names of
+            `IfcChangeActionEnum`.
+        changes (dict): The `(old, new)` values of the attributes, hashes
+            of referenced rows and container of a modified entity, by name.
+        owner_history_id (int): The owner history of the entity in the
+            later revision, or in the earlier one once deleted.
+
+    """
+
+    global_id: str
+    action: str
+    changes: dict[str, tuple[Any, Any]]
+    owner_history_id: Optional[int]
+
+
+class RevisionDiffSummary:
+    """
+    Revision Diff Summary Class
+    ===========================
+
+    Numbers of entities changed between two revisions.
+
+    Attributes:
+        added (int): Entities only the later revision contains.
+        removed (int): Entities only the earlier revision contains.
+        modified (int): Entities whose digest or container changed.
+
+    """
+
+    def __init__(
+        self,
+        added: int = 0,
+        removed: int = 0,
+        modified: int = 0,
+    ) -> None:
+        """
+        Initialise the counts.
+        """
+        self.added = added
+        self.removed = removed
+        self.modified = modified
+
+    def __str__(self) -> str:
+        """
+        String representation of the counts.
+        """
+        return (
+            f"{self.added} added, {self.removed} removed, "
+            f"{self.modified} modified"
+        )
+
+    @property
+    def total(self) -> int:
+        """
+        Total number of changed entities.
+        """
+        return self.added + self.removed + self.modified
+
+
+class RevisionDiff:
+    """
+    Revision Diff Class
+    ===================
+
+    The difference between two revisions of a project, computed by the
+    database when iterated or summarised.
+
+    Parameters:
+        old (IfcProjectRevisionModel): The earlier revision.
+        new (IfcProjectRevisionModel): The later revision.
+        attributes (bool): Whether to compute the per-attribute deltas of
+            the modified entities.
+        batch_size (int): Changed entities resolved per query.
+
+    Raises:
+        ValueError: If the revisions are stored in different databases.
+
+    """
+
+    def __init__(
+        self,
+        old: IfcProjectRevisionModel,
+        new: IfcProjectRevisionModel,
+        attributes: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """
+        Initialise the diff.
+        """
+        if old._state.db != new._state.db:
+            raise ValueError(
+                "Both revisions must be stored in the same database."
+            )
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+        self.old = old
+        self.new = new
+        self.attributes = attributes
+        self.batch_size = batch_size
+        self.using = old._state.db
+
+    def __iter__(self) -> Iterator[EntityChange]:
+        """
+        Stream the added and modified entities, then the removed ones, in
+        global id order.
+        """
+        if self.identical:
+            return
+        changed = (
+            self._entities(self.new)
+            .values_list("global_id", "digest", "container")
+            .difference(
+                self._entities(self.old)
+                .values_list("global_id", "digest", "container")
+            )
+            .order_by("global_id")
+        )
+        batch = []
+        for global_id, _, _ in changed.iterator(chunk_size=self.batch_size):
+            batch.append(global_id)
+            if len(batch) == self.batch_size:
+                yield from self._changes(batch)
+                batch = []
+        if batch:
+            yield from self._changes(batch)
+        batch = []
+        for global_id in self._removed().iterator(
+            chunk_size=self.batch_size,
+        ):
+            batch.append(global_id)
+            if len(batch) == self.batch_size:
+                yield from self._deletions(batch)
+                batch = []
+        if batch:
+            yield from self._deletions(batch)
+
+    @property
+    def identical(self) -> bool:
+        """
+        Whether the rollups of the revisions prove them equal.
+        """
+        return (
+            self.old.rollup_digest is not None
+            and self.old.rollup_digest == self.new.rollup_digest
+        )
+
+    def summary(self) -> RevisionDiffSummary:
+        """
+        Count the changes with three queries, without streaming them.
+
+        Returns:
+            RevisionDiffSummary: The numbers of changed entities.
+        """
+        if self.identical:
+            return RevisionDiffSummary()
+        changed = (
+            self._entities(self.new)
+            .values_list("global_id", "digest", "container")
+            .difference(
+                self._entities(self.old)
+                .values_list("global_id", "digest", "container")
+            )
+            .count()
+        )
+        added = self._added().count()
+        return RevisionDiffSummary(
+            added = added,
+            removed = self._removed().count(),
+            modified = changed - added,
+        )
+
+    # Class | Helpers
+    # =========================================================================
+
+    def _entities(
+        self,
+        revision: IfcProjectRevisionModel,
+    ) -> models.QuerySet:
+        """
+        Return the entities of a revision.
+        """
+        return IfcRevisionEntityModel._default_manager.using(
+            self.using,
+        ).filter(revision=revision)
+
+    def _global_ids(
+        self,
+        revision: IfcProjectRevisionModel,
+    ) -> models.QuerySet:
+        """
+        Return the global ids of the entities of a revision.
+        """
+        return self._entities(revision).values_list("global_id", flat=True)
+
+    def _added(self) -> models.QuerySet:
+        """
+        Return the global ids only the later revision contains.
+        """
+        return self._global_ids(self.new).difference(
+            self._global_ids(self.old),
+        )
+
+    def _removed(self) -> models.QuerySet:
+        """
+        Return the global ids only the earlier revision contains.
+        """
+        return self._global_ids(self.old).difference(
+            self._global_ids(self.new),
+        ).order_by("global_id")
+
+    def _rows(
+        self,
+        revision: IfcProjectRevisionModel,
+        global_ids: list[str],
+    ) -> dict[str, tuple]:
+        """
+        Return the container, owner history and, when the deltas are
+        computed, attributes of entities of a revision, by global id.
+        """
+        fields = ["global_id", "container", "owner_history"]
+        if self.attributes:
+            fields.append("attributes")
+        return {
+            global_id: values
+            for global_id, *values in self._entities(revision).filter(
+                global_id__in=global_ids,
+            ).values_list(*fields)
+        }
+
+    def _changes(self, global_ids: list[str]) -> Iterator[EntityChange]:
+        """
+        Resolve a batch of changed entities into additions and
+        modifications.
+        """
+        old = self._rows(self.old, global_ids)
+        new = self._rows(self.new, global_ids)
+        for global_id in global_ids:
+            container, owner_history, *attributes = new[global_id]
+            if global_id not in old:
+                yield EntityChange(global_id, ADDED, {}, owner_history)
+                continue
+            old_container, _, *old_attributes = old[global_id]
+            changes = {}
+            if container != old_container:
+                changes[CONTAINER] = (old_container, container)
+            if self.attributes:
+                changes.update(_delta(old_attributes[0], attributes[0]))
+            yield EntityChange(global_id, MODIFIED, changes, owner_history)
+
+    def _deletions(self, global_ids: list[str]) -> Iterator[EntityChange]:
+        """
+        Return the changes of a batch of removed entities.
+        """
+        owner_histories = dict(
+            self._entities(self.old)
+            .filter(global_id__in=global_ids)
+            .values_list("global_id", "owner_history")
+        )
+        for global_id in global_ids:
+            yield EntityChange(
+                global_id, DELETED, {}, owner_histories.get(global_id),
+            )
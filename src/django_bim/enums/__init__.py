@@ -14,6 +14,8 @@ Currently, the module includes:
 - `IfcChangeActionEnum`: ...
 - `IfcRoleEnum`: Enumerations for different roles specified in IFC standards
     that can be assigned to actors in a building construction project.
+- `IfcSIPrefix`: The decimal prefixes of SI units, e.g. MILLI.
+- `IfcSIUnitName`: The names of SI units, e.g. METRE.
 - `IfcStateEnum`: ...
 
 """
@@ -23,9 +25,10 @@ Currently, the module includes:
 # =============================================================================
 
 # Local enumeration modules
-from .enum_ifc_address_type import IfcAddressTypeEnum
+from .actor import IfcAddressTypeEnum, IfcRoleEnum
 from .enum_ifc_change_action import IfcChangeActionEnum
-from .enum_ifc_role import IfcRoleEnum
+from .enum_ifc_si_prefix import IfcSIPrefix
+from .enum_ifc_si_unit_name import IfcSIUnitName
 from .enum_ifc_state import IfcStateEnum
 
 
@@ -37,5 +40,7 @@ __all__ = [
     "IfcAddressTypeEnum",
     "IfcChangeActionEnum",
     "IfcRoleEnum",
+    "IfcSIPrefix",
+    "IfcSIUnitName",
     "IfcStateEnum",
 ]
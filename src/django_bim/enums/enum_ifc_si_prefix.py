@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC SI Prefix Enum Class
+=================================
+
+For more information, refer to:
+https://standards.buildingsmart.org/IFC/RELEASE/IFC4/ADD2_TC1/HTML/link/ifcsiprefix.htm
+
+"""  # noqa E501
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+from enum import Enum
+from typing import Any
+
+# Import | Libraries
+from django.utils.translation import gettext_lazy as _
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcSIPrefix(Enum):
+    """
+    IFC SI Prefix Enum Class
+    ========================
+
+    Enumeration for IfcSIPrefix providing the decimal prefixes of SI units
+    according to the IFC standard, e.g. MILLI for the millimetre.
+
+    Enum Members:
+    - EXA to DECA: The prefixes of the multiples, from 10^18 to 10^1.
+    - DECI to ATTO: The prefixes of the fractions, from 10^-1 to 10^-18.
+    """
+    EXA = _("Exa")
+    PETA = _("Peta")
+    TERA = _("Tera")
+    GIGA = _("Giga")
+    MEGA = _("Mega")
+    KILO = _("Kilo")
+    HECTO = _("Hecto")
+    DECA = _("Deca")
+    DECI = _("Deci")
+    CENTI = _("Centi")
+    MILLI = _("Milli")
+    MICRO = _("Micro")
+    NANO = _("Nano")
+    PICO = _("Pico")
+    FEMTO = _("Femto")
+    ATTO = _("Atto")
+
+    @classmethod
+    def choices(cls) -> tuple[tuple[str, Any], ...]:
+        """
+        Returns the choices for field choices in a Django model field,
+        formatted as required by Django's field choices.
+
+        Returns:
+            tuple of tuples: Each tuple contains the enum member's name and
+                its human-readable name, suitable for use in model field
+                choices.
+        """
+        return tuple((item.name, item.value) for item in cls)
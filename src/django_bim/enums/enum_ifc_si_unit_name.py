@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC SI Unit Name Enum Class
+====================================
+
+For more information, refer to:
+https://standards.buildingsmart.org/IFC/RELEASE/IFC4/ADD2_TC1/HTML/link/ifcsiunitname.htm
+
+"""  # noqa E501
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+from enum import Enum
+from typing import Any
+
+# Import | Libraries
+from django.utils.translation import gettext_lazy as _
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcSIUnitName(Enum):
+    """
+    IFC SI Unit Name Enum Class
+    ===========================
+
+    Enumeration for IfcSIUnitName providing the names of the SI units
+    according to the IFC standard, without prefix, e.g. METRE.
+
+    """
+    AMPERE = _("Ampere")
+    BECQUEREL = _("Becquerel")
+    CANDELA = _("Candela")
+    COULOMB = _("Coulomb")
+    CUBIC_METRE = _("Cubic Metre")
+    DEGREE_CELSIUS = _("Degree Celsius")
+    FARAD = _("Farad")
+    GRAM = _("Gram")
+    GRAY = _("Gray")
+    HENRY = _("Henry")
+    HERTZ = _("Hertz")
+    JOULE = _("Joule")
+    KELVIN = _("Kelvin")
+    LUMEN = _("Lumen")
+    LUX = _("Lux")
+    METRE = _("Metre")
+    MOLE = _("Mole")
+    NEWTON = _("Newton")
+    OHM = _("Ohm")
+    PASCAL = _("Pascal")
+    RADIAN = _("Radian")
+    SECOND = _("Second")
+    SIEMENS = _("Siemens")
+    SIEVERT = _("Sievert")
+    SQUARE_METRE = _("Square Metre")
+    STERADIAN = _("Steradian")
+    TESLA = _("Tesla")
+    VOLT = _("Volt")
+    WATT = _("Watt")
+    WEBER = _("Weber")
+
+    @classmethod
+    def choices(cls) -> tuple[tuple[str, Any], ...]:
+        """
+        Returns the choices for field choices in a Django model field,
+        formatted as required by Django's field choices.
+
+        Returns:
+            tuple of tuples: Each tuple contains the enum member's name and
+                its human-readable name, suitable for use in model field
+                choices.
+        """
+        return tuple((item.name, item.value) for item in cls)
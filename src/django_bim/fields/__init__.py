@@ -23,7 +23,12 @@ Django applications.
 # =============================================================================
 
 # Import | Local Modules
-from .model import IfcGloballyUniqueIdField, IfcLabelField, IfcTextField
+from .model import (
+    IfcGloballyUniqueIdField,
+    IfcLabelField,
+    IfcTextField,
+    trusted_guids,
+)
 
 # =============================================================================
 # Module Level Variables
@@ -33,4 +38,5 @@ __all__ = [
     "IfcGloballyUniqueIdField",
     "IfcLabelField",
     "IfcTextField",
+    "trusted_guids",
 ]
@@ -23,12 +23,11 @@ Django applications.
 # =============================================================================
 
 # Import | Local Modules
-from .field_model_ifc_guid import IfcGloballyUniqueIdField
-from .field_model_ifc_identifier import IfcIdentifierField
-from .field_model_ifc_label import IfcLabelField
-from .field_model_ifc_role_type import IfcRoleTypeField
-from .field_model_ifc_text import IfcTextField
+from .field_model_ifc_guid import IfcGloballyUniqueIdField, trusted_guids
+from .field_model_ifc_role_enum import IfcRoleEnumField
 from .field_model_ifc_timestamp import IfcTimestampField
+from .field_model_ifc_transform import IfcTransformField
+from .measure import IfcIdentifierField, IfcLabelField, IfcTextField
 
 
 # =============================================================================
@@ -39,7 +38,9 @@ __all__ = [
     "IfcGloballyUniqueIdField",
     "IfcIdentifierField",
     "IfcLabelField",
-    "IfcRoleTypeField",
+    "IfcRoleEnumField",
     "IfcTextField",
     "IfcTimestampField",
+    "IfcTransformField",
+    "trusted_guids",
 ]
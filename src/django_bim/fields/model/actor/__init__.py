@@ -18,7 +18,12 @@ Django BIM IFC Actor Model Fields Module
 # =============================================================================
 
 # Import | Local Modules
-from .field_model_ifc_actor_select import IfcActorSelectField
+from .field_model_ifc_actor_select import (
+    IfcActorForeignKey,
+    IfcActorSelectField,
+    prefetch_actors,
+    warm_actor_content_types,
+)
 
 
 # =============================================================================
@@ -26,5 +31,8 @@ from .field_model_ifc_actor_select import IfcActorSelectField
 # =============================================================================
 
 __all__ = [
+    "IfcActorForeignKey",
     "IfcActorSelectField",
+    "prefetch_actors",
+    "warm_actor_content_types",
 ]
@@ -6,13 +6,30 @@
 # =============================================================================
 
 """
+Provides IFC Actor Select Field Class
+=====================================
 
-===================================
+This module defines the IfcActorSelectField, a generic relation to an
+IfcPerson, an IfcOrganization or an IfcPersonAndOrganization.
 
-https://ifc43-docs.standards.buildingsmart.org/IFC/RELEASE/IFC4x3/HTML/lexical/IfcActorSelect.htm
+Following the actor of every row of a list is one query per row.
+`prefetch_actors(queryset)` resolves the actors of all rows with one query
+per concrete actor model, through the default managers of the actor models,
+which also load the relations used by their `__str__`. The content types of
+the actor models are resolved from the process-wide cache of
+`ContentType.objects`, which `warm_actor_content_types` fills when the
+first request of the process starts.
 
+Usage:
+    class IfcApprovalModel(models.Model):
+        requesting_approval = IfcActorSelectField(null=True)
 
-"""
+    approvals = prefetch_actors(IfcApprovalModel.objects.all())
+
+More information on IfcActorSelect can be found here:
+https://ifc43-docs.standards.buildingsmart.org/IFC/RELEASE/IFC4x3/HTML/lexical/IfcActorSelect.htm
+
+"""  # noqa E501
 
 
 # =============================================================================
@@ -20,82 +37,181 @@ https://ifc43-docs.standards.buildingsmart.org/IFC/RELEASE/IFC4x3/HTML/lexical/I
 # =============================================================================
 
 # Import | Standard Library
-from typing import Literal
+from collections import defaultdict
+from typing import Optional
 
 # Import | Libraries
+from django.apps import apps
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
-from django.utils.translation import gettext_lazy as _
+from django.db import DEFAULT_DB_ALIAS, models
 
 # Import | Local Modules
 
 
+# =============================================================================
+# Variables
+# =============================================================================
+
+# Model names of the entities an IfcActorSelect can refer to
+ACTOR_MODEL_NAMES = (
+    "ifcpersonmodel",
+    "ifcorganizationmodel",
+    "ifcpersonandorganizationmodel",
+)
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def actor_models() -> list[type[models.Model]]:
+    """
+    Return the installed actor models.
+
+    Returns:
+        list: The installed models named in `ACTOR_MODEL_NAMES`.
+    """
+    return [
+        model for model in apps.get_models()
+        if model._meta.model_name in ACTOR_MODEL_NAMES
+    ]
+
+
+def warm_actor_content_types(using: str = DEFAULT_DB_ALIAS, **kwargs) -> None:
+    """
+    Load the content types of the actor models into the cache of
+    `ContentType.objects`, with at most one query per database.
+
+    Run by the app on the first request, as the database should not be
+    queried while the apps are loading.
+
+    Parameters:
+        using (str): The database alias.
+    """
+    ContentType.objects.db_manager(using).get_for_models(*actor_models())
+
+
+def prefetch_actors(
+    queryset: models.QuerySet,
+    *names: str,
+) -> list[models.Model]:
+    """
+    Evaluate a queryset and resolve the actor fields of its rows, with one
+    query per actor field and concrete actor model.
+
+    Parameters:
+        queryset (QuerySet): The rows to load.
+        *names (str): The actor fields to resolve, by default every
+            IfcActorSelectField of the model.
+
+    Returns:
+        list: The rows, with their actors cached.
+    """
+    instances = list(queryset)
+    if not instances:
+        return instances
+    using = queryset.db
+    if not names:
+        names = [
+            field.name for field in queryset.model._meta.private_fields
+            if isinstance(field, IfcActorForeignKey)
+        ]
+    content_types = ContentType.objects.db_manager(using)
+    for name in names:
+        field = queryset.model._meta.get_field(name)
+        ct_attname = field.model._meta.get_field(field.ct_field).attname
+        keys = defaultdict(set)
+        for instance in instances:
+            ct_id = getattr(instance, ct_attname)
+            if ct_id is not None:
+                keys[ct_id].add(getattr(instance, field.fk_field))
+        actors = {}
+        for ct_id, pks in keys.items():
+            model = content_types.get_for_id(ct_id).model_class()
+            objects = model._default_manager.using(using).in_bulk(pks)
+            for pk, actor in objects.items():
+                actors[ct_id, pk] = actor
+        for instance in instances:
+            key = (
+                getattr(instance, ct_attname),
+                getattr(instance, field.fk_field),
+            )
+            field.set_cached_value(instance, actors.get(key))
+    return instances
+
+
 # =============================================================================
 # Classes
 # =============================================================================
 
+class IfcActorForeignKey(GenericForeignKey):
+    """
+    IFC Actor Foreign Key Class
+    ===========================
+
+    The generic foreign key installed by IfcActorSelectField, which
+    `prefetch_actors` resolves by default.
 
-class IfcActorSelectField(models.Field):
     """
-    ...
+
+
+class IfcActorSelectField:
     """
+    IFC Actor Select Field Class
+    ============================
 
-    description: str = _(
-        message="A field that can refer to an IfcOrganization, IfcPerson, or IfcPersonAndOrganization"
-    )
+    Declares a generic relation to an actor of the model.
 
-    def __init__(self, *args, **kwargs) -> None:
-        """
-        ...
-        """
-        super().__init__(*args, **kwargs)
-        self.object_id_field = "object_id"
-        self.content_type_field = "content_type"
+    The declaration is replaced by three fields named after it: the
+    `<name>_content_type` foreign key, the `<name>_object_id` big integer
+    and the `<name>` IfcActorForeignKey combining them.
+
+    Parameters:
+        null (bool): Whether the actor is optional.
+        verbose_name (str): The human-readable name of the relation.
+        help_text (str): The help text of the relation.
 
-    def contribute_to_class(
+    """
+
+    def __init__(
         self,
-        cls,
-        name,
-        private_only=False,
-        **kwarg,
+        null: bool = False,
+        verbose_name: Optional[str] = None,
+        help_text: str = "",
     ) -> None:
         """
-        ...
+        Store the options of the declaration.
         """
-        self.name = name
-        self.model = cls
-        ct_field = models.ForeignKey(
-            ContentType,
-            on_delete=models.CASCADE,
-            limit_choices_to={
-                "model__in": (
-                    "ifcperson",
-                    "ifcorganization",
-                    "ifcpersonandorganization",
-                ),
-            },
-        )
-        fk_field = models.PositiveIntegerField()
-        cls.add_to_class(self.content_type_field, ct_field)
-        cls.add_to_class(self.object_id_field, fk_field)
-        actor = GenericForeignKey(
-            ct_field=self.content_type_field, fk_field=self.object_id_field
-        )
-        cls.add_to_class(name, actor)
-
-        super().contribute_to_class(
-            cls=cls,
-            name=name,
-            private_only=private_only,
-            **kwargs,
-        )
-
-    def get_internal_type(self) -> Literal["IfcActorSelectField"]:
+        self.null = null
+        self.verbose_name = verbose_name
+        self.help_text = help_text
+
+    def contribute_to_class(self, cls, name: str, **kwargs) -> None:
         """
-        ...
+        Install the fields of the relation on the model.
         """
-        return "IfcActorSelectField"
+        ct_field = f"{name}_content_type"
+        fk_field = f"{name}_object_id"
+        cls.add_to_class(ct_field, models.ForeignKey(
+            ContentType,
+            on_delete = models.CASCADE,
+            null = self.null,
+            blank = self.null,
+            related_name = "+",
+            limit_choices_to = {"model__in": ACTOR_MODEL_NAMES},
+            verbose_name = self.verbose_name,
+            help_text = self.help_text,
+        ))
+        # The primary keys of the actor models are BigAutoFields
+        cls.add_to_class(fk_field, models.PositiveBigIntegerField(
+            null = self.null,
+            blank = self.null,
+        ))
+        cls.add_to_class(name, IfcActorForeignKey(
+            ct_field = ct_field,
+            fk_field = fk_field,
+        ))
 
 
 # =============================================================================
@@ -103,5 +219,10 @@ class IfcActorSelectField(models.Field):
 # =============================================================================
 
 __all__: list[str] = [
+    "ACTOR_MODEL_NAMES",
+    "IfcActorForeignKey",
     "IfcActorSelectField",
+    "actor_models",
+    "prefetch_actors",
+    "warm_actor_content_types",
 ]
@@ -13,6 +13,23 @@ Defines a custom Django model field specifically for handling IFC Globally
 Unique Identifiers (GUID). These GUIDs are standardized as 22-character
 Base64 encoded strings, uniquely identifying elements in IFC models.
 
+By default the GUID is stored as text. With `binary=True` (or the
+`DJANGO_BIM_BINARY_GUIDS` setting) it is stored as the 16-byte UUID it
+encodes, in a native `uuid` column on PostgreSQL and a 16-byte binary column
+elsewhere, which more than halves the size of the unique index. The field
+still exposes the 22-character form in Python.
+
+Values are validated whenever they are prepared for a query or converted
+with `to_python`. Code that already validated a batch (e.g. with
+`django_bim.utils.guid.validate_many`) or reads GUIDs back from the database
+can skip the per-value checks inside `trusted_guids()`; `full_clean()` stays
+strict because the field validators still run.
+
+Note:
+    Switching the storage mode of an existing column changes its type, so
+    the migration has to convert the stored values as well, e.g. with a
+    `RunPython` step using `django_bim.utils.guid`.
+
 """
 
 
@@ -21,19 +38,36 @@ Base64 encoded strings, uniquely identifying elements in IFC models.
 # =============================================================================
 
 # Import | Standard Library
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
 
 # Import | Libraries
+from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db import models
 
 # Import | Local Modules
 from ...utils import validate_ifc_guid
+from ...utils.guid import from_uuid, new_default, to_uuid
 
 
 # =============================================================================
 # Variables
 # =============================================================================
 
-__all__ = ["IfcGloballyUniqueIdField", ]
+__all__ = ["IfcGloballyUniqueIdField", "trusted_guids", ]
+
+# Column types of the binary storage mode, per database vendor
+_BINARY_DB_TYPES: dict[str, str] = {
+    "postgresql": "uuid",
+    "mysql": "binary(16)",
+    "oracle": "RAW(16)",
+}
+
+# Whether per-value validation is skipped, see `trusted_guids`
+_trusted: ContextVar[bool] = ContextVar("trusted_guids", default=False)
 
 
 # =============================================================================
@@ -56,27 +90,65 @@ class IfcGloballyUniqueIdField(models.CharField):
         unique (bool): Ensures that all values in the database are unique.
         validators (list): List of validators applied to the field,
             specifically `validate_ifc_guid`.
+        default (Callable): Defaults to `new_default`, so new rows get a
+            random GUID unless one is given.
+        binary (bool): Whether the GUID is stored as a 16-byte UUID instead
+            of text. Defaults to the `DJANGO_BIM_BINARY_GUIDS` setting.
 
     """
 
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(
+        self,
+        *args,
+        binary: Optional[bool] = None,
+        **kwargs,
+    ) -> None:
         """
         """
         kwargs["max_length"] = 22  # Ensure the length is always 22
         kwargs["unique"] = True  # Ensure uniqueness across database entries
         kwargs["validators"] = [validate_ifc_guid]
+        kwargs.setdefault("default", new_default)
+        if binary is None:
+            binary = getattr(settings, "DJANGO_BIM_BINARY_GUIDS", False)
+        self.binary = bool(binary)
         super().__init__(*args, **kwargs)
 
+    def deconstruct(self) -> tuple:
+        """
+        Include the storage mode in migrations, so changing the setting
+        produces a migration of the column, and leave out the options set
+        by `__init__`.
+        """
+        name, path, args, kwargs = super().deconstruct()
+        for option in ("max_length", "unique", "validators"):
+            kwargs.pop(option, None)
+        kwargs["binary"] = self.binary
+        return name, path, args, kwargs
+
+    def db_type(self, connection) -> Optional[str]:
+        """
+        Return the column type, a 16-byte UUID column in binary mode.
+        """
+        if not self.binary:
+            return super().db_type(connection)
+        return _BINARY_DB_TYPES.get(connection.vendor, "blob")
+
     def from_db_value(
         self,
-        value: str,
+        value: Any,
         expression,
         connection
-    ) -> str:
+    ) -> Optional[str]:
         """
-        Return the value directly from the database as is.
+        Return the value from the database, encoding binary UUIDs back to
+        the 22-character form.
         """
-        return value
+        if value is None or not self.binary:
+            return value
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(bytes=bytes(value))
+        return from_uuid(value)
 
     def to_python(self, value: str) -> str:
         """
@@ -89,7 +161,7 @@ class IfcGloballyUniqueIdField(models.CharField):
         Returns:
             str: The validated and correctly formatted GUID string.
         """
-        if isinstance(value, str):
+        if isinstance(value, str) and not _trusted.get():
             validate_ifc_guid(value)
         return value
 
@@ -103,5 +175,63 @@ class IfcGloballyUniqueIdField(models.CharField):
         Returns:
             str: The value prepared for database insertion, after validation.
         """
-        validate_ifc_guid(value)
-        return super().get_prep_value(value)
+        if not _trusted.get():
+            validate_ifc_guid(value)
+        # `CharField.get_prep_value` would validate again in `to_python`
+        return models.Field.get_prep_value(self, value)
+
+    def get_db_prep_value(
+        self,
+        value: Any,
+        connection,
+        prepared: bool = False,
+    ) -> Any:
+        """
+        Convert the value for the database, decoding it to a UUID (or its
+        16 bytes) in binary mode.
+
+        Parameters:
+            value (str): The GUID to store or look up.
+            connection: The database connection.
+            prepared (bool): Whether `get_prep_value` was already applied.
+
+        Returns:
+            Any: The value in the column representation.
+        """
+        value = super().get_db_prep_value(value, connection, prepared)
+        if value is None or not self.binary:
+            return value
+        try:
+            guid = to_uuid(value)
+        except ValueError as error:
+            raise ValidationError(str(error), code="invalid") from error
+        if connection.vendor == "postgresql":
+            return guid
+        return guid.bytes
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+@contextmanager
+def trusted_guids() -> Iterator[None]:
+    """
+    Skip the per-value GUID validation of `IfcGloballyUniqueIdField` in
+    `get_prep_value` and `to_python` for the duration of the block.
+
+    Meant for bulk paths whose values are already known to be valid, e.g.
+    `bulk_create` after a `validate_many` or `filter(global_id__in=...)`
+    with GUIDs read from the database. Lookups prepare their values when the
+    queryset is filtered, so the filter call must be inside the block.
+    Field validators, and therefore `full_clean()`, are not affected.
+
+    Example:
+        with trusted_guids():
+            IfcProjectModel.objects.bulk_create(projects)
+    """
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
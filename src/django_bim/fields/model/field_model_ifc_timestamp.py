@@ -7,8 +7,13 @@
 
 """
 Provides IFC Timestamp Model Field Class
-===================================
+========================================
 
+Defines a Django model field for IfcTimeStamp values. The timestamp is
+stored as a 64-bit integer column of seconds since the epoch, so range
+queries compare numbers and can use an index, while Python code works with
+timezone-aware `datetime.datetime` objects. Lookups such as `__gte` or
+`__range` accept datetimes and translate them to epoch seconds.
 
 https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcmeasureresource/lexical/ifctimestamp.htm
 
@@ -23,7 +28,10 @@ https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcmeasureresour
 import datetime
 
 # Import | Libraries
+from django import forms
 from django.db import models
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.timezone import make_aware, get_default_timezone
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
@@ -42,7 +50,7 @@ __all__ = ["IfcTimestampField", ]
 # Classes
 # =============================================================================
 
-class IfcTimestampField(models.TextField):
+class IfcTimestampField(models.BigIntegerField):
     """
     IFC Timestamp Model Field Class
     ===============================
@@ -55,8 +63,70 @@ class IfcTimestampField(models.TextField):
     datetime objects, automatically handling conversion between these for
     ease of use within Django.
 
+    Attributes:
+        auto_now (bool): Set the field to the current time whenever an
+            existing row is saved, and on creation if no value is given.
+        auto_now_add (bool): Set the field to the current time on creation
+            if no value is given.
+
+    Note:
+        Unlike `DateTimeField`, an explicit value given on creation is kept,
+        as IFC timestamps usually come from the authoring application (e.g.
+        when importing a file with `bulk_create`).
+
     """
 
+    def __init__(
+        self,
+        *args,
+        auto_now: bool = False,
+        auto_now_add: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        """
+        self.auto_now = auto_now
+        self.auto_now_add = auto_now_add
+        if auto_now or auto_now_add:
+            kwargs["editable"] = False
+            kwargs["blank"] = True
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self) -> tuple:
+        """
+        Include the automatic update options in migrations.
+        """
+        name, path, args, kwargs = super().deconstruct()
+        if self.auto_now:
+            kwargs["auto_now"] = True
+        if self.auto_now_add:
+            kwargs["auto_now_add"] = True
+        if self.auto_now or self.auto_now_add:
+            del kwargs["editable"]
+            del kwargs["blank"]
+        return name, path, args, kwargs
+
+    @cached_property
+    def validators(self) -> list:
+        """
+        Return the field validators, without the integer range validators
+        of `BigIntegerField`, which cannot compare datetimes.
+        """
+        return [*self.default_validators, *self._validators]
+
+    def pre_save(self, model_instance, add: bool):
+        """
+        Apply `auto_now` and `auto_now_add` before saving.
+        """
+        value = getattr(model_instance, self.attname)
+        if (
+            (self.auto_now and not add)
+            or ((self.auto_now or self.auto_now_add) and value is None)
+        ):
+            value = timezone.now()
+            setattr(model_instance, self.attname, value)
+        return value
+
     def from_db_value(self, value, expression, connection):
         """
         Convert an integer from the database to a datetime.datetime object.
@@ -64,12 +134,12 @@ class IfcTimestampField(models.TextField):
         if value is None:
             return value
         try:
-            return make_aware(
-                datetime.datetime.utcfromtimestamp(value),
-                get_default_timezone()
+            return datetime.datetime.fromtimestamp(
+                int(value),
+                tz=datetime.timezone.utc,
             )
         # Handle overflow error which can happen with large timestamps
-        except OverflowError:
+        except (OverflowError, OSError):
             raise ValidationError(
                 _("Timestamp value is out of range for datetime.")
             )
@@ -83,21 +153,33 @@ class IfcTimestampField(models.TextField):
         if value is None:
             return value
         try:
-            return make_aware(
-                datetime.datetime.utcfromtimestamp(int(value)),
-                get_default_timezone()
+            return datetime.datetime.fromtimestamp(
+                int(value),
+                tz=datetime.timezone.utc,
             )
-        except (ValueError, OverflowError):
+        except (TypeError, ValueError, OverflowError, OSError):
             raise ValidationError(_("Invalid timestamp value."))
 
     def get_prep_value(self, value):
         """
         Convert the datetime.datetime object to an integer timestamp before
-        saving to the database.
+        saving to the database or using it in a lookup. Naive datetimes are
+        interpreted in the default time zone.
         """
         if isinstance(value, datetime.datetime):
+            if timezone.is_naive(value):
+                value = make_aware(value, get_default_timezone())
             return int(value.timestamp())
-        return value
+        return super().get_prep_value(value)
+
+    def formfield(self, **kwargs):
+        """
+        Edit the timestamp as a date and time rather than as an integer.
+        """
+        return models.Field.formfield(
+            self,
+            **{"form_class": forms.DateTimeField, **kwargs},
+        )
 
     def value_to_string(self, obj):
         """
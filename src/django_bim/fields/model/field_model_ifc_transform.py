@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC Transform Model Field Class
+========================================
+
+Defines a Django model field storing a homogeneous 4x4 transformation
+matrix, as used to place objects relative to each other. The matrix is
+packed as 16 little-endian float64 values in row-major order (128 bytes) in
+a binary column, and exposed in Python as a flat tuple of 16 floats (see
+`django_bim.utils.matrix`).
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import struct
+from typing import Any, Optional
+
+# Import | Libraries
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+# Import | Local Modules
+from ...utils.matrix import Matrix
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__ = ["IfcTransformField", ]
+
+_PACKING = struct.Struct("<16d")
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcTransformField(models.BinaryField):
+    """
+    IFC Transform Model Field Class
+    ===============================
+
+    Custom Django field for storing a 4x4 transformation matrix as packed
+    float64 values. Any sequence of 16 numbers is accepted and read back as
+    a tuple of floats.
+
+    """
+
+    def from_db_value(self, value, expression, connection):
+        """
+        Unpack the stored bytes into a tuple of 16 floats.
+        """
+        if value is None:
+            return value
+        return _PACKING.unpack(value)
+
+    def to_python(self, value: Any) -> Optional[Matrix]:
+        """
+        Convert packed bytes, a sequence of 16 numbers or their
+        comma-separated serialization to a tuple of floats.
+        """
+        if value is None:
+            return value
+        if isinstance(value, str):
+            value = value.split(",")
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            try:
+                return _PACKING.unpack(value)
+            except struct.error:
+                raise ValidationError(
+                    _("A transform must be packed as 16 float64 values.")
+                )
+        try:
+            matrix = tuple(float(number) for number in value)
+        except (TypeError, ValueError):
+            raise ValidationError(_("A transform must contain numbers."))
+        if len(matrix) != 16:
+            raise ValidationError(_("A transform must contain 16 numbers."))
+        return matrix
+
+    def get_prep_value(self, value: Any) -> Optional[bytes]:
+        """
+        Pack the matrix into 128 bytes.
+        """
+        value = self.to_python(value)
+        if value is None:
+            return value
+        return _PACKING.pack(*value)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        """
+        Let the backend wrap the packed bytes for its binary column.
+        """
+        if not prepared:
+            value = self.get_prep_value(value)
+        return super().get_db_prep_value(value, connection, prepared=True)
+
+    def value_to_string(self, obj) -> str:
+        """
+        Serialize the matrix as 16 comma-separated numbers.
+        """
+        value = self.value_from_object(obj)
+        return "" if value is None else ",".join(map(repr, value))
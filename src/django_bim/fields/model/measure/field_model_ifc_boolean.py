@@ -1,5 +1,20 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC Boolean Model Field Class
+======================================
+
+For more information, refer to:
 https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcmeasureresource/lexical/ifcboolean.htm
 
+"""  # noqa E501
+
+
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Geometry Module
+==========================
+
+This module groups the NumPy-based geometry operations run over the
+coordinates stored in the `models/ifc` tables. NumPy is an optional
+dependency, installed with the `geometry` extra.
+
+Available Modules:
+- transform: Applies placement, scaling and georeferencing transforms to
+  the coordinates of whole querysets with one matrix multiply.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Local Modules
+from .transform import (
+    GatheredCoordinates,
+    compose,
+    gather_coordinates,
+    map_conversion,
+    scaling,
+    transform_points,
+    transform_queryset,
+    translation,
+)
+
+
+# =============================================================================
+# Module Level Variables
+# =============================================================================
+
+__all__ = [
+    "GatheredCoordinates",
+    "compose",
+    "gather_coordinates",
+    "map_conversion",
+    "scaling",
+    "transform_points",
+    "transform_queryset",
+    "translation",
+]
@@ -0,0 +1,500 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides Bulk Coordinate Transform Functions
+============================================
+
+Applies placement matrices, unit scaling and georeferencing offsets to many
+coordinates at once. The coordinates of a queryset are read with one
+`values_list` query into a single `(n, 3)` NumPy array, the transforms are
+composed into one 4x4 matrix, and the array is transformed with a single
+matrix multiply instead of point by point in Python.
+
+Supported querysets:
+- `IfcCartesianPoint` rows (`x`, `y`, `z` columns),
+- `IfcLine` rows (typed end point columns, whose length and bounding box
+  are updated with them),
+- `IfcCartesianPointListModel` rows (packed coordinates).
+
+Transforms are row-major 4x4 matrices as in `django_bim.utils.matrix`
+(tuples of 16 floats, sequences or `(4, 4)` arrays), or placements, which
+stand for their materialised world transform. 2D coordinates are treated as
+lying in the z = 0 plane and stay 2D.
+
+Available Functions:
+- compose: Combines transforms into one matrix.
+- scaling: Returns a uniform scaling matrix, e.g. for unit conversion.
+- translation: Returns a translation matrix.
+- map_conversion: Returns the matrix of an IfcMapConversion.
+- transform_points: Transforms an array of points.
+- gather_coordinates: Reads the coordinates of a queryset into one array.
+- transform_queryset: Transforms the coordinates of a queryset and
+  optionally writes them back with `bulk_update`.
+
+Example:
+    >>> points = IfcCartesianPoint.objects.filter(...)
+    >>> world = transform_queryset(points, placement, scaling(0.001))
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+from typing import Any, Callable, NamedTuple, Optional
+
+# Import | Libraries
+from django.db import models
+
+try:
+    import numpy
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "django_bim.geometry requires NumPy, install the 'geometry' extra."
+    ) from error
+
+# Import | Local Modules
+from ..models.ifc.geometry.model_ifc_geometry_curve_line import (
+    COORDINATE_FIELDS as LINE_COORDINATE_FIELDS,
+    EXTENT_FIELDS as LINE_EXTENT_FIELDS,
+    line_extent,
+)
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+# Default number of rows per `bulk_update` query
+_UPDATE_BATCH_SIZE = 1000
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class GatheredCoordinates(NamedTuple):
+    """
+    Gathered Coordinates Class
+    ==========================
+
+    The coordinates of a queryset, gathered into one array.
+
+    Attributes:
+        pks (list): Primary keys of the rows, in order.
+        points (numpy.ndarray): All points as an `(n, 3)` float64 array, 2D
+            points with z = 0.
+        offsets (numpy.ndarray): The points of row `i` are
+            `points[offsets[i]:offsets[i + 1]]`.
+        dimensions (numpy.ndarray): Number of coordinates, 2 or 3, of the
+            points of each row.
+
+    """
+
+    pks: list
+    points: Any
+    offsets: Any
+    dimensions: Any
+
+    def split(self, points: Any = None) -> list:
+        """
+        Split the points, or transformed points, back into one array per
+        row, in the dimension of the row.
+
+        Parameters:
+            points (numpy.ndarray): Points shaped like `self.points`,
+                defaults to `self.points`.
+
+        Returns:
+            list: One `(count, dimensions)` array per row.
+        """
+        points = self.points if points is None else points
+        return [
+            points[start:end, :dimensions]
+            for start, end, dimensions in zip(
+                self.offsets[:-1].tolist(),
+                self.offsets[1:].tolist(),
+                self.dimensions.tolist(),
+            )
+        ]
+
+
+class _CoordinateSource(NamedTuple):
+    """
+    How coordinates are read from and written back to the rows of a model.
+    """
+
+    fields: tuple[str, ...]
+    updated: tuple[str, ...]
+    gather: Callable[[list], GatheredCoordinates]
+    values: Callable[[GatheredCoordinates, Any, int], dict[str, Any]]
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def compose(*transforms: Any) -> Any:
+    """
+    Combine transforms into one matrix applying them in the order given,
+    e.g. `compose(placement, scaling(0.001))` places, then scales.
+
+    Parameters:
+        *transforms (Any): Matrices or placements.
+
+    Returns:
+        numpy.ndarray: The combined `(4, 4)` matrix.
+    """
+    matrix = numpy.identity(4)
+    for transform in transforms:
+        matrix = _as_matrix(transform) @ matrix
+    return matrix
+
+
+def scaling(factor: float) -> Any:
+    """
+    Return a uniform scaling matrix, e.g. `scaling(0.001)` for millimetres
+    to metres.
+
+    Parameters:
+        factor (float): The scale factor.
+
+    Returns:
+        numpy.ndarray: The `(4, 4)` matrix.
+    """
+    return numpy.diag([factor, factor, factor, 1.0])
+
+
+def translation(x: float, y: float, z: float = 0.0) -> Any:
+    """
+    Return a translation matrix.
+
+    Parameters:
+        x (float): The offset along x.
+        y (float): The offset along y.
+        z (float): The offset along z.
+
+    Returns:
+        numpy.ndarray: The `(4, 4)` matrix.
+    """
+    matrix = numpy.identity(4)
+    matrix[:3, 3] = (x, y, z)
+    return matrix
+
+
+def map_conversion(
+    eastings: float,
+    northings: float,
+    orthogonal_height: float,
+    x_axis_abscissa: float = 1.0,
+    x_axis_ordinate: float = 0.0,
+    scale: float = 1.0,
+) -> Any:
+    """
+    Return the matrix converting engineering coordinates to map coordinates
+    as described by an IfcMapConversion: scale, rotate about z so the x axis
+    points along (`x_axis_abscissa`, `x_axis_ordinate`), then offset.
+
+    Parameters:
+        eastings (float): Map easting of the engineering origin.
+        northings (float): Map northing of the engineering origin.
+        orthogonal_height (float): Map height of the engineering origin.
+        x_axis_abscissa (float): Map x component of the engineering x axis.
+        x_axis_ordinate (float): Map y component of the engineering x axis.
+        scale (float): Engineering to map length ratio.
+
+    Returns:
+        numpy.ndarray: The `(4, 4)` matrix.
+    """
+    angle = numpy.arctan2(x_axis_ordinate, x_axis_abscissa)
+    cos, sin = numpy.cos(angle) * scale, numpy.sin(angle) * scale
+    return numpy.array([
+        [cos, -sin, 0.0, eastings],
+        [sin, cos, 0.0, northings],
+        [0.0, 0.0, scale, orthogonal_height],
+        [0.0, 0.0, 0.0, 1.0],
+    ])
+
+
+def transform_points(points: Any, *transforms: Any) -> Any:
+    """
+    Transform points with one matrix multiply.
+
+    Parameters:
+        points (numpy.ndarray): An `(n, 2)` or `(n, 3)` array.
+        *transforms (Any): Matrices or placements, applied in the order
+            given.
+
+    Returns:
+        numpy.ndarray: The transformed points, shaped like `points`.
+
+    Raises:
+        ValueError: If the points are not 2D or 3D.
+    """
+    points = numpy.asarray(points, dtype=numpy.float64)
+    if points.ndim != 2 or points.shape[1] not in (2, 3):
+        raise ValueError(f"Expected (n, 2) or (n, 3) points: {points.shape}.")
+    matrix = compose(*transforms)
+    dimensions = points.shape[1]
+    # Row vectors, so the linear part is applied transposed
+    return (
+        points @ matrix[:dimensions, :dimensions].T
+        + matrix[:dimensions, 3]
+    )
+
+
+def gather_coordinates(queryset: models.QuerySet) -> GatheredCoordinates:
+    """
+    Read the coordinates of a queryset into one array with one query.
+
+    Parameters:
+        queryset (QuerySet): Points, lines or point lists.
+
+    Returns:
+        GatheredCoordinates: The coordinates.
+
+    Raises:
+        TypeError: If the model has no known coordinate fields.
+    """
+    source = _source(queryset.model)
+    return source.gather(
+        list(queryset.order_by().values_list("pk", *source.fields))
+    )
+
+
+def transform_queryset(
+    queryset: models.QuerySet,
+    *transforms: Any,
+    save: bool = False,
+    batch_size: Optional[int] = _UPDATE_BATCH_SIZE,
+) -> GatheredCoordinates:
+    """
+    Transform the coordinates of a queryset, and optionally store them.
+
+    Parameters:
+        queryset (QuerySet): Points, lines or point lists.
+        *transforms (Any): Matrices or placements, applied in the order
+            given.
+        save (bool): Whether to write the transformed coordinates back with
+            `bulk_update`.
+        batch_size (int): Rows per `bulk_update` query.
+
+    Returns:
+        GatheredCoordinates: The transformed coordinates.
+    """
+    gathered = gather_coordinates(queryset)
+    points = transform_points(gathered.points, *transforms)
+    # Transforms may move 2D points out of the z = 0 plane, which they do
+    # not store
+    points[numpy.repeat(
+        gathered.dimensions == 2,
+        numpy.diff(gathered.offsets),
+    ), 2] = 0.0
+    transformed = gathered._replace(points=points)
+    if save and transformed.pks:
+        model = queryset.model
+        source = _source(model)
+        model._default_manager.db_manager(queryset.db).bulk_update(
+            [
+                model(pk=pk, **source.values(transformed, points, index))
+                for index, pk in enumerate(transformed.pks)
+            ],
+            source.updated,
+            batch_size=batch_size,
+        )
+    return transformed
+
+
+# Functions | Helpers
+# =============================================================================
+
+def _as_matrix(transform: Any) -> Any:
+    """
+    Return a transform as a `(4, 4)` array.
+    """
+    if hasattr(transform, "world_matrix"):
+        transform = transform.world_matrix()
+    matrix = numpy.asarray(transform, dtype=numpy.float64)
+    if matrix.size != 16:
+        raise ValueError(f"Expected a 4x4 matrix: {matrix.shape}.")
+    return matrix.reshape(4, 4)
+
+
+def _gathered(
+    pks: list,
+    points: Any,
+    counts: Any,
+    dimensions: Any,
+) -> GatheredCoordinates:
+    """
+    Build gathered coordinates from per-row point counts.
+    """
+    offsets = numpy.zeros(len(pks) + 1, dtype=numpy.int64)
+    numpy.cumsum(counts, out=offsets[1:])
+    return GatheredCoordinates(
+        pks=pks,
+        points=points.reshape(-1, 3),
+        offsets=offsets,
+        dimensions=numpy.asarray(dimensions, dtype=numpy.int64),
+    )
+
+
+def _gather_point_rows(rows: list) -> GatheredCoordinates:
+    """
+    Gather `(pk, x, y, z)` rows, `z` being `None` for 2D points.
+    """
+    values = numpy.array(
+        [row[1:] for row in rows], dtype=numpy.float64,
+    ).reshape(-1, 3)
+    flat = numpy.isnan(values[:, 2])
+    values[flat, 2] = 0.0
+    return _gathered(
+        [row[0] for row in rows],
+        values,
+        numpy.ones(len(rows), dtype=numpy.int64),
+        numpy.where(flat, 2, 3),
+    )
+
+
+def _point_row_values(
+    gathered: GatheredCoordinates,
+    points: Any,
+    index: int,
+) -> dict[str, Any]:
+    """
+    The `x`, `y` and `z` of a transformed point row.
+    """
+    x, y, z = points[index].tolist()
+    if gathered.dimensions[index] == 2:
+        z = None
+    return {"x": x, "y": y, "z": z}
+
+
+def _gather_line_rows(rows: list) -> GatheredCoordinates:
+    """
+    Gather `(pk, start_x, start_y, start_z, end_x, end_y, end_z)` rows, the
+    z coordinates being `None` for 2D lines.
+    """
+    values = numpy.array(
+        [row[1:] for row in rows], dtype=numpy.float64,
+    ).reshape(-1, 3)
+    flat = numpy.isnan(values[:, 2]).reshape(-1, 2).any(axis=1)
+    values[numpy.repeat(flat, 2), 2] = 0.0
+    return _gathered(
+        [row[0] for row in rows],
+        values,
+        numpy.full(len(rows), 2, dtype=numpy.int64),
+        numpy.where(flat, 2, 3),
+    )
+
+
+def _line_row_values(
+    gathered: GatheredCoordinates,
+    points: Any,
+    index: int,
+) -> dict[str, Any]:
+    """
+    The coordinates, length and bounding box of a transformed line row.
+    """
+    start = gathered.offsets[index]
+    coordinates = points[start:start + 2].tolist()
+    if gathered.dimensions[index] == 2:
+        coordinates[0][2] = coordinates[1][2] = None
+    return {
+        **dict(zip(LINE_COORDINATE_FIELDS, coordinates[0] + coordinates[1])),
+        **line_extent(*coordinates),
+    }
+
+
+def _gather_point_list_rows(rows: list) -> GatheredCoordinates:
+    """
+    Gather `(pk, dimensions, count, coordinates)` rows of packed lists.
+    """
+    blocks = []
+    for _, dimensions, count, coordinates in rows:
+        block = numpy.frombuffer(
+            coordinates, dtype="<f8", count=count * dimensions,
+        ).reshape(count, dimensions)
+        if dimensions == 2:
+            block = numpy.column_stack((block, numpy.zeros(count)))
+        blocks.append(block)
+    return _gathered(
+        [row[0] for row in rows],
+        numpy.concatenate(blocks) if blocks else numpy.empty((0, 3)),
+        [row[2] for row in rows],
+        [row[1] for row in rows],
+    )
+
+
+def _point_list_row_values(
+    gathered: GatheredCoordinates,
+    points: Any,
+    index: int,
+) -> dict[str, Any]:
+    """
+    The packed `coordinates` of a transformed point list row.
+    """
+    start, end = gathered.offsets[index:index + 2]
+    dimensions = gathered.dimensions[index]
+    return {
+        "dimensions": int(dimensions),
+        "count": int(end - start),
+        "coordinates": numpy.ascontiguousarray(
+            points[start:end, :dimensions], dtype="<f8",
+        ).tobytes(),
+    }
+
+
+def _source(model: type[models.Model]) -> _CoordinateSource:
+    """
+    Return how the coordinates of a model are stored.
+    """
+    names = {field.name for field in model._meta.concrete_fields}
+    for source in _SOURCES:
+        if names.issuperset(source.fields):
+            return source
+    raise TypeError(f"{model.__name__} has no known coordinate fields.")
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+_SOURCES = (
+    _CoordinateSource(
+        ("x", "y", "z"),
+        ("x", "y", "z"),
+        _gather_point_rows,
+        _point_row_values,
+    ),
+    _CoordinateSource(
+        LINE_COORDINATE_FIELDS,
+        (*LINE_COORDINATE_FIELDS, *LINE_EXTENT_FIELDS),
+        _gather_line_rows,
+        _line_row_values,
+    ),
+    _CoordinateSource(
+        ("dimensions", "count", "coordinates"),
+        ("dimensions", "count", "coordinates"),
+        _gather_point_list_rows,
+        _point_list_row_values,
+    ),
+)
+
+__all__ = [
+    "GatheredCoordinates",
+    "compose",
+    "gather_coordinates",
+    "map_conversion",
+    "scaling",
+    "transform_points",
+    "transform_queryset",
+    "translation",
+]
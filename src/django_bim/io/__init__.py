@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM IO Module
+====================
+
+This module groups the readers and writers used to move IFC data in and out
+of the `models/ifc` tables, such as the IFC-SPF (STEP) importer, the
+ifcJSON importer and exporter, and the columnar (Arrow, Parquet) exporter.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Local Modules
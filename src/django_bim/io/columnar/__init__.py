@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Columnar Module
+==========================
+
+This module writes the `models/ifc` tables to Apache Arrow IPC or Parquet
+files for analytics, and requires PyArrow (the `columnar` extra).
+
+Available Functions:
+- columnar_models: Returns the models of the IFC tables.
+- export_columnar: Writes the table of a model to an Arrow IPC or Parquet
+  file through a `ColumnarTable`.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Local Modules
+from .columnar_exporter import (
+    ARROW,
+    PARQUET,
+    ColumnarColumn,
+    ColumnarTable,
+    columnar_models,
+    export_columnar,
+)
+
+
+# =============================================================================
+# Module Level Variables
+# =============================================================================
+
+__all__ = [
+    "ARROW",
+    "PARQUET",
+    "ColumnarColumn",
+    "ColumnarTable",
+    "columnar_models",
+    "export_columnar",
+]
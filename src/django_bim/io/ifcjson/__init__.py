@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM ifcJSON Module
+=========================
+
+This module reads ifcJSON files into the `models/ifc` tables and streams
+projects out as ifcJSON, for web clients.
+
+Both directions reuse the entity builders and writers of the IFC-SPF
+module, and encode and decode JSON with `orjson` when it is installed
+(the `json` extra).
+
+Available Functions:
+- iter_ifcjson_objects: Streams the entity objects of an ifcJSON file.
+- import_ifcjson: Imports a file through an `IfcJsonImporter`.
+- export_ifcjson: Writes a project to a file-like object through an
+  `IfcJsonExporter`.
+- export_ifcjson_response: Serves a project as a `StreamingHttpResponse`.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Local Modules
+from .ifcjson_entities import IFC_JSON_ENTITIES, IfcJsonEntity
+from .ifcjson_exporter import (
+    IfcJsonExporter,
+    export_ifcjson,
+    export_ifcjson_response,
+)
+from .ifcjson_importer import IfcJsonImporter, import_ifcjson
+from .ifcjson_reader import IfcJsonParseError, iter_ifcjson_objects
+
+
+# =============================================================================
+# Module Level Variables
+# =============================================================================
+
+__all__ = [
+    "IFC_JSON_ENTITIES",
+    "IfcJsonEntity",
+    "IfcJsonExporter",
+    "IfcJsonImporter",
+    "IfcJsonParseError",
+    "export_ifcjson",
+    "export_ifcjson_response",
+    "import_ifcjson",
+    "iter_ifcjson_objects",
+]
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides ifcJSON Encoder Functions
+==================================
+
+This module encodes and decodes the JSON values of ifcJSON files.
+
+When `orjson` is installed (the `json` extra), it is used for both
+directions, which is several times faster than the `json` module of the
+standard library on the many small objects of an ifcJSON file; otherwise
+the standard library is used, with the same compact output.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import json
+from typing import Any, Union
+
+# Import | Libraries
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "decode_json",
+    "encode_json",
+]
+
+_ENCODER = json.JSONEncoder(
+    ensure_ascii=False,
+    separators=(",", ":"),
+    default=str,
+)
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def encode_json(value: Any) -> str:
+    """
+    Encode a value as compact JSON text.
+
+    Parameters:
+        value (Any): The value; tuples are written as arrays, and values
+            JSON has no type for (e.g. `Decimal`) as strings.
+
+    Returns:
+        str: The JSON text, without line breaks.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=str).decode("utf-8")
+    return _ENCODER.encode(value)
+
+
+def decode_json(data: Union[bytes, str]) -> Any:
+    """
+    Decode JSON text.
+
+    Parameters:
+        data (bytes | str): The UTF-8 encoded or decoded JSON text.
+
+    Returns:
+        Any: The decoded value.
+
+    Raises:
+        ValueError: If the text is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
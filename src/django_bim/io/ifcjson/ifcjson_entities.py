@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides ifcJSON Entity Classes
+===============================
+
+This module names the attributes of the entity types the IFC-SPF builders
+and writers handle, so ifcJSON objects can be converted to and from the
+positional attribute lists of `step_builders` and `step_writers`.
+
+ifcJSON writes entity types in their schema spelling (`IfcOwnerHistory`)
+and attributes in lower camel case (`owningUser`); references to other
+entities are objects with the type and the `globalId` of the referenced
+entity, e.g. `{"type": "IfcOwnerHistory", "ref": "..."}`.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+from typing import NamedTuple
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "IFC_JSON_ENTITIES",
+    "IFC_JSON_TYPES",
+    "IfcJsonEntity",
+]
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcJsonEntity(NamedTuple):
+    """
+    ifcJSON Entity Class
+    ====================
+
+    The ifcJSON spelling of an entity type.
+
+    Attributes:
+        entity_type (str): The entity type, e.g. `IfcOwnerHistory`.
+        attributes (tuple): The attribute names, in schema order.
+
+    """
+
+    entity_type: str
+    attributes: tuple[str, ...]
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+_REPRESENTATION = (
+    "contextOfItems",
+    "representationIdentifier",
+    "representationType",
+    "items",
+)
+
+_PRODUCT = (
+    "globalId",
+    "ownerHistory",
+    "name",
+    "description",
+    "objectType",
+    "objectPlacement",
+    "representation",
+)
+
+# Subtypes of `IfcProduct` read with the attributes of `IfcProduct`
+_PRODUCT_TYPES = (
+    "IfcBeam",
+    "IfcBuilding",
+    "IfcBuildingStorey",
+    "IfcColumn",
+    "IfcCovering",
+    "IfcCurtainWall",
+    "IfcDoor",
+    "IfcFooting",
+    "IfcFurnishingElement",
+    "IfcMember",
+    "IfcPile",
+    "IfcPlate",
+    "IfcRailing",
+    "IfcRamp",
+    "IfcRoof",
+    "IfcSite",
+    "IfcSlab",
+    "IfcSpace",
+    "IfcStair",
+    "IfcWall",
+    "IfcWallStandardCase",
+    "IfcWindow",
+)
+
+# Upper-case IFC-SPF entity type to ifcJSON entity
+IFC_JSON_ENTITIES: dict[str, IfcJsonEntity] = {
+    "IFCPERSON": IfcJsonEntity("IfcPerson", (
+        "identification",
+        "familyName",
+        "givenName",
+        "middleNames",
+        "prefixTitles",
+        "suffixTitles",
+        "roles",
+        "addresses",
+    )),
+    "IFCORGANIZATION": IfcJsonEntity("IfcOrganization", (
+        "identification",
+        "name",
+        "description",
+        "roles",
+        "addresses",
+    )),
+    "IFCPERSONANDORGANIZATION": IfcJsonEntity("IfcPersonAndOrganization", (
+        "thePerson",
+        "theOrganization",
+        "roles",
+    )),
+    "IFCAPPLICATION": IfcJsonEntity("IfcApplication", (
+        "applicationDeveloper",
+        "version",
+        "applicationFullName",
+        "applicationIdentifier",
+    )),
+    "IFCOWNERHISTORY": IfcJsonEntity("IfcOwnerHistory", (
+        "owningUser",
+        "owningApplication",
+        "state",
+        "changeAction",
+        "lastModifiedDate",
+        "lastModifyingUser",
+        "lastModifyingApplication",
+        "creationDate",
+    )),
+    "IFCSIUNIT": IfcJsonEntity("IfcSIUnit", (
+        "dimensions",
+        "unitType",
+        "prefix",
+        "name",
+    )),
+    "IFCUNITASSIGNMENT": IfcJsonEntity("IfcUnitAssignment", (
+        "units",
+    )),
+    "IFCREPRESENTATIONCONTEXT": IfcJsonEntity("IfcRepresentationContext", (
+        "contextIdentifier",
+        "contextType",
+    )),
+    "IFCGEOMETRICREPRESENTATIONCONTEXT": IfcJsonEntity(
+        "IfcGeometricRepresentationContext",
+        (
+            "contextIdentifier",
+            "contextType",
+            "coordinateSpaceDimension",
+            "precision",
+            "worldCoordinateSystem",
+            "trueNorth",
+        ),
+    ),
+    "IFCREPRESENTATION": IfcJsonEntity("IfcRepresentation", _REPRESENTATION),
+    "IFCSHAPEREPRESENTATION": IfcJsonEntity(
+        "IfcShapeRepresentation",
+        _REPRESENTATION,
+    ),
+    "IFCPRODUCTDEFINITIONSHAPE": IfcJsonEntity("IfcProductDefinitionShape", (
+        "name",
+        "description",
+        "representations",
+    )),
+    "IFCDIRECTION": IfcJsonEntity("IfcDirection", (
+        "directionRatios",
+    )),
+    "IFCAXIS2PLACEMENT3D": IfcJsonEntity("IfcAxis2Placement3D", (
+        "location",
+        "axis",
+        "refDirection",
+    )),
+    "IFCLOCALPLACEMENT": IfcJsonEntity("IfcLocalPlacement", (
+        "placementRelTo",
+        "relativePlacement",
+    )),
+    "IFCPROJECT": IfcJsonEntity("IfcProject", (
+        "globalId",
+        "ownerHistory",
+        "name",
+        "description",
+        "objectType",
+        "longName",
+        "phase",
+        "representationContexts",
+        "unitsInContext",
+    )),
+    "IFCCARTESIANPOINT": IfcJsonEntity("IfcCartesianPoint", (
+        "coordinates",
+    )),
+    "IFCCARTESIANPOINTLIST2D": IfcJsonEntity("IfcCartesianPointList2D", (
+        "coordList",
+    )),
+    "IFCCARTESIANPOINTLIST3D": IfcJsonEntity("IfcCartesianPointList3D", (
+        "coordList",
+    )),
+    "IFCINDEXEDPOLYCURVE": IfcJsonEntity("IfcIndexedPolyCurve", (
+        "points",
+        "segments",
+        "selfIntersect",
+    )),
+    "IFCTRIANGULATEDFACESET": IfcJsonEntity("IfcTriangulatedFaceSet", (
+        "coordinates",
+        "normals",
+        "closed",
+        "coordIndex",
+        "pnIndex",
+    )),
+    "IFCPOLYLINE": IfcJsonEntity("IfcPolyline", (
+        "points",
+    )),
+    "IFCGRIDAXIS": IfcJsonEntity("IfcGridAxis", (
+        "axisTag",
+        "axisCurve",
+        "sameSense",
+    )),
+    "IFCGRID": IfcJsonEntity("IfcGrid", (
+        *_PRODUCT,
+        "uAxes",
+        "vAxes",
+        "wAxes",
+        "predefinedType",
+    )),
+    "IFCBUILDINGELEMENTPROXY": IfcJsonEntity("IfcBuildingElementProxy", (
+        *_PRODUCT,
+        "tag",
+        "predefinedType",
+    )),
+    "IFCRELAGGREGATES": IfcJsonEntity("IfcRelAggregates", (
+        "globalId",
+        "ownerHistory",
+        "name",
+        "description",
+        "relatingObject",
+        "relatedObjects",
+    )),
+    "IFCRELCONTAINEDINSPATIALSTRUCTURE": IfcJsonEntity(
+        "IfcRelContainedInSpatialStructure",
+        (
+            "globalId",
+            "ownerHistory",
+            "name",
+            "description",
+            "relatedElements",
+            "relatingStructure",
+        ),
+    ),
+    **{
+        entity_type.upper(): IfcJsonEntity(entity_type, _PRODUCT)
+        for entity_type in _PRODUCT_TYPES
+    },
+}
+
+# The defined types written with their type in select attributes, as
+# `{"type": "IfcLineIndex", "value": [1, 2]}`
+IFC_JSON_TYPES: dict[str, str] = {
+    "IFCARCINDEX": "IfcArcIndex",
+    "IFCLINEINDEX": "IfcLineIndex",
+}
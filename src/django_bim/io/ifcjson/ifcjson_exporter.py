@@ -0,0 +1,399 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides ifcJSON Exporter Class
+===============================
+
+This module writes an `IfcProjectModel` and the rows reachable from it as
+ifcJSON, for web clients.
+
+The rows are selected and converted by the `StepEntityWriter` of the
+IFC-SPF exporter, so both formats export the same entities, and streamed
+the same way: every entity type is read with a single `values()` query
+consumed through `iterator(chunk_size=...)`, and every entity is encoded
+on a line of its own as soon as its row arrives. A client can decode the
+entities line by line while the rest of the project is still being
+serialised, either as:
+- an ifcJSON document, whose `data` array holds one entity per line,
+- newline-delimited JSON (`lines=True`), one entity per line and nothing
+  else.
+
+Entities are identified by their `globalId`: rooted entities by their
+own, the others by a UUID made of a name-based UUID of their writer key
+(their model, or their model and name for derived entities) and of their
+primary key in the last 12 hexadecimal digits, which is stable across
+exports of the same database. Derived attributes (`*` in IFC-SPF) are left
+out. References are written as
+`{"type": ..., "ref": globalId}` objects; the global ids of referenced
+rooted rows are joined into the `values()` query of the referencing rows.
+
+The lines can be written to a file-like object with `export_ifcjson`, or
+served with `export_ifcjson_response` as a `StreamingHttpResponse`.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import uuid
+from typing import IO, Any, Iterator, Optional
+
+# Import | Libraries
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.http import content_disposition_header
+
+# Import | Local Modules
+from ...models.ifc.model_ifc_root import IfcRootModel
+from ..step.step_encoder import DERIVED, StepTyped
+from ..step.step_exporter import DEFAULT_EXPORT_CHUNK_SIZE
+from ..step.step_writers import (
+    STEP_ENTITY_WRITERS,
+    StepEntityWriter,
+    WriterKey,
+    key_model,
+)
+from .ifcjson_encoder import encode_json
+from .ifcjson_entities import IFC_JSON_ENTITIES, IFC_JSON_TYPES
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "IfcJsonExporter",
+    "export_ifcjson",
+    "export_ifcjson_response",
+]
+
+IFC_JSON_VERSION = "0.0.1"
+
+# Namespace of the UUIDs identifying the rows of models without `global_id`
+IFC_JSON_NAMESPACE = uuid.uuid5(
+    uuid.NAMESPACE_URL, "https://www.djangobim.com/ifcjson",
+)
+
+# Lines are joined into blocks of about this many characters before they are
+# written, which keeps the number of `write()` calls and response chunks low
+_BLOCK_SIZE = 1 << 16
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcJsonExporter:
+    """
+    ifcJSON Exporter Class
+    ======================
+
+    Streams a project and the rows reachable from it as ifcJSON lines.
+
+    Attributes:
+        project (IfcProjectModel): The exported project.
+        chunk_size (int): Number of rows fetched per database round trip.
+        writers (tuple): The `StepEntityWriter` of every exported entity
+            type, in output order.
+        schema (str): The schema identifier written to the document.
+        using (str): The database alias to read from, defaulting to the
+            one the project was loaded from.
+        lines (bool): Whether to write newline-delimited JSON instead of
+            an ifcJSON document.
+        entities (int): Number of entities written so far.
+
+    """
+
+    def __init__(
+        self,
+        project: Any,
+        chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+        writers: Optional[tuple[StepEntityWriter, ...]] = None,
+        schema: str = "IFC4",
+        using: Optional[str] = None,
+        lines: bool = False,
+    ) -> None:
+        """
+        Initialise the exporter.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        self.project = project
+        self.chunk_size = chunk_size
+        self.writers = writers or STEP_ENTITY_WRITERS
+        self.schema = schema
+        self.using = using or project._state.db
+        self.lines = lines
+        self.entities = 0
+        # The ifcJSON type of the references to the rows of each writer key,
+        # the UUID prefix of the rows of keys without `global_id`, and the
+        # global ids of the rooted rows the current row references
+        self._types: dict[WriterKey, str] = {}
+        self._prefixes: dict[WriterKey, str] = {}
+        self._global_ids: dict[tuple[type, int], str] = {}
+
+    # Class | Public Methods
+    # =========================================================================
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Yield the lines of the file.
+
+        Yields:
+            str: One line per entity, and the opening and closing lines of
+                the document.
+        """
+        self._types = {}
+        for writer in self.writers:
+            self._types.setdefault(
+                writer.key,
+                IFC_JSON_ENTITIES[writer.entity_type].entity_type,
+            )
+        if self.lines:
+            for value in self._entities():
+                yield encode_json(value) + "\n"
+            return
+        yield self._header()
+        # Every entity but the last is followed by a comma
+        pending = None
+        for value in self._entities():
+            if pending is not None:
+                yield pending + ",\n"
+            pending = encode_json(value)
+        if pending is not None:
+            yield pending + "\n"
+        yield "]}\n"
+
+    def iter_blocks(self, size: int = _BLOCK_SIZE) -> Iterator[str]:
+        """
+        Yield the file in blocks of whole lines.
+
+        Parameters:
+            size (int): Approximate number of characters per block.
+
+        Yields:
+            str: Consecutive blocks of lines.
+        """
+        block: list[str] = []
+        length = 0
+        for line in self.iter_lines():
+            block.append(line)
+            length += len(line)
+            if length >= size:
+                yield "".join(block)
+                block.clear()
+                length = 0
+        if block:
+            yield "".join(block)
+
+    def reference(
+        self,
+        key: WriterKey,
+        pk: Optional[int],
+    ) -> Optional[dict[str, str]]:
+        """
+        Return the reference to a row, or `None` for a null foreign key or
+        a model that is not exported.
+
+        Parameters:
+            key (WriterKey): The model of the row, or `(model, name)` for
+                an entity derived from it.
+            pk (int): The primary key of the row.
+
+        Returns:
+            dict: The `type` and `ref` of the reference to write.
+        """
+        if pk is None:
+            return None
+        entity_type = self._types.get(key)
+        if entity_type is None:
+            return None
+        return {"type": entity_type, "ref": self.global_id(key, pk)}
+
+    def global_id(self, key: WriterKey, pk: int) -> str:
+        """
+        Return the `globalId` identifying a row.
+
+        Parameters:
+            key (WriterKey): The model of the row, or `(model, name)` for
+                an entity derived from it.
+            pk (int): The primary key of the row.
+
+        Returns:
+            str: The `global_id` of a rooted row, or the UUID derived from
+                the key and primary key of another row.
+        """
+        model = key_model(key)
+        prefix = self._prefixes.get(key)
+        if prefix is None and (
+            isinstance(key, tuple) or not issubclass(model, IfcRootModel)
+        ):
+            name = model._meta.label
+            if isinstance(key, tuple):
+                name = f"{name}.{key[1]}"
+            prefix = str(uuid.uuid5(IFC_JSON_NAMESPACE, name))
+            prefix = self._prefixes[key] = prefix[:24]
+        if prefix is not None:
+            return f"{prefix}{pk:012x}"
+        global_id = self._global_ids.get((model, pk))
+        if global_id is None:
+            # Only references that are not joined into the row, e.g. of
+            # custom writers, are looked up one by one
+            global_id = model._default_manager.using(self.using).filter(
+                pk=pk,
+            ).values_list("global_id", flat=True).first()
+            self._global_ids[model, pk] = global_id
+        return global_id
+
+    # Class | Helpers
+    # =========================================================================
+
+    def _entities(self) -> Iterator[dict[str, Any]]:
+        """
+        Yield the entities as JSON objects, writer by writer.
+        """
+        resolve = self.reference
+        for writer in self.writers:
+            entity = IFC_JSON_ENTITIES[writer.entity_type]
+            identified = "globalId" in entity.attributes
+            joins = _global_id_joins(writer)
+            for row in writer.rows(
+                self.project,
+                self.using,
+                self.chunk_size,
+                tuple(column for _, column in joins.values()),
+            ):
+                self._global_ids = {
+                    (model, row[column]): row[joined]
+                    for column, (model, joined) in joins.items()
+                    if row[column] is not None
+                }
+                value = {"type": entity.entity_type}
+                if not identified:
+                    value["globalId"] = self.global_id(writer.key, row["pk"])
+                for name, argument in zip(
+                    entity.attributes,
+                    writer.build_arguments(row, resolve),
+                ):
+                    if argument is not None and argument is not DERIVED:
+                        value[name] = _typed(argument)
+                self.entities += 1
+                yield value
+
+    def _header(self) -> str:
+        """
+        Return the opening line of the document, up to its `data` array.
+        """
+        header = encode_json({
+            "type": "ifcJSON",
+            "version": IFC_JSON_VERSION,
+            "schemaIdentifier": self.schema,
+            "originatingSystem": "django-bim",
+            "preprocessorVersion": "django-bim",
+            "timeStamp": timezone.now().replace(microsecond=0).isoformat(),
+        })
+        return header[:-1] + ',"data":[\n'
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def _global_id_joins(writer: StepEntityWriter) -> dict[str, tuple[type, str]]:
+    """
+    Return the rooted model and the joined `global_id` column of each
+    column of a writer holding the primary key of a rooted row: its own
+    primary key, and its foreign keys to rooted models.
+    """
+    model = key_model(writer.key)
+    joins = {}
+    if issubclass(model, IfcRootModel):
+        joins["pk"] = (model, "global_id")
+    for field in writer.model._meta.concrete_fields:
+        if (
+            field.many_to_one
+            and field.attname in writer.columns
+            and issubclass(field.related_model, IfcRootModel)
+        ):
+            joins[field.attname] = (
+                field.related_model,
+                f"{field.name}__global_id",
+            )
+    return joins
+
+
+def _typed(value: Any) -> Any:
+    """
+    Write the `StepTyped` values of a list as ifcJSON typed values, e.g.
+    the segments of an `IfcIndexedPolyCurve`.
+    """
+    if isinstance(value, list) and value and isinstance(value[0], StepTyped):
+        return [
+            {"type": IFC_JSON_TYPES[item.type_name], "value": item.value}
+            for item in value
+        ]
+    return value
+
+
+def export_ifcjson(
+    project: Any,
+    stream: IO[str],
+    **options: Any,
+) -> int:
+    """
+    Write a project as an ifcJSON file.
+
+    Parameters:
+        project (IfcProjectModel): The project to export.
+        stream (IO[str]): A text file-like object to write to.
+        **options: Forwarded to `IfcJsonExporter`.
+
+    Returns:
+        int: Number of entities written.
+    """
+    exporter = IfcJsonExporter(project, **options)
+    for block in exporter.iter_blocks():
+        stream.write(block)
+    return exporter.entities
+
+
+def export_ifcjson_response(
+    project: Any,
+    filename: Optional[str] = None,
+    **options: Any,
+) -> StreamingHttpResponse:
+    """
+    Serve a project as an ifcJSON download, which clients can decode line
+    by line while it streams.
+
+    Parameters:
+        project (IfcProjectModel): The project to export.
+        filename (str): The download file name, defaulting to the project
+            name.
+        **options: Forwarded to `IfcJsonExporter`.
+
+    Returns:
+        StreamingHttpResponse: The response streaming the file.
+    """
+    exporter = IfcJsonExporter(project, **options)
+    if exporter.lines:
+        extension, content_type = "ndjson", "application/x-ndjson"
+    else:
+        extension, content_type = "json", "application/json"
+    filename = filename or f"{project.name or 'project'}.{extension}"
+    response = StreamingHttpResponse(
+        exporter.iter_blocks(),
+        content_type=content_type,
+    )
+    response["Content-Disposition"] = content_disposition_header(
+        True, filename,
+    )
+    return response
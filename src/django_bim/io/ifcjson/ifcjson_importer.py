@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides ifcJSON Importer Class
+===============================
+
+This module loads an ifcJSON file into the `models/ifc` tables.
+
+`IfcJsonImporter` is a `StepImporter` reading its entities from
+`iter_ifcjson_objects` instead of the DATA section of an IFC-SPF file, so
+both formats share the passes, the batched `bulk_create` and `bulk_update`
+writes, the interning of owner histories and the incremental imports.
+
+Every ifcJSON object of a type with a builder becomes a `StepEntity` whose
+arguments are the attribute values in schema order (see
+`IFC_JSON_ENTITIES`), with references turned into `StepReference` values:
+- entities are numbered by `globalId` in order of first appearance, so
+  references to entities further down the file resolve like forward
+  `#id` references,
+- entities nested inline in another one, without a `globalId`, are
+  numbered by their position in the file and read before the entity
+  holding them.
+
+The numbers of the `globalId` values read are kept in memory for the
+duration of the import, as the `#id` index is for IFC-SPF files.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import copy
+import itertools
+import os
+from typing import Any, Iterator, Optional, Union
+
+# Import | Libraries
+
+# Import | Local Modules
+from ...models.ifc.geometry.model_ifc_cartesian_point_list import pack_points
+from ..step.step_builders import STEP_ENTITY_BUILDERS, StepEntityBuilder
+from ..step.step_importer import StepImporter, StepImportResult
+from ..step.step_encoder import StepTyped
+from ..step.step_parser import (
+    StepCoordinateList,
+    StepReference,
+    parse_step_coordinate_list,
+    parse_step_indexed_segments,
+)
+from ..step.step_reader import StepEntity
+from .ifcjson_entities import IFC_JSON_ENTITIES, IFC_JSON_TYPES
+from .ifcjson_reader import IfcJsonParseError, iter_ifcjson_objects
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "IFC_JSON_BUILDERS",
+    "IfcJsonImporter",
+    "import_ifcjson",
+]
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def import_ifcjson(
+    path: Union[str, os.PathLike],
+    **options: Any,
+) -> StepImportResult:
+    """
+    Import an ifcJSON file into the `models/ifc` tables.
+
+    Parameters:
+        path (str | PathLike): Path to the `.json` or `.ndjson` file.
+        **options: Forwarded to `IfcJsonImporter`.
+
+    Returns:
+        StepImportResult: The import statistics.
+    """
+    return IfcJsonImporter(path, **options).run()
+
+
+# Functions | Helpers
+# =============================================================================
+
+def _arguments(arguments: list[Any], attributes: Any = None) -> list[Any]:
+    """
+    Return the attribute values of an entity, which the reader decoded
+    already.
+    """
+    return arguments
+
+
+def _coordinate_list(
+    arguments: list[Any],
+    attributes: Any = None,
+) -> list[Any]:
+    """
+    Pack the `coordList` of an `IfcCartesianPointList2D` / `3D` like
+    `parse_step_coordinate_list` does.
+    """
+    points = arguments[0] or []
+    dimensions = len(points[0]) if points else 3
+    try:
+        coordinates = pack_points(points)
+    except TypeError as error:
+        raise IfcJsonParseError(f"Invalid coordinate: {error}") from None
+    if len(coordinates) != 8 * dimensions * len(points):
+        raise IfcJsonParseError(
+            f"Expected {len(points)} tuples of {dimensions} coordinates."
+        )
+    return [
+        StepCoordinateList(dimensions, len(points), coordinates),
+        *arguments[1:],
+    ]
+
+
+def _indexed_segments(
+    arguments: list[Any],
+    attributes: Any = None,
+) -> list[Any]:
+    """
+    Store the typed `segments` of an `IfcIndexedPolyCurve` as `[kind,
+    indices]` pairs like `parse_step_indexed_segments` does.
+    """
+    if len(arguments) > 1 and isinstance(arguments[1], list):
+        arguments[1] = [
+            [segment.type_name[3:-5], segment.value]
+            for segment in arguments[1]
+            if isinstance(segment, StepTyped)
+        ]
+    return arguments
+
+
+def _ifcjson_builder(builder: StepEntityBuilder) -> StepEntityBuilder:
+    """
+    Return a copy of an IFC-SPF builder reading decoded ifcJSON arguments.
+    """
+    builder = copy.copy(builder)
+    if builder.parser is parse_step_coordinate_list:
+        builder.parser = _coordinate_list
+    elif builder.parser is parse_step_indexed_segments:
+        builder.parser = _indexed_segments
+    else:
+        builder.parser = _arguments
+    return builder
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcJsonImporter(StepImporter):
+    """
+    ifcJSON Importer Class
+    ======================
+
+    Imports an ifcJSON document, JSON array or newline-delimited JSON file
+    into the `models/ifc` tables, see `StepImporter`.
+
+    Attributes:
+        path (str | PathLike): Path to the `.json` or `.ndjson` file.
+        builders (dict): Entity type to `StepEntityBuilder` mapping, by
+            default `IFC_JSON_BUILDERS`.
+
+    Raises:
+        ValueError: If more than one worker is requested; ifcJSON files
+            are read by the importing process.
+
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        **options: Any,
+    ) -> None:
+        """
+        Initialise the importer.
+        """
+        if options.get("workers", 1) > 1:
+            raise ValueError("ifcJSON files are read by a single process.")
+        options.setdefault("builders", IFC_JSON_BUILDERS)
+        super().__init__(path, **options)
+        self._numbers: dict[str, int] = {}
+
+    # Class | Passes
+    # =========================================================================
+
+    def _entities(
+        self,
+        entity_types: frozenset[bytes],
+    ) -> Iterator[StepEntity]:
+        """
+        Stream the entities of the given types from the file, in file order,
+        the entities nested inline before the entity holding them.
+        """
+        wanted = {entity_type.decode("ascii") for entity_type in entity_types}
+        inline = itertools.count(1)
+        for value in iter_ifcjson_objects(self.path):
+            if not isinstance(value, dict):
+                continue
+            entities: list[StepEntity] = []
+            self._entity(value, wanted, inline, entities)
+            yield from entities
+
+    # Class | Helpers
+    # =========================================================================
+
+    def _arguments(
+        self,
+        entity: StepEntity,
+        attributes: Optional[frozenset[int]],
+    ) -> list[Any]:
+        """
+        Return the attribute values of an entity, which `_entity` decoded
+        already.
+        """
+        return entity.arguments
+
+    def _number(self, global_id: str) -> int:
+        """
+        Return the number standing for the `#id` of an entity.
+        """
+        number = self._numbers.get(global_id)
+        if number is None:
+            number = len(self._numbers) + 1
+            self._numbers[global_id] = number
+        return number
+
+    def _entity(
+        self,
+        value: dict[str, Any],
+        wanted: set[str],
+        inline: Iterator[int],
+        entities: list[StepEntity],
+    ) -> Optional[int]:
+        """
+        Convert an ifcJSON object, and the objects nested in it, to entities
+        appended to `entities`, returning its number, or `None` if it has
+        no known type.
+        """
+        entity_type = str(value.get("type", "")).upper()
+        schema = IFC_JSON_ENTITIES.get(entity_type)
+        if schema is None:
+            return None
+        global_id = value.get("globalId") or f"#{next(inline)}"
+        number = self._number(global_id)
+        arguments = [
+            self._argument(value.get(name), wanted, inline, entities)
+            for name in schema.attributes
+        ]
+        if entity_type in wanted:
+            entities.append(StepEntity(number, entity_type, arguments))
+        return number
+
+    def _argument(
+        self,
+        value: Any,
+        wanted: set[str],
+        inline: Iterator[int],
+        entities: list[StepEntity],
+    ) -> Any:
+        """
+        Convert an attribute value, replacing references and nested
+        objects with `StepReference` values.
+        """
+        if isinstance(value, dict):
+            type_name = str(value.get("type", "")).upper()
+            if type_name in IFC_JSON_TYPES:
+                return StepTyped(type_name, value.get("value"))
+            global_id = value.get("ref")
+            if global_id is not None:
+                return StepReference(self._number(global_id))
+            number = self._entity(value, wanted, inline, entities)
+            return None if number is None else StepReference(number)
+        # Lists are homogeneous: lists of values, e.g. coordinates, are
+        # kept as they are
+        if isinstance(value, list) and value and isinstance(value[0], dict):
+            references = (
+                self._argument(item, wanted, inline, entities)
+                for item in value
+            )
+            return [
+                reference for reference in references
+                if reference is not None
+            ]
+        return value
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+# The builders of `STEP_ENTITY_BUILDERS`, reading ifcJSON arguments
+IFC_JSON_BUILDERS: dict[str, StepEntityBuilder] = {
+    entity_type: _ifcjson_builder(builder)
+    for entity_type, builder in STEP_ENTITY_BUILDERS.items()
+}
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides ifcJSON Reader Functions
+=================================
+
+This module streams the entity objects of an ifcJSON file without decoding
+the file as a whole.
+
+Three layouts are read:
+- an ifcJSON document, `{"type": "ifcJSON", ..., "data": [...]}`, whose
+  `data` array holds the entities,
+- a bare JSON array of entities,
+- newline-delimited JSON, one entity per line.
+
+The file is memory-mapped like IFC-SPF files (see `step_reader`) and
+scanned for the structural characters only, with compiled bytes patterns,
+to find where each entity object starts and ends; every object is then
+decoded on its own with `decode_json`. Objects written on a line of their
+own, as `IfcJsonExporter` writes them, are decoded straight from the line,
+so the scan only walks the objects of pretty-printed files; a document
+written on a single line is decoded at once.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import mmap
+import os
+import re
+from typing import Any, Iterator, Optional, Union
+
+# Import | Libraries
+
+# Import | Local Modules
+from .ifcjson_encoder import decode_json
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "IfcJsonParseError",
+    "iter_ifcjson_objects",
+]
+
+_TOKEN_PATTERN = re.compile(rb'[{}\[\]"]')
+
+# The closing quote of a string, skipping escaped characters
+_STRING_END_PATTERN = re.compile(rb'\\.|"', re.S)
+
+# The start of the value of the `data` key of a document
+_DATA_ARRAY_PATTERN = re.compile(rb"\s*:\s*\[")
+
+_DATA_KEY = b"data"
+
+_QUOTE, _OPEN_BRACE, _OPEN_BRACKET = b'"{['
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcJsonParseError(ValueError):
+    """
+    ifcJSON Parse Error Class
+    =========================
+
+    Raised when a file is not a well-formed ifcJSON document, array or
+    newline-delimited JSON stream.
+
+    """
+
+
+class _EntityScanner:
+    """
+    Finds the values at the depth of the entities of a document, array or
+    stream of values, one structural character at a time.
+    """
+
+    def __init__(self, buffer: mmap.mmap) -> None:
+        """
+        Start scanning at the beginning of the buffer.
+        """
+        self.buffer = buffer
+        self.depth = 0
+        # The depth of the entities: 0 for a stream, 1 for an array, 2 for
+        # the `data` array of a document, -1 once that array is closed
+        self.level = 0
+        # The offset of the entity being scanned, or -1
+        self.start = -1
+        self.items = 0
+        self.position = 0
+
+    def scan(self) -> Iterator[Any]:
+        """
+        Yield the decoded entities.
+        """
+        search = _TOKEN_PATTERN.search
+        buffer = self.buffer
+        while True:
+            match = search(buffer, self.position)
+            if match is None:
+                break
+            offset = match.start()
+            token = buffer[offset]
+            self.position = offset + 1
+            if token == _QUOTE:
+                self.position = _string_end(buffer, self.position)
+                # A key of the document itself may open its `data` array
+                if self.depth == 1 and self.level == 0 and not self.items:
+                    self._enter_data(offset)
+            elif token == _OPEN_BRACE or token == _OPEN_BRACKET:
+                values = self._open(offset, token)
+                if values:
+                    yield from values
+            else:
+                value = self._close(token)
+                if value is not None:
+                    yield value
+        if self.depth or self.start >= 0:
+            raise IfcJsonParseError("The file ends inside a JSON value.")
+
+    def _enter_data(self, offset: int) -> None:
+        """
+        Enter the `data` array of a document if the string at an offset is
+        its key.
+        """
+        end = self.position
+        if self.buffer[offset + 1:end - 1] != _DATA_KEY:
+            return
+        array = _DATA_ARRAY_PATTERN.match(self.buffer, end)
+        if array is not None:
+            self.level = self.depth = 2
+            self.start = -1
+            self.position = array.end()
+
+    def _open(self, offset: int, token: int) -> Optional[list]:
+        """
+        Enter an object or array, returning the entities it holds at once
+        if it is written on a line of its own.
+        """
+        if self.depth == self.level:
+            if self.depth == 0 and token == _OPEN_BRACKET:
+                self.level = self.depth = 1
+                return None
+            line = _line(self.buffer, offset)
+            if line is not None:
+                value, self.position = line
+                self.items += 1
+                if self.level == 0 and self.items == 1 and _is_document(value):
+                    return value["data"]
+                return [value]
+            self.start = offset
+        self.depth += 1
+        return None
+
+    def _close(self, token: int) -> Any:
+        """
+        Leave an object or array, returning it if it is an entity.
+        """
+        if self.depth == 0:
+            raise IfcJsonParseError(f"Unexpected {chr(token)!r}.")
+        self.depth -= 1
+        if self.depth == self.level and self.start >= 0:
+            try:
+                value = decode_json(self.buffer[self.start:self.position])
+            except ValueError as error:
+                raise IfcJsonParseError(str(error)) from None
+            self.start = -1
+            self.items += 1
+            return value
+        if self.depth < self.level:
+            # The array of the entities is closed, e.g. followed by
+            # further keys of the document
+            self.level = -1
+        return None
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def iter_ifcjson_objects(path: Union[str, os.PathLike]) -> Iterator[Any]:
+    """
+    Stream the entity objects of an ifcJSON file.
+
+    Parameters:
+        path (str | PathLike): Path to the `.json` or `.ndjson` file.
+
+    Yields:
+        Any: The decoded entities, usually dictionaries, in file order.
+            Scalar items of the `data` array are skipped.
+
+    Raises:
+        IfcJsonParseError: If the file ends inside a value, or an entity
+            is not valid JSON.
+    """
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            raise ValueError(f"{os.fspath(path)} is empty.")
+        buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        yield from _EntityScanner(buffer).scan()
+    finally:
+        buffer.close()
+
+
+# Functions | Helpers
+# =============================================================================
+
+def _string_end(buffer: mmap.mmap, position: int) -> int:
+    """
+    Return the offset following the closing quote of a string.
+    """
+    while True:
+        match = _STRING_END_PATTERN.search(buffer, position)
+        if match is None:
+            raise IfcJsonParseError("The file ends inside a JSON string.")
+        position = match.end()
+        if buffer[match.start()] == _QUOTE:
+            return position
+
+
+def _line(buffer: mmap.mmap, offset: int) -> Optional[tuple[Any, int]]:
+    """
+    Decode a value written on a line of its own, followed by an optional
+    comma, returning it with the offset of the end of the line, or `None`
+    if the value spans several lines or shares its line.
+    """
+    end = buffer.find(b"\n", offset)
+    if end < 0:
+        end = len(buffer)
+    line = buffer[offset:end].rstrip()
+    if line.endswith(b","):
+        line = line[:-1]
+    try:
+        value = decode_json(line)
+    except ValueError:
+        return None
+    if not isinstance(value, (dict, list)):
+        return None
+    return value, end
+
+
+def _is_document(value: Any) -> bool:
+    """
+    Whether a decoded value is a whole ifcJSON document.
+    """
+    return isinstance(value, dict) and isinstance(value.get("data"), list)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM IFC STEP Module
+==========================
+
+This module reads IFC-SPF (ISO 10303-21, "STEP") files into the
+`models/ifc` tables and writes projects back out as IFC-SPF files.
+
+Available Functions:
+- iter_step_entities: Streams the entity instances of the DATA section.
+- split_step_data: Splits the DATA section into byte ranges for parallel
+  parsing.
+- parse_step_arguments: Decodes the parameter list of an entity instance.
+- import_step: Imports a file through a `StepImporter`.
+- export_project: Writes a project to a file-like object through a
+  `StepExporter`.
+- export_project_response: Serves a project as a `StreamingHttpResponse`.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Local Modules
+from .step_exporter import (
+    StepExporter,
+    export_project,
+    export_project_response,
+)
+from .step_importer import StepImporter, StepImportResult, import_step
+from .step_index import StepEntityIndex
+from .step_interning import StepRowInterner
+from .step_parser import (
+    StepEnum,
+    StepParseError,
+    StepReference,
+    parse_step_arguments,
+)
+from .step_reader import StepEntity, iter_step_entities, split_step_data
+from .step_spill import StepSpill
+
+
+# =============================================================================
+# Module Level Variables
+# =============================================================================
+
+__all__ = [
+    "StepEntity",
+    "StepEntityIndex",
+    "StepEnum",
+    "StepExporter",
+    "StepImporter",
+    "StepImportResult",
+    "StepParseError",
+    "StepReference",
+    "StepRowInterner",
+    "StepSpill",
+    "export_project",
+    "export_project_response",
+    "import_step",
+    "iter_step_entities",
+    "parse_step_arguments",
+    "split_step_data",
+]
@@ -0,0 +1,701 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC STEP Entity Builder Classes
+========================================
+
+This module maps IFC-SPF entity types onto the Django models of
+`django_bim.models.ifc`. Each `StepEntityBuilder` declares, by attribute
+position in the IFC schema, which attributes become model fields and which
+entity references become foreign keys or many-to-many links, so the importer
+can create rows first and resolve `#id` references afterwards.
+
+`build_step_records` applies the builders to a stream of entities for one
+import phase. It only depends on the entity stream, so it runs unchanged in
+the importing process or in parallel worker processes.
+
+The subtypes of `IfcProduct` without a model of their own (walls, slabs,
+storeys...) are stored as `IfcProductModel` rows with the attributes of
+`IfcProduct`. The relationships of `STEP_RELATIONSHIPS` have no rows of
+their own either: the importer stores them as the `container` or `project`
+of their related products.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+from functools import partial
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+# Import | Libraries
+from django.db import models
+
+# Import | Local Modules
+from ...models.ifc.actor.model_ifc_organization import IfcOrganizationModel
+from ...models.ifc.actor.model_ifc_person import IfcPersonModel
+from ...models.ifc.actor.model_ifc_person_organization import (
+    IfcPersonAndOrganizationModel,
+)
+from ...models.ifc.geometry.model_ifc_cartesian_point import (
+    IfcCartesianPoint,
+)
+from ...models.ifc.geometry.model_ifc_cartesian_point_list import (
+    IfcCartesianPointListModel,
+    pack_points,
+)
+from ...models.ifc.geometry.model_ifc_geometry_curve_line import IfcLine
+from ...models.ifc.geometry.model_ifc_indexed_poly_curve import (
+    IfcIndexedPolyCurveModel,
+)
+from ...models.ifc.geometry.model_ifc_triangulated_face_set import (
+    IfcTriangulatedFaceSetModel,
+    pack_index_list,
+    pack_indices,
+)
+from ...models.ifc.grid.model_ifc_grid import IfcGridModel
+from ...models.ifc.grid.model_ifc_grid_axis import IfcGridAxisModel
+from ...models.ifc.model_ifc_application import IfcApplicationModel
+from ...models.ifc.model_ifc_owner_history import IfcOwnerHistoryModel
+from ...models.ifc.model_ifc_product import IfcProductModel
+from ...models.ifc.model_ifc_product_representation import (
+    IfcProductRepresentation,
+)
+from ...models.ifc.model_ifc_project import IfcProjectModel
+from ...models.ifc.model_ifc_root import IfcRootModel
+from ...models.ifc.placement.model_ifc_placement_local import (
+    IfcLocalPlacementModel,
+)
+from ...models.ifc.representation.model_ifc_representation import (
+    IfcRepresentationModel,
+)
+from ...models.ifc.representation.model_ifc_representation_context import (
+    IfcRepresentationContextModel,
+)
+from ...models.ifc.unit.model_ifc_unit_assignment import IfcUnitAssignment
+from ...models.ifc.unit.model_ifc_unit_si import IfcSIUnitModel
+from .step_parser import (
+    parse_step_arguments,
+    parse_step_coordinate_list,
+    parse_step_indexed_segments,
+)
+from .step_reader import StepEntity
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "PHASE_CREATE",
+    "PHASE_DEFERRED",
+    "PHASE_INTERNED",
+    "PHASE_LINK",
+    "STEP_ENTITY_BUILDERS",
+    "STEP_RELATIONSHIPS",
+    "StepEntityBuilder",
+    "build_step_records",
+    "step_entity_types",
+]
+
+FieldSpec = tuple[int, Optional[Callable[[Any], Any]]]
+
+# Import phases, see `build_step_records`
+PHASE_CREATE = "create"
+PHASE_DEFERRED = "deferred"
+PHASE_INTERNED = "interned"
+PHASE_LINK = "link"
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def _text(value: Any) -> Optional[str]:
+    """
+    Convert a STEP value to text, joining lists such as `MiddleNames`.
+    """
+    if isinstance(value, list):
+        return " ".join(str(item) for item in value if item is not None)
+    return str(value)
+
+
+def _enum(value: Any) -> Optional[str]:
+    """
+    Convert a STEP enumeration value to the enum member name stored in
+    `choices` fields.
+    """
+    return str(value).upper()
+
+
+def _pick_coordinate(value: Any, axis: int) -> Optional[float]:
+    """
+    Pick one axis of an `IfcCartesianPoint` coordinate list.
+    """
+    if len(value) > axis:
+        return float(value[axis])
+    return None
+
+
+def _coordinate(axis: int) -> Callable[[Any], Optional[float]]:
+    """
+    Return a (picklable) converter picking one axis of a coordinate list.
+    """
+    return partial(_pick_coordinate, axis=axis)
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class StepEntityBuilder:
+    """
+    STEP Entity Builder Class
+    =========================
+
+    Describes how one IFC entity type is persisted into a Django model.
+
+    Attributes:
+        model (type[models.Model]): The model the entity is stored in.
+        fields (dict): Model field name to `(attribute index, converter)`.
+            The converter is skipped for unset (`$`) attributes.
+        references (dict): Foreign key field name to attribute index of
+            the referenced entity.
+        many (dict): Many-to-many field name to attribute index of the list
+            of referenced entities. Reverse foreign keys of generic relation
+            tables, such as `unit_relations`, are linked the same way.
+        required (frozenset): Foreign keys that cannot be null, so the row
+            can only be created once the referenced rows exist.
+        transforms (dict): Transform field name to attribute index of the
+            referenced `IfcAxis2Placement3D`, whose matrix the importer
+            stores once the rows are linked (e.g. `relative_transform`).
+        points (int): Optional attribute index of a list of referenced
+            `IfcCartesianPoint`, whose first and last points the importer
+            stores with the `set_points` method of the model once the rows
+            are created, e.g. for polylines stored as `IfcLine`.
+        unique_field (str): Optional unique field whose values identify
+            rows across imports, such as the identifier of a person: rows
+            with a value that exists already are updated in place instead
+            of created.
+        unique_together (tuple): Optional fields whose values together
+            identify a row, kept unique by the database, such as the
+            person and organization of an `IfcPersonAndOrganization`: rows
+            with values that exist already share the existing row.
+        identifier_field (str): Optional field filled with a per-import
+            unique identifier derived from the `#id`, for models that
+            require one (e.g. `placement_id`).
+        interning_fields (tuple): Fields identifying a row, for models
+            whose identical rows are shared through a `StepRowInterner`.
+            Interned rows are created in a pass of their own, after the
+            deferred one, with all their references resolved, as the
+            references are part of the identity.
+        parser (Callable): Function decoding the parameter list, with the
+            signature of `parse_step_arguments` (the default), e.g.
+            `parse_step_coordinate_list` for coordinate lists.
+        interned (bool): Whether rows are shared, see `interning_fields`.
+        rooted (bool): Whether the model is an IfcRootModel, whose rows are
+            identified by `global_id` across imports.
+        deferred (bool): Whether rows can only be created after the
+            independent rows exist.
+        required_references (dict): The references resolved before the row
+            is created: the mandatory ones, or all of them for interned
+            rows.
+        optional_references (dict): The references linked after all rows
+            have been created.
+        create_attributes (frozenset): Attribute indices decoded when the
+            row is created.
+        link_attributes (frozenset): Attribute indices decoded when the
+            references are linked.
+        reference_attributes (frozenset): Attribute indices of all the
+            references.
+
+    """
+
+    def __init__(
+        self,
+        model: type[models.Model],
+        fields: Optional[dict[str, FieldSpec]] = None,
+        references: Optional[dict[str, int]] = None,
+        many: Optional[dict[str, int]] = None,
+        transforms: Optional[dict[str, int]] = None,
+        points: Optional[int] = None,
+        required: tuple[str, ...] = (),
+        unique_field: Optional[str] = None,
+        unique_together: tuple[str, ...] = (),
+        identifier_field: Optional[str] = None,
+        interning_fields: tuple[str, ...] = (),
+        parser: Callable[..., list[Any]] = parse_step_arguments,
+    ) -> None:
+        """
+        Initialise the builder.
+        """
+        self.model = model
+        self.fields = fields or {}
+        self.references = references or {}
+        self.many = many or {}
+        self.transforms = transforms or {}
+        self.points = points
+        self.required = frozenset(required)
+        self.unique_field = unique_field
+        self.unique_together = tuple(unique_together)
+        self.identifier_field = identifier_field
+        self.interning_fields = tuple(interning_fields)
+        self.parser = parser
+        # Rows with mandatory references are created in a deferred pass,
+        # optional references are linked once all rows exist
+        interned = bool(self.interning_fields)
+        self.interned = interned
+        self.deferred = bool(self.required) or interned
+        self.rooted = issubclass(model, IfcRootModel)
+        self.required_references = {
+            name: index
+            for name, index in self.references.items()
+            if interned or name in self.required
+        }
+        self.optional_references = {
+            name: index
+            for name, index in self.references.items()
+            if name not in self.required_references
+        }
+        # Only these attributes are decoded, see `parse_step_arguments`
+        self.create_attributes = frozenset(
+            [index for index, _ in self.fields.values()]
+            + list(self.required_references.values())
+        )
+        self.link_attributes = frozenset(
+            list(self.optional_references.values())
+            + list(self.many.values())
+        )
+        self.reference_attributes = frozenset(
+            list(self.references.values())
+            + list(self.many.values())
+        )
+
+    def build_fields(self, arguments: list[Any]) -> dict[str, Any]:
+        """
+        Return the scalar model field values for an entity.
+
+        Parameters:
+            arguments (list): The parsed attribute values.
+
+        Returns:
+            dict: Keyword arguments for the model constructor.
+        """
+        values: dict[str, Any] = {}
+        count = len(arguments)
+        for name, (index, convert) in self.fields.items():
+            value = arguments[index] if index < count else None
+            if value is not None and convert is not None:
+                value = convert(value)
+            values[name] = value
+        return values
+
+    def build_references(
+        self,
+        arguments: list[Any],
+        names: Optional[dict[str, int]] = None,
+    ) -> dict[str, Optional[int]]:
+        """
+        Return the referenced `#id` for each foreign key of an entity.
+
+        Parameters:
+            arguments (list): The parsed attribute values.
+            names (dict): The references to read, defaulting to all.
+
+        Returns:
+            dict: Foreign key field name to referenced `#id` (or `None`).
+        """
+        count = len(arguments)
+        references: dict[str, Optional[int]] = {}
+        for name, index in (names or self.references).items():
+            value = arguments[index] if index < count else None
+            references[name] = int(value) if value is not None else None
+        return references
+
+    def build_many(self, arguments: list[Any]) -> dict[str, list[int]]:
+        """
+        Return the referenced `#ids` for each many-to-many field.
+
+        Parameters:
+            arguments (list): The parsed attribute values.
+
+        Returns:
+            dict: Many-to-many field name to list of referenced `#ids`.
+        """
+        count = len(arguments)
+        return {
+            name: [int(item) for item in (arguments[index] or ())]
+            if index < count else []
+            for name, index in self.many.items()
+        }
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def build_step_records(
+    entities: Iterable[StepEntity],
+    builders: dict[str, StepEntityBuilder],
+    phase: str,
+) -> Iterator[tuple[Any, ...]]:
+    """
+    Parse the entities relevant to an import phase into plain records.
+
+    Entities without a builder are skipped without parsing their
+    parameters, and of the others only the attributes used in the phase are
+    decoded. Records only hold built-in types, so they can be sent back from
+    worker processes cheaply.
+
+    Parameters:
+        entities (Iterable[StepEntity]): The entity stream.
+        builders (dict): Entity type to `StepEntityBuilder` mapping.
+        phase (str): `PHASE_CREATE` for rows without mandatory references,
+            `PHASE_DEFERRED` for rows with mandatory references,
+            `PHASE_INTERNED` for the rows of interned builders, or
+            `PHASE_LINK` for the references linked after creation.
+
+    Yields:
+        tuple: For the create phases, `(step_id, entity_type, fields,
+            required)` where `required` maps foreign keys to `#ids`. For the
+            link phase, `(step_id, entity_type, references, many)`.
+    """
+    link = phase == PHASE_LINK
+    interned = phase == PHASE_INTERNED
+    deferred = interned or phase == PHASE_DEFERRED
+    for entity in entities:
+        builder = builders.get(entity.entity_type)
+        if builder is None:
+            continue
+        if link:
+            optional = builder.optional_references
+            if not optional and not builder.many:
+                continue
+            arguments = builder.parser(
+                entity.arguments,
+                builder.link_attributes,
+            )
+            yield (
+                entity.step_id,
+                entity.entity_type,
+                builder.build_references(arguments, optional)
+                if optional else {},
+                builder.build_many(arguments),
+            )
+        elif builder.deferred is deferred and builder.interned is interned:
+            arguments = builder.parser(
+                entity.arguments,
+                builder.create_attributes,
+            )
+            yield (
+                entity.step_id,
+                entity.entity_type,
+                builder.build_fields(arguments),
+                builder.build_references(
+                    arguments,
+                    builder.required_references,
+                ) if deferred else {},
+            )
+
+
+def step_entity_types(
+    builders: dict[str, StepEntityBuilder],
+) -> frozenset[bytes]:
+    """
+    Return the entity types handled by a set of builders, in the form
+    expected by the `entity_types` filter of `iter_step_entities`.
+
+    Parameters:
+        builders (dict): Entity type to `StepEntityBuilder` mapping.
+
+    Returns:
+        frozenset: The upper-case entity types as bytes.
+    """
+    return frozenset(entity_type.encode("ascii") for entity_type in builders)
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+_REPRESENTATION_CONTEXT = StepEntityBuilder(
+    model=IfcRepresentationContextModel,
+    fields={
+        "context_identifier": (0, _text),
+        "context_type": (1, _text),
+        "precision": (3, float),
+    },
+    transforms={
+        "world_coordinate_system": 4,
+    },
+)
+
+_REPRESENTATION = StepEntityBuilder(
+    model=IfcRepresentationModel,
+    fields={
+        "representation_identifier": (1, _text),
+        "representation_type": (2, _text),
+    },
+    references={
+        "context_of_items": 0,
+    },
+    many={
+        "item_relations": 3,
+    },
+    required=("context_of_items",),
+)
+
+# The attributes of `IfcProduct`, shared by its subtypes
+_PRODUCT_FIELDS: dict[str, FieldSpec] = {
+    "global_id": (0, _text),
+    "name": (2, _text),
+    "description": (3, _text),
+    "object_type": (4, _text),
+}
+
+_PRODUCT_REFERENCES = {
+    "owner_history": 1,
+    "object_placement": 5,
+    "representation": 6,
+}
+
+_PRODUCT = StepEntityBuilder(
+    model=IfcProductModel,
+    fields=_PRODUCT_FIELDS,
+    references=_PRODUCT_REFERENCES,
+)
+
+# Subtypes of `IfcProduct` stored as `IfcProductModel` rows
+_PRODUCT_TYPES = (
+    "IFCBEAM",
+    "IFCBUILDING",
+    "IFCBUILDINGELEMENTPROXY",
+    "IFCBUILDINGSTOREY",
+    "IFCCOLUMN",
+    "IFCCOVERING",
+    "IFCCURTAINWALL",
+    "IFCDOOR",
+    "IFCFOOTING",
+    "IFCFURNISHINGELEMENT",
+    "IFCMEMBER",
+    "IFCPILE",
+    "IFCPLATE",
+    "IFCRAILING",
+    "IFCRAMP",
+    "IFCROOF",
+    "IFCSITE",
+    "IFCSLAB",
+    "IFCSPACE",
+    "IFCSTAIR",
+    "IFCWALL",
+    "IFCWALLSTANDARDCASE",
+    "IFCWINDOW",
+)
+
+# Coordinate lists of indexed poly curves and triangulated face sets, stored
+# as one packed row per list
+_POINT_LIST = StepEntityBuilder(
+    model=IfcCartesianPointListModel,
+    fields={
+        "dimensions": (0, attrgetter("dimensions")),
+        "count": (0, attrgetter("count")),
+        "coordinates": (0, attrgetter("coordinates")),
+    },
+    parser=parse_step_coordinate_list,
+)
+
+STEP_ENTITY_BUILDERS: dict[str, StepEntityBuilder] = {
+    "IFCPERSON": StepEntityBuilder(
+        model=IfcPersonModel,
+        fields={
+            "identifier": (0, _text),
+            "family_name": (1, _text),
+            "first_name": (2, _text),
+            "middle_names": (3, _text),
+            "prefix_titles": (4, _text),
+            "suffix_titles": (5, _text),
+        },
+        unique_field="identifier",
+    ),
+    "IFCORGANIZATION": StepEntityBuilder(
+        model=IfcOrganizationModel,
+        fields={
+            "identifier": (0, _text),
+            "name": (1, _text),
+            "description": (2, _text),
+        },
+        unique_field="identifier",
+    ),
+    "IFCPERSONANDORGANIZATION": StepEntityBuilder(
+        model=IfcPersonAndOrganizationModel,
+        references={
+            "person": 0,
+            "organization": 1,
+        },
+        required=("person", "organization"),
+        unique_together=("person", "organization"),
+    ),
+    "IFCAPPLICATION": StepEntityBuilder(
+        model=IfcApplicationModel,
+        fields={
+            "version": (1, _text),
+            "application_full_name": (2, _text),
+            "application_identifier": (3, _text),
+        },
+        references={
+            "application_developer": 0,
+        },
+        unique_field="application_identifier",
+    ),
+    "IFCOWNERHISTORY": StepEntityBuilder(
+        model=IfcOwnerHistoryModel,
+        fields={
+            "state": (2, _enum),
+            "change_action": (3, _enum),
+            "last_modified_date": (4, int),
+            "creation_date": (7, int),
+        },
+        references={
+            "creation_user": 0,
+            "application": 1,
+            "modification_user": 5,
+        },
+        interning_fields=IfcOwnerHistoryModel.INTERNING_FIELDS,
+    ),
+    "IFCSIUNIT": StepEntityBuilder(
+        model=IfcSIUnitModel,
+        fields={
+            "unit_type": (1, _enum),
+            "prefix": (2, _enum),
+            "name": (3, _enum),
+        },
+    ),
+    "IFCUNITASSIGNMENT": StepEntityBuilder(
+        model=IfcUnitAssignment,
+        many={
+            "unit_relations": 0,
+        },
+    ),
+    "IFCREPRESENTATIONCONTEXT": _REPRESENTATION_CONTEXT,
+    "IFCGEOMETRICREPRESENTATIONCONTEXT": _REPRESENTATION_CONTEXT,
+    "IFCREPRESENTATION": _REPRESENTATION,
+    "IFCSHAPEREPRESENTATION": _REPRESENTATION,
+    "IFCLOCALPLACEMENT": StepEntityBuilder(
+        model=IfcLocalPlacementModel,
+        references={
+            "relative_placement": 0,
+        },
+        transforms={
+            "relative_transform": 1,
+        },
+        identifier_field="placement_id",
+    ),
+    "IFCPROJECT": StepEntityBuilder(
+        model=IfcProjectModel,
+        fields={
+            "global_id": (0, _text),
+            "name": (2, _text),
+            "description": (3, _text),
+            "long_name": (5, _text),
+            "phase": (6, _text),
+        },
+        references={
+            "owner_history": 1,
+            "units_in_context": 8,
+        },
+        many={
+            "representation_contexts": 7,
+        },
+        required=("units_in_context",),
+    ),
+    "IFCCARTESIANPOINT": StepEntityBuilder(
+        model=IfcCartesianPoint,
+        fields={
+            "x": (0, _coordinate(0)),
+            "y": (0, _coordinate(1)),
+            "z": (0, _coordinate(2)),
+        },
+    ),
+    "IFCCARTESIANPOINTLIST2D": _POINT_LIST,
+    "IFCCARTESIANPOINTLIST3D": _POINT_LIST,
+    "IFCINDEXEDPOLYCURVE": StepEntityBuilder(
+        model=IfcIndexedPolyCurveModel,
+        fields={
+            "segments": (1, None),
+            "self_intersect": (2, None),
+        },
+        references={
+            "points": 0,
+        },
+        required=("points",),
+        parser=parse_step_indexed_segments,
+    ),
+    # Indices and normals are packed like the coordinates of point lists
+    "IFCTRIANGULATEDFACESET": StepEntityBuilder(
+        model=IfcTriangulatedFaceSetModel,
+        fields={
+            "normals": (1, pack_points),
+            "closed": (2, None),
+            "face_count": (3, len),
+            "coord_index": (3, pack_indices),
+            "pn_index": (4, pack_index_list),
+        },
+        references={
+            "coordinates": 0,
+        },
+        required=("coordinates",),
+    ),
+    # Polylines are stored by their end points, like the axes of grids
+    "IFCPOLYLINE": StepEntityBuilder(
+        model=IfcLine,
+        points=0,
+    ),
+    "IFCPRODUCTDEFINITIONSHAPE": StepEntityBuilder(
+        model=IfcProductRepresentation,
+        fields={
+            "name": (0, _text),
+            "description": (1, _text),
+        },
+        many={
+            "representations": 2,
+        },
+    ),
+    "IFCGRIDAXIS": StepEntityBuilder(
+        model=IfcGridAxisModel,
+        fields={
+            "axis_tag": (0, _text),
+            "same_sense": (2, None),
+        },
+        references={
+            "axis_curve": 1,
+        },
+    ),
+    "IFCGRID": StepEntityBuilder(
+        model=IfcGridModel,
+        fields=_PRODUCT_FIELDS,
+        references=_PRODUCT_REFERENCES,
+        many={
+            "u_axes": 7,
+            "v_axes": 8,
+            "w_axes": 9,
+        },
+    ),
+    **dict.fromkeys(_PRODUCT_TYPES, _PRODUCT),
+}
+
+# Relationships stored as the containers of their related products: entity
+# type to the attribute indices of the relating object and of the list of
+# related objects
+STEP_RELATIONSHIPS: dict[str, tuple[int, int]] = {
+    "IFCRELAGGREGATES": (4, 5),
+    "IFCRELCONTAINEDINSPATIALSTRUCTURE": (5, 4),
+}
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC STEP Encoder Functions
+===================================
+
+This module is the counterpart of `step_parser`: it formats Python values as
+IFC-SPF (ISO 10303-21) parameters and entity instance lines.
+
+Mapping of Python values:
+- `None` becomes `$` (unset).
+- `DERIVED` becomes `*`, for attributes the schema derives.
+- `True` / `False` become `.T.` / `.F.`.
+- `StepReference` becomes `#123`.
+- `StepEnum` becomes `.ENUM.`.
+- `StepTyped` becomes `TYPE(value)`, e.g. `IFCLINEINDEX((1,2))`.
+- `int` and `float` become STEP integers and reals (reals always carry a
+  decimal point, e.g. `1.` or `1.5E-05`).
+- `str` becomes a quoted string, with non-ASCII characters escaped.
+- Lists and tuples become `(a,b)`.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import re
+from typing import Any, Iterable, NamedTuple
+
+# Import | Libraries
+
+# Import | Local Modules
+from .step_parser import StepEnum, StepReference
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "DERIVED",
+    "StepDerived",
+    "StepTyped",
+    "encode_step_string",
+    "format_step_entity",
+    "format_step_value",
+]
+
+# Characters that cannot appear verbatim in a STEP string literal
+_UNSAFE_PATTERN = re.compile(r"[^\x20-\x7e]+")
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class StepDerived:
+    """
+    STEP Derived Class
+    ==================
+
+    The value of an attribute redeclared as derived by a subtype, e.g. the
+    `Dimensions` of an `IfcSIUnit`, written as `*`.
+
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        """
+        Return the value in its STEP notation.
+        """
+        return "*"
+
+
+DERIVED = StepDerived()
+
+
+class StepTyped(NamedTuple):
+    """
+    STEP Typed Class
+    ================
+
+    A value of a defined type in a select attribute, written with its
+    type, e.g. `IFCLINEINDEX((1,2))` for a segment of an
+    `IfcIndexedPolyCurve`.
+
+    Attributes:
+        type_name (str): The upper-case type.
+        value (Any): The value.
+
+    """
+
+    type_name: str
+    value: Any
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def _encode_unsafe(match: re.Match) -> str:
+    """
+    Encode a run of non-printable or non-ASCII characters as `\\X2\\` (or
+    `\\X4\\` for characters beyond the Basic Multilingual Plane).
+    """
+    text = match.group(0)
+    if all(ord(character) <= 0xFFFF for character in text):
+        return "\\X2\\" + text.encode("utf-16-be").hex().upper() + "\\X0\\"
+    return "\\X4\\" + text.encode("utf-32-be").hex().upper() + "\\X0\\"
+
+
+def encode_step_string(value: str) -> str:
+    """
+    Encode a Python string as a quoted STEP string literal.
+
+    Parameters:
+        value (str): The string to encode.
+
+    Returns:
+        str: The literal including its surrounding quotes.
+    """
+    value = value.replace("\\", "\\\\").replace("'", "''")
+    return "'" + _UNSAFE_PATTERN.sub(_encode_unsafe, value) + "'"
+
+
+def _format_real(value: float) -> str:
+    """
+    Format a float as a STEP real, which requires a decimal point.
+    """
+    text = repr(value).upper()
+    mantissa, _, exponent = text.partition("E")
+    if "." not in mantissa:
+        mantissa += "."
+    elif mantissa.endswith(".0"):
+        mantissa = mantissa[:-1]
+    return f"{mantissa}E{exponent}" if exponent else mantissa
+
+
+def _format_wrapped(value: Any) -> str:
+    """
+    Format a reference, an enumeration or a typed value, which wrap the
+    integers, strings and values they stand for.
+    """
+    if isinstance(value, StepReference):
+        return f"#{int(value)}"
+    if isinstance(value, StepEnum):
+        return f".{value}."
+    return f"{value.type_name}({format_step_value(value.value)})"
+
+
+def format_step_value(value: Any) -> str:
+    """
+    Format a Python value as a STEP parameter.
+
+    Parameters:
+        value (Any): The value to format, see the module docstring.
+
+    Returns:
+        str: The STEP notation of the value.
+
+    Raises:
+        TypeError: If the value has no STEP representation.
+    """
+    if value is None:
+        return "$"
+    if value is DERIVED:
+        return "*"
+    if isinstance(value, bool):
+        return ".T." if value else ".F."
+    if isinstance(value, (StepReference, StepEnum, StepTyped)):
+        return _format_wrapped(value)
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return _format_real(value)
+    if isinstance(value, str):
+        return encode_step_string(value)
+    if isinstance(value, (list, tuple)):
+        return "(" + ",".join(format_step_value(item) for item in value) + ")"
+    raise TypeError(f"Cannot format {type(value).__name__} as STEP value.")
+
+
+def format_step_entity(
+    step_id: int,
+    entity_type: str,
+    arguments: Iterable[Any],
+) -> str:
+    """
+    Format an entity instance line, e.g. `#1=IFCPROJECT('abc',#2,$);`.
+
+    Parameters:
+        step_id (int): The instance id.
+        entity_type (str): The upper-case entity type.
+        arguments (Iterable): The attribute values, in schema order.
+
+    Returns:
+        str: The instance line, including its line break.
+    """
+    parameters = ",".join(format_step_value(value) for value in arguments)
+    return f"#{step_id}={entity_type}({parameters});\n"
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC STEP Exporter Class
+================================
+
+This module writes an `IfcProjectModel` and the rows reachable from it as an
+IFC-SPF (STEP) file.
+
+The export is streamed: every entity type is read with a single `values()`
+query consumed through `iterator(chunk_size=...)`, and lines are produced as
+the rows arrive, so memory use does not depend on the number of rows.
+
+No `#id` mapping is kept either. Before writing, the exporter reads the
+largest primary key of every exported model and reserves a block of ids per
+writer key, so the `#id` of any row, including rows that are referenced
+before they are written, is `offset(key) + pk`. Entities derived from the
+rows of a model, such as the axis placement of a local placement, have a
+key and a block of their own.
+
+The lines can be written to a file-like object with `export_project`, or
+served with `export_project_response` as a `StreamingHttpResponse`.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+from typing import IO, Any, Iterator, Optional
+
+# Import | Libraries
+from django.db.models import Max
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.http import content_disposition_header
+
+# Import | Local Modules
+from .step_encoder import format_step_entity, format_step_value
+from .step_parser import StepReference
+from .step_writers import (
+    STEP_ENTITY_WRITERS,
+    StepEntityWriter,
+    WriterKey,
+    key_model,
+)
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "StepExporter",
+    "export_project",
+    "export_project_response",
+]
+
+DEFAULT_EXPORT_CHUNK_SIZE = 2000
+
+# Lines are joined into blocks of about this many characters before they are
+# written, which keeps the number of `write()` calls and response chunks low
+_BLOCK_SIZE = 1 << 16
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class StepExporter:
+    """
+    STEP Exporter Class
+    ===================
+
+    Streams a project and the rows reachable from it as IFC-SPF lines.
+
+    Attributes:
+        project (IfcProjectModel): The exported project.
+        chunk_size (int): Number of rows fetched per database round trip.
+        writers (tuple): The `StepEntityWriter` of every exported entity
+            type, in output order.
+        schema (str): The schema identifier written to `FILE_SCHEMA`.
+        using (str): The database alias to read from, defaulting to the
+            one the project was loaded from.
+        entities (int): Number of entity instances written so far.
+
+    """
+
+    def __init__(
+        self,
+        project: Any,
+        chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+        writers: Optional[tuple[StepEntityWriter, ...]] = None,
+        schema: str = "IFC4",
+        using: Optional[str] = None,
+    ) -> None:
+        """
+        Initialise the exporter.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        self.project = project
+        self.chunk_size = chunk_size
+        self.writers = writers or STEP_ENTITY_WRITERS
+        self.schema = schema
+        self.using = using or project._state.db
+        self.entities = 0
+        self._offsets: dict[WriterKey, int] = {}
+
+    # Class | Public Methods
+    # =========================================================================
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Yield the lines of the file, header and footer included.
+
+        Yields:
+            str: One line per header entry or entity instance.
+        """
+        self._reserve_ids()
+        yield from self._header()
+        resolve = self.reference
+        for writer in self.writers:
+            entity_type = writer.entity_type
+            offset = self._offsets[writer.key]
+            for row in writer.rows(self.project, self.using, self.chunk_size):
+                self.entities += 1
+                yield format_step_entity(
+                    offset + row["pk"],
+                    entity_type,
+                    writer.build_arguments(row, resolve),
+                )
+        yield "ENDSEC;\n"
+        yield "END-ISO-10303-21;\n"
+
+    def iter_blocks(self, size: int = _BLOCK_SIZE) -> Iterator[str]:
+        """
+        Yield the file in blocks of whole lines.
+
+        Parameters:
+            size (int): Approximate number of characters per block.
+
+        Yields:
+            str: Consecutive blocks of lines.
+        """
+        block: list[str] = []
+        length = 0
+        for line in self.iter_lines():
+            block.append(line)
+            length += len(line)
+            if length >= size:
+                yield "".join(block)
+                block.clear()
+                length = 0
+        if block:
+            yield "".join(block)
+
+    def reference(
+        self,
+        key: WriterKey,
+        pk: Optional[int],
+    ) -> Optional[StepReference]:
+        """
+        Return the `#id` of a row, or `None` for a null foreign key or a
+        model that is not exported.
+
+        Parameters:
+            key (WriterKey): The model of the row, or `(model, name)` for
+                an entity derived from it.
+            pk (int): The primary key of the row.
+
+        Returns:
+            StepReference: The reference to write.
+        """
+        if pk is None:
+            return None
+        offset = self._offsets.get(key)
+        if offset is None:
+            return None
+        return StepReference(offset + pk)
+
+    # Class | Helpers
+    # =========================================================================
+
+    def _reserve_ids(self) -> None:
+        """
+        Reserve a block of `#ids` per writer key.
+        """
+        self._offsets.clear()
+        offset = 0
+        for writer in self.writers:
+            if writer.key in self._offsets:
+                continue
+            self._offsets[writer.key] = offset
+            largest = key_model(writer.key)._default_manager.using(
+                self.using,
+            ).aggregate(largest=Max("pk"))["largest"]
+            offset += largest or 0
+
+    def _header(self) -> Iterator[str]:
+        """
+        Yield the HEADER section and the start of the DATA section.
+        """
+        stamp = timezone.now().replace(microsecond=0).isoformat()
+        entries = (
+            ("FILE_DESCRIPTION", (
+                ["ViewDefinition [CoordinationView]"],
+                "2;1",
+            )),
+            ("FILE_NAME", (
+                self.project.name or "",
+                stamp,
+                [""],
+                [""],
+                "django-bim",
+                "django-bim",
+                "",
+            )),
+            ("FILE_SCHEMA", ([self.schema],)),
+        )
+        yield "ISO-10303-21;\n"
+        yield "HEADER;\n"
+        for entry, arguments in entries:
+            parameters = ",".join(
+                format_step_value(value) for value in arguments
+            )
+            yield f"{entry}({parameters});\n"
+        yield "ENDSEC;\n"
+        yield "DATA;\n"
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def export_project(
+    project: Any,
+    stream: IO[str],
+    **options: Any,
+) -> int:
+    """
+    Write a project as an IFC-SPF file.
+
+    Parameters:
+        project (IfcProjectModel): The project to export.
+        stream (IO[str]): A text file-like object to write to.
+        **options: Forwarded to `StepExporter`.
+
+    Returns:
+        int: Number of entity instances written.
+    """
+    exporter = StepExporter(project, **options)
+    for block in exporter.iter_blocks():
+        stream.write(block)
+    return exporter.entities
+
+
+def export_project_response(
+    project: Any,
+    filename: Optional[str] = None,
+    **options: Any,
+) -> StreamingHttpResponse:
+    """
+    Serve a project as an IFC-SPF file download.
+
+    Parameters:
+        project (IfcProjectModel): The project to export.
+        filename (str): The download file name, defaulting to the project
+            name.
+        **options: Forwarded to `StepExporter`.
+
+    Returns:
+        StreamingHttpResponse: The response streaming the file.
+    """
+    filename = filename or f"{project.name or 'project'}.ifc"
+    response = StreamingHttpResponse(
+        StepExporter(project, **options).iter_blocks(),
+        content_type="application/x-step",
+    )
+    response["Content-Disposition"] = content_disposition_header(
+        True, filename,
+    )
+    return response
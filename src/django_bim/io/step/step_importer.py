@@ -0,0 +1,1941 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC STEP Importer Class
+================================
+
+This module loads an IFC-SPF (STEP) file into the `models/ifc` tables.
+
+The file is memory-mapped and streamed with `iter_step_entities`, which
+skips the entity types without a builder, so memory stays flat except for
+the compact `#id` index, and rows are written with batched `bulk_create`
+and `bulk_update` calls instead of one `save()` per entity. Because STEP
+files freely reference entities that appear later in the file, the import
+runs over the file in passes:
+
+1. Create the rows of every entity without mandatory references.
+2. Create the rows whose mandatory references (e.g. the context of an
+   `IfcShapeRepresentation`) are now resolvable through the index.
+3. Link the optional foreign keys and many-to-many relations, resolving
+   every `#id` forward reference through the index.
+
+Rows of builders with `interning_fields` (the owner histories) are created
+between the second and third passes through a `StepRowInterner`, so
+entities with identical owner histories share a single row.
+
+Once the references are linked, further passes over the file store what
+has no row of its own:
+- the end points of the polylines, read from their `IfcCartesianPoint`,
+- the relationships of `STEP_RELATIONSHIPS` (`IfcRelAggregates`,
+  `IfcRelContainedInSpatialStructure`), as the `container`, or the
+  `project`, of their related products, moving the rollups of the products
+  whose container changed,
+- the axis counts and intersections of the grids, whose axes were linked
+  in bulk.
+
+The content hashes, digests and rollups of the rooted entities written by
+an import are computed last, once the world transforms of the placements
+they reference are up to date, with `update_digests()`.
+
+When the placement closure table is enabled (`DJANGO_BIM_PLACEMENT_CLOSURE`),
+the rows of the imported local placements are added once every reference
+is linked.
+
+The transforms of the local placements and the world coordinate systems of
+the contexts are read from the `IfcAxis2Placement3D` they reference, with
+its location and directions, in a last pass over the file, and the world
+transforms of the imported placements are updated with
+`IfcLocalPlacementModel.update_world_transforms`.
+
+With `workers > 1`, the create and link passes tokenise the file in a
+process pool (see `step_parallel`), started once per import, while the
+importing process merges the results into the array-backed
+`StepEntityIndex` and performs the database writes.
+
+With `incremental=True`, a new revision of a model is imported over the
+previous one, writing only what changed:
+
+1. The entities of `IfcRootModel` subclasses are matched to the existing
+   rows by `global_id` and compared by `content_hash`, for their own
+   attributes, and by `reference_hash`, for the entities they reference
+   directly or indirectly (the owner history excepted). Unchanged rows are
+   kept and only entered in the index. Only incremental imports compute
+   reference hashes, so the first incremental import over a full import
+   counts every rooted entity as modified.
+2. The entities referenced by the added and modified ones are collected,
+   following the references of the builders until no new `#id` is found.
+3. The passes above run on the added and modified entities and their
+   references only; modified rows are updated in place with `bulk_update`.
+   The rows they referenced before, e.g. their unit assignment, are
+   deleted once nothing else references them.
+4. The added and modified rows point at an owner history with the change
+   action `ADDED` or `MODIFIED`, the rows the file no longer contains at
+   one with `DELETED`, or are deleted with `purge=True`. These owner
+   histories are copies of the original ones, interned like on import.
+
+Existing rows of the imported project that are missing from the file count
+as deleted; the rows of other projects are left as they are.
+
+Note:
+    Reading the primary keys back from `bulk_create` requires a database
+    that supports `RETURNING` (PostgreSQL, SQLite 3.35+, MariaDB 10.5+).
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import contextlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Iterator, Optional, Union
+
+# Import | Libraries
+from django.apps import apps
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.db import DEFAULT_DB_ALIAS, connections, models, transaction
+
+# Import | Local Modules
+from ...enums import IfcChangeActionEnum
+from ...fields.model.field_model_ifc_guid import (
+    IfcGloballyUniqueIdField,
+    trusted_guids,
+)
+from ...models.ifc.geometry.model_ifc_geometry_curve_line import (
+    COORDINATE_FIELDS,
+    EXTENT_FIELDS,
+)
+from ...models.ifc.actor.model_ifc_organization import IfcOrganizationModel
+from ...models.ifc.actor.model_ifc_person import IfcPersonModel
+from ...models.ifc.actor.model_ifc_person_organization import (
+    IfcPersonAndOrganizationModel,
+)
+from ...models.ifc.grid.model_ifc_grid import IfcGridModel
+from ...models.ifc.grid.model_ifc_grid_intersection import (
+    IfcGridIntersectionModel,
+)
+from ...models.ifc.model_ifc_application import IfcApplicationModel
+from ...models.ifc.model_ifc_owner_history import IfcOwnerHistoryModel
+from ...models.ifc.model_ifc_product import IfcProductModel, move_products
+from ...models.ifc.model_ifc_project import IfcProjectModel
+from ...models.ifc.placement.model_ifc_placement_closure import (
+    IfcLocalPlacementClosureModel,
+)
+from ...models.ifc.placement.model_ifc_placement_local import (
+    IfcLocalPlacementModel,
+    placement_closure_enabled,
+)
+from ...utils.digest import hash_values
+from ...utils.guid import validate_many
+from ...utils.matrix import Matrix, placement_matrix
+from .step_builders import (
+    PHASE_CREATE,
+    PHASE_DEFERRED,
+    PHASE_INTERNED,
+    PHASE_LINK,
+    STEP_ENTITY_BUILDERS,
+    STEP_RELATIONSHIPS,
+    StepEntityBuilder,
+    build_step_records,
+    step_entity_types,
+)
+from .step_index import StepEntityIndex
+from .step_interning import DEFAULT_INTERNING_CACHE_SIZE, StepRowInterner
+from .step_parallel import (
+    DEFAULT_CHUNK_SIZE,
+    iter_parallel_records,
+    open_worker_pool,
+)
+from .step_parser import StepReference, parse_step_arguments
+from .step_reader import StepEntity, iter_step_entities
+from .step_spill import StepSpill
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "StepImportResult",
+    "StepImporter",
+    "import_step",
+]
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Number of values per `__in` query, below the SQLite variable limit
+_LOOKUP_BATCH_SIZE = 900
+
+# The entities read for the transforms of the builders, see `_transform_pass`
+_TRANSFORM_TYPES = frozenset([
+    b"IFCAXIS2PLACEMENT3D",
+    b"IFCCARTESIANPOINT",
+    b"IFCDIRECTION",
+])
+
+ADDED = IfcChangeActionEnum.ADDED.name
+MODIFIED = IfcChangeActionEnum.MODIFIED.name
+DELETED = IfcChangeActionEnum.DELETED.name
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class StepImportResult:
+    """
+    STEP Import Result Class
+    ========================
+
+    Statistics collected while importing an IFC-SPF file.
+
+    Attributes:
+        entities (int): Number of entity instances of the imported types
+            read from the file.
+        created (dict): Number of rows created, per model label.
+        linked (int): Number of rows whose references were linked.
+        reused (int): Number of entities mapped onto an existing interned
+            row instead of creating one.
+        skipped (int): Number of entities skipped because a mandatory
+            reference could not be resolved.
+        changes (dict): Number of `IfcRootModel` rows per change action
+            (`ADDED`, `MODIFIED`, `DELETED`) of an incremental import.
+        unchanged (int): Number of `IfcRootModel` rows an incremental
+            import left as they were.
+        projects (list): Primary keys of the projects of the file, written
+            or, by an incremental import, left as they were.
+        elapsed (float): Wall-clock duration of the import in seconds.
+
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialise empty statistics.
+        """
+        self.entities = 0
+        self.created: dict[str, int] = {}
+        self.linked = 0
+        self.reused = 0
+        self.skipped = 0
+        self.changes: dict[str, int] = {}
+        self.unchanged = 0
+        self.projects: list[int] = []
+        self.elapsed = 0.0
+
+    @property
+    def total_created(self) -> int:
+        """
+        Total number of rows created across all models.
+        """
+        return sum(self.created.values())
+
+    @property
+    def entities_per_second(self) -> float:
+        """
+        Import throughput in entity instances read per second.
+        """
+        if not self.elapsed:
+            return 0.0
+        return self.entities / self.elapsed
+
+
+class _ReferenceHasher:
+    """
+    Reference Hasher Class
+    ======================
+
+    Hashes the entities referenced by the rooted entities of a file,
+    memoising the hash of each referenced entity.
+
+    Attributes:
+        roots (StepSpill): The entity type, attributes and `global_id` of
+            the rooted entities.
+        nodes (StepSpill): The entity type and attributes of the entities
+            they reference.
+        hashes (StepSpill): The hashes computed so far.
+
+    """
+
+    def __init__(
+        self,
+        roots: StepSpill,
+        nodes: StepSpill,
+        hashes: StepSpill,
+    ) -> None:
+        """
+        Initialise the hasher.
+        """
+        self.roots = roots
+        self.nodes = nodes
+        self.hashes = hashes
+
+    def root_hash(self, step_id: int) -> str:
+        """
+        Return the `reference_hash` of a rooted entity.
+        """
+        entity_type, arguments, _ = self.roots.get(step_id)
+        return self._hash(entity_type, arguments, frozenset((step_id,)))
+
+    def _hash(
+        self,
+        entity_type: str,
+        arguments: list[Any],
+        path: frozenset[int],
+    ) -> str:
+        """
+        Hash the attributes of an entity, replacing its references by the
+        hashes of the referenced entities.
+        """
+        return hash_values((
+            entity_type,
+            *(self._canonical(value, path) for value in arguments),
+        ))
+
+    def _canonical(self, value: Any, path: frozenset[int]) -> Any:
+        """
+        Return an attribute value with its references replaced: rooted
+        entities by their `global_id`, other entities by their hash, and
+        cycles or entities that were not read by markers.
+        """
+        if isinstance(value, (list, tuple)):
+            return [self._canonical(item, path) for item in value]
+        if not isinstance(value, StepReference):
+            return value
+        step_id = int(value)
+        root = self.roots.get(step_id)
+        if root is not None:
+            return ["@", root[2]]
+        if step_id in path:
+            return ["^"]
+        digest = self.hashes.get(step_id)
+        if digest is None:
+            node = self.nodes.get(step_id)
+            if node is None:
+                return ["?"]
+            digest = self._hash(*node, path | {step_id})
+            self.hashes[step_id] = digest
+        return ["#", digest]
+
+
+class StepImporter:
+    """
+    STEP Importer Class
+    ===================
+
+    Imports an IFC-SPF file into the `models/ifc` tables using batched bulk
+    queries and a multi-pass `#id` reference resolution.
+
+    Attributes:
+        path (str | PathLike): Path to the `.ifc` file.
+        batch_size (int): Number of rows per `bulk_create` / `bulk_update`.
+        namespace (str): Prefix for identifiers derived from `#ids`, so the
+            same file can be imported more than once. Defaults to the file
+            name, followed by the import time for incremental imports.
+        using (str): The database alias to import into.
+        builders (dict): Entity type to `StepEntityBuilder` mapping.
+        relationships (dict): Entity type to the attribute indices of the
+            relating object and of the related objects of the
+            relationships stored as containers, see `STEP_RELATIONSHIPS`.
+        workers (int): Number of processes used to parse the file. With the
+            default of 1 the file is parsed in the importing process.
+        chunk_size (int): Approximate size in bytes of the DATA section
+            ranges handed to each worker.
+        interning_cache_size (int): Number of interning keys cached in
+            memory per interned model.
+        incremental (bool): Whether to update the rows of a previous
+            revision in place, writing only what changed.
+        purge (bool): Whether an incremental import deletes the rows
+            missing from the file instead of marking them as deleted.
+        index (StepEntityIndex): The `#id -> (entity type, pk)` index of
+            the imported rows.
+
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        namespace: Optional[str] = None,
+        using: str = DEFAULT_DB_ALIAS,
+        builders: Optional[dict[str, StepEntityBuilder]] = None,
+        relationships: Optional[dict[str, tuple[int, int]]] = None,
+        workers: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        interning_cache_size: int = DEFAULT_INTERNING_CACHE_SIZE,
+        incremental: bool = False,
+        purge: bool = False,
+    ) -> None:
+        """
+        Initialise the importer.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+        if workers < 1:
+            raise ValueError("workers must be a positive integer.")
+        if purge and not incremental:
+            raise ValueError("purge requires an incremental import.")
+        self.path = path
+        self.batch_size = batch_size
+        if namespace is None:
+            namespace = os.path.basename(os.fspath(path))
+            # The rows of the previous revision keep their identifiers
+            if incremental:
+                namespace += time.strftime("@%Y%m%dT%H%M%S")
+        self.namespace = namespace
+        self.using = using
+        self.builders = builders or STEP_ENTITY_BUILDERS
+        self.relationships = (
+            STEP_RELATIONSHIPS if relationships is None else relationships
+        )
+        self._sweepable = {
+            builder.model
+            for builder in self.builders.values()
+            if not (
+                builder.rooted
+                or builder.interning_fields
+                or builder.unique_field
+                or builder.unique_together
+            )
+        }
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.interning_cache_size = interning_cache_size
+        self.incremental = incremental
+        self.purge = purge
+        self.index = StepEntityIndex()
+        self.result = StepImportResult()
+        self._attnames: dict[tuple[type[models.Model], str], str] = {}
+        self._guid_fields: dict[type[models.Model], list[str]] = {}
+        self._interners: dict[str, StepRowInterner] = {}
+        # Incremental imports: the `#ids` to import, the change action of
+        # the added and modified rooted entities, the rows of the modified
+        # ones and the existing rows found in the file, per model
+        self._wanted: Optional[set[int]] = None
+        self._changes: dict[int, str] = {}
+        self._existing: dict[int, int] = {}
+        self._seen: dict[type[models.Model], set[int]] = {}
+        # The rows the modified ones referenced, per model, deleted once
+        # they are no longer referenced
+        self._superseded: dict[type[models.Model], set[int]] = {}
+        # The rows of the rooted entities written, per model
+        self._written: dict[type[models.Model], list[int]] = {}
+        # The `reference_hash` of each rooted entity of the file
+        self._reference_hashes = StepSpill()
+        # The worker processes, started by the first parallel pass
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    # Class | Public Methods
+    # =========================================================================
+
+    def run(self) -> StepImportResult:
+        """
+        Run the import inside a single transaction.
+
+        Returns:
+            StepImportResult: The import statistics.
+        """
+        started = time.perf_counter()
+        with transaction.atomic(using=self.using), self._reference_hashes, \
+                self._workers():
+            if self.incremental:
+                self._reference_hash_pass()
+                self._match_pass()
+            self._create_pass(PHASE_CREATE)
+            self._create_pass(PHASE_DEFERRED)
+            self._create_pass(PHASE_INTERNED)
+            self._link_pass()
+            if self.incremental:
+                self._sweep_pass()
+            self._points_pass()
+            self._container_pass()
+            self._grid_pass()
+            self._closure_pass()
+            self._transform_pass()
+            self._digest_pass()
+            if self.incremental:
+                self._change_pass()
+        self.result.projects = sorted({
+            *self._written.get(IfcProjectModel, ()),
+            *self._seen.get(IfcProjectModel, ()),
+        })
+        self.result.elapsed = time.perf_counter() - started
+        return self.result
+
+    # Class | Passes
+    # =========================================================================
+
+    def _records(self, phase: str) -> Iterator[tuple[Any, ...]]:
+        """
+        Stream the records of an import phase, counting the entities read
+        during the first pass.
+        """
+        count = phase == PHASE_CREATE
+        wanted = self._wanted
+        if self.workers > 1:
+            builders = (
+                None if self.builders is STEP_ENTITY_BUILDERS
+                else self.builders
+            )
+            if self._pool is None:
+                self._pool = open_worker_pool(self.workers, builders)
+            for entities, records in iter_parallel_records(
+                self.path,
+                phase,
+                workers=self.workers,
+                chunk_size=self.chunk_size,
+                executor=self._pool,
+            ):
+                if count:
+                    self.result.entities += entities
+                if wanted is not None:
+                    records = [
+                        record for record in records if record[0] in wanted
+                    ]
+                yield from records
+            return
+        entities = self._entities(step_entity_types(self.builders))
+        if count:
+            entities = self._counted(entities)
+        if wanted is not None:
+            entities = (
+                entity for entity in entities if entity.step_id in wanted
+            )
+        yield from build_step_records(entities, self.builders, phase)
+
+    @contextlib.contextmanager
+    def _workers(self) -> Iterator[None]:
+        """
+        Shut down the worker processes, if a pass started them, once the
+        import ends.
+        """
+        try:
+            yield
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def _entities(
+        self,
+        entity_types: frozenset[bytes],
+    ) -> Iterator[StepEntity]:
+        """
+        Stream the entities of the given types from the file, in file order.
+        Importers of other formats override this method.
+        """
+        return iter_step_entities(self.path, entity_types=entity_types)
+
+    def _counted(
+        self,
+        entities: Iterator[StepEntity],
+    ) -> Iterator[StepEntity]:
+        """
+        Count the entities passing through a stream.
+        """
+        for entity in entities:
+            self.result.entities += 1
+            yield entity
+
+    def _reference_hash_pass(self) -> None:
+        """
+        Hash the entities each rooted entity references, directly or
+        indirectly, reading the file once per level of references.
+
+        Only the entity types the import reads are followed, as the others
+        are not stored. References to rooted entities are hashed by their
+        `global_id`, and the owner history of rooted entities is left out.
+        The entities reached are kept in `StepSpill` mappings, so memory
+        stays flat.
+        """
+        rooted = {
+            entity_type: builder
+            for entity_type, builder in self.builders.items()
+            if builder.rooted
+        }
+        if not rooted:
+            return
+        with StepSpill() as roots, StepSpill() as nodes, \
+                StepSpill() as hashes:
+            roots.update(self._roots(rooted))
+            self._read_references(roots, nodes)
+            hasher = _ReferenceHasher(roots, nodes, hashes)
+            self._reference_hashes.update(
+                (step_id, hasher.root_hash(step_id)) for step_id in roots
+            )
+
+    def _roots(
+        self,
+        rooted: dict[str, StepEntityBuilder],
+    ) -> Iterator[tuple[int, tuple[str, list[Any], Any]]]:
+        """
+        Yield the entity type, attributes and `global_id` of the rooted
+        entities, leaving their owner history out.
+        """
+        for entity in self._entities(step_entity_types(rooted)):
+            builder = rooted[entity.entity_type]
+            arguments = list(self._arguments(entity, None))
+            history = builder.references.get("owner_history")
+            if history is not None and history < len(arguments):
+                arguments[history] = None
+            global_id = builder.fields["global_id"][0]
+            yield entity.step_id, (
+                entity.entity_type,
+                arguments,
+                arguments[global_id] if global_id < len(arguments) else None,
+            )
+
+    def _read_references(self, roots: StepSpill, nodes: StepSpill) -> None:
+        """
+        Store the entity type and attributes of the entities the rooted
+        entities reference, reading the file once per level of references.
+        """
+        entity_types = step_entity_types(self.builders) | _TRANSFORM_TYPES
+        frontier = {
+            step_id
+            for _, arguments, _ in roots.values()
+            for step_id in _references(arguments)
+            if step_id not in roots
+        }
+        while frontier:
+            found: set[int] = set()
+            nodes.update(self._nodes(entity_types, frontier, found))
+            frontier = {
+                step_id for step_id in found
+                if step_id not in nodes and step_id not in roots
+            }
+
+    def _nodes(
+        self,
+        entity_types: frozenset[bytes],
+        frontier: set[int],
+        found: set[int],
+    ) -> Iterator[tuple[int, tuple[str, list[Any]]]]:
+        """
+        Yield the entity type and attributes of the entities of a level of
+        references, adding the `#ids` they reference to `found`.
+        """
+        for entity in self._entities(entity_types):
+            if entity.step_id in frontier:
+                arguments = self._arguments(entity, None)
+                found.update(_references(arguments))
+                yield entity.step_id, (entity.entity_type, arguments)
+
+    def _match_pass(self) -> None:
+        """
+        Match the rooted entities to the existing rows by `global_id`, then
+        collect the entities to import: the added and modified ones and
+        the entities they reference.
+        """
+        rooted = {
+            entity_type: builder
+            for entity_type, builder in self.builders.items()
+            if builder.rooted
+        }
+        batch: list[tuple[int, str, models.Model]] = []
+        for entity in self._entities(step_entity_types(rooted)):
+            builder = rooted[entity.entity_type]
+            arguments = builder.parser(
+                entity.arguments,
+                builder.create_attributes,
+            )
+            instance = builder.model(**builder.build_fields(arguments))
+            batch.append((entity.step_id, entity.entity_type, instance))
+            if len(batch) >= _LOOKUP_BATCH_SIZE:
+                self._match(batch)
+                batch = []
+        if batch:
+            self._match(batch)
+        self._wanted = self._dependencies(set(self._changes))
+
+    def _match(self, batch: list[tuple[int, str, models.Model]]) -> None:
+        """
+        Classify a batch of rooted entities as added, modified or unchanged.
+        """
+        by_model: dict[type[models.Model], list] = {}
+        for item in batch:
+            model = self.builders[item[1]].model
+            by_model.setdefault(model, []).append(item)
+        for model, items in by_model.items():
+            existing = {
+                global_id: (pk, content_hash, reference_hash, action)
+                for global_id, pk, content_hash, reference_hash, action in (
+                    model._default_manager.using(self.using)
+                    .filter(global_id__in=[
+                        instance.global_id for _, _, instance in items
+                    ])
+                    .values_list(
+                        "global_id",
+                        "pk",
+                        "content_hash",
+                        "reference_hash",
+                        "owner_history__change_action",
+                    )
+                )
+            }
+            seen = self._seen.setdefault(model, set())
+            for step_id, entity_type, instance in items:
+                row = existing.get(instance.global_id)
+                if row is None:
+                    self._changes[step_id] = ADDED
+                    continue
+                pk, content_hash, reference_hash, action = row
+                seen.add(pk)
+                if action == DELETED:
+                    # Deleted in an earlier revision, then restored
+                    self._changes[step_id] = ADDED
+                    self._existing[step_id] = pk
+                elif (
+                    content_hash != instance.compute_content_hash()
+                    or reference_hash != self._reference_hashes.get(step_id)
+                ):
+                    self._changes[step_id] = MODIFIED
+                    self._existing[step_id] = pk
+                else:
+                    self.index.set(step_id, entity_type, pk)
+                    self.result.unchanged += 1
+            self._supersede(self._row_references(model, [
+                self._existing[step_id]
+                for step_id, _, _ in items
+                if step_id in self._existing
+            ]))
+
+    def _dependencies(self, wanted: set[int]) -> set[int]:
+        """
+        Add the entities referenced by a set of entities, directly or
+        indirectly, reading the file once per level of references. The
+        rooted entities left unchanged are not followed.
+        """
+        frontier = set(wanted)
+        entity_types = step_entity_types({
+            entity_type: builder
+            for entity_type, builder in self.builders.items()
+            if builder.reference_attributes
+        })
+        while frontier:
+            found: set[int] = set()
+            for entity in self._entities(entity_types):
+                if entity.step_id not in frontier:
+                    continue
+                builder = self.builders[entity.entity_type]
+                arguments = builder.parser(
+                    entity.arguments,
+                    builder.reference_attributes,
+                )
+                found.update(
+                    step_id
+                    for step_id in builder.build_references(arguments).values()
+                    if step_id is not None
+                )
+                for step_ids in builder.build_many(arguments).values():
+                    found.update(step_ids)
+            frontier = {
+                step_id for step_id in found
+                if step_id not in wanted and step_id not in self.index
+            }
+            wanted |= frontier
+        return wanted
+
+    def _create_pass(self, phase: str) -> None:
+        """
+        Create the rows of the independent, deferred or interned entities.
+        """
+        buffers: dict[str, list[tuple[int, Any]]] = {}
+        deferred = phase != PHASE_CREATE
+        for step_id, entity_type, values, required in self._records(phase):
+            builder = self.builders[entity_type]
+            if deferred:
+                resolved = self._resolve(builder, required)
+                if any(
+                    self._attname(builder.model, name) not in resolved
+                    for name in builder.required
+                ):
+                    self.result.skipped += 1
+                    continue
+                values.update(resolved)
+            if builder.identifier_field:
+                values[builder.identifier_field] = (
+                    f"{self.namespace}#{step_id}"
+                )
+            buffer = buffers.setdefault(entity_type, [])
+            buffer.append((step_id, builder.model(**values)))
+            if len(buffer) >= self.batch_size:
+                self._flush_create(entity_type, buffer)
+                buffer.clear()
+        for entity_type, buffer in buffers.items():
+            if buffer:
+                self._flush_create(entity_type, buffer)
+
+    def _link_pass(self) -> None:
+        """
+        Link the optional foreign keys and many-to-many relations.
+        """
+        updates: dict[tuple[type[models.Model], tuple[str, ...]], list] = {}
+        links: dict[Any, list[Any]] = {}
+        self._unlink_modified()
+        for step_id, entity_type, references, many in self._records(
+            PHASE_LINK
+        ):
+            pk = self.index.get(step_id)
+            if pk is None:
+                continue
+            builder = self.builders[entity_type]
+            self._link_references(builder, step_id, pk, references, updates)
+            self._link_many(builder, pk, many, links)
+        for key, buffer in updates.items():
+            if buffer:
+                self._flush_update(key, buffer)
+        for through, buffer in links.items():
+            if buffer:
+                self._flush_links(through, buffer)
+
+    def _link_references(
+        self,
+        builder: StepEntityBuilder,
+        step_id: int,
+        pk: int,
+        references: dict[str, Optional[int]],
+        updates: dict[tuple[type[models.Model], tuple[str, ...]], list],
+    ) -> None:
+        """
+        Buffer the update of the optional foreign keys of a row.
+        """
+        values = self._resolve(builder, references)
+        if step_id in self._existing:
+            # Clears the references the new revision dropped
+            for name in builder.optional_references:
+                values.setdefault(self._attname(builder.model, name), None)
+        if not values:
+            return
+        key = (builder.model, tuple(sorted(values)))
+        buffer = updates.setdefault(key, [])
+        buffer.append(builder.model(pk=pk, **values))
+        if len(buffer) >= self.batch_size:
+            self._flush_update(key, buffer)
+            buffer.clear()
+
+    def _link_many(
+        self,
+        builder: StepEntityBuilder,
+        pk: int,
+        many: dict[str, list[int]],
+        links: dict[Any, list[Any]],
+    ) -> None:
+        """
+        Buffer the link rows of the many-to-many relations of a row.
+        """
+        for name, targets in many.items():
+            field = builder.model._meta.get_field(name)
+            through = _link_model(field)
+            buffer = links.setdefault(through, [])
+            for target in targets:
+                target_pk = self.index.get(target)
+                if target_pk is not None:
+                    buffer.append(self._link(field, pk, target, target_pk))
+            if len(buffer) >= self.batch_size:
+                self._flush_links(through, buffer)
+                buffer.clear()
+
+    def _unlink_modified(self) -> None:
+        """
+        Remove the many-to-many and generic relation links of the modified
+        rows, which the link pass recreates from the new revision.
+        """
+        pks: dict[str, list[int]] = {}
+        for step_id, pk in self._existing.items():
+            entity_type = self.index.entity_type(step_id)
+            if entity_type is not None:
+                pks.setdefault(entity_type, []).append(pk)
+        for entity_type, rows in pks.items():
+            builder = self.builders[entity_type]
+            for name in builder.many:
+                field = builder.model._meta.get_field(name)
+                manager = _link_model(field)._default_manager
+                if field.many_to_many:
+                    lookup = f"{field.m2m_field_name()}__in"
+                else:
+                    lookup = f"{field.field.name}__in"
+                for start in range(0, len(rows), _LOOKUP_BATCH_SIZE):
+                    manager.using(self.using).filter(**{
+                        lookup: rows[start:start + _LOOKUP_BATCH_SIZE],
+                    }).delete()
+
+    def _sweep_pass(self) -> None:
+        """
+        Delete the rows the modified rows referenced before the link pass
+        replaced them, once nothing references them any more, then the
+        rows these referenced, and so on. Rows still referenced, e.g. by
+        another project, are kept.
+        """
+        candidates, self._superseded = self._superseded, {}
+        while candidates:
+            for model, pks in candidates.items():
+                unreferenced = list(pks - self._referenced(model, pks))
+                if not unreferenced:
+                    continue
+                self._supersede(self._row_references(model, unreferenced))
+                manager = model._base_manager.using(self.using)
+                for chunk in _chunks(unreferenced):
+                    manager.filter(pk__in=chunk).delete()
+            candidates, self._superseded = self._superseded, {}
+
+    def _points_pass(self) -> None:
+        """
+        Store the end points of the imported rows of builders with
+        `points`, e.g. polylines, reading the coordinates of their first
+        and last `IfcCartesianPoint` from the file.
+        """
+        builders = {
+            entity_type: builder
+            for entity_type, builder in self.builders.items()
+            if builder.points is not None
+        }
+        if not builders:
+            return
+        wanted = self._wanted
+        ends: dict[type[models.Model], dict[int, tuple[int, int]]] = {}
+        for entity in self._entities(step_entity_types(builders)):
+            if wanted is not None and entity.step_id not in wanted:
+                continue
+            pk = self.index.get(entity.step_id)
+            if pk is None:
+                continue
+            builder = builders[entity.entity_type]
+            arguments = self._arguments(entity, frozenset((builder.points,)))
+            points = list(_references(arguments[builder.points:][:1]))
+            if points:
+                ends.setdefault(builder.model, {})[pk] = (
+                    points[0], points[-1],
+                )
+        coordinates = self._vectors({
+            step_id
+            for rows in ends.values()
+            for pair in rows.values()
+            for step_id in pair
+        })
+        for model, rows in ends.items():
+            instances = []
+            for pk, (start, end) in rows.items():
+                if start in coordinates and end in coordinates:
+                    instance = model(pk=pk)
+                    instance.set_points(coordinates[start], coordinates[end])
+                    instances.append(instance)
+            self._write_columns(
+                model, (*COORDINATE_FIELDS, *EXTENT_FIELDS), instances,
+            )
+
+    def _container_pass(self) -> None:
+        """
+        Store the relationships of the file as the containers of their
+        related products: the relating product, or the project of the
+        top-level products (e.g. of a site). Only the products whose
+        container changed are written, with their rollups moved along.
+        """
+        if not self.relationships:
+            return
+        containers: dict[int, tuple[Optional[int], Optional[int]]] = {}
+        for entity in self._entities(step_entity_types(self.relationships)):
+            relating, related = self.relationships[entity.entity_type]
+            arguments = self._arguments(entity, frozenset((relating, related)))
+            parent = self._container(
+                next(_references(arguments[relating:][:1]), None),
+            )
+            if parent is None:
+                continue
+            for step_id in _references(arguments[related:][:1]):
+                if self._model(step_id, IfcProductModel):
+                    containers[self.index.get(step_id)] = parent
+            if len(containers) >= self.batch_size:
+                move_products(containers, using=self.using)
+                containers = {}
+        if containers:
+            move_products(containers, using=self.using)
+
+    def _grid_pass(self) -> None:
+        """
+        Recompute the axis counts and the intersections of the written
+        grids, whose axes were linked in bulk, bypassing the signals that
+        maintain them.
+        """
+        grids = self._written.get(IfcGridModel, [])
+        manager = IfcGridModel._default_manager.using(self.using)
+        for start in range(0, len(grids), _LOOKUP_BATCH_SIZE):
+            manager.filter(
+                pk__in=grids[start:start + _LOOKUP_BATCH_SIZE],
+            ).update_axis_counts()
+        if grids:
+            IfcGridIntersectionModel.rebuild(grids, using=self.using)
+
+    def _digest_pass(self) -> None:
+        """
+        Compute the digests of the written rooted entities, and add them to
+        the rollups.
+        """
+        for model, rows in self._written.items():
+            manager = model._default_manager.using(self.using)
+            for start in range(0, len(rows), _LOOKUP_BATCH_SIZE):
+                manager.filter(
+                    pk__in=rows[start:start + _LOOKUP_BATCH_SIZE],
+                ).update_digests(batch_size=self.batch_size)
+
+    def _change_pass(self) -> None:
+        """
+        Record the change actions of an incremental import, and mark or
+        delete the rows of the imported project the file no longer
+        contains.
+        """
+        changed: dict[type[models.Model], dict[int, str]] = {}
+        for step_id, action in self._changes.items():
+            pk = self.index.get(step_id)
+            if pk is None:
+                continue
+            model = self.builders[self.index.entity_type(step_id)].model
+            changed.setdefault(model, {})[pk] = action
+            self.result.changes[action] = (
+                self.result.changes.get(action, 0) + 1
+            )
+        rooted = {
+            builder.model
+            for builder in self.builders.values()
+            if builder.rooted
+        }
+        projects = {
+            *self._seen.get(IfcProjectModel, ()),
+            *changed.get(IfcProjectModel, {}),
+        }
+        for model in rooted:
+            actions = changed.get(model, {})
+            seen = self._seen.get(model, set())
+            manager = model._default_manager.using(self.using)
+            rows = self._project_rows(model, projects)
+            # The rows of subclasses with builders, e.g. grids, are
+            # checked with their own model
+            for subclass in rooted:
+                if subclass is not model and issubclass(subclass, model):
+                    rows = rows.exclude(
+                        pk__in=subclass._default_manager.values("pk"),
+                    )
+            missing = [
+                pk
+                for pk, action in rows.values_list(
+                    "pk", "owner_history__change_action",
+                ).iterator()
+                if pk not in seen and pk not in actions and action != DELETED
+            ]
+            if missing:
+                self.result.changes[DELETED] = (
+                    self.result.changes.get(DELETED, 0) + len(missing)
+                )
+            if self.purge:
+                for start in range(0, len(missing), _LOOKUP_BATCH_SIZE):
+                    manager.filter(
+                        pk__in=missing[start:start + _LOOKUP_BATCH_SIZE],
+                    ).delete()
+            else:
+                actions.update(dict.fromkeys(missing, DELETED))
+            self._record_changes(model, actions)
+
+    def _project_rows(
+        self,
+        model: type[models.Model],
+        projects: set[int],
+    ) -> models.QuerySet:
+        """
+        Return the existing rows of a rooted model that belong to the
+        imported projects: the projects themselves, or their products.
+        Rows of models not linked to a project are left out.
+        """
+        manager = model._default_manager.using(self.using)
+        if issubclass(model, IfcProjectModel):
+            return manager.filter(pk__in=projects)
+        if not projects or not issubclass(model, IfcProductModel):
+            return manager.none()
+        condition = models.Q()
+        for project in projects:
+            condition |= models.Q(
+                pk__in=IfcProductModel._default_manager.using(self.using)
+                .of_project(project).values("pk"),
+            )
+        return manager.filter(condition)
+
+    def _record_changes(
+        self,
+        model: type[models.Model],
+        actions: dict[int, str],
+    ) -> None:
+        """
+        Point rows at an owner history with their change action: an
+        interned copy of their owner history with the action replaced.
+        """
+        if not actions:
+            return
+        manager = model._default_manager.using(self.using)
+        rows = list(actions)
+        histories: dict[int, Optional[int]] = {}
+        for start in range(0, len(rows), _LOOKUP_BATCH_SIZE):
+            histories.update(
+                manager.filter(pk__in=rows[start:start + _LOOKUP_BATCH_SIZE])
+                .values_list("pk", "owner_history")
+            )
+        fields = [
+            IfcOwnerHistoryModel._meta.get_field(name).attname
+            for name in IfcOwnerHistoryModel.INTERNING_FIELDS
+        ]
+        sources = {
+            pk: dict(zip(fields, values))
+            for pk, *values in (
+                IfcOwnerHistoryModel._default_manager.using(self.using)
+                .filter(pk__in=set(histories.values()) - {None})
+                .values_list("pk", *fields)
+            )
+        }
+        copies: dict[tuple[Optional[int], str], Any] = {}
+        for pk, action in actions.items():
+            source = histories.get(pk)
+            if (source, action) not in copies:
+                values = dict(sources.get(source, {}))
+                values["change_action"] = action
+                copies[source, action] = IfcOwnerHistoryModel(**values)
+        keys = list(copies)
+        history_pks = dict(zip(
+            keys,
+            self._owner_history_interner().intern(
+                [copies[key] for key in keys]
+            ),
+        ))
+        manager.bulk_update(
+            [
+                model(pk=pk, owner_history_id=history_pks[
+                    histories.get(pk), action
+                ])
+                for pk, action in actions.items()
+            ],
+            fields=["owner_history"],
+            batch_size=self.batch_size,
+        )
+
+    def _closure_pass(self) -> None:
+        """
+        Add the closure table rows of the imported local placements.
+        """
+        if not placement_closure_enabled():
+            return
+        entity_types = {
+            entity_type
+            for entity_type, builder in self.builders.items()
+            if builder.model is IfcLocalPlacementModel
+        }
+        if not entity_types:
+            return
+        index = self.index
+        IfcLocalPlacementClosureModel.add_placements(
+            (
+                index.get(step_id)
+                for step_id in index
+                if index.entity_type(step_id) in entity_types
+            ),
+            using=self.using,
+        )
+
+    def _transform_pass(self) -> None:
+        """
+        Store the matrices of the `IfcAxis2Placement3D` referenced by the
+        transform fields of the imported rows, then update the world
+        transforms of the imported placements.
+        """
+        builders = {
+            entity_type: builder
+            for entity_type, builder in self.builders.items()
+            if builder.transforms
+        }
+        if not builders:
+            return
+        wanted = self._wanted
+        # The axis placement referenced by each transform field of a row
+        targets: dict[tuple[type[models.Model], str], dict[int, int]] = {}
+        placements: list[int] = []
+        for entity in self._entities(step_entity_types(builders)):
+            if wanted is not None and entity.step_id not in wanted:
+                continue
+            pk = self.index.get(entity.step_id)
+            if pk is None:
+                continue
+            builder = builders[entity.entity_type]
+            if builder.model is IfcLocalPlacementModel:
+                placements.append(pk)
+            arguments = self._arguments(
+                entity,
+                frozenset(builder.transforms.values()),
+            )
+            for name, index in builder.transforms.items():
+                if index < len(arguments) and arguments[index] is not None:
+                    targets.setdefault((builder.model, name), {})[pk] = int(
+                        arguments[index]
+                    )
+        axes = self._axis_placements({
+            step_id for rows in targets.values() for step_id in rows.values()
+        })
+        for (model, name), rows in targets.items():
+            self._write_columns(model, (name,), [
+                model(pk=pk, **{name: axes[step_id]})
+                for pk, step_id in rows.items()
+                if step_id in axes
+            ])
+        if placements:
+            IfcLocalPlacementModel.update_world_transforms(
+                roots=placements,
+                using=self.using,
+            )
+
+    # Class | Helpers
+    # =========================================================================
+
+    def _arguments(
+        self,
+        entity: StepEntity,
+        attributes: Optional[frozenset[int]],
+    ) -> list[Any]:
+        """
+        Decode some attributes of an entity read outside the builders, or
+        all of them for `None`. Importers of other formats override this
+        method.
+        """
+        return parse_step_arguments(entity.arguments, attributes)
+
+    def _axis_placements(self, wanted: set[int]) -> dict[int, Matrix]:
+        """
+        Return the matrices of `IfcAxis2Placement3D` entities, reading
+        their locations and directions from the file.
+        """
+        if not wanted:
+            return {}
+        axes: dict[int, list[Optional[int]]] = {}
+        for entity in self._entities(frozenset([b"IFCAXIS2PLACEMENT3D"])):
+            if entity.step_id in wanted:
+                axes[entity.step_id] = [
+                    None if value is None else int(value)
+                    for value in self._arguments(entity, frozenset((0, 1, 2)))
+                ]
+        values = self._vectors({
+            step_id for references in axes.values() for step_id in references
+        })
+        return {
+            step_id: placement_matrix(*(
+                None if reference is None else values.get(reference)
+                for reference in (references + [None] * 3)[:3]
+            ))
+            for step_id, references in axes.items()
+            if references and references[0] in values
+        }
+
+    def _vectors(self, wanted: set[int]) -> dict[int, list[float]]:
+        """
+        Return the coordinates of `IfcCartesianPoint` and the ratios of
+        `IfcDirection` entities, read from the file.
+        """
+        values: dict[int, list[float]] = {}
+        if not wanted:
+            return values
+        for entity in self._entities(
+            frozenset([b"IFCCARTESIANPOINT", b"IFCDIRECTION"])
+        ):
+            if entity.step_id in wanted:
+                values[entity.step_id] = self._arguments(
+                    entity,
+                    frozenset((0,)),
+                )[0]
+        return values
+
+    def _model(self, step_id: int, model: type[models.Model]) -> bool:
+        """
+        Return whether an entity was imported as a row of a model.
+        """
+        entity_type = self.index.entity_type(step_id)
+        return entity_type is not None and issubclass(
+            self.builders[entity_type].model, model,
+        )
+
+    def _container(
+        self,
+        step_id: Optional[int],
+    ) -> Optional[tuple[Optional[int], Optional[int]]]:
+        """
+        Return the `(container, project)` primary keys of the products
+        related to an entity by a relationship, or `None` if it is neither
+        an imported product nor an imported project.
+        """
+        if step_id is None:
+            return None
+        if self._model(step_id, IfcProductModel):
+            return (self.index.get(step_id), None)
+        if self._model(step_id, IfcProjectModel):
+            return (None, self.index.get(step_id))
+        return None
+
+    def _supersede(
+        self,
+        references: dict[type[models.Model], set[int]],
+    ) -> None:
+        """
+        Add rows to delete by the sweep pass once nothing references them.
+        Only the rows of builders that are neither rooted, interned nor
+        matched by a unique field are deleted, as only these are created
+        anew by each revision.
+        """
+        for model, pks in references.items():
+            if model in self._sweepable:
+                self._superseded.setdefault(model, set()).update(pks)
+
+    def _row_references(
+        self,
+        model: type[models.Model],
+        pks: list[int],
+    ) -> dict[type[models.Model], set[int]]:
+        """
+        Return the rows some rows reference, through their foreign keys,
+        many-to-many fields and generic relation tables, per model.
+        """
+        references: dict[type[models.Model], set[int]] = {}
+        for field in model._meta.get_fields():
+            for chunk in _chunks(pks):
+                for target, pk in self._field_references(field, chunk):
+                    if pk is not None:
+                        references.setdefault(target, set()).add(pk)
+        return references
+
+    def _field_references(
+        self,
+        field: Any,
+        pks: list[int],
+    ) -> Iterator[tuple[type[models.Model], int]]:
+        """
+        Yield the model and primary key of the rows some rows reference
+        through one of their fields.
+        """
+        if field.many_to_one and field.concrete:
+            rows = field.model._base_manager.using(self.using)
+            for (pk,) in rows.filter(pk__in=pks).values_list(field.attname):
+                yield field.related_model, pk
+        elif field.many_to_many and field.concrete:
+            rows = field.remote_field.through._base_manager.using(self.using)
+            for (pk,) in rows.filter(**{
+                f"{field.m2m_field_name()}__in": pks,
+            }).values_list(f"{field.m2m_reverse_field_name()}_id"):
+                yield field.related_model, pk
+        elif field.one_to_many and _generic_table(field.related_model):
+            rows = field.related_model._base_manager.using(self.using)
+            content_types = ContentType.objects.db_manager(self.using)
+            for ct_field, fk_field in _generic_keys(field.related_model):
+                for content_type, pk in rows.filter(**{
+                    f"{field.field.name}__in": pks,
+                }).values_list(ct_field, fk_field):
+                    yield (
+                        content_types.get_for_id(content_type).model_class(),
+                        pk,
+                    )
+
+    def _referenced(
+        self,
+        model: type[models.Model],
+        pks: set[int],
+    ) -> set[int]:
+        """
+        Return the rows of a model still referenced by the rows of the
+        builders, directly or through a many-to-many field, or by a
+        generic relation table. The rows of other tables, such as the
+        closure table or the grid intersections, derive from the rows they
+        reference and are deleted with them.
+        """
+        models_read = {builder.model for builder in self.builders.values()}
+        referenced: set[int] = set()
+        content_type = ContentType.objects.db_manager(
+            self.using,
+        ).get_for_model(model)
+        for chunk in _chunks(list(pks)):
+            for relation in model._meta.related_objects:
+                if relation.many_to_many:
+                    name = relation.field.m2m_reverse_field_name()
+                    rows = relation.through._base_manager
+                elif relation.related_model in models_read:
+                    name = relation.field.name
+                    rows = relation.related_model._base_manager
+                else:
+                    continue
+                referenced.update(
+                    rows.using(self.using)
+                    .filter(**{f"{name}__in": chunk})
+                    .values_list(f"{name}_id", flat=True)
+                )
+            for table in _generic_tables(model._meta.app_label):
+                for ct_field, fk_field in _generic_keys(table):
+                    referenced.update(
+                        table._base_manager.using(self.using)
+                        .filter(**{
+                            ct_field: content_type,
+                            f"{fk_field}__in": chunk,
+                        })
+                        .values_list(fk_field, flat=True)
+                    )
+        return referenced
+
+    def _attname(self, model: type[models.Model], name: str) -> str:
+        """
+        Return the database attribute name (`<name>_id`) of a foreign key.
+        """
+        key = (model, name)
+        attname = self._attnames.get(key)
+        if attname is None:
+            attname = model._meta.get_field(name).attname
+            self._attnames[key] = attname
+        return attname
+
+    def _guid_attnames(self, model: type[models.Model]) -> list[str]:
+        """
+        Return the attribute names of the GUID fields of a model.
+        """
+        attnames = self._guid_fields.get(model)
+        if attnames is None:
+            attnames = [
+                field.attname for field in model._meta.concrete_fields
+                if isinstance(field, IfcGloballyUniqueIdField)
+            ]
+            self._guid_fields[model] = attnames
+        return attnames
+
+    def _resolve(
+        self,
+        builder: StepEntityBuilder,
+        references: dict[str, Optional[int]],
+    ) -> dict[str, int]:
+        """
+        Translate referenced `#ids` into foreign key values, dropping those
+        that point at entities that were not imported.
+        """
+        resolved: dict[str, int] = {}
+        for name, step_id in references.items():
+            if step_id is None:
+                continue
+            pk = self.index.get(step_id)
+            if pk is not None:
+                resolved[self._attname(builder.model, name)] = pk
+        return resolved
+
+    def _flush_create(
+        self,
+        entity_type: str,
+        buffer: list[tuple[int, Any]],
+    ) -> None:
+        """
+        Bulk create a batch of rows and record their primary keys.
+
+        GUIDs are validated once per batch, so the per-value validation of
+        `IfcGloballyUniqueIdField` is skipped while the rows are written.
+        """
+        builder = self.builders[entity_type]
+        model = builder.model
+        instances = [instance for _, instance in buffer]
+        for attname in self._guid_attnames(model):
+            validate_many(
+                [getattr(instance, attname) for instance in instances]
+            )
+        interner = self._interner(entity_type)
+        with trusted_guids():
+            if builder.rooted:
+                created = self._write_rooted(builder, buffer)
+            elif builder.unique_field is not None:
+                created = self._write_unique(builder, instances)
+            elif builder.unique_together:
+                created = self._write_unique_together(builder, instances)
+            elif interner is None:
+                model.objects.using(self.using).bulk_create(
+                    instances,
+                    batch_size=self.batch_size,
+                )
+                created = len(instances)
+            else:
+                before = interner.created
+                interner.intern(instances)
+                created = interner.created - before
+                self.result.reused += len(instances) - created
+        self.index.update(
+            (step_id for step_id, _ in buffer),
+            entity_type,
+            (instance.pk for instance in instances),
+        )
+        label = model._meta.label
+        self.result.created[label] = (
+            self.result.created.get(label, 0) + created
+        )
+
+    def _owner_history_interner(self) -> StepRowInterner:
+        """
+        Return the interner of the owner histories, shared with their
+        builders.
+        """
+        key = IfcOwnerHistoryModel._meta.label
+        interner = self._interners.get(key)
+        if interner is None:
+            interner = StepRowInterner(
+                IfcOwnerHistoryModel,
+                IfcOwnerHistoryModel.INTERNING_FIELDS,
+                cache_size=self.interning_cache_size,
+                using=self.using,
+            )
+            self._interners[key] = interner
+        return interner
+
+    def _write_rooted(
+        self,
+        builder: StepEntityBuilder,
+        buffer: list[tuple[int, Any]],
+    ) -> int:
+        """
+        Create the new rooted rows and update the modified ones in place,
+        storing their content and reference hashes for later incremental
+        imports.
+
+        Returns:
+            int: Number of rows created.
+        """
+        created, updated = [], []
+        for step_id, instance in buffer:
+            instance.content_hash = instance.compute_content_hash()
+            instance.reference_hash = self._reference_hashes.get(step_id)
+            pk = self._existing.get(step_id)
+            if pk is None:
+                created.append(instance)
+            else:
+                instance.pk = pk
+                updated.append(instance)
+        manager = builder.model.objects.using(self.using)
+        if created:
+            self._bulk_create(builder.model, created)
+        self._written.setdefault(builder.model, []).extend(
+            instance.pk for instance in created + updated
+        )
+        if updated:
+            manager.bulk_update(
+                updated,
+                fields=[
+                    *builder.fields,
+                    *builder.required_references,
+                    "content_hash",
+                    "reference_hash",
+                ],
+                batch_size=self.batch_size,
+            )
+        return len(created)
+
+    def _bulk_create(
+        self,
+        model: type[models.Model],
+        instances: list[Any],
+    ) -> None:
+        """
+        Bulk create rows. `bulk_create` rejects the models of multi-table
+        inheritance, such as grids, whose rows are saved one by one
+        instead, bypassing their `save()` methods as the other rows do.
+        """
+        if not model._meta.parents:
+            model.objects.using(self.using).bulk_create(
+                instances,
+                batch_size=self.batch_size,
+            )
+            return
+        for instance in instances:
+            instance.save_base(using=self.using, force_insert=True)
+
+    def _write_columns(
+        self,
+        model: type[models.Model],
+        names: tuple[str, ...],
+        instances: list[Any],
+    ) -> None:
+        """
+        Store columns of rows, with one prepared UPDATE per row, which
+        scales linearly, unlike the CASE expressions of `bulk_update`.
+        """
+        if not instances:
+            return
+        connection = connections[self.using]
+        quote = connection.ops.quote_name
+        fields = [model._meta.get_field(name) for name in names]
+        # Inherited columns live in the table of the declaring model
+        meta = fields[0].model._meta
+        assignments = ", ".join(
+            f"{quote(field.column)} = %s" for field in fields
+        )
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"UPDATE {quote(meta.db_table)} SET {assignments} "
+                f"WHERE {quote(meta.pk.column)} = %s",
+                [
+                    (
+                        *(
+                            field.get_db_prep_value(
+                                getattr(instance, field.attname),
+                                connection,
+                            )
+                            for field in fields
+                        ),
+                        instance.pk,
+                    )
+                    for instance in instances
+                ],
+            )
+
+    def _write_unique(
+        self,
+        builder: StepEntityBuilder,
+        instances: list[Any],
+    ) -> int:
+        """
+        Create the rows whose `unique_field` value is new, and update the
+        existing actors of the imported project with the other values in
+        place; the actors of other projects are shared as they are. Rows
+        sharing a value share a row, and rows without a value are matched
+        by all their fields to the actors of the imported project.
+
+        Returns:
+            int: Number of rows created.
+        """
+        manager = builder.model.objects.using(self.using)
+        actors = set(
+            self._project_actors(builder.model).values_list("pk", flat=True)
+        )
+        existing = self._unique_rows(builder, actors, {
+            _unique_key(builder, instance) for instance in instances
+        })
+        created, updated, shared = [], [], []
+        first: dict[Any, Any] = {}
+        for instance in instances:
+            key = _unique_key(builder, instance)
+            if key in first:
+                shared.append((instance, first[key]))
+                continue
+            first[key] = instance
+            instance.pk = existing.get(key)
+            if instance.pk is None:
+                created.append(instance)
+            elif instance.pk in actors:
+                updated.append(instance)
+        if created:
+            manager.bulk_create(created, batch_size=self.batch_size)
+        if updated:
+            manager.bulk_update(
+                updated,
+                fields=list(builder.fields),
+                batch_size=self.batch_size,
+            )
+        for instance, original in shared:
+            instance.pk = original.pk
+        self.result.reused += len(instances) - len(created)
+        return len(created)
+
+    def _unique_rows(
+        self,
+        builder: StepEntityBuilder,
+        actors: set[int],
+        keys: set[Any],
+    ) -> dict[Any, int]:
+        """
+        Return the primary keys of the existing rows matching the keys of
+        `_unique_key`: any row with the same `unique_field` value, which
+        the database keeps unique, or one of the actors of the imported
+        project with the same fields.
+        """
+        name = builder.unique_field
+        manager = builder.model.objects.using(self.using)
+        values = [key for key in keys if not isinstance(key, tuple)]
+        existing: dict[Any, int] = {}
+        for chunk in _chunks(values):
+            existing.update(
+                manager.filter(**{f"{name}__in": chunk})
+                .values_list(name, "pk")
+            )
+        if len(values) < len(keys):
+            existing.update(
+                ((None, *fields), pk)
+                for pk, *fields in manager.filter(**{
+                    "pk__in": actors,
+                    f"{name}__isnull": True,
+                }).values_list("pk", *builder.fields)
+            )
+        return existing
+
+    def _write_unique_together(
+        self,
+        builder: StepEntityBuilder,
+        instances: list[Any],
+    ) -> int:
+        """
+        Create the rows whose `unique_together` values are new, and share
+        the existing rows with the others.
+
+        Returns:
+            int: Number of rows created.
+        """
+        attnames = [
+            self._attname(builder.model, name)
+            for name in builder.unique_together
+        ]
+        keys = [
+            tuple(getattr(instance, attname) for attname in attnames)
+            for instance in instances
+        ]
+        existing = self._unique_together_rows(builder, attnames, set(keys))
+        missing: dict[tuple[Any, ...], Any] = {}
+        for key, instance in zip(keys, instances):
+            if key not in existing:
+                missing.setdefault(key, instance)
+        if missing:
+            builder.model.objects.using(self.using).bulk_create(
+                list(missing.values()),
+                batch_size=self.batch_size,
+            )
+            existing.update(
+                (key, instance.pk) for key, instance in missing.items()
+            )
+        for key, instance in zip(keys, instances):
+            instance.pk = existing[key]
+        self.result.reused += len(instances) - len(missing)
+        return len(missing)
+
+    def _unique_together_rows(
+        self,
+        builder: StepEntityBuilder,
+        attnames: list[str],
+        keys: set[tuple[Any, ...]],
+    ) -> dict[tuple[Any, ...], int]:
+        """
+        Return the primary keys of the existing rows by their
+        `unique_together` values.
+        """
+        manager = builder.model.objects.using(self.using)
+        existing: dict[tuple[Any, ...], int] = {}
+        for chunk in _chunks(list(keys)):
+            rows = manager.filter(**{
+                f"{attname}__in": {key[position] for key in chunk}
+                for position, attname in enumerate(attnames)
+            })
+            for pk, *values in rows.values_list("pk", *attnames):
+                if tuple(values) in keys:
+                    existing[tuple(values)] = pk
+        return existing
+
+    def _project_actors(self, model: type[models.Model]) -> models.QuerySet:
+        """
+        Return the persons, organizations or applications of the owner
+        histories of the imported projects and of their products, the only
+        actors an import rewrites. There are none on the first import of a
+        project.
+        """
+        manager = model._default_manager.using(self.using)
+        projects = self._seen.get(IfcProjectModel)
+        if not projects:
+            return manager.none()
+        histories = IfcOwnerHistoryModel._default_manager.using(
+            self.using,
+        ).filter(
+            models.Q(pk__in=self._project_rows(IfcProjectModel, projects)
+                     .values("owner_history"))
+            | models.Q(pk__in=self._project_rows(IfcProductModel, projects)
+                       .values("owner_history"))
+        )
+        users = IfcPersonAndOrganizationModel._default_manager.using(
+            self.using,
+        ).filter(
+            models.Q(pk__in=histories.values("creation_user"))
+            | models.Q(pk__in=histories.values("modification_user"))
+        )
+        applications = IfcApplicationModel._default_manager.using(
+            self.using,
+        ).filter(pk__in=histories.values("application"))
+        if model is IfcApplicationModel:
+            return applications
+        if model is IfcPersonModel:
+            return manager.filter(pk__in=users.values("person"))
+        if model is IfcOrganizationModel:
+            developers = applications.values("application_developer")
+            return manager.filter(
+                models.Q(pk__in=users.values("organization"))
+                | models.Q(pk__in=developers)
+            )
+        return manager.none()
+
+    def _interner(self, entity_type: str) -> Optional[StepRowInterner]:
+        """
+        Return the interner of an entity type, or `None` if its rows are not
+        interned. Entity types sharing a model share the interner.
+        """
+        builder = self.builders[entity_type]
+        if not builder.interning_fields:
+            return None
+        key = builder.model._meta.label
+        interner = self._interners.get(key)
+        if interner is None:
+            interner = StepRowInterner(
+                builder.model,
+                builder.interning_fields,
+                cache_size=self.interning_cache_size,
+                using=self.using,
+            )
+            self._interners[key] = interner
+        return interner
+
+    def _flush_update(
+        self,
+        key: tuple[type[models.Model], tuple[str, ...]],
+        buffer: list[Any],
+    ) -> None:
+        """
+        Bulk update the foreign keys of a batch of rows.
+        """
+        model, fields = key
+        model.objects.using(self.using).bulk_update(
+            buffer,
+            fields=list(fields),
+            batch_size=self.batch_size,
+        )
+        self.result.linked += len(buffer)
+
+    def _link(
+        self,
+        field: Any,
+        pk: int,
+        target: int,
+        target_pk: int,
+    ) -> models.Model:
+        """
+        Return the row linking a row to one of its targets: a row of the
+        through table of a many-to-many field, or of the generic relation
+        table of a reverse foreign key such as `unit_relations`.
+        """
+        if field.many_to_many:
+            return field.remote_field.through(**{
+                f"{field.m2m_field_name()}_id": pk,
+                f"{field.m2m_reverse_field_name()}_id": target_pk,
+            })
+        model = self.builders[self.index.entity_type(target)].model
+        return field.related_model(**{
+            field.field.attname: pk,
+            "content_type_id": ContentType.objects.db_manager(
+                self.using,
+            ).get_for_model(model).pk,
+            "object_id": target_pk,
+        })
+
+    def _flush_links(self, through: Any, buffer: list[Any]) -> None:
+        """
+        Bulk create a batch of many-to-many or generic relation link rows.
+        """
+        through.objects.using(self.using).bulk_create(
+            buffer,
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def _references(value: Any) -> Iterator[int]:
+    """
+    Yield the `#ids` referenced in a decoded attribute value.
+    """
+    if isinstance(value, StepReference):
+        yield int(value)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _references(item)
+
+
+def _chunks(values: list[Any]) -> Iterator[list[Any]]:
+    """
+    Split values into lists of at most `_LOOKUP_BATCH_SIZE` for `__in`
+    lookups.
+    """
+    for start in range(0, len(values), _LOOKUP_BATCH_SIZE):
+        yield values[start:start + _LOOKUP_BATCH_SIZE]
+
+
+def _generic_table(model: type[models.Model]) -> bool:
+    """
+    Return whether a model is a generic relation table, whose rows link a
+    row to rows of any model through a `GenericForeignKey`.
+    """
+    return bool(_generic_keys(model))
+
+
+def _generic_keys(model: type[models.Model]) -> list[tuple[str, str]]:
+    """
+    Return the content type and object id fields of the generic foreign
+    keys of a model, e.g. the two actors of an approval.
+    """
+    return [
+        (field.ct_field, field.fk_field)
+        for field in model._meta.private_fields
+        if isinstance(field, GenericForeignKey)
+    ]
+
+
+@lru_cache(maxsize=None)
+def _generic_tables(app_label: str) -> tuple[type[models.Model], ...]:
+    """
+    Return the generic relation tables of an application.
+    """
+    return tuple(
+        model
+        for model in apps.get_app_config(app_label).get_models()
+        if _generic_table(model)
+    )
+
+
+def _unique_key(builder: StepEntityBuilder, instance: Any) -> Any:
+    """
+    Return the value of the `unique_field` of a row, or a tuple of all its
+    field values if it has none.
+    """
+    value = getattr(instance, builder.unique_field)
+    if value is not None:
+        return value
+    return (None, *(getattr(instance, name) for name in builder.fields))
+
+
+def _link_model(field: Any) -> type[models.Model]:
+    """
+    Return the model of the rows linking a row to the targets of a
+    many-to-many field or of a reverse foreign key to a generic relation
+    table.
+    """
+    if field.many_to_many:
+        return field.remote_field.through
+    return field.related_model
+
+
+def import_step(
+    path: Union[str, os.PathLike],
+    **options: Any,
+) -> StepImportResult:
+    """
+    Import an IFC-SPF file into the `models/ifc` tables.
+
+    Parameters:
+        path (str | PathLike): Path to the `.ifc` file.
+        **options: Forwarded to `StepImporter`.
+
+    Returns:
+        StepImportResult: The import statistics.
+    """
+    return StepImporter(path, **options).run()
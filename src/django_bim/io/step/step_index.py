@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC STEP Entity Index Class
+====================================
+
+This module provides the `#id -> (entity type, pk)` index used by the STEP
+importer to resolve entity references. Instance ids in IFC-SPF files are
+mostly near-dense integers, so the index is stored as pages of two `array`
+buffers (8 bytes for the primary key plus 2 bytes for the entity type code
+per id) rather than as a dictionary of Python objects, which keeps it
+compact for files with tens of millions of instances.
+
+Pages cover `PAGE_SIZE` consecutive ids and are allocated when an id in
+their range is first indexed, so sparse ids, e.g. of files written with
+large id offsets or of the few entities an incremental import writes, use
+memory in proportion to the indexed ids rather than to the largest `#id`.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+from array import array
+from typing import Iterable, Iterator, Optional
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "PAGE_SIZE",
+    "StepEntityIndex",
+]
+
+# Number of consecutive ids per page, a power of two
+PAGE_SIZE = 4096
+
+_MISSING = -1
+_PAGE_BITS = PAGE_SIZE.bit_length() - 1
+_PAGE_MASK = PAGE_SIZE - 1
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class StepEntityIndex:
+    """
+    STEP Entity Index Class
+    =======================
+
+    Paged, array-backed mapping of STEP instance ids to the entity type and
+    primary key of the row they were imported into.
+
+    Attributes:
+        entity_types (list): Entity type names, addressed by type code.
+            Code 0 is reserved for "not indexed".
+
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialise an empty index.
+        """
+        # Page number to the primary key and type code buffers of its ids
+        self._pages: dict[int, tuple[array, array]] = {}
+        self._codes: dict[str, int] = {}
+        self.entity_types: list[str] = [""]
+        self._size = 0
+
+    # Class | Magic Methods
+    # =========================================================================
+
+    def __len__(self) -> int:
+        """
+        Return the number of indexed ids.
+        """
+        return self._size
+
+    def __contains__(self, step_id: int) -> bool:
+        """
+        Return whether the given id is indexed.
+        """
+        page = self._pages.get(step_id >> _PAGE_BITS) if step_id >= 0 else None
+        return page is not None and page[1][step_id & _PAGE_MASK] != 0
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Iterate over the indexed ids in ascending order.
+        """
+        for number in sorted(self._pages):
+            types = self._pages[number][1]
+            first = number << _PAGE_BITS
+            for offset in range(PAGE_SIZE):
+                if types[offset]:
+                    yield first + offset
+
+    # Class | Public Methods
+    # =========================================================================
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory used by the index buffers, in bytes.
+        """
+        return sum(
+            pks.itemsize * len(pks) + types.itemsize * len(types)
+            for pks, types in self._pages.values()
+        )
+
+    def type_code(self, entity_type: str) -> int:
+        """
+        Return the compact code of an entity type, registering it if needed.
+        """
+        code = self._codes.get(entity_type)
+        if code is None:
+            code = len(self.entity_types)
+            if code > 0xFFFF:
+                raise OverflowError("Too many entity types for the index.")
+            self._codes[entity_type] = code
+            self.entity_types.append(entity_type)
+        return code
+
+    def set(self, step_id: int, entity_type: str, pk: int) -> None:
+        """
+        Index a single imported entity.
+
+        Parameters:
+            step_id (int): The STEP instance id.
+            entity_type (str): The upper-case entity type.
+            pk (int): The primary key of the imported row.
+        """
+        self.update((step_id,), entity_type, (pk,))
+
+    def update(
+        self,
+        step_ids: Iterable[int],
+        entity_type: str,
+        pks: Iterable[int],
+    ) -> None:
+        """
+        Index a batch of imported entities of the same type.
+
+        Parameters:
+            step_ids (Iterable[int]): The STEP instance ids.
+            entity_type (str): The upper-case entity type.
+            pks (Iterable[int]): The primary keys, in the same order.
+        """
+        code = self.type_code(entity_type)
+        for step_id, pk in zip(step_ids, pks):
+            page_pks, types = self._page(step_id)
+            offset = step_id & _PAGE_MASK
+            if types[offset] == 0:
+                self._size += 1
+            types[offset] = code
+            page_pks[offset] = pk
+
+    def get(
+        self,
+        step_id: int,
+        default: Optional[int] = None,
+    ) -> Optional[int]:
+        """
+        Return the primary key imported for an id, or `default`.
+        """
+        page = self._pages.get(step_id >> _PAGE_BITS) if step_id >= 0 else None
+        if page is not None and page[1][step_id & _PAGE_MASK]:
+            return page[0][step_id & _PAGE_MASK]
+        return default
+
+    def entity_type(self, step_id: int) -> Optional[str]:
+        """
+        Return the entity type imported for an id, or `None`.
+        """
+        page = self._pages.get(step_id >> _PAGE_BITS) if step_id >= 0 else None
+        if page is not None:
+            code = page[1][step_id & _PAGE_MASK]
+            if code:
+                return self.entity_types[code]
+        return None
+
+    # Class | Helpers
+    # =========================================================================
+
+    def _page(self, step_id: int) -> tuple[array, array]:
+        """
+        Return the buffers of the page of an id, allocating them if needed.
+        """
+        if step_id < 0:
+            raise ValueError(f"Invalid STEP instance id: {step_id}")
+        page = self._pages.get(step_id >> _PAGE_BITS)
+        if page is None:
+            page = self._pages[step_id >> _PAGE_BITS] = (
+                array("q", [_MISSING]) * PAGE_SIZE,
+                array("H", [0]) * PAGE_SIZE,
+            )
+        return page
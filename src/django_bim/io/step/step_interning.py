@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC STEP Row Interning Class
+=====================================
+
+Authoring tools write one `IfcOwnerHistory` per element even though nearly
+all of them carry the same user, application, state and change action. This
+module merges such rows on import: every row is identified by a hash of its
+identifying fields, stored in a unique column, and each distinct combination
+is created only once and shared by all entities that use it.
+
+Lookups go through an in-memory LRU cache first, then through the unique
+hash column for the combinations created by earlier batches or imports, and
+only the combinations that are still unknown are bulk created.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import hashlib
+from collections import OrderedDict
+from typing import Any, Sequence
+
+# Import | Libraries
+from django.db import DEFAULT_DB_ALIAS, models
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "DEFAULT_INTERNING_CACHE_SIZE",
+    "StepRowInterner",
+]
+
+DEFAULT_INTERNING_CACHE_SIZE = 65536
+
+# Number of keys per `key__in` query, below the SQLite variable limit
+_LOOKUP_BATCH_SIZE = 900
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class StepRowInterner:
+    """
+    STEP Row Interner Class
+    =======================
+
+    Maps model instances onto shared rows identified by a hash of their
+    identifying fields.
+
+    Attributes:
+        model (type[models.Model]): The interned model.
+        fields (tuple): Names of the fields that identify a row.
+        key_field (str): Name of the unique column holding the hash.
+        cache_size (int): Maximum number of keys kept in the LRU cache.
+        using (str): The database alias.
+        created (int): Number of rows created so far.
+        reused (int): Number of instances mapped onto existing rows.
+
+    """
+
+    def __init__(
+        self,
+        model: type[models.Model],
+        fields: Sequence[str],
+        key_field: str = "interning_key",
+        cache_size: int = DEFAULT_INTERNING_CACHE_SIZE,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> None:
+        """
+        Initialise the interner.
+        """
+        self.model = model
+        self.fields = tuple(fields)
+        self.key_field = key_field
+        self.cache_size = cache_size
+        self.using = using
+        self.created = 0
+        self.reused = 0
+        self._cache: OrderedDict[str, int] = OrderedDict()
+        self._model_fields = [
+            model._meta.get_field(name) for name in self.fields
+        ]
+
+    # Class | Public Methods
+    # =========================================================================
+
+    def key(self, instance: models.Model) -> str:
+        """
+        Return the interning key of an instance.
+
+        The identifying values are normalised with `get_prep_value`, so e.g.
+        a datetime and its epoch timestamp give the same key.
+
+        Parameters:
+            instance (models.Model): The instance.
+
+        Returns:
+            str: A 32-character hexadecimal hash.
+        """
+        values = tuple(
+            field.get_prep_value(getattr(instance, field.attname))
+            for field in self._model_fields
+        )
+        return hashlib.blake2b(
+            repr(values).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+
+    def intern(self, instances: Sequence[models.Model]) -> list[int]:
+        """
+        Map instances onto shared rows, creating the missing ones.
+
+        Every instance gets the primary key of its shared row assigned.
+
+        Parameters:
+            instances (Sequence[models.Model]): Unsaved instances.
+
+        Returns:
+            list: The primary key of the row of each instance, in order.
+        """
+        keys = [self.key(instance) for instance in instances]
+        found = self._lookup(keys)
+
+        missing: dict[str, models.Model] = {}
+        for key, instance in zip(keys, instances):
+            if key not in found and key not in missing:
+                setattr(instance, self.key_field, key)
+                missing[key] = instance
+        if missing:
+            manager = self.model._default_manager.using(self.using)
+            # Conflicts come from concurrent imports creating the same rows;
+            # their keys are read back below like the created ones
+            manager.bulk_create(
+                list(missing.values()),
+                ignore_conflicts=True,
+            )
+            found.update(self._fetch(list(missing)))
+            self.created += len(missing)
+
+        pks = []
+        for key, instance in zip(keys, instances):
+            pk = found[key]
+            instance.pk = pk
+            pks.append(pk)
+        self.reused += len(instances) - len(missing)
+        self._remember(found)
+        return pks
+
+    # Class | Helpers
+    # =========================================================================
+
+    def _lookup(self, keys: list[str]) -> dict[str, int]:
+        """
+        Resolve keys through the cache, then through the database.
+        """
+        cache = self._cache
+        found: dict[str, int] = {}
+        unknown: set[str] = set()
+        for key in keys:
+            pk = cache.get(key)
+            if pk is None:
+                unknown.add(key)
+            else:
+                cache.move_to_end(key)
+                found[key] = pk
+        if unknown:
+            found.update(self._fetch(list(unknown)))
+        return found
+
+    def _fetch(self, keys: list[str]) -> dict[str, int]:
+        """
+        Read the primary keys of existing rows by their keys.
+        """
+        manager = self.model._default_manager.using(self.using)
+        found: dict[str, int] = {}
+        lookup = f"{self.key_field}__in"
+        for start in range(0, len(keys), _LOOKUP_BATCH_SIZE):
+            batch = keys[start:start + _LOOKUP_BATCH_SIZE]
+            found.update(
+                manager.filter(**{lookup: batch})
+                .values_list(self.key_field, "pk")
+            )
+        return found
+
+    def _remember(self, found: dict[str, int]) -> None:
+        """
+        Add resolved keys to the LRU cache, evicting the oldest ones.
+        """
+        cache = self._cache
+        for key, pk in found.items():
+            cache[key] = pk
+            cache.move_to_end(key)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC STEP Parallel Parsing Functions
+============================================
+
+This module spreads the CPU-bound part of a STEP import, tokenising entity
+parameters and applying the builders, over a `ProcessPoolExecutor`.
+
+The DATA section is split into byte ranges on instance boundaries with
+`split_step_data`. Each worker parses one range and returns plain records
+(see `build_step_records`); the importing process consumes the records in
+file order and does all database work, so workers never share a database
+connection. At most `2 * workers` ranges are in flight, which bounds the
+memory held by pending results regardless of the file size.
+
+Ranges are at most `chunk_size` bytes, and small enough that every worker
+gets several of them, so files smaller than a few chunks are spread over
+the pool too. An importer running several passes opens the pool once with
+`open_worker_pool` and passes it to each `iter_parallel_records` call, so
+the workers set up Django once per import rather than once per pass.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Iterator, Optional, Union
+
+# Import | Libraries
+
+# Import | Local Modules
+from .step_reader import iter_step_entities, split_step_data
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "DEFAULT_CHUNK_SIZE",
+    "iter_parallel_records",
+    "open_worker_pool",
+]
+
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Ranges each worker gets at least, for files smaller than the chunks
+_RANGES_PER_WORKER = 4
+
+# Smallest range split off to balance the workers, in bytes
+_MIN_CHUNK_SIZE = 64 * 1024
+
+# Builders of the current worker process, set by `_initialise_worker`
+_worker_builders: Optional[dict[str, Any]] = None
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def _initialise_worker(builders: Optional[dict[str, Any]]) -> None:
+    """
+    Prepare a worker process.
+
+    Under the "spawn" start method the worker starts from a fresh
+    interpreter, so Django is set up before the builders (which reference
+    models) are imported.
+    """
+    global _worker_builders
+
+    from django.apps import apps
+
+    if not apps.ready:
+        import django
+
+        django.setup()
+    if builders is None:
+        from .step_builders import STEP_ENTITY_BUILDERS
+
+        builders = STEP_ENTITY_BUILDERS
+    _worker_builders = builders
+
+
+def _parse_range(
+    path: Union[str, os.PathLike],
+    start: int,
+    end: int,
+    phase: str,
+) -> tuple[int, list[tuple[Any, ...]]]:
+    """
+    Parse one byte range in a worker process.
+
+    Returns:
+        tuple: The number of entities in the range and the records of the
+            requested phase.
+    """
+    from .step_builders import build_step_records, step_entity_types
+
+    count = 0
+
+    def counted(entities):
+        nonlocal count
+        for entity in entities:
+            count += 1
+            yield entity
+
+    records = list(build_step_records(
+        counted(iter_step_entities(
+            path,
+            start,
+            end,
+            entity_types=step_entity_types(_worker_builders),
+        )),
+        _worker_builders,
+        phase,
+    ))
+    return count, records
+
+
+def _chunk_size(
+    path: Union[str, os.PathLike],
+    workers: int,
+    chunk_size: int,
+) -> int:
+    """
+    Return the size of the ranges of a file, at most `chunk_size` and small
+    enough to give each worker `_RANGES_PER_WORKER` ranges.
+    """
+    balanced = os.path.getsize(path) // (_RANGES_PER_WORKER * workers)
+    return min(chunk_size, max(balanced, _MIN_CHUNK_SIZE))
+
+
+def _submit(
+    executor: ProcessPoolExecutor,
+    ranges: list[tuple[int, int]],
+    path: Union[str, os.PathLike],
+    phase: str,
+    window: int,
+) -> Iterator[tuple[int, list[tuple[Any, ...]]]]:
+    """
+    Parse the ranges in the pool, with at most `window` in flight, and
+    yield their results in file order.
+    """
+    pending: deque[Future] = deque()
+    for start, end in ranges:
+        pending.append(executor.submit(_parse_range, path, start, end, phase))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def open_worker_pool(
+    workers: int,
+    builders: Optional[dict[str, Any]] = None,
+) -> ProcessPoolExecutor:
+    """
+    Start the worker processes of `iter_parallel_records`.
+
+    Parameters:
+        workers (int): Number of worker processes.
+        builders (dict): Custom builders, or `None` for the default
+            `STEP_ENTITY_BUILDERS`. Custom builders are pickled to the
+            workers and must therefore not use lambdas as converters.
+
+    Returns:
+        ProcessPoolExecutor: The pool, to shut down once the import ends.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialise_worker,
+        initargs=(builders,),
+    )
+
+
+def iter_parallel_records(
+    path: Union[str, os.PathLike],
+    phase: str,
+    workers: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    builders: Optional[dict[str, Any]] = None,
+    executor: Optional[ProcessPoolExecutor] = None,
+) -> Iterator[tuple[int, list[tuple[Any, ...]]]]:
+    """
+    Parse the DATA section of a file in worker processes.
+
+    Parameters:
+        path (str | PathLike): Path to the `.ifc` file.
+        phase (str): The import phase, see `build_step_records`.
+        workers (int): Number of worker processes.
+        chunk_size (int): Largest size of a parsed range in bytes.
+        builders (dict): Custom builders, see `open_worker_pool`; ignored
+            when `executor` is given.
+        executor (ProcessPoolExecutor): A pool opened with
+            `open_worker_pool`, or `None` to open one for this call.
+
+    Yields:
+        tuple: Per range, in file order, the number of entities read and
+            the list of records.
+    """
+    ranges = split_step_data(path, _chunk_size(path, workers, chunk_size))
+    if executor is None:
+        with open_worker_pool(workers, builders) as executor:
+            yield from _submit(executor, ranges, path, phase, 2 * workers)
+    else:
+        yield from _submit(executor, ranges, path, phase, 2 * workers)
@@ -0,0 +1,489 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC STEP Parser Functions
+==================================
+
+This module tokenises the parameter list of a single IFC-SPF (ISO 10303-21)
+entity instance, e.g. the `'2O2Fr$t4X7Zf8NOew3FLOH',#5,'Project',$` part of
+`#1=IFCPROJECT('2O2Fr$t4X7Zf8NOew3FLOH',#5,'Project',$);`, into plain Python
+values.
+
+Mapping of STEP values:
+- `$` (unset) and `*` (derived) become `None`.
+- `#123` becomes a `StepReference` (an `int` subclass).
+- `'text'` becomes a `str`, with the STEP escape sequences decoded.
+- `.T.` / `.F.` / `.U.` become `True` / `False` / `None`.
+- `.ENUM.` becomes a `StepEnum` (a `str` subclass holding `ENUM`).
+- Numbers become `int` or `float`.
+- Lists `(a,b)` become Python lists.
+- Typed values such as `IFCLABEL('x')` are unwrapped to their inner value.
+
+For more information, refer to:
+https://standards.buildingsmart.org/documents/Implementation/ImplementationGuide_IFCHeaderData_Version_1.0.2.pdf
+
+"""  # noqa E501
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import re
+import sys
+from array import array
+from typing import AbstractSet, Any, Callable, NamedTuple, Optional, Union
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "StepCoordinateList",
+    "StepEnum",
+    "StepParseError",
+    "StepReference",
+    "decode_step_string",
+    "parse_step_arguments",
+    "parse_step_coordinate_list",
+    "parse_step_indexed_segments",
+]
+
+_TOKEN_PATTERN = re.compile(
+    rb"""\s*(?:
+        \#(?P<ref>\d+)
+        |(?P<string>'(?:[^']|'')*')
+        |(?P<enum>\.[A-Za-z0-9_]+\.)
+        |(?P<number>[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+        |(?P<null>[$*])
+        |(?P<open>\()
+        |(?P<close>\))
+        |(?P<comma>,)
+        |(?P<keyword>[A-Za-z_][A-Za-z0-9_]*)
+        |(?P<binary>"[0-9A-Fa-f]*")
+    )""",
+    re.VERBOSE,
+)
+
+_ESCAPE_PATTERN = re.compile(
+    r"\\X2\\((?:[0-9A-Fa-f]{4})+)\\X0\\"
+    r"|\\X4\\((?:[0-9A-Fa-f]{8})+)\\X0\\"
+    r"|\\X\\([0-9A-Fa-f]{2})"
+    r"|\\S\\(.)"
+    r"|\\P[A-Z]\\"
+    r"|\\\\"
+)
+
+# End of the outer list of a list of coordinate tuples
+_COORDINATES_END_PATTERN = re.compile(rb"\)\s*\)|\(\s*\)")
+
+# Types of the segments of an `IfcIndexedPolyCurve`, in file order
+_SEGMENT_PATTERN = re.compile(rb"IFC(LINE|ARC)INDEX\s*\(", re.IGNORECASE)
+
+_LOGICALS: dict[bytes, Any] = {
+    b".T.": True,
+    b".F.": False,
+    b".U.": None,
+}
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class StepParseError(ValueError):
+    """
+    STEP Parse Error Class
+    ======================
+
+    Raised when an entity instance does not follow the IFC-SPF syntax.
+
+    """
+
+
+class StepCoordinateList(NamedTuple):
+    """
+    STEP Coordinate List Class
+    ==========================
+
+    The coordinate list of an `IfcCartesianPointList2D` / `3D`, decoded by
+    `parse_step_coordinate_list`.
+
+    Attributes:
+        dimensions (int): Coordinates per point.
+        count (int): Number of points.
+        coordinates (bytes): The coordinates as little-endian float64
+            values.
+
+    """
+
+    dimensions: int
+    count: int
+    coordinates: bytes
+
+
+class StepReference(int):
+    """
+    STEP Reference Class
+    ====================
+
+    An entity instance reference (`#123`) found in a parameter list.
+
+    Subclassing `int` keeps references cheap to create and compare while
+    still letting builders tell them apart from plain integer values.
+
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        """
+        Return the reference in its STEP notation.
+        """
+        return f"#{int(self)}"
+
+
+class StepEnum(str):
+    """
+    STEP Enum Class
+    ===============
+
+    An enumeration value (`.ELEMENT.`) found in a parameter list, holding the
+    bare enumeration item name, e.g. `ELEMENT`.
+
+    """
+
+    __slots__ = ()
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def _decode_escape(match: re.Match) -> str:
+    """
+    Decode a single STEP string escape sequence.
+    """
+    if match.group(1):
+        hex_value = match.group(1)
+        return bytes.fromhex(hex_value).decode("utf-16-be")
+    if match.group(2):
+        hex_value = match.group(2)
+        return bytes.fromhex(hex_value).decode("utf-32-be")
+    if match.group(3):
+        return bytes.fromhex(match.group(3)).decode("latin-1")
+    if match.group(4):
+        return chr(ord(match.group(4)) + 128)
+    if match.group(0) == "\\\\":
+        return "\\"
+    # Code page switches (\PA\ etc.) carry no character of their own
+    return ""
+
+
+def decode_step_string(value: str) -> str:
+    """
+    Decode a quoted STEP string literal into a Python string.
+
+    Parameters:
+        value (str): The literal including its surrounding quotes.
+
+    Returns:
+        str: The decoded string.
+    """
+    value = value[1:-1].replace("''", "'")
+    if "\\" not in value:
+        return value
+    return _ESCAPE_PATTERN.sub(_decode_escape, value)
+
+
+def _number(match: re.Match) -> Union[int, float]:
+    """
+    Decode a number token.
+    """
+    number = match.group("number")
+    if b"." in number or b"e" in number or b"E" in number:
+        return float(number)
+    return int(number)
+
+
+def _enum(match: re.Match) -> Any:
+    """
+    Decode an enumeration token, logicals included.
+    """
+    enum = match.group("enum")
+    if enum in _LOGICALS:
+        return _LOGICALS[enum]
+    return StepEnum(enum[1:-1].decode("ascii"))
+
+
+def _check_blank(text: Union[bytes, memoryview], position: int) -> None:
+    """
+    Raise an error unless the rest of a parameter list is blank.
+    """
+    if bytes(text[position:]).strip():
+        raise StepParseError(
+            f"Unexpected character at offset {position}: "
+            f"{bytes(text[position:position + 20])!r}"
+        )
+
+
+def _finish(
+    root: list[Any],
+    depth: int,
+    skip_depth: int,
+    skipped: bool,
+) -> list[Any]:
+    """
+    Check that every list of a parameter list was closed, and add the
+    trailing skipped attribute.
+    """
+    if depth != 1 or skip_depth:
+        raise StepParseError("Unbalanced parenthesis at end of parameters")
+    if skipped:
+        root.append(None)
+    return root
+
+
+def _skipped(attributes: Optional[AbstractSet[int]], attribute: int) -> bool:
+    """
+    Return whether a top-level attribute is skipped.
+    """
+    return attributes is not None and attribute not in attributes
+
+
+def _skipped_depth(kind: Optional[str], depth: int, position: int) -> int:
+    """
+    Return the nesting depth of a skipped attribute after a token.
+    """
+    if kind == "open":
+        return depth + 1
+    if kind == "close":
+        if not depth:
+            raise StepParseError(
+                f"Unbalanced parenthesis at offset {position}"
+            )
+        return depth - 1
+    return depth
+
+
+def _nest(
+    kind: Optional[str],
+    stack: list[list[Any]],
+    typed: list[bool],
+    keyword: bool,
+    position: int,
+) -> bool:
+    """
+    Open or close a list on the stack of open lists, unwrapping typed
+    values, and return whether a typed value (`IFCLABEL(`) starts.
+    """
+    if kind == "keyword":
+        return True
+    if kind == "open":
+        stack.append([])
+        typed.append(keyword)
+    elif kind == "close":
+        if len(stack) == 1:
+            raise StepParseError(
+                f"Unbalanced parenthesis at offset {position}"
+            )
+        closed = stack.pop()
+        if typed.pop():
+            stack[-1].append(closed[0] if closed else None)
+        else:
+            stack[-1].append(closed)
+    return False
+
+
+# Decoders of the tokens holding a single value
+_SCALARS: dict[str, Callable[[re.Match], Any]] = {
+    "ref": lambda match: StepReference(match.group("ref")),
+    "string": lambda match: decode_step_string(
+        match.group("string").decode("latin-1")
+    ),
+    "number": _number,
+    "enum": _enum,
+    "null": lambda match: None,
+    "binary": lambda match: match.group("binary")[1:-1].decode("ascii"),
+}
+
+
+def parse_step_arguments(
+    text: Union[bytes, memoryview, str],
+    attributes: Optional[AbstractSet[int]] = None,
+) -> list[Any]:
+    """
+    Parse the parameter list of an entity instance.
+
+    When only some attributes are needed, `attributes` restricts decoding
+    to those top-level positions: the other attributes are still tokenised
+    to find their boundaries, but no values are built for them and parsing
+    stops after the last wanted attribute.
+
+    Parameters:
+        text (bytes | memoryview | str): The bytes between the outer
+            parentheses of the entity instance, e.g. `'abc',#5,$,(1.,2.)`.
+            Text is encoded as Latin-1 first.
+        attributes (AbstractSet[int]): Optional indices of the top-level
+            attributes to decode. Skipped attributes are returned as
+            `None` and trailing ones are omitted.
+
+    Returns:
+        list: The decoded attribute values, in schema order.
+
+    Raises:
+        StepParseError: If the text is not a valid STEP parameter list.
+    """
+    if isinstance(text, str):
+        text = text.encode("latin-1")
+    root: list[Any] = []
+    stack: list[list[Any]] = [root]
+    # Typed values (IFCLABEL('x')) are unwrapped when their list closes
+    typed: list[bool] = [False]
+    pending_keyword = False
+    position = 0
+    length = len(text)
+    # Top-level attribute being read, and whether (and how deep) it is
+    # being skipped
+    attribute = 0
+    last = max(attributes, default=-1) if attributes is not None else length
+    skip = _skipped(attributes, 0)
+    skip_depth = 0
+
+    while position < length:
+        match = _TOKEN_PATTERN.match(text, position)
+        if match is None:
+            _check_blank(text, position)
+            break
+        position = match.end()
+        kind = match.lastgroup
+
+        if kind == "comma":
+            if len(stack) == 1 and not skip_depth:
+                if skip:
+                    root.append(None)
+                attribute += 1
+                if attribute > last:
+                    return root
+                skip = _skipped(attributes, attribute)
+            continue
+        if skip:
+            skip_depth = _skipped_depth(kind, skip_depth, position)
+            continue
+
+        value = _SCALARS.get(kind)
+        if value is not None:
+            stack[-1].append(value(match))
+            pending_keyword = False
+        else:
+            pending_keyword = _nest(
+                kind, stack, typed, pending_keyword, position,
+            )
+    return _finish(root, len(stack), skip_depth, skip and length > 0)
+
+
+def parse_step_coordinate_list(
+    text: Union[bytes, memoryview, str],
+    attributes: Optional[AbstractSet[int]] = None,
+) -> list[Any]:
+    """
+    Parse the first attribute of an entity holding a list of coordinate
+    tuples, e.g. `((0.,0.,0.),(1.,0.,0.)),$` for an
+    `IfcCartesianPointList3D`.
+
+    Such lists hold the vertices of whole meshes, so instead of tokenising
+    every number, the list is split on its separators and converted in one
+    pass to packed float64 values. The other attributes are not decoded.
+
+    Parameters:
+        text (bytes | memoryview | str): The bytes between the outer
+            parentheses of the entity instance.
+        attributes (AbstractSet[int]): Accepted for compatibility with
+            `parse_step_arguments`; only the first attribute is decoded.
+
+    Returns:
+        list: A single `StepCoordinateList`.
+
+    Raises:
+        StepParseError: If the first attribute is not a list of tuples of
+            numbers of equal length.
+    """
+    if isinstance(text, str):
+        text = text.encode("latin-1")
+    data = bytes(text)
+    start = data.find(b"(")
+    if start < 0 or data[:start].strip():
+        raise StepParseError("Expected a list of coordinate tuples.")
+    # A plain search finds the end of well-formed lists much faster than
+    # the pattern, which also allows whitespace and empty lists
+    end = data.find(b"))", start)
+    if end < 0 or data[start + 1:start + 2] != b"(":
+        match = _COORDINATES_END_PATTERN.search(data, start)
+        if match is None:
+            raise StepParseError("Expected a list of coordinate tuples.")
+        end = match.start()
+    body = data[start + 1:end + 1].strip()
+    if not body:
+        return [StepCoordinateList(3, 0, b"")]
+    count = body.count(b"(")
+    first = body[:body.find(b")")]
+    dimensions = first.count(b",") + 1
+    try:
+        values = array(
+            "d",
+            map(float, body.translate(None, b"() \t\r\n").split(b",")),
+        )
+    except ValueError as error:
+        raise StepParseError(f"Invalid coordinate: {error}") from None
+    if len(values) != count * dimensions:
+        raise StepParseError(
+            f"Expected {count} tuples of {dimensions} coordinates."
+        )
+    if sys.byteorder == "big":
+        values.byteswap()
+    return [StepCoordinateList(dimensions, count, values.tobytes())]
+
+
+def parse_step_indexed_segments(
+    text: Union[bytes, memoryview, str],
+    attributes: Optional[AbstractSet[int]] = None,
+) -> list[Any]:
+    """
+    Parse the parameter list of an `IfcIndexedPolyCurve`, keeping the type
+    of its segments, e.g. `#1,(IFCLINEINDEX((1,2)),IFCARCINDEX((2,3,4))),$`.
+
+    `parse_step_arguments` unwraps typed values, which would leave lines
+    of three points and arcs apart only by their position, so the types are
+    read from the text and paired with the unwrapped segments.
+
+    Parameters:
+        text (bytes | memoryview | str): The bytes between the outer
+            parentheses of the entity instance.
+        attributes (AbstractSet[int]): Optional indices of the top-level
+            attributes to decode, see `parse_step_arguments`.
+
+    Returns:
+        list: The decoded attribute values, the segments as `[kind,
+            indices]` pairs with `kind` being `LINE` or `ARC`.
+    """
+    if isinstance(text, str):
+        text = text.encode("latin-1")
+    arguments = parse_step_arguments(text, attributes)
+    if len(arguments) > 1 and isinstance(arguments[1], list):
+        kinds = _SEGMENT_PATTERN.findall(bytes(text))
+        arguments[1] = [
+            [kind.decode("ascii").upper(), indices]
+            for kind, indices in zip(kinds, arguments[1])
+        ]
+    return arguments
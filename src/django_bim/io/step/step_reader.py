@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC STEP Reader Functions
+==================================
+
+This module streams the entity instances of the DATA section of an IFC-SPF
+(STEP) file.
+
+The file is memory-mapped and scanned with a compiled bytes pattern, and
+every instance is yielded as a `StepEntity` whose parameters are a
+`memoryview` slice of the mapping. No parameter bytes are copied or decoded
+until a builder parses the attributes it needs, the mapped pages are shared
+with the page cache rather than held on the Python heap, and instances of
+entity types that are not persisted can be filtered out by comparing their
+type name in place.
+
+For parallel imports, `split_step_data` divides the DATA section into byte
+ranges that start on instance boundaries, and `iter_step_entities` can read
+a single such range.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import mmap
+import os
+import re
+from typing import AbstractSet, Iterator, NamedTuple, Optional, Union
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "StepEntity",
+    "iter_step_entities",
+    "split_step_data",
+]
+
+# `#id=TYPE(parameters);` where the parameters may contain quoted strings
+# holding `;` or doubled quotes. The unrolled string loop keeps matching
+# linear in the length of the instance.
+_INSTANCE_PATTERN = re.compile(
+    rb"#(\d+)\s*=\s*([A-Za-z0-9_]+)\s*"
+    rb"\(([^';]*(?:'[^']*(?:''[^']*)*'[^';]*)*)\)\s*;"
+)
+
+_DATA_PATTERN = re.compile(rb"^[ \t]*DATA[ \t]*(?:\([^)]*\))?[ \t]*;", re.M)
+
+_ENDSEC_MARKER = b"ENDSEC;"
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class StepEntity(NamedTuple):
+    """
+    STEP Entity Class
+    =================
+
+    A single entity instance read from the DATA section.
+
+    Attributes:
+        step_id (int): The instance id, i.e. `123` for `#123`.
+        entity_type (str): The upper-case entity type, e.g. `IFCPROJECT`.
+        arguments (memoryview): The raw bytes between the outer
+            parentheses, to be decoded with `parse_step_arguments`. The view
+            points into the memory-mapped file, so it should be parsed while
+            the entity stream is consumed rather than kept around.
+
+    """
+
+    step_id: int
+    entity_type: str
+    arguments: memoryview
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def _open_mapping(path: Union[str, os.PathLike]) -> mmap.mmap:
+    """
+    Memory-map a file for reading.
+    """
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            raise ValueError(f"{os.fspath(path)} is empty.")
+        return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _find_data_section(buffer: mmap.mmap) -> tuple[int, int]:
+    """
+    Return the byte offsets of the first and past-the-last instance of the
+    DATA section.
+    """
+    match = _DATA_PATTERN.search(buffer)
+    if match is None:
+        raise ValueError("The file has no DATA section.")
+    start = match.end()
+    end = buffer.rfind(_ENDSEC_MARKER, start)
+    return start, (end if end != -1 else len(buffer))
+
+
+def iter_step_entities(
+    path: Union[str, os.PathLike],
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+    entity_types: Optional[AbstractSet[bytes]] = None,
+) -> Iterator[StepEntity]:
+    """
+    Stream the entity instances of an IFC-SPF file.
+
+    Complex (multi-type) instances such as `#1=(IFCA()IFCB());` are not
+    mapped to any model and are skipped.
+
+    Parameters:
+        path (str | PathLike): Path to the `.ifc` file.
+        start (int): Optional byte offset of a range returned by
+            `split_step_data`; the whole DATA section is read if omitted.
+        end (int): Byte offset at which the range ends.
+        entity_types (AbstractSet[bytes]): Optional entity types to yield,
+            as upper-case bytes, e.g. `{b"IFCPROJECT"}`. Other instances
+            are skipped before their type name or parameters are decoded.
+
+    Yields:
+        StepEntity: The entity instances, in file order.
+    """
+    buffer = _open_mapping(path)
+    view = memoryview(buffer)
+    try:
+        if start is None:
+            start, data_end = _find_data_section(buffer)
+            end = data_end if end is None else end
+        elif end is None:
+            end = len(buffer)
+        for match in _INSTANCE_PATTERN.finditer(buffer, start, end):
+            type_start, type_end = match.span(2)
+            entity_type = view[type_start:type_end]
+            # Read-only byte views hash and compare like `bytes`
+            if entity_types is not None and entity_type not in entity_types:
+                continue
+            arguments_start, arguments_end = match.span(3)
+            yield StepEntity(
+                int(match.group(1)),
+                entity_type.tobytes().decode("ascii").upper(),
+                view[arguments_start:arguments_end],
+            )
+    finally:
+        view.release()
+        try:
+            buffer.close()
+        except BufferError:
+            # A consumer still holds an argument view; the mapping is
+            # unmapped once the last view is garbage collected
+            pass
+
+
+def split_step_data(
+    path: Union[str, os.PathLike],
+    chunk_size: int,
+) -> list[tuple[int, int]]:
+    """
+    Split the DATA section of an IFC-SPF file into byte ranges.
+
+    Every range starts at the beginning of an instance line (`#123=...`) so
+    that ranges can be parsed independently, e.g. in worker processes.
+
+    Parameters:
+        path (str | PathLike): Path to the `.ifc` file.
+        chunk_size (int): Approximate size of a range in bytes.
+
+    Returns:
+        list: `(start, end)` byte offsets, covering the DATA section.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    buffer = _open_mapping(path)
+    try:
+        start, end = _find_data_section(buffer)
+        boundaries = [start]
+        position = start + chunk_size
+        while position < end:
+            found = buffer.find(b"\n#", position, end)
+            if found == -1:
+                break
+            boundaries.append(found + 1)
+            position = found + 1 + chunk_size
+    finally:
+        buffer.close()
+    boundaries.append(end)
+    return list(zip(boundaries[:-1], boundaries[1:]))
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC STEP Spill Class
+=============================
+
+The passes of the STEP importer that follow references through the whole
+file, such as the reference hashes of an incremental import, keep a value
+per entity they reached. This module stores these values in a private
+temporary SQLite database instead of a dictionary: SQLite keeps the recent
+pages in a bounded cache and spills the others to a temporary file, so the
+memory of such a pass stays flat however large the file is.
+
+Values are pickled, which keeps the `StepReference` and `StepEnum` values
+of decoded attributes apart from plain integers and strings.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import pickle
+import sqlite3
+from typing import Any, Iterable, Iterator
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "DEFAULT_SPILL_CACHE_SIZE",
+    "StepSpill",
+]
+
+# Size of the page cache kept in memory, in KiB
+DEFAULT_SPILL_CACHE_SIZE = 16384
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class StepSpill:
+    """
+    STEP Spill Class
+    ================
+
+    Mapping of STEP instance ids to values, held in a temporary database
+    that spills to disk beyond its page cache.
+
+    Attributes:
+        cache_size (int): Size of the page cache kept in memory, in KiB.
+
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_SPILL_CACHE_SIZE) -> None:
+        """
+        Initialise an empty mapping.
+        """
+        self.cache_size = cache_size
+        # An empty name opens a private database backed by a temporary file
+        self._connection = sqlite3.connect("")
+        self._connection.execute(f"PRAGMA cache_size = {-int(cache_size)}")
+        self._connection.execute("PRAGMA journal_mode = OFF")
+        self._connection.execute("PRAGMA synchronous = OFF")
+        self._connection.execute(
+            "CREATE TABLE spill (id INTEGER PRIMARY KEY, value BLOB)"
+        )
+
+    # Class | Magic Methods
+    # =========================================================================
+
+    def __enter__(self) -> "StepSpill":
+        """
+        Return the mapping, closed when the block exits.
+        """
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """
+        Close the mapping, deleting its temporary file.
+        """
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Return the number of stored ids.
+        """
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM spill"
+        ).fetchone()[0]
+
+    def __contains__(self, step_id: int) -> bool:
+        """
+        Return whether a value is stored for an id.
+        """
+        return self._connection.execute(
+            "SELECT 1 FROM spill WHERE id = ?", (step_id,)
+        ).fetchone() is not None
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Iterate over the stored ids in ascending order.
+        """
+        for (step_id,) in self._connection.execute(
+            "SELECT id FROM spill ORDER BY id"
+        ):
+            yield step_id
+
+    def __setitem__(self, step_id: int, value: Any) -> None:
+        """
+        Store the value of an id.
+        """
+        self.update(((step_id, value),))
+
+    # Class | Public Methods
+    # =========================================================================
+
+    def get(self, step_id: int, default: Any = None) -> Any:
+        """
+        Return the value stored for an id, or `default`.
+        """
+        row = self._connection.execute(
+            "SELECT value FROM spill WHERE id = ?", (step_id,)
+        ).fetchone()
+        if row is None:
+            return default
+        return pickle.loads(row[0])
+
+    def update(self, items: Iterable[tuple[int, Any]]) -> None:
+        """
+        Store the values of several ids, replacing the stored ones.
+
+        Parameters:
+            items (Iterable[tuple[int, Any]]): The `(id, value)` pairs,
+                consumed lazily.
+        """
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO spill (id, value) VALUES (?, ?)",
+            (
+                (step_id, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+                for step_id, value in items
+            ),
+        )
+
+    def items(self) -> Iterator[tuple[int, Any]]:
+        """
+        Iterate over the stored `(id, value)` pairs in ascending id order.
+        """
+        for step_id, value in self._connection.execute(
+            "SELECT id, value FROM spill ORDER BY id"
+        ):
+            yield step_id, pickle.loads(value)
+
+    def values(self) -> Iterator[Any]:
+        """
+        Iterate over the stored values in ascending id order.
+        """
+        for _, value in self.items():
+            yield value
+
+    def close(self) -> None:
+        """
+        Close the database, deleting its temporary file.
+        """
+        self._connection.close()
@@ -0,0 +1,1089 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC STEP Entity Writer Classes
+=======================================
+
+This module is the counterpart of `step_builders`: it maps the Django models
+of `django_bim.models.ifc` back onto IFC-SPF entity instances.
+
+Each `StepEntityWriter` lists the attributes of one entity type in schema
+order as `StepAttribute` specifications, and selects the rows that belong to
+a project. Rows are read with `values()` so no model instances are created,
+and references are written through the `#id` mapping of the exporter.
+
+Entities that are not stored as rows of their own are derived from the row
+of another model, under a key of their own for the `#id` mapping, e.g. the
+`IfcAxis2Placement3D` of a local placement and its location and directions
+from the stored transform, or the `IfcRelAggregates` of a product from its
+container.
+
+Attributes listing many rows (many-to-many fields and the generic relations
+of units and representation items) are read with one query per chunk of
+rows, see `StepEntityWriter.rows`.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import calendar
+import datetime
+import itertools
+import uuid
+from collections import defaultdict
+from typing import Any, Callable, Iterator, NamedTuple, Optional, Union
+
+# Import | Libraries
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+# Import | Local Modules
+from ...models.ifc.actor.model_ifc_organization import IfcOrganizationModel
+from ...models.ifc.actor.model_ifc_person import IfcPersonModel
+from ...models.ifc.actor.model_ifc_person_organization import (
+    IfcPersonAndOrganizationModel,
+)
+from ...models.ifc.geometry.model_ifc_cartesian_point import (
+    IfcCartesianPoint,
+)
+from ...models.ifc.geometry.model_ifc_cartesian_point_list import (
+    IfcCartesianPointListModel,
+    unpack_points,
+)
+from ...models.ifc.geometry.model_ifc_geometry_curve_line import IfcLine
+from ...models.ifc.geometry.model_ifc_indexed_poly_curve import (
+    IfcIndexedPolyCurveModel,
+)
+from ...models.ifc.geometry.model_ifc_triangulated_face_set import (
+    IfcTriangulatedFaceSetModel,
+    unpack_indices,
+)
+from ...models.ifc.grid.model_ifc_grid import IfcGridModel
+from ...models.ifc.grid.model_ifc_grid_axis import IfcGridAxisModel
+from ...models.ifc.model_ifc_application import IfcApplicationModel
+from ...models.ifc.model_ifc_owner_history import IfcOwnerHistoryModel
+from ...models.ifc.model_ifc_product import IfcProductModel
+from ...models.ifc.model_ifc_product_representation import (
+    IfcProductRepresentation,
+)
+from ...models.ifc.model_ifc_project import IfcProjectModel
+from ...models.ifc.placement.model_ifc_placement_local import (
+    IfcLocalPlacementModel,
+)
+from ...models.ifc.representation import IfcRepresentationItemRelation
+from ...models.ifc.representation.model_ifc_representation import (
+    IfcRepresentationModel,
+)
+from ...models.ifc.representation.model_ifc_representation_context import (
+    IfcRepresentationContextModel,
+)
+from ...models.ifc.unit.model_ifc_unit_assignment import IfcUnitAssignment
+from ...models.ifc.unit.model_ifc_unit_relation import IfcUnitRelation
+from ...models.ifc.unit.model_ifc_unit_si import IfcSIUnitModel
+from ...utils.guid import from_uuid
+from ...utils.matrix import IDENTITY, placement_axes
+from .step_encoder import DERIVED, StepTyped
+from .step_parser import StepEnum
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "STEP_ENTITY_WRITERS",
+    "StepAttribute",
+    "StepEntityWriter",
+    "WriterKey",
+    "key_model",
+]
+
+# Identifies a block of `#ids`: a model, or `(model, name)` for the entities
+# derived from each row of a model
+WriterKey = Union[type[models.Model], tuple[type[models.Model], str]]
+
+# Resolves `(key, pk)` to the `#id` of the exported row
+ReferenceResolver = Callable[[WriterKey, Optional[int]], Any]
+
+# Fills the prefetched values of a chunk of rows, read from a database
+RowPrefetcher = Callable[[list[dict[str, Any]], str], None]
+
+# Number of values per `__in` query, below the SQLite variable limit
+_LOOKUP_BATCH_SIZE = 900
+
+# Namespace of the GUIDs of the relationships derived from products
+_RELATIONSHIP_NAMESPACE = uuid.uuid5(
+    uuid.NAMESPACE_URL, "https://www.djangobim.com/ifc/relationships",
+)
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class StepAttribute(NamedTuple):
+    """
+    STEP Attribute Class
+    ====================
+
+    Specification of one entity attribute.
+
+    Attributes:
+        columns (tuple): The `values()` columns the attribute is read from.
+        value (Callable): Called with the row and the reference resolver,
+            returns the Python value to format.
+        prefetch (Callable): Optional function adding the values the
+            attribute reads from other tables to a chunk of rows.
+
+    """
+
+    columns: tuple[str, ...]
+    value: Callable[[dict[str, Any], ReferenceResolver], Any]
+    prefetch: Optional[RowPrefetcher] = None
+
+
+class StepEntityWriter:
+    """
+    STEP Entity Writer Class
+    ========================
+
+    Describes how rows of one Django model are written as IFC entities.
+
+    Attributes:
+        entity_type (str): The upper-case entity type written.
+        model (type[models.Model]): The model the rows are read from.
+        attributes (tuple): The `StepAttribute` of every entity attribute,
+            in schema order.
+        select (Callable): Called with the exported project, returns the
+            queryset of rows to write.
+        key (WriterKey): The block of `#ids` of the written entities, by
+            default the model.
+        columns (tuple): The columns read for each row.
+        prefetches (tuple): The prefetch functions of the attributes.
+
+    """
+
+    def __init__(
+        self,
+        entity_type: str,
+        model: type[models.Model],
+        attributes: tuple[StepAttribute, ...],
+        select: Optional[Callable[[Any], models.QuerySet]] = None,
+        key: Optional[WriterKey] = None,
+    ) -> None:
+        """
+        Initialise the writer.
+        """
+        self.entity_type = entity_type
+        self.model = model
+        self.attributes = attributes
+        self.key = key or model
+        self.prefetches = tuple(
+            attribute.prefetch for attribute in attributes
+            if attribute.prefetch is not None
+        )
+        self.select = select or (
+            lambda project: model._default_manager.all()
+        )
+        columns = ["pk"]
+        for attribute in attributes:
+            columns.extend(
+                column for column in attribute.columns
+                if column not in columns
+            )
+        self.columns = tuple(columns)
+
+    def queryset(
+        self,
+        project: Any,
+        columns: tuple[str, ...] = (),
+    ) -> models.QuerySet:
+        """
+        Return the rows of a project as `values()` dictionaries, in primary
+        key order.
+
+        Parameters:
+            project (IfcProjectModel): The exported project.
+            columns (tuple): Further columns to read, e.g. joined ones.
+
+        Returns:
+            QuerySet: The rows to write.
+        """
+        return self.select(project).order_by("pk").values(
+            *self.columns,
+            *(column for column in columns if column not in self.columns),
+        )
+
+    def rows(
+        self,
+        project: Any,
+        using: str,
+        chunk_size: int,
+        columns: tuple[str, ...] = (),
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream the rows of a project, with the values of the attributes
+        listing other rows prefetched per chunk.
+
+        Parameters:
+            project (IfcProjectModel): The exported project.
+            using (str): The database alias to read from.
+            chunk_size (int): Number of rows fetched per round trip.
+            columns (tuple): Further columns to read, e.g. joined ones.
+
+        Yields:
+            dict: The `values()` rows.
+        """
+        rows = self.queryset(project, columns).using(using).iterator(
+            chunk_size=chunk_size,
+        )
+        if not self.prefetches:
+            yield from rows
+            return
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                return
+            for prefetch in self.prefetches:
+                prefetch(chunk, using)
+            yield from chunk
+
+    def build_arguments(
+        self,
+        row: dict[str, Any],
+        resolve: ReferenceResolver,
+    ) -> list[Any]:
+        """
+        Return the attribute values of a row, in schema order.
+
+        Parameters:
+            row (dict): The `values()` row.
+            resolve (Callable): Maps `(key, pk)` to a `StepReference`.
+
+        Returns:
+            list: The values to format with `format_step_entity`.
+        """
+        return [attribute.value(row, resolve) for attribute in self.attributes]
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def key_model(key: WriterKey) -> type[models.Model]:
+    """
+    Return the model whose primary keys number the `#ids` of a key.
+
+    Parameters:
+        key (WriterKey): A model, or `(model, name)`.
+
+    Returns:
+        type[models.Model]: The model.
+    """
+    return key[0] if isinstance(key, tuple) else key
+
+
+def _unset() -> StepAttribute:
+    """
+    An attribute that is not stored and written as `$`.
+    """
+    return StepAttribute((), lambda row, resolve: None)
+
+
+def _constant(value: Any) -> StepAttribute:
+    """
+    An attribute written with a fixed value.
+    """
+    return StepAttribute((), lambda row, resolve: value)
+
+
+def _field(
+    name: str,
+    convert: Optional[Callable[[Any], Any]] = None,
+) -> StepAttribute:
+    """
+    An attribute read from a model field. The converter is skipped for
+    null values.
+    """
+    if convert is None:
+        return StepAttribute((name,), lambda row, resolve: row[name])
+    return StepAttribute(
+        (name,),
+        lambda row, resolve: (
+            None if row[name] is None else convert(row[name])
+        ),
+    )
+
+
+def _reference(name: str, key: WriterKey) -> StepAttribute:
+    """
+    An attribute referencing the row of a foreign key.
+    """
+    column = f"{name}_id"
+    return StepAttribute(
+        (column,),
+        lambda row, resolve: resolve(key, row[column]),
+    )
+
+
+def _derived(key: WriterKey) -> StepAttribute:
+    """
+    An attribute referencing the entity derived from the same row.
+    """
+    return StepAttribute((), lambda row, resolve: resolve(key, row["pk"]))
+
+
+def _vector(column: str, index: int) -> StepAttribute:
+    """
+    The location (0), Z axis (1) or X axis (2) of the placement matrix
+    stored in a column, see `placement_axes`.
+    """
+    return StepAttribute(
+        (column,),
+        lambda row, resolve: [
+            float(value)
+            for value in placement_axes(row[column] or IDENTITY)[index]
+        ],
+    )
+
+
+def _labels(value: str) -> list[str]:
+    """
+    Split a stored space-separated label list such as `MiddleNames`.
+    """
+    return value.split()
+
+
+def _timestamp(value: Any) -> int:
+    """
+    Convert a stored timestamp to `IfcTimeStamp` seconds since the epoch.
+    """
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            return int(value.timestamp())
+        return calendar.timegm(value.utctimetuple())
+    return int(value)
+
+
+def _point(prefix: str = "") -> StepAttribute:
+    """
+    The coordinate list of an `IfcCartesianPoint`, from the `x`, `y` and
+    optional `z` columns, e.g. `start_x` with the prefix `start_`.
+    """
+    columns = tuple(f"{prefix}{axis}" for axis in "xyz")
+    return StepAttribute(
+        columns,
+        lambda row, resolve: [
+            float(row[column]) for column in columns
+            if row[column] is not None
+        ],
+    )
+
+
+def _point_list() -> StepAttribute:
+    """
+    The nested coordinate list of an `IfcCartesianPointList`.
+    """
+    return StepAttribute(
+        ("dimensions", "coordinates"),
+        lambda row, resolve: unpack_points(
+            row["coordinates"], row["dimensions"],
+        ),
+    )
+
+
+def _segments(value: list[Any]) -> list[StepTyped]:
+    """
+    Type the stored `[kind, indices]` segments of an `IfcIndexedPolyCurve`
+    as `IfcLineIndex` / `IfcArcIndex` values.
+    """
+    return [StepTyped(f"IFC{kind}INDEX", indices) for kind, indices in value]
+
+
+def _normals(value: bytes) -> Optional[list[tuple[float, ...]]]:
+    """
+    Unpack the normals of an `IfcTriangulatedFaceSet`.
+    """
+    return unpack_points(value, 3) or None
+
+
+def _index_list(value: bytes) -> list[int]:
+    """
+    Unpack a flat list of indices such as a `PnIndex`.
+    """
+    return [index for index, in unpack_indices(value, 1)]
+
+
+# Row selections, following the references of a project
+# -----------------------------------------------------------------------------
+
+def _owner_histories(project: Any) -> models.QuerySet:
+    """
+    Select the owner histories of a project and of its products.
+    """
+    return IfcOwnerHistoryModel._default_manager.filter(
+        models.Q(pk=project.owner_history_id)
+        | models.Q(pk__in=_products(project).values("owner_history"))
+    )
+
+
+def _applications(project: Any) -> models.QuerySet:
+    """
+    Select the applications of the owner history of a project.
+    """
+    return IfcApplicationModel._default_manager.filter(
+        pk__in=_owner_histories(project).values("application"),
+    )
+
+
+def _users(project: Any) -> models.QuerySet:
+    """
+    Select the users of the owner history of a project.
+    """
+    histories = _owner_histories(project)
+    return IfcPersonAndOrganizationModel._default_manager.filter(
+        models.Q(pk__in=histories.values("creation_user"))
+        | models.Q(pk__in=histories.values("modification_user"))
+    )
+
+
+def _persons(project: Any) -> models.QuerySet:
+    """
+    Select the persons of the users of a project.
+    """
+    return IfcPersonModel._default_manager.filter(
+        pk__in=_users(project).values("person"),
+    )
+
+
+def _organizations(project: Any) -> models.QuerySet:
+    """
+    Select the organizations of the users and applications of a project.
+    """
+    return IfcOrganizationModel._default_manager.filter(
+        models.Q(pk__in=_users(project).values("organization"))
+        | models.Q(
+            pk__in=_applications(project).values("application_developer")
+        )
+    )
+
+
+def _si_units(project: Any) -> models.QuerySet:
+    """
+    Select the SI units assigned to a project.
+    """
+    return IfcSIUnitModel._default_manager.filter(
+        pk__in=IfcUnitRelation._default_manager.filter(
+            assignment=project.units_in_context_id,
+            content_type=ContentType.objects.get_for_model(IfcSIUnitModel),
+        ).values("object_id"),
+    )
+
+
+def _contexts(project: Any) -> models.QuerySet:
+    """
+    Select the representation contexts of a project.
+    """
+    return IfcRepresentationContextModel._default_manager.filter(
+        pk__in=project.representation_contexts.values("pk"),
+    )
+
+
+def _representations(project: Any) -> models.QuerySet:
+    """
+    Select the representations in the contexts of a project.
+    """
+    return IfcRepresentationModel._default_manager.filter(
+        context_of_items__in=_contexts(project),
+    )
+
+
+def _items(model: type[models.Model]) -> Callable[[Any], models.QuerySet]:
+    """
+    Select the rows of a model that are items of the representations of a
+    project.
+    """
+    def select(project: Any) -> models.QuerySet:
+        return model._default_manager.filter(
+            pk__in=IfcRepresentationItemRelation._default_manager.filter(
+                representation__in=_representations(project),
+                content_type=ContentType.objects.get_for_model(model),
+            ).values("object_id"),
+        )
+    return select
+
+
+def _point_lists(dimensions: int) -> Callable[[Any], models.QuerySet]:
+    """
+    Select the point lists of a dimension that are representation items of
+    a project, or hold the points of its indexed curves and face sets.
+    """
+    items = _items(IfcCartesianPointListModel)
+    curves = _items(IfcIndexedPolyCurveModel)
+    face_sets = _items(IfcTriangulatedFaceSetModel)
+
+    def select(project: Any) -> models.QuerySet:
+        return IfcCartesianPointListModel._default_manager.filter(
+            models.Q(pk__in=items(project).values("pk"))
+            | models.Q(pk__in=curves(project).values("points"))
+            | models.Q(pk__in=face_sets(project).values("coordinates")),
+            dimensions=dimensions,
+        )
+    return select
+
+
+def _products(project: Any) -> models.QuerySet:
+    """
+    Select the products of a project, at any depth of its tree.
+    """
+    return IfcProductModel._default_manager.of_project(project)
+
+
+def _proxies(project: Any) -> models.QuerySet:
+    """
+    Select the products of a project without a more specific model.
+    """
+    return _products(project).filter(ifcgridmodel__isnull=True)
+
+
+def _grids(project: Any) -> models.QuerySet:
+    """
+    Select the grids of a project.
+    """
+    return IfcGridModel._default_manager.of_project(project)
+
+
+def _grid_axes(project: Any) -> models.QuerySet:
+    """
+    Select the axes of the grids of a project.
+    """
+    grids = _grids(project)
+    return IfcGridAxisModel._default_manager.filter(
+        models.Q(pk__in=grids.values("u_axes"))
+        | models.Q(pk__in=grids.values("v_axes"))
+        | models.Q(pk__in=grids.values("w_axes"))
+    )
+
+
+def _axis_lines(project: Any) -> models.QuerySet:
+    """
+    Select the lines of the grid axes of a project.
+    """
+    return IfcLine._default_manager.filter(
+        pk__in=_grid_axes(project).values("axis_curve"),
+    )
+
+
+def _product_representations(project: Any) -> models.QuerySet:
+    """
+    Select the representations of the products of a project.
+    """
+    return IfcProductRepresentation._default_manager.filter(
+        pk__in=_products(project).values("representation"),
+    )
+
+
+def _placements(project: Any) -> models.QuerySet:
+    """
+    Select the placements of the products of a project and the placements
+    they are relative to.
+    """
+    return IfcLocalPlacementModel._default_manager.filter(
+        pk__in=_products(project).values("object_placement"),
+    ).with_ancestors()
+
+
+# Attributes listing rows
+# -----------------------------------------------------------------------------
+
+def _in_batches(pks: list[int]) -> Iterator[list[int]]:
+    """
+    Split primary keys into batches for `__in` lookups.
+    """
+    for start in range(0, len(pks), _LOOKUP_BATCH_SIZE):
+        yield pks[start:start + _LOOKUP_BATCH_SIZE]
+
+
+def _many(
+    model: type[models.Model],
+    name: str,
+    target: WriterKey,
+    optional: bool = False,
+) -> StepAttribute:
+    """
+    An attribute listing the rows of a many-to-many field, in the order
+    they were linked. An empty list is written as `$` if the attribute is
+    optional.
+    """
+    field = model._meta.get_field(name)
+    through = field.remote_field.through
+    source = f"{field.m2m_field_name()}_id"
+    destination = f"{field.m2m_reverse_field_name()}_id"
+
+    def prefetch(rows: list[dict[str, Any]], using: str) -> None:
+        targets = defaultdict(list)
+        for pks in _in_batches([row["pk"] for row in rows]):
+            for pk, target_pk in (
+                through._default_manager.using(using)
+                .filter(**{f"{source}__in": pks})
+                .order_by("pk")
+                .values_list(source, destination)
+            ):
+                targets[pk].append(target_pk)
+        for row in rows:
+            row[name] = targets.get(row["pk"], [])
+
+    def value(row: dict[str, Any], resolve: ReferenceResolver) -> Any:
+        references = [resolve(target, pk) for pk in row[name]]
+        references = [
+            reference for reference in references if reference is not None
+        ]
+        if optional and not references:
+            return None
+        return references
+
+    return StepAttribute((), value, prefetch)
+
+
+def _related(model: type[models.Model], name: str) -> StepAttribute:
+    """
+    An attribute listing the rows linked through a generic relation table,
+    such as the units of a unit assignment, in the order they were linked.
+    Rows of models that are not exported are left out.
+    """
+    field = model._meta.get_field(name)
+    relation = field.related_model
+    source = field.field.attname
+
+    def prefetch(rows: list[dict[str, Any]], using: str) -> None:
+        types = ContentType.objects.db_manager(using)
+        targets = defaultdict(list)
+        for pks in _in_batches([row["pk"] for row in rows]):
+            for pk, content_type, object_id in (
+                relation._default_manager.using(using)
+                .filter(**{f"{source}__in": pks})
+                .order_by("pk")
+                .values_list(source, "content_type", "object_id")
+            ):
+                targets[pk].append((
+                    types.get_for_id(content_type).model_class(),
+                    object_id,
+                ))
+        for row in rows:
+            row[name] = targets.get(row["pk"], [])
+
+    def value(row: dict[str, Any], resolve: ReferenceResolver) -> Any:
+        references = [
+            resolve(target, pk) for target, pk in row[name]
+        ]
+        return [
+            reference for reference in references if reference is not None
+        ]
+
+    return StepAttribute((), value, prefetch)
+
+
+# Derived entities
+# -----------------------------------------------------------------------------
+
+def _axis_placement_writers(
+    model: type[models.Model],
+    column: str,
+    select: Callable[[Any], models.QuerySet],
+) -> tuple[StepEntityWriter, ...]:
+    """
+    Return the writers of the `IfcAxis2Placement3D` derived from the
+    placement matrix stored in a column, with its location and directions,
+    under the keys `(model, "placement")`, `(model, "location")`,
+    `(model, "axis")` and `(model, "ref_direction")`.
+    """
+    location = (model, "location")
+    axis = (model, "axis")
+    ref_direction = (model, "ref_direction")
+    return (
+        StepEntityWriter(
+            "IFCCARTESIANPOINT",
+            model,
+            (
+                _vector(column, 0),
+            ),
+            select=select,
+            key=location,
+        ),
+        StepEntityWriter(
+            "IFCDIRECTION",
+            model,
+            (
+                _vector(column, 1),
+            ),
+            select=select,
+            key=axis,
+        ),
+        StepEntityWriter(
+            "IFCDIRECTION",
+            model,
+            (
+                _vector(column, 2),
+            ),
+            select=select,
+            key=ref_direction,
+        ),
+        StepEntityWriter(
+            "IFCAXIS2PLACEMENT3D",
+            model,
+            (
+                _derived(location),
+                _derived(axis),
+                _derived(ref_direction),
+            ),
+            select=select,
+            key=(model, "placement"),
+        ),
+    )
+
+
+def _relationship_id() -> StepAttribute:
+    """
+    The `GlobalId` of a relationship derived from a rooted row, stable
+    across exports.
+    """
+    return StepAttribute(
+        ("global_id",),
+        lambda row, resolve: from_uuid(
+            uuid.uuid5(_RELATIONSHIP_NAMESPACE, row["global_id"])
+        ),
+    )
+
+
+def _relating_object() -> StepAttribute:
+    """
+    The container of a product, or its project for a top-level product.
+    """
+    return StepAttribute(
+        ("container_id", "project_id"),
+        lambda row, resolve: (
+            resolve(IfcProductModel, row["container_id"])
+            if row["container_id"] is not None
+            else resolve(IfcProjectModel, row["project_id"])
+        ),
+    )
+
+
+def _product_attributes() -> tuple[StepAttribute, ...]:
+    """
+    The attributes of `IfcProduct`, shared by its subtypes.
+    """
+    return (
+        _field("global_id"),
+        _reference("owner_history", IfcOwnerHistoryModel),
+        _field("name"),
+        _field("description"),
+        _field("object_type"),
+        _reference("object_placement", IfcLocalPlacementModel),
+        _reference("representation", IfcProductRepresentation),
+    )
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+# Writers in output order; referenced rows are written first where possible
+STEP_ENTITY_WRITERS: tuple[StepEntityWriter, ...] = (
+    StepEntityWriter(
+        "IFCPERSON",
+        IfcPersonModel,
+        (
+            _field("identifier"),
+            _field("family_name"),
+            _field("first_name"),
+            _field("middle_names", _labels),
+            _field("prefix_titles", _labels),
+            _field("suffix_titles", _labels),
+            _unset(),
+            _unset(),
+        ),
+        select=_persons,
+    ),
+    StepEntityWriter(
+        "IFCORGANIZATION",
+        IfcOrganizationModel,
+        (
+            _field("identifier"),
+            _field("name"),
+            _field("description"),
+            _unset(),
+            _unset(),
+        ),
+        select=_organizations,
+    ),
+    StepEntityWriter(
+        "IFCPERSONANDORGANIZATION",
+        IfcPersonAndOrganizationModel,
+        (
+            _reference("person", IfcPersonModel),
+            _reference("organization", IfcOrganizationModel),
+            _unset(),
+        ),
+        select=_users,
+    ),
+    StepEntityWriter(
+        "IFCAPPLICATION",
+        IfcApplicationModel,
+        (
+            _reference("application_developer", IfcOrganizationModel),
+            _field("version"),
+            _field("application_full_name"),
+            _field("application_identifier"),
+        ),
+        select=_applications,
+    ),
+    StepEntityWriter(
+        "IFCOWNERHISTORY",
+        IfcOwnerHistoryModel,
+        (
+            _reference("creation_user", IfcPersonAndOrganizationModel),
+            _reference("application", IfcApplicationModel),
+            _field("state", StepEnum),
+            _field("change_action", StepEnum),
+            _field("last_modified_date", _timestamp),
+            _reference("modification_user", IfcPersonAndOrganizationModel),
+            _unset(),
+            _field("creation_date", _timestamp),
+        ),
+        select=_owner_histories,
+    ),
+    StepEntityWriter(
+        "IFCSIUNIT",
+        IfcSIUnitModel,
+        (
+            _constant(DERIVED),
+            _field("unit_type", StepEnum),
+            _field("prefix", StepEnum),
+            _field("name", StepEnum),
+        ),
+        select=_si_units,
+    ),
+    StepEntityWriter(
+        "IFCUNITASSIGNMENT",
+        IfcUnitAssignment,
+        (
+            _related(IfcUnitAssignment, "unit_relations"),
+        ),
+        select=lambda project: IfcUnitAssignment._default_manager.filter(
+            pk=project.units_in_context_id,
+        ),
+    ),
+    *_axis_placement_writers(
+        IfcRepresentationContextModel,
+        "world_coordinate_system",
+        _contexts,
+    ),
+    StepEntityWriter(
+        "IFCGEOMETRICREPRESENTATIONCONTEXT",
+        IfcRepresentationContextModel,
+        (
+            _field("context_identifier"),
+            _field("context_type"),
+            _constant(3),
+            _field("precision"),
+            _derived((IfcRepresentationContextModel, "placement")),
+            _unset(),
+        ),
+        select=_contexts,
+    ),
+    StepEntityWriter(
+        "IFCCARTESIANPOINT",
+        IfcCartesianPoint,
+        (
+            _point(),
+        ),
+        select=_items(IfcCartesianPoint),
+    ),
+    StepEntityWriter(
+        "IFCCARTESIANPOINTLIST2D",
+        IfcCartesianPointListModel,
+        (
+            _point_list(),
+        ),
+        select=_point_lists(2),
+    ),
+    StepEntityWriter(
+        "IFCCARTESIANPOINTLIST3D",
+        IfcCartesianPointListModel,
+        (
+            _point_list(),
+        ),
+        select=_point_lists(3),
+    ),
+    StepEntityWriter(
+        "IFCINDEXEDPOLYCURVE",
+        IfcIndexedPolyCurveModel,
+        (
+            _reference("points", IfcCartesianPointListModel),
+            _field("segments", _segments),
+            _field("self_intersect"),
+        ),
+        select=_items(IfcIndexedPolyCurveModel),
+    ),
+    StepEntityWriter(
+        "IFCTRIANGULATEDFACESET",
+        IfcTriangulatedFaceSetModel,
+        (
+            _reference("coordinates", IfcCartesianPointListModel),
+            _field("normals", _normals),
+            _field("closed"),
+            _field("coord_index", unpack_indices),
+            _field("pn_index", _index_list),
+        ),
+        select=_items(IfcTriangulatedFaceSetModel),
+    ),
+    StepEntityWriter(
+        "IFCSHAPEREPRESENTATION",
+        IfcRepresentationModel,
+        (
+            _reference("context_of_items", IfcRepresentationContextModel),
+            _field("representation_identifier"),
+            _field("representation_type"),
+            _related(IfcRepresentationModel, "item_relations"),
+        ),
+        select=_representations,
+    ),
+    StepEntityWriter(
+        "IFCPRODUCTDEFINITIONSHAPE",
+        IfcProductRepresentation,
+        (
+            _field("name"),
+            _field("description"),
+            _many(
+                IfcProductRepresentation,
+                "representations",
+                IfcRepresentationModel,
+            ),
+        ),
+        select=_product_representations,
+    ),
+    *_axis_placement_writers(
+        IfcLocalPlacementModel,
+        "relative_transform",
+        _placements,
+    ),
+    StepEntityWriter(
+        "IFCLOCALPLACEMENT",
+        IfcLocalPlacementModel,
+        (
+            _reference("relative_placement", IfcLocalPlacementModel),
+            _derived((IfcLocalPlacementModel, "placement")),
+        ),
+        select=_placements,
+    ),
+    StepEntityWriter(
+        "IFCCARTESIANPOINT",
+        IfcLine,
+        (
+            _point("start_"),
+        ),
+        select=_axis_lines,
+        key=(IfcLine, "start"),
+    ),
+    StepEntityWriter(
+        "IFCCARTESIANPOINT",
+        IfcLine,
+        (
+            _point("end_"),
+        ),
+        select=_axis_lines,
+        key=(IfcLine, "end"),
+    ),
+    StepEntityWriter(
+        "IFCPOLYLINE",
+        IfcLine,
+        (
+            StepAttribute((), lambda row, resolve: [
+                resolve((IfcLine, "start"), row["pk"]),
+                resolve((IfcLine, "end"), row["pk"]),
+            ]),
+        ),
+        select=_axis_lines,
+    ),
+    StepEntityWriter(
+        "IFCGRIDAXIS",
+        IfcGridAxisModel,
+        (
+            _field("axis_tag"),
+            _reference("axis_curve", IfcLine),
+            _field("same_sense"),
+        ),
+        select=_grid_axes,
+    ),
+    StepEntityWriter(
+        "IFCPROJECT",
+        IfcProjectModel,
+        (
+            _field("global_id"),
+            _reference("owner_history", IfcOwnerHistoryModel),
+            _field("name"),
+            _field("description"),
+            _unset(),
+            _field("long_name"),
+            _field("phase"),
+            _many(
+                IfcProjectModel,
+                "representation_contexts",
+                IfcRepresentationContextModel,
+            ),
+            _reference("units_in_context", IfcUnitAssignment),
+        ),
+        select=lambda project: IfcProjectModel._default_manager.filter(
+            pk=project.pk,
+        ),
+    ),
+    StepEntityWriter(
+        "IFCGRID",
+        IfcGridModel,
+        (
+            *_product_attributes(),
+            _many(IfcGridModel, "u_axes", IfcGridAxisModel),
+            _many(IfcGridModel, "v_axes", IfcGridAxisModel),
+            _many(IfcGridModel, "w_axes", IfcGridAxisModel, optional=True),
+            _unset(),
+        ),
+        select=_grids,
+        key=IfcProductModel,
+    ),
+    StepEntityWriter(
+        "IFCBUILDINGELEMENTPROXY",
+        IfcProductModel,
+        (
+            *_product_attributes(),
+            _unset(),
+            _unset(),
+        ),
+        select=_proxies,
+    ),
+    StepEntityWriter(
+        "IFCRELAGGREGATES",
+        IfcProductModel,
+        (
+            _relationship_id(),
+            _reference("owner_history", IfcOwnerHistoryModel),
+            _unset(),
+            _unset(),
+            _relating_object(),
+            StepAttribute((), lambda row, resolve: [
+                resolve(IfcProductModel, row["pk"]),
+            ]),
+        ),
+        select=_products,
+        key=(IfcProductModel, "aggregates"),
+    ),
+)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides BIM Diff Management Command
+====================================
+
+Compares two stored revisions of a project, e.g. stored by
+`bim_import --revision`, and reports the numbers of added, removed and
+modified entities, and optionally each change.
+
+Usage:
+    python manage.py bim_diff 12 14
+    python manage.py bim_diff 12 14 --changes
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import time
+
+# Import | Libraries
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+# Import | Local Modules
+from ...diff import diff_revisions
+from ...models.ifc.revision.model_ifc_project_revision import (
+    IfcProjectRevisionModel,
+)
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class Command(BaseCommand):
+    """
+    BIM Diff Command Class
+    ======================
+
+    Management command wrapping `diff_revisions`.
+
+    """
+
+    help = "Compare two stored revisions of a project."
+
+    def add_arguments(self, parser) -> None:
+        """
+        Register the command line arguments.
+        """
+        parser.add_argument(
+            "old",
+            type=int,
+            help="Primary key of the earlier revision.",
+        )
+        parser.add_argument(
+            "new",
+            type=int,
+            help="Primary key of the later revision.",
+        )
+        parser.add_argument(
+            "--changes",
+            action="store_true",
+            help="List every changed entity with its attribute deltas.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database of the revisions (default: %(default)s).",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Compare the revisions and report the changes.
+        """
+        revisions = IfcProjectRevisionModel.objects.using(
+            options["database"],
+        ).in_bulk([options["old"], options["new"]])
+        for key in ("old", "new"):
+            if options[key] not in revisions:
+                raise CommandError(f"Revision {options[key]} does not exist.")
+        started = time.perf_counter()
+        diff = diff_revisions(
+            revisions[options["old"]],
+            revisions[options["new"]],
+            attributes=options["changes"],
+        )
+        if options["changes"]:
+            for change in diff:
+                self.stdout.write(f"{change.action} {change.global_id}")
+                for name, (old, new) in change.changes.items():
+                    self.stdout.write(f"  {name}: {old!r} -> {new!r}")
+        summary = diff.summary()
+        self.stdout.write(self.style.SUCCESS(
+            f"{summary} in {time.perf_counter() - started:.2f}s."
+        ))
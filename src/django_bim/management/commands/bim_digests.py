@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides BIM Digests Management Command
+=======================================
+
+Recomputes the content hashes and digests of every IFC rooted entity, then
+the rollups of every product and project, e.g. after rows were written
+with `bulk_create` or `update()`, or placements moved.
+
+Usage:
+    python manage.py bim_digests
+    python manage.py bim_digests --database revisions
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import time
+
+# Import | Libraries
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+# Import | Local Modules
+from ...models.ifc.model_ifc_product import rebuild_rollups
+from ...models.ifc.model_ifc_root import IfcRootModel
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class Command(BaseCommand):
+    """
+    BIM Digests Command Class
+    =========================
+
+    Management command wrapping `update_digests` and `rebuild_rollups`.
+
+    """
+
+    help = "Recompute the digests and rollups of the IFC entities."
+
+    def add_arguments(self, parser) -> None:
+        """
+        Register the command line arguments.
+        """
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to update (default: %(default)s).",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Update the digests and rollups and report what was done.
+        """
+        using = options["database"]
+        started = time.perf_counter()
+        # Subclasses last, so rows of multi-table subclasses end up with
+        # the digest of their most derived model
+        models = sorted(
+            (
+                model for model in apps.get_models()
+                if issubclass(model, IfcRootModel)
+            ),
+            key=lambda model: len(model._meta.get_parent_list()),
+        )
+        with transaction.atomic(using=using):
+            for model in models:
+                updated = model._default_manager.using(using).update_digests()
+                self.stdout.write(
+                    f"Updated the digests of {updated} "
+                    f"{model._meta.verbose_name_plural}."
+                )
+            rebuilt = rebuild_rollups(using=using)
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {rebuilt} rollups in "
+            f"{time.perf_counter() - started:.2f}s."
+        ))
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides BIM Import Management Command
+======================================
+
+Imports an IFC-SPF (STEP) file, or an ifcJSON file (`.json`, `.ndjson`),
+into the `models/ifc` tables and reports the import throughput.
+
+Usage:
+    python manage.py bim_import path/to/model.ifc --batch-size 5000
+    python manage.py bim_import path/to/model.ifc --workers 8
+    python manage.py bim_import path/to/revision.ifc --incremental
+    python manage.py bim_import path/to/revision.ifc --revision Tuesday
+    python manage.py bim_import path/to/model.ndjson
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import os
+
+# Import | Libraries
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+# Import | Local Modules
+from ...io.ifcjson import IfcJsonImporter
+from ...io.step import StepImporter
+from ...io.step.step_importer import DEFAULT_BATCH_SIZE
+from ...io.step.step_parallel import DEFAULT_CHUNK_SIZE
+from ...models.ifc.model_ifc_project import IfcProjectModel
+from ...models.ifc.revision.model_ifc_project_revision import (
+    IfcProjectRevisionModel,
+)
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+# File extensions read as ifcJSON rather than IFC-SPF
+IFC_JSON_EXTENSIONS = (".json", ".ndjson")
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class Command(BaseCommand):
+    """
+    BIM Import Command Class
+    ========================
+
+    Management command wrapping `StepImporter` and `IfcJsonImporter`.
+
+    """
+
+    help = "Import an IFC-SPF (STEP) or ifcJSON file into the IFC model tables."  # noqa E501
+
+    def add_arguments(self, parser) -> None:
+        """
+        Register the command line arguments.
+        """
+        parser.add_argument(
+            "path",
+            help="Path to the .ifc, .json or .ndjson file to import.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of rows per bulk query (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes parsing the file in parallel "
+                 "(default: %(default)s).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Bytes of the DATA section parsed per worker task "
+                 "(default: %(default)s).",
+        )
+        parser.add_argument(
+            "--namespace",
+            default=None,
+            help="Prefix for identifiers derived from #ids "
+                 "(default: the file name).",
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Update the rows of the previous revision in place, "
+                 "writing only the changed entities.",
+        )
+        parser.add_argument(
+            "--purge",
+            action="store_true",
+            help="With --incremental, delete the entities missing from the "
+                 "file instead of marking them as deleted.",
+        )
+        parser.add_argument(
+            "--revision",
+            default=None,
+            metavar="LABEL",
+            help="Store a revision of each imported project, for "
+                 "bim_diff.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to import into (default: %(default)s).",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Run the import and report its statistics.
+        """
+        extension = os.path.splitext(options["path"])[1].lower()
+        if extension in IFC_JSON_EXTENSIONS:
+            importer_class = IfcJsonImporter
+        else:
+            importer_class = StepImporter
+        try:
+            importer = importer_class(
+                options["path"],
+                batch_size=options["batch_size"],
+                namespace=options["namespace"],
+                using=options["database"],
+                workers=options["workers"],
+                chunk_size=options["chunk_size"],
+                incremental=options["incremental"],
+                purge=options["purge"],
+            )
+            result = importer.run()
+        except (OSError, ValueError) as error:
+            raise CommandError(str(error)) from error
+
+        for label, count in sorted(result.created.items()):
+            self.stdout.write(f"  {label}: {count}")
+        if options["incremental"]:
+            changes = ", ".join(
+                f"{count} {action.lower()}"
+                for action, count in sorted(result.changes.items())
+            )
+            self.stdout.write(
+                f"Left {result.unchanged} entities unchanged"
+                + (f", {changes}." if changes else ".")
+            )
+        if result.reused:
+            self.stdout.write(
+                f"Reused existing rows for {result.reused} entities."
+            )
+        if result.skipped:
+            self.stdout.write(self.style.WARNING(
+                f"Skipped {result.skipped} entities with unresolved "
+                "mandatory references."
+            ))
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {result.total_created} rows from {result.entities} "
+            f"entities in {result.elapsed:.2f}s "
+            f"({result.entities_per_second:,.0f} entities/s)."
+        ))
+        if options["revision"] is not None:
+            projects = IfcProjectModel.objects.using(
+                options["database"],
+            ).filter(pk__in=result.projects)
+            for project in projects:
+                revision = IfcProjectRevisionModel.capture(
+                    project, label=options["revision"],
+                )
+                self.stdout.write(
+                    f"Stored revision {revision.pk} of project "
+                    f"{project.global_id} ({revision.entity_count} "
+                    "entities)."
+                )
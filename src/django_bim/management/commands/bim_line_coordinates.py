@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides BIM Line Coordinates Management Command
+================================================
+
+Copies the legacy `start_point` and `end_point` JSON coordinates of
+`IfcLine` rows into the typed coordinate columns, and fills their length
+and bounding box columns. Lines already converted are skipped, so the
+command can be interrupted and run again.
+
+Usage:
+    python manage.py bim_line_coordinates
+    python manage.py bim_line_coordinates --batch-size 5000
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import time
+
+# Import | Libraries
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+# Import | Local Modules
+from ...models.ifc.geometry.model_ifc_geometry_curve_line import (
+    IfcLine,
+    copy_json_coordinates,
+)
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class Command(BaseCommand):
+    """
+    BIM Line Coordinates Command Class
+    ==================================
+
+    Management command wrapping `copy_json_coordinates`.
+
+    """
+
+    help = "Copy the JSON end points of IfcLine rows to the typed columns."
+
+    def add_arguments(self, parser) -> None:
+        """
+        Register the command line arguments.
+        """
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Lines per query (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to convert (default: %(default)s).",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Convert the lines and report their number.
+        """
+        started = time.perf_counter()
+        converted = copy_json_coordinates(
+            IfcLine,
+            batch_size=options["batch_size"],
+            using=options["database"],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Converted {converted} lines in "
+            f"{time.perf_counter() - started:.2f}s."
+        ))
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides BIM Placement Closure Management Command
+=================================================
+
+Rebuilds the closure table of the local placement hierarchy from the
+`relative_placement` links, e.g. after enabling the
+`DJANGO_BIM_PLACEMENT_CLOSURE` setting on existing data or after placements
+were moved with bulk queries that bypass the signals.
+
+Usage:
+    python manage.py bim_placement_closure
+    python manage.py bim_placement_closure --database replica
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import time
+
+# Import | Libraries
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+# Import | Local Modules
+from ...models.ifc.placement.model_ifc_placement_closure import (
+    IfcLocalPlacementClosureModel,
+)
+from ...models.ifc.placement.model_ifc_placement_local import (
+    placement_closure_enabled,
+)
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class Command(BaseCommand):
+    """
+    BIM Placement Closure Command Class
+    ===================================
+
+    Management command wrapping `IfcLocalPlacementClosureModel.rebuild`.
+
+    """
+
+    help = "Rebuild the closure table of the local placement hierarchy."
+
+    def add_arguments(self, parser) -> None:
+        """
+        Register the command line arguments.
+        """
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to rebuild (default: %(default)s).",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Rebuild the table and report its size.
+        """
+        if not placement_closure_enabled():
+            self.stdout.write(self.style.WARNING(
+                "DJANGO_BIM_PLACEMENT_CLOSURE is disabled, so the table "
+                "will not be maintained or used after the rebuild."
+            ))
+        started = time.perf_counter()
+        rows = IfcLocalPlacementClosureModel.rebuild(
+            using=options["database"],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {rows} closure rows in "
+            f"{time.perf_counter() - started:.2f}s."
+        ))
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides BIM Spatial Index Management Command
+=============================================
+
+Creates the native spatial index of the product bounding boxes: a GiST
+index on PostgreSQL, an R*Tree virtual table with its triggers on SQLite.
+The migrations create it already, and
+`IfcProductModel.objects.intersecting` uses it whenever it exists; the
+command recreates a dropped index. Running it again does not recreate
+existing objects, but refills the R*Tree table.
+
+Usage:
+    python manage.py bim_spatial_index
+    python manage.py bim_spatial_index --update-bounds
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import time
+
+# Import | Libraries
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+# Import | Local Modules
+from ...models.ifc.model_ifc_product import (
+    IfcProductModel,
+    create_spatial_index,
+)
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class Command(BaseCommand):
+    """
+    BIM Spatial Index Command Class
+    ===============================
+
+    Management command wrapping `create_spatial_index`.
+
+    """
+
+    help = "Create the spatial index of the product bounding boxes."
+
+    def add_arguments(self, parser) -> None:
+        """
+        Register the command line arguments.
+        """
+        parser.add_argument(
+            "--update-bounds",
+            action="store_true",
+            help="Recompute the world bounding boxes of all products first.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to index (default: %(default)s).",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Create the index and report what was done.
+        """
+        using = options["database"]
+        started = time.perf_counter()
+        if options["update_bounds"]:
+            updated = (
+                IfcProductModel.objects.using(using).update_world_bounds()
+            )
+            self.stdout.write(f"Updated the bounds of {updated} products.")
+        kind = create_spatial_index(using=using)
+        if kind is None:
+            self.stdout.write(self.style.WARNING(
+                "The database has no native spatial index, intersecting "
+                "filters on the bounding box columns."
+            ))
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f"Created the {kind} in "
+            f"{time.perf_counter() - started:.2f}s."
+        ))
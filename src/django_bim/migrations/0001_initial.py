@@ -0,0 +1,545 @@
+# Generated by Django 4.2.30 on 2026-10-17 11:43
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+import django_bim.fields.model.field_model_ifc_guid
+import django_bim.fields.model.field_model_ifc_role_enum
+import django_bim.fields.model.field_model_ifc_timestamp
+import django_bim.fields.model.field_model_ifc_transform
+import django_bim.fields.model.measure.field_model_ifc_identifier
+import django_bim.fields.model.measure.field_model_ifc_label
+import django_bim.fields.model.measure.field_model_ifc_text
+import django_bim.utils.guid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IfcActorRoleModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', django_bim.fields.model.field_model_ifc_role_enum.IfcRoleEnumField(choices=(('ARCHITECT', 'Architect'), ('BUILDINGOPERATOR', 'Building Operator'), ('BUILDINGOWNER', 'Building Owner'), ('CIVILENGINEER', 'Civil Engineer'), ('CLIENT', 'Client'), ('COMMISSIONINGENGINEER', 'Commissioning Engineer'), ('CONSTRUCTIONMANAGER', 'Construction Manager'), ('CONSULTANT', 'Consultant'), ('CONTRACTOR', 'Contractor'), ('COSTENGINEER', 'Cost Engineer'), ('ELECTRICALENGINEER', 'Electrical Engineer'), ('ENGINEER', 'Engineer'), ('FACILITIESMANAGER', 'Facilities Manager'), ('FIELDCONSTRUCTIONMANAGER', 'Field Construction Manager'), ('MANUFACTURER', 'Manufacturer'), ('MECHANICALENGINEER', 'Mechanical Engineer'), ('OWNER', 'Owner'), ('PROJECTMANAGER', 'Project Manager'), ('RESELLER', 'Reseller'), ('STRUCTURALENGINEER', 'Structural Engineer'), ('SUBCONTRACTOR', 'Sub-contractor'), ('SUPPLIER', 'Supplier'), ('USERDEFINED', 'User Defined')), default='USERDEFINED', help_text='The role of the actor in the project according to IFC standards.', max_length=50, verbose_name='Role')),
+                ('user_defined_role', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text="A user-defined role, applicable if the role type is 'USERDEFINED'.", max_length=255, null=True, verbose_name='User Defined Role')),
+                ('description', django_bim.fields.model.measure.field_model_ifc_text.IfcTextField(blank=True, help_text='A description of the role.', null=True, verbose_name='Description')),
+            ],
+            options={
+                'verbose_name': 'IFC Actor Role',
+                'verbose_name_plural': 'IFC Actor Roles',
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcAddressModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('purpose', models.CharField(choices=[('DISTRIBUTIONPOINT', 'Distribution Point'), ('HOME', 'Home'), ('OFFICE', 'Office'), ('SITE', 'Site'), ('USERDEFINED', 'User Defined'), ('NOTDEFINED', 'Not Defined')], default='NOTDEFINED', help_text='The intended purpose of this address, according to IfcAddressTypeEnum.', max_length=50, verbose_name='Purpose')),
+                ('description', django_bim.fields.model.measure.field_model_ifc_text.IfcTextField(blank=True, help_text='Additional description or notes about the address.', null=True, verbose_name='Description')),
+                ('user_defined_purpose', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text="Specify the purpose if 'USERDEFINED' is selected in 'purpose'.", max_length=255, null=True, verbose_name='User Defined Purpose')),
+            ],
+            options={
+                'verbose_name': 'IFC Address',
+                'verbose_name_plural': 'IFC Addresses',
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcApplicationModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('application_full_name', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text='Full name of the application software.', max_length=255, null=True, verbose_name='Application Full Name')),
+                ('application_identifier', django_bim.fields.model.measure.field_model_ifc_identifier.IfcIdentifierField(blank=True, help_text='A unique identifier for the application.', max_length=255, null=True, unique=True, verbose_name='Application Identifier')),
+                ('version', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text='The version of the application software.', max_length=255, null=True, verbose_name='Version')),
+            ],
+            options={
+                'verbose_name': 'IFC Application',
+                'verbose_name_plural': 'IFC Applications',
+                'ordering': ['application_full_name', 'version'],
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcCartesianPoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('representation_identifier', models.CharField(blank=True, help_text='An optional identifier for the geometric representation item.', max_length=255, null=True, verbose_name='Representation Identifier')),
+                ('x', models.FloatField(verbose_name='X Coordinate')),
+                ('y', models.FloatField(verbose_name='Y Coordinate')),
+                ('z', models.FloatField(blank=True, help_text='Z coordinate is optional for 3D points.', null=True, verbose_name='Z Coordinate')),
+            ],
+            options={
+                'verbose_name': 'IFC Cartesian Point',
+                'verbose_name_plural': 'IFC Cartesian Points',
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcCartesianPointListModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimensions', models.PositiveSmallIntegerField(default=3, help_text='Number of coordinates per point, 2 or 3.', validators=[django.core.validators.MinValueValidator(2), django.core.validators.MaxValueValidator(3)], verbose_name='Dimensions')),
+                ('count', models.PositiveIntegerField(default=0, help_text='Number of points in the list.', verbose_name='Count')),
+                ('coordinates', models.BinaryField(default=b'', help_text='The coordinates of all points, packed as little-endian float64 values.', verbose_name='Coordinates')),
+            ],
+            options={
+                'verbose_name': 'IFC Cartesian Point List',
+                'verbose_name_plural': 'IFC Cartesian Point Lists',
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcGridAxisModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('axis_tag', models.CharField(help_text='Label or identifier for the grid axis.', max_length=100, verbose_name='Axis Tag')),
+                ('same_sense', models.BooleanField(default=True, help_text='Indicates if the grid axis has the same sense as the geometric representation.', verbose_name='Same Sense')),
+            ],
+            options={
+                'verbose_name': 'IFC Grid Axis',
+                'verbose_name_plural': 'IFC Grid Axes',
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcGridPlacementModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('placement_id', models.CharField(help_text='A unique identifier for the placement.', max_length=255, unique=True, verbose_name='Placement ID')),
+                ('placement_location', models.CharField(help_text="Descriptive location within the grid, such as 'A1', 'B2', etc.", max_length=255, verbose_name='Placement Location')),
+                ('u_tag', models.CharField(blank=True, help_text='Tag of the first axis of the intersection, if not given by the location.', max_length=100, verbose_name='U Tag')),
+                ('v_tag', models.CharField(blank=True, help_text='Tag of the second axis of the intersection, if not given by the location.', max_length=100, verbose_name='V Tag')),
+            ],
+            options={
+                'verbose_name': 'IFC Object Placement',
+                'verbose_name_plural': 'IFC Object Placements',
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcLocalPlacementModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('placement_id', models.CharField(help_text='A unique identifier for the placement.', max_length=255, unique=True, verbose_name='Placement ID')),
+                ('relative_transform', django_bim.fields.model.field_model_ifc_transform.IfcTransformField(default=(1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0), help_text='The 4x4 transform relative to the relative placement.', verbose_name='Relative Transform')),
+                ('world_transform', django_bim.fields.model.field_model_ifc_transform.IfcTransformField(default=(1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0), help_text='The 4x4 transform in world coordinates, maintained on save.', verbose_name='World Transform')),
+                ('relative_placement', models.ForeignKey(blank=True, help_text='References another placement to which this placement is relative.', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='related_placements', to='django_bim.ifclocalplacementmodel', verbose_name='Relative Placement')),
+            ],
+            options={
+                'verbose_name': 'IFC Object Placement',
+                'verbose_name_plural': 'IFC Object Placements',
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcOrganizationModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('identifier', django_bim.fields.model.measure.field_model_ifc_identifier.IfcIdentifierField(blank=True, help_text='A unique identifier for the organization, such as a registration number.', max_length=255, null=True, unique=True, verbose_name='Identifier')),
+                ('name', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text='The official name of the organization.', max_length=255, null=True, verbose_name='Organization Name')),
+                ('description', django_bim.fields.model.measure.field_model_ifc_text.IfcTextField(blank=True, help_text='A brief description of the organization.', null=True, verbose_name='Description')),
+                ('address', models.ManyToManyField(blank=True, help_text='Postal and telecom addresses of an organization.', to='django_bim.ifcaddressmodel', verbose_name='Addresses')),
+                ('roles', models.ManyToManyField(blank=True, help_text='Roles that the organization performs in the construction process.', to='django_bim.ifcactorrolemodel', verbose_name='Roles')),
+            ],
+            options={
+                'verbose_name': 'IFC Organization',
+                'verbose_name_plural': 'IFC Organizations',
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcOwnerHistoryModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('creation_date', django_bim.fields.model.field_model_ifc_timestamp.IfcTimestampField(auto_now_add=True, help_text='The timestamp when the entity was created.', verbose_name='Creation Date')),
+                ('last_modified_date', django_bim.fields.model.field_model_ifc_timestamp.IfcTimestampField(auto_now=True, help_text='The timestamp when the entity was last modified.', verbose_name='Last Modified Date')),
+                ('change_action', models.CharField(choices=[('NOCHANGE', 'No Change'), ('MODIFIED', 'Modified'), ('ADDED', 'Added'), ('DELETED', 'Deleted'), ('NOTDEFINED', 'Not Defined')], default='NOTDEFINED', help_text='The type of procedural action taken on the entity.', max_length=50, verbose_name='Change Action')),
+                ('state', models.CharField(blank=True, choices=[('READWRITE', 'Read-Write'), ('READONLY', 'Read-Only'), ('LOCKED', 'Locked'), ('READWRITELOCKED', 'Read-Write Locked'), ('READONLYLOCKED', 'Read-Only Locked')], help_text='The state of the entity at the last modification time.', max_length=50, null=True, verbose_name='State')),
+                ('interning_key', models.CharField(blank=True, editable=False, help_text='Hash identifying rows shared between entities with the same owner history.', max_length=32, null=True, unique=True, verbose_name='Interning Key')),
+                ('application', models.ForeignKey(blank=True, help_text='The software application used to make the modification.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='used_in_modifications', to='django_bim.ifcapplicationmodel', verbose_name='Application')),
+            ],
+            options={
+                'verbose_name': 'IFC Owner History',
+                'verbose_name_plural': 'IFC Owner Histories',
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcProductModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('global_id', django_bim.fields.model.field_model_ifc_guid.IfcGloballyUniqueIdField(binary=False, default=django_bim.utils.guid.new_default, help_text='Globally unique identifier in the IFC model.')),
+                ('name', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text='Name of the IFC entity.', max_length=255, null=True, verbose_name='name')),
+                ('description', django_bim.fields.model.measure.field_model_ifc_text.IfcTextField(blank=True, help_text='Description of the IFC entity.', null=True, verbose_name='description')),
+                ('content_hash', models.CharField(blank=True, editable=False, help_text='Hash of the attribute values of the entity.', max_length=32, null=True, verbose_name='content hash')),
+                ('digest', models.CharField(blank=True, editable=False, help_text='Hash of the attribute values of the entity and of the rows it references.', max_length=32, null=True, verbose_name='digest')),
+                ('object_type', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text='A user-defined type to classify the object beyond its classification by entity type.', max_length=255, null=True, verbose_name='Object Type')),
+                ('local_bounds', models.BinaryField(blank=True, help_text='Bounding box of the shape in the coordinate system of the placement.', null=True, verbose_name='Local Bounds')),
+                ('min_x', models.FloatField(blank=True, editable=False, null=True)),
+                ('min_y', models.FloatField(blank=True, editable=False, null=True)),
+                ('min_z', models.FloatField(blank=True, editable=False, null=True)),
+                ('max_x', models.FloatField(blank=True, editable=False, null=True)),
+                ('max_y', models.FloatField(blank=True, editable=False, null=True)),
+                ('max_z', models.FloatField(blank=True, editable=False, null=True)),
+                ('rollup_digest', models.CharField(blank=True, editable=False, help_text='Combined digests of the product and of the products it contains.', max_length=32, null=True, verbose_name='Rollup Digest')),
+                ('container', models.ForeignKey(blank=True, help_text='The spatial structure element or product containing the product, e.g. the storey of a wall.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='contained_products', to='django_bim.ifcproductmodel', verbose_name='Container')),
+                ('object_placement', models.ForeignKey(blank=True, help_text='Specifies the placement of the product in space.', null=True, on_delete=django.db.models.deletion.SET_NULL, to='django_bim.ifclocalplacementmodel', verbose_name='Object Placement')),
+                ('owner_history', models.ForeignKey(blank=True, help_text='Ownership history of the object.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='owned_%(class)ss', to='django_bim.ifcownerhistorymodel', verbose_name='owner history')),
+            ],
+            options={
+                'verbose_name': 'IFC Product',
+                'verbose_name_plural': 'IFC Products',
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcProductRepresentation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('details', models.TextField(verbose_name='Representation Details')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='IfcProjectModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('global_id', django_bim.fields.model.field_model_ifc_guid.IfcGloballyUniqueIdField(binary=False, default=django_bim.utils.guid.new_default, help_text='Globally unique identifier in the IFC model.')),
+                ('name', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text='Name of the IFC entity.', max_length=255, null=True, verbose_name='name')),
+                ('description', django_bim.fields.model.measure.field_model_ifc_text.IfcTextField(blank=True, help_text='Description of the IFC entity.', null=True, verbose_name='description')),
+                ('content_hash', models.CharField(blank=True, editable=False, help_text='Hash of the attribute values of the entity.', max_length=32, null=True, verbose_name='content hash')),
+                ('digest', models.CharField(blank=True, editable=False, help_text='Hash of the attribute values of the entity and of the rows it references.', max_length=32, null=True, verbose_name='digest')),
+                ('long_name', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text='A longer and more descriptive name for the project.', max_length=255, null=True, verbose_name='Long Name')),
+                ('phase', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text='The current phase of the project such as planning, construction, or operation.', max_length=255, null=True, verbose_name='Phase')),
+                ('rollup_digest', models.CharField(blank=True, editable=False, help_text='Combined digests of the project and of its products.', max_length=32, null=True, verbose_name='Rollup Digest')),
+                ('owner_history', models.ForeignKey(blank=True, help_text='Ownership history of the object.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='owned_%(class)ss', to='django_bim.ifcownerhistorymodel', verbose_name='owner history')),
+            ],
+            options={
+                'verbose_name': 'IFC Project',
+                'verbose_name_plural': 'IFC Projects',
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcProjectRevisionModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('label', models.CharField(blank=True, default='', help_text='A label of the revision, e.g. of the upload.', max_length=255, verbose_name='Label')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='When the revision was stored.', verbose_name='Created At')),
+                ('rollup_digest', models.CharField(blank=True, editable=False, help_text='The rollup of the project when the revision was stored.', max_length=32, null=True, verbose_name='Rollup Digest')),
+                ('entity_count', models.PositiveIntegerField(default=0, editable=False, help_text='Number of entities stored in the revision.', verbose_name='Entity Count')),
+                ('project', models.ForeignKey(help_text='The project of the revision.', on_delete=django.db.models.deletion.CASCADE, related_name='revisions', to='django_bim.ifcprojectmodel', verbose_name='Project')),
+            ],
+            options={
+                'verbose_name': 'IFC Project Revision',
+                'verbose_name_plural': 'IFC Project Revisions',
+                'ordering': ['created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcRepresentationContextModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('context_identifier', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text='Identifies the context type, which could be used to differentiate between different graphical or spatial contexts.', max_length=255, null=True, verbose_name='Context Identifier')),
+                ('context_type', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text="Further describes the type of representation context, such as 'Model' or 'Plan'.", max_length=255, null=True, verbose_name='Context Type')),
+            ],
+            options={
+                'verbose_name': 'IFC Representation Context',
+                'verbose_name_plural': 'IFC Representation Contexts',
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcUnitAssignment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+            ],
+            options={
+                'verbose_name': 'IFC Unit Assignment',
+                'verbose_name_plural': 'IFC Unit Assignments',
+            },
+        ),
+        migrations.CreateModel(
+            name='LengthUnit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('unit_type', models.CharField(choices=[('LENGTHUNIT', 'Length Unit'), ('AREAUNIT', 'Area Unit'), ('VOLUMEUNIT', 'Volume Unit'), ('COUNTUNIT', 'Count Unit'), ('WEIGHTUNIT', 'Weight Unit'), ('TIMEUNIT', 'Time Unit')], default='LENGTHUNIT', editable=False, help_text='Specifies the type of unit of measure.', max_length=50, verbose_name='Unit Type')),
+                ('unit_name', models.CharField(help_text='Name of the length unit, e.g., meter, millimeter.', max_length=100, verbose_name='Unit Name')),
+            ],
+            options={
+                'verbose_name': 'Length Unit',
+                'verbose_name_plural': 'Length Units',
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcGridModel',
+            fields=[
+                ('ifcproductmodel_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='django_bim.ifcproductmodel')),
+                ('u_axis_count', models.PositiveIntegerField(default=0, editable=False, help_text='The number of U axes, maintained on write.', verbose_name='U Axis Count')),
+                ('v_axis_count', models.PositiveIntegerField(default=0, editable=False, help_text='The number of V axes, maintained on write.', verbose_name='V Axis Count')),
+                ('w_axis_count', models.PositiveIntegerField(default=0, editable=False, help_text='The number of W axes, maintained on write.', verbose_name='W Axis Count')),
+            ],
+            options={
+                'verbose_name': 'IFC Grid',
+                'verbose_name_plural': 'IFC Grids',
+            },
+            bases=('django_bim.ifcproductmodel',),
+        ),
+        migrations.CreateModel(
+            name='IfcRevisionEntityModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('global_id', models.CharField(help_text='The global id of the entity.', max_length=22, verbose_name='Global ID')),
+                ('container', models.CharField(blank=True, default='', help_text='The global id of the product containing the entity, empty at the top level.', max_length=22, verbose_name='Container')),
+                ('content_hash', models.CharField(blank=True, default='', help_text='The content hash of the entity.', max_length=32, verbose_name='Content Hash')),
+                ('digest', models.CharField(blank=True, default='', help_text='The digest of the entity.', max_length=32, verbose_name='Digest')),
+                ('attributes', models.JSONField(blank=True, default=dict, help_text='The canonical attribute values and the hashes of the referenced rows.', verbose_name='Attributes')),
+                ('owner_history', models.ForeignKey(blank=True, help_text='The owner history of the entity when the revision was stored.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='django_bim.ifcownerhistorymodel', verbose_name='Owner History')),
+                ('revision', models.ForeignKey(help_text='The revision the entity belongs to.', on_delete=django.db.models.deletion.CASCADE, related_name='entities', to='django_bim.ifcprojectrevisionmodel', verbose_name='Revision')),
+            ],
+            options={
+                'verbose_name': 'IFC Revision Entity',
+                'verbose_name_plural': 'IFC Revision Entities',
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcRepresentationModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('representation_identifier', models.CharField(blank=True, help_text="Identifier of the representation, such as 'Body' for geometric representation or 'Axis' for symbolic representation.", max_length=255, null=True, verbose_name='Representation Identifier')),
+                ('representation_type', models.CharField(blank=True, help_text="The type of the representation, such as 'Mesh', 'Solid', or 'Curve'.", max_length=255, null=True, verbose_name='Representation Type')),
+                ('context_of_items', models.ForeignKey(help_text='The context that defines how the representation items are interpreted.', on_delete=django.db.models.deletion.CASCADE, to='django_bim.ifcrepresentationcontextmodel', verbose_name='Context of Items')),
+            ],
+            options={
+                'verbose_name': 'IFC Representation',
+                'verbose_name_plural': 'IFC Representations',
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcRepresentationItemRelation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+                ('representation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='item_relations', to='django_bim.ifcrepresentationmodel', verbose_name='Representation')),
+            ],
+            options={
+                'verbose_name': 'IFC Representation Item Relation',
+                'verbose_name_plural': 'IFC Representation Item Relations',
+            },
+        ),
+        migrations.AddField(
+            model_name='ifcprojectmodel',
+            name='representation_contexts',
+            field=models.ManyToManyField(help_text='Geometric contexts that define how the geometries are represented in the project.', to='django_bim.ifcrepresentationcontextmodel', verbose_name='Geometric Representation Contexts'),
+        ),
+        migrations.AddField(
+            model_name='ifcprojectmodel',
+            name='units_in_context',
+            field=models.ForeignKey(help_text='The units used within this project.', on_delete=django.db.models.deletion.RESTRICT, to='django_bim.ifcunitassignment', verbose_name='Units In Context'),
+        ),
+        migrations.AddField(
+            model_name='ifcproductmodel',
+            name='project',
+            field=models.ForeignKey(blank=True, help_text='The project of a product without container, e.g. of a site.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='products', to='django_bim.ifcprojectmodel', verbose_name='Project'),
+        ),
+        migrations.AddField(
+            model_name='ifcproductmodel',
+            name='representation',
+            field=models.ForeignKey(blank=True, help_text='Links to the geometric and/or topological representation of the product.', null=True, on_delete=django.db.models.deletion.SET_NULL, to='django_bim.ifcproductrepresentation', verbose_name='Representation'),
+        ),
+        migrations.CreateModel(
+            name='IfcPersonModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('identifier', django_bim.fields.model.measure.field_model_ifc_identifier.IfcIdentifierField(blank=True, help_text='Identification of the person.A unique identifier for the person, such as an employee or membership number.', max_length=255, null=True, unique=True, verbose_name='Identification')),
+                ('family_name', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text='The name by which the family identity of the person may be recognized.', max_length=255, null=True, verbose_name='Family Name')),
+                ('first_name', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text="The individual's given name.", max_length=255, null=True, verbose_name='First Name')),
+                ('middle_names', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text='Any middle names of the individual.', max_length=255, null=True, verbose_name='Middle Names')),
+                ('prefix_titles', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text="Honorifics or formal titles preceding the individual's name.", max_length=255, null=True, verbose_name='Prefix Titles')),
+                ('suffix_titles', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text="Qualifications or titles following the individual's name.", max_length=255, null=True, verbose_name='Suffix Titles')),
+                ('addresses', models.ManyToManyField(blank=True, help_text="The individual's contact addresses.", to='django_bim.ifcaddressmodel', verbose_name='Addresses')),
+                ('roles', models.ManyToManyField(blank=True, help_text='The roles held by the individual within various projects.', to='django_bim.ifcactorrolemodel', verbose_name='Roles')),
+            ],
+            options={
+                'verbose_name': 'IFC Person',
+                'verbose_name_plural': 'IFC Persons',
+                'ordering': ['family_name', 'first_name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcPersonAndOrganizationModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('organization', models.ForeignKey(help_text='The organization with which the person is associated.', on_delete=django.db.models.deletion.CASCADE, to='django_bim.ifcorganizationmodel', verbose_name='Organization')),
+                ('person', models.ForeignKey(help_text='The individual associated with the organization.', on_delete=django.db.models.deletion.CASCADE, to='django_bim.ifcpersonmodel', verbose_name='Person')),
+                ('roles', models.ManyToManyField(blank=True, help_text='Specific roles the person fulfills within the organization.', to='django_bim.ifcactorrolemodel', verbose_name='Roles')),
+            ],
+            options={
+                'verbose_name': 'IFC Person and Organization',
+                'verbose_name_plural': 'IFC Persons and Organizations',
+            },
+        ),
+        migrations.AddField(
+            model_name='ifcownerhistorymodel',
+            name='creation_user',
+            field=models.ForeignKey(blank=True, help_text='The user who initially created the entity.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='created_ifc_entities', to='django_bim.ifcpersonandorganizationmodel', verbose_name='Creation User'),
+        ),
+        migrations.AddField(
+            model_name='ifcownerhistorymodel',
+            name='modification_user',
+            field=models.ForeignKey(blank=True, help_text='The user who last modified the entity.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='modified_ifc_entities', to='django_bim.ifcpersonandorganizationmodel', verbose_name='Modification User'),
+        ),
+        migrations.CreateModel(
+            name='IfcLocalPlacementClosureModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('depth', models.PositiveIntegerField(help_text='Number of levels between the two placements.', verbose_name='Depth')),
+                ('ancestor', models.ForeignKey(help_text='The enclosing placement.', on_delete=django.db.models.deletion.CASCADE, related_name='descendant_links', to='django_bim.ifclocalplacementmodel', verbose_name='Ancestor')),
+                ('descendant', models.ForeignKey(help_text='The placement nested under the ancestor.', on_delete=django.db.models.deletion.CASCADE, related_name='ancestor_links', to='django_bim.ifclocalplacementmodel', verbose_name='Descendant')),
+            ],
+            options={
+                'verbose_name': 'IFC Local Placement Closure',
+                'verbose_name_plural': 'IFC Local Placement Closures',
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcLine',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('curve_name', models.CharField(blank=True, help_text='Optional name or description of the curve.', max_length=255, null=True, verbose_name='Curve Name')),
+                ('start_x', models.FloatField(default=0.0, verbose_name='Start X')),
+                ('start_y', models.FloatField(default=0.0, verbose_name='Start Y')),
+                ('start_z', models.FloatField(blank=True, help_text='Empty for 2D lines.', null=True, verbose_name='Start Z')),
+                ('end_x', models.FloatField(default=0.0, verbose_name='End X')),
+                ('end_y', models.FloatField(default=0.0, verbose_name='End Y')),
+                ('end_z', models.FloatField(blank=True, help_text='Empty for 2D lines.', null=True, verbose_name='End Z')),
+                ('length', models.FloatField(default=0.0, editable=False, help_text='Distance between the start and end points.', verbose_name='Length')),
+                ('min_x', models.FloatField(default=0.0, editable=False)),
+                ('min_y', models.FloatField(default=0.0, editable=False)),
+                ('min_z', models.FloatField(blank=True, editable=False, null=True)),
+                ('max_x', models.FloatField(default=0.0, editable=False)),
+                ('max_y', models.FloatField(default=0.0, editable=False)),
+                ('max_z', models.FloatField(blank=True, editable=False, null=True)),
+                ('start_point', models.JSONField(blank=True, editable=False, help_text='Former JSON start point, copied to the typed columns by copy_json_coordinates.', null=True, verbose_name='Start Point (legacy)')),
+                ('end_point', models.JSONField(blank=True, editable=False, help_text='Former JSON end point, copied to the typed columns by copy_json_coordinates.', null=True, verbose_name='End Point (legacy)')),
+            ],
+            options={
+                'verbose_name': 'IFC Line',
+                'verbose_name_plural': 'IFC Lines',
+                'indexes': [models.Index(fields=['min_x', 'min_y'], name='idx_line_min_xy'), models.Index(fields=['max_x', 'max_y'], name='idx_line_max_xy')],
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcGridIntersectionModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('u_tag', models.CharField(help_text='The tag of the axis of the first set.', max_length=100, verbose_name='U Tag')),
+                ('v_tag', models.CharField(help_text='The tag of the axis of the second set.', max_length=100, verbose_name='V Tag')),
+                ('label', models.CharField(help_text="The tags of both axes joined, such as 'A1'.", max_length=200, verbose_name='Label')),
+                ('x', models.FloatField(verbose_name='X Coordinate')),
+                ('y', models.FloatField(verbose_name='Y Coordinate')),
+                ('u_axis', models.ForeignKey(help_text='The axis of the first set.', on_delete=django.db.models.deletion.CASCADE, related_name='+', to='django_bim.ifcgridaxismodel', verbose_name='U Axis')),
+                ('v_axis', models.ForeignKey(help_text='The axis of the second set.', on_delete=django.db.models.deletion.CASCADE, related_name='+', to='django_bim.ifcgridaxismodel', verbose_name='V Axis')),
+            ],
+            options={
+                'verbose_name': 'IFC Grid Intersection',
+                'verbose_name_plural': 'IFC Grid Intersections',
+            },
+        ),
+        migrations.AddField(
+            model_name='ifcgridaxismodel',
+            name='axis_curve',
+            field=models.ForeignKey(blank=True, help_text='Geometric curve associated with the grid axis.', null=True, on_delete=django.db.models.deletion.SET_NULL, to='django_bim.ifcline', verbose_name='Axis Curve'),
+        ),
+        migrations.AddField(
+            model_name='ifcapplicationmodel',
+            name='application_developer',
+            field=models.ForeignKey(blank=True, help_text='Name of the organization or individual developing the application.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='developed_applications', to='django_bim.ifcorganizationmodel', verbose_name='Application Developer'),
+        ),
+        migrations.CreateModel(
+            name='IfcUnitRelation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('assignment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='unit_relations', to='django_bim.ifcunitassignment', verbose_name='Unit Assignment')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name': 'IFC Unit Relation',
+                'verbose_name_plural': 'IFC Unit Relations',
+                'indexes': [models.Index(fields=['content_type', 'object_id'], name='django_bim__content_212e0b_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='ifcrevisionentitymodel',
+            constraint=models.UniqueConstraint(fields=('revision', 'global_id'), name='uniq_revision_entity'),
+        ),
+        migrations.AddIndex(
+            model_name='ifcrepresentationitemrelation',
+            index=models.Index(fields=['content_type', 'object_id'], name='django_bim__content_7e6396_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ifcproductmodel',
+            index=models.Index(fields=['min_x', 'min_y'], name='idx_product_min_xy'),
+        ),
+        migrations.AddIndex(
+            model_name='ifcproductmodel',
+            index=models.Index(fields=['max_x', 'max_y'], name='idx_product_max_xy'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='ifcpersonandorganizationmodel',
+            unique_together={('person', 'organization')},
+        ),
+        migrations.AddIndex(
+            model_name='ifcownerhistorymodel',
+            index=models.Index(fields=['creation_user'], name='idx_creation_user'),
+        ),
+        migrations.AddIndex(
+            model_name='ifcownerhistorymodel',
+            index=models.Index(fields=['modification_user'], name='idx_modification_user'),
+        ),
+        migrations.AddIndex(
+            model_name='ifcownerhistorymodel',
+            index=models.Index(fields=['last_modified_date', 'id'], name='idx_last_modified_date'),
+        ),
+        migrations.AddIndex(
+            model_name='ifcorganizationmodel',
+            index=models.Index(fields=['identifier'], name='idx_ifc_org_identifier'),
+        ),
+        migrations.AddIndex(
+            model_name='ifclocalplacementclosuremodel',
+            index=models.Index(fields=['ancestor', 'depth', 'descendant'], name='idx_placement_closure_subtree'),
+        ),
+        migrations.AddConstraint(
+            model_name='ifclocalplacementclosuremodel',
+            constraint=models.UniqueConstraint(fields=('ancestor', 'descendant'), name='uniq_placement_closure'),
+        ),
+        migrations.AddField(
+            model_name='ifcgridplacementmodel',
+            name='grid',
+            field=models.ForeignKey(blank=True, help_text='The grid used for this placement.', null=True, on_delete=django.db.models.deletion.CASCADE, to='django_bim.ifcgridmodel', verbose_name='Grid'),
+        ),
+        migrations.AddField(
+            model_name='ifcgridmodel',
+            name='u_axes',
+            field=models.ManyToManyField(help_text='The U axes of the grid.', related_name='u_axes', to='django_bim.ifcgridaxismodel', verbose_name='U Axes'),
+        ),
+        migrations.AddField(
+            model_name='ifcgridmodel',
+            name='v_axes',
+            field=models.ManyToManyField(help_text='The V axes of the grid.', related_name='v_axes', to='django_bim.ifcgridaxismodel', verbose_name='V Axes'),
+        ),
+        migrations.AddField(
+            model_name='ifcgridmodel',
+            name='w_axes',
+            field=models.ManyToManyField(blank=True, help_text='The W axes of the grid, optional for 3D grids.', related_name='w_axes', to='django_bim.ifcgridaxismodel', verbose_name='W Axes'),
+        ),
+        migrations.AddField(
+            model_name='ifcgridintersectionmodel',
+            name='grid',
+            field=models.ForeignKey(help_text='The grid of the intersecting axes.', on_delete=django.db.models.deletion.CASCADE, related_name='intersections', to='django_bim.ifcgridmodel', verbose_name='Grid'),
+        ),
+        migrations.AddIndex(
+            model_name='ifcgridintersectionmodel',
+            index=models.Index(fields=['grid', 'label'], name='idx_grid_intersection_label'),
+        ),
+        migrations.AddConstraint(
+            model_name='ifcgridintersectionmodel',
+            constraint=models.UniqueConstraint(fields=('grid', 'u_tag', 'v_tag'), name='uniq_grid_intersection_tags'),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 4.2.30 on 2026-10-17 11:52
+
+from django.db import migrations, models
+import django_bim.fields.model.field_model_ifc_transform
+import django_bim.fields.model.measure.field_model_ifc_label
+import django_bim.fields.model.measure.field_model_ifc_text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_bim', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IfcSIUnitModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('unit_type', models.CharField(choices=[('LENGTHUNIT', 'Length Unit'), ('AREAUNIT', 'Area Unit'), ('VOLUMEUNIT', 'Volume Unit'), ('COUNTUNIT', 'Count Unit'), ('WEIGHTUNIT', 'Weight Unit'), ('TIMEUNIT', 'Time Unit'), ('MASSUNIT', 'Mass Unit'), ('PLANEANGLEUNIT', 'Plane Angle Unit'), ('SOLIDANGLEUNIT', 'Solid Angle Unit'), ('THERMODYNAMICTEMPERATUREUNIT', 'Thermodynamic Temperature Unit'), ('ELECTRICCURRENTUNIT', 'Electric Current Unit'), ('LUMINOUSINTENSITYUNIT', 'Luminous Intensity Unit'), ('AMOUNTOFSUBSTANCEUNIT', 'Amount Of Substance Unit')], help_text='Specifies the type of unit of measure.', max_length=50, verbose_name='Unit Type')),
+                ('prefix', models.CharField(blank=True, choices=[('EXA', 'Exa'), ('PETA', 'Peta'), ('TERA', 'Tera'), ('GIGA', 'Giga'), ('MEGA', 'Mega'), ('KILO', 'Kilo'), ('HECTO', 'Hecto'), ('DECA', 'Deca'), ('DECI', 'Deci'), ('CENTI', 'Centi'), ('MILLI', 'Milli'), ('MICRO', 'Micro'), ('NANO', 'Nano'), ('PICO', 'Pico'), ('FEMTO', 'Femto'), ('ATTO', 'Atto')], help_text='The decimal prefix of the unit, e.g. MILLI.', max_length=10, null=True, verbose_name='Prefix')),
+                ('name', models.CharField(choices=[('AMPERE', 'Ampere'), ('BECQUEREL', 'Becquerel'), ('CANDELA', 'Candela'), ('COULOMB', 'Coulomb'), ('CUBIC_METRE', 'Cubic Metre'), ('DEGREE_CELSIUS', 'Degree Celsius'), ('FARAD', 'Farad'), ('GRAM', 'Gram'), ('GRAY', 'Gray'), ('HENRY', 'Henry'), ('HERTZ', 'Hertz'), ('JOULE', 'Joule'), ('KELVIN', 'Kelvin'), ('LUMEN', 'Lumen'), ('LUX', 'Lux'), ('METRE', 'Metre'), ('MOLE', 'Mole'), ('NEWTON', 'Newton'), ('OHM', 'Ohm'), ('PASCAL', 'Pascal'), ('RADIAN', 'Radian'), ('SECOND', 'Second'), ('SIEMENS', 'Siemens'), ('SIEVERT', 'Sievert'), ('SQUARE_METRE', 'Square Metre'), ('STERADIAN', 'Steradian'), ('TESLA', 'Tesla'), ('VOLT', 'Volt'), ('WATT', 'Watt'), ('WEBER', 'Weber')], help_text='The name of the SI unit, e.g. METRE.', max_length=50, verbose_name='Name')),
+            ],
+            options={
+                'verbose_name': 'IFC SI Unit',
+                'verbose_name_plural': 'IFC SI Units',
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='ifcproductrepresentation',
+            options={'verbose_name': 'IFC Product Representation', 'verbose_name_plural': 'IFC Product Representations'},
+        ),
+        migrations.RemoveField(
+            model_name='ifcproductrepresentation',
+            name='details',
+        ),
+        migrations.AddField(
+            model_name='ifcproductrepresentation',
+            name='description',
+            field=django_bim.fields.model.measure.field_model_ifc_text.IfcTextField(blank=True, help_text='The description of the product representation.', null=True, verbose_name='Description'),
+        ),
+        migrations.AddField(
+            model_name='ifcproductrepresentation',
+            name='name',
+            field=django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text='The name of the product representation.', max_length=255, null=True, verbose_name='Name'),
+        ),
+        migrations.AddField(
+            model_name='ifcproductrepresentation',
+            name='representations',
+            field=models.ManyToManyField(blank=True, help_text='The representations of the product.', related_name='product_representations', to='django_bim.ifcrepresentationmodel', verbose_name='Representations'),
+        ),
+        migrations.AddField(
+            model_name='ifcrepresentationcontextmodel',
+            name='world_coordinate_system',
+            field=django_bim.fields.model.field_model_ifc_transform.IfcTransformField(default=(1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0), help_text='The 4x4 transform of the coordinate system of the context.', verbose_name='World Coordinate System'),
+        ),
+        migrations.AlterField(
+            model_name='lengthunit',
+            name='unit_type',
+            field=models.CharField(choices=[('LENGTHUNIT', 'Length Unit'), ('AREAUNIT', 'Area Unit'), ('VOLUMEUNIT', 'Volume Unit'), ('COUNTUNIT', 'Count Unit'), ('WEIGHTUNIT', 'Weight Unit'), ('TIMEUNIT', 'Time Unit'), ('MASSUNIT', 'Mass Unit'), ('PLANEANGLEUNIT', 'Plane Angle Unit'), ('SOLIDANGLEUNIT', 'Solid Angle Unit'), ('THERMODYNAMICTEMPERATUREUNIT', 'Thermodynamic Temperature Unit'), ('ELECTRICCURRENTUNIT', 'Electric Current Unit'), ('LUMINOUSINTENSITYUNIT', 'Luminous Intensity Unit'), ('AMOUNTOFSUBSTANCEUNIT', 'Amount Of Substance Unit')], default='LENGTHUNIT', editable=False, help_text='Specifies the type of unit of measure.', max_length=50, verbose_name='Unit Type'),
+        ),
+    ]
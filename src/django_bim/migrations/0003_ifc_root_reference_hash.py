@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-17 11:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_bim', '0002_ifc_si_units_and_product_shapes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ifcproductmodel',
+            name='reference_hash',
+            field=models.CharField(blank=True, editable=False, help_text='Hash of the entities referenced in the last imported file.', max_length=32, null=True, verbose_name='reference hash'),
+        ),
+        migrations.AddField(
+            model_name='ifcprojectmodel',
+            name='reference_hash',
+            field=models.CharField(blank=True, editable=False, help_text='Hash of the entities referenced in the last imported file.', max_length=32, null=True, verbose_name='reference hash'),
+        ),
+    ]
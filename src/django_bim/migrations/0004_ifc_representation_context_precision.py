@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 12:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_bim', '0003_ifc_root_reference_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ifcrepresentationcontextmodel',
+            name='precision',
+            field=models.FloatField(blank=True, help_text='The precision of the coordinates of the geometric representations in the context.', null=True, verbose_name='Precision'),
+        ),
+    ]
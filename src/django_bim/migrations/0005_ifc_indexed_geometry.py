@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-17 12:39
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_bim', '0004_ifc_representation_context_precision'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IfcTriangulatedFaceSetModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('normals', models.BinaryField(blank=True, help_text='The normals, packed as little-endian float64 values, three per normal.', null=True, verbose_name='Normals')),
+                ('closed', models.BooleanField(blank=True, help_text='Whether the mesh encloses a volume, if known.', null=True, verbose_name='Closed')),
+                ('face_count', models.PositiveIntegerField(default=0, help_text='Number of triangles.', verbose_name='Face Count')),
+                ('coord_index', models.BinaryField(default=b'', help_text='The 1-based vertex indices of the triangles, packed as little-endian uint32 values.', verbose_name='Coordinate Index')),
+                ('pn_index', models.BinaryField(blank=True, help_text='The 1-based indices into the point list the triangles refer to, packed as little-endian uint32 values.', null=True, verbose_name='Point Index')),
+                ('coordinates', models.ForeignKey(help_text='The point list of the vertices.', on_delete=django.db.models.deletion.CASCADE, related_name='triangulated_face_sets', to='django_bim.ifccartesianpointlistmodel', verbose_name='Coordinates')),
+            ],
+            options={
+                'verbose_name': 'IFC Triangulated Face Set',
+                'verbose_name_plural': 'IFC Triangulated Face Sets',
+            },
+        ),
+        migrations.CreateModel(
+            name='IfcIndexedPolyCurveModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('curve_name', models.CharField(blank=True, help_text='Optional name or description of the curve.', max_length=255, null=True, verbose_name='Curve Name')),
+                ('segments', models.JSONField(blank=True, help_text='The kind and 1-based point indices of each segment, e.g. ["LINE", [1, 2]].', null=True, verbose_name='Segments')),
+                ('self_intersect', models.BooleanField(blank=True, help_text='Whether the curve intersects itself, if known.', null=True, verbose_name='Self Intersect')),
+                ('points', models.ForeignKey(help_text='The point list of the curve.', on_delete=django.db.models.deletion.CASCADE, related_name='indexed_poly_curves', to='django_bim.ifccartesianpointlistmodel', verbose_name='Points')),
+            ],
+            options={
+                'verbose_name': 'IFC Indexed Poly Curve',
+                'verbose_name_plural': 'IFC Indexed Poly Curves',
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-17 13:05
+
+from django.db import migrations
+
+from ..models.ifc.model_ifc_product import (
+    create_spatial_index,
+    drop_spatial_index,
+)
+
+
+def create_index(apps, schema_editor):
+    create_spatial_index(using=schema_editor.connection.alias)
+
+
+def drop_index(apps, schema_editor):
+    drop_spatial_index(using=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_bim', '0005_ifc_indexed_geometry'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
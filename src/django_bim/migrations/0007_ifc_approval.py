@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-17 12:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django_bim.fields.model.measure.field_model_ifc_identifier
+import django_bim.fields.model.measure.field_model_ifc_label
+import django_bim.fields.model.measure.field_model_ifc_text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('django_bim', '0006_ifc_product_spatial_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IfcApprovalModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('identifier', django_bim.fields.model.measure.field_model_ifc_identifier.IfcIdentifierField(blank=True, help_text='The identifier of the approval.', max_length=255, null=True, verbose_name='Identifier')),
+                ('name', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text='The name of the approval.', max_length=255, null=True, verbose_name='Name')),
+                ('description', django_bim.fields.model.measure.field_model_ifc_text.IfcTextField(blank=True, help_text='A description of the approval.', null=True, verbose_name='Description')),
+                ('time_of_approval', models.DateTimeField(blank=True, help_text='When the approval was given.', null=True, verbose_name='Time of Approval')),
+                ('status', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text='The status of the approval, e.g. Approved.', max_length=255, null=True, verbose_name='Status')),
+                ('level', django_bim.fields.model.measure.field_model_ifc_label.IfcLabelField(blank=True, help_text='The level of the approval, e.g. Draft.', max_length=255, null=True, verbose_name='Level')),
+                ('qualifier', django_bim.fields.model.measure.field_model_ifc_text.IfcTextField(blank=True, help_text='The conditions of the approval.', null=True, verbose_name='Qualifier')),
+                ('requesting_approval_object_id', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('giving_approval_object_id', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('giving_approval_content_type', models.ForeignKey(blank=True, help_text='The actor giving the approval.', limit_choices_to={'model__in': ('ifcpersonmodel', 'ifcorganizationmodel', 'ifcpersonandorganizationmodel')}, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype', verbose_name='Giving Approval')),
+                ('requesting_approval_content_type', models.ForeignKey(blank=True, help_text='The actor requesting the approval.', limit_choices_to={'model__in': ('ifcpersonmodel', 'ifcorganizationmodel', 'ifcpersonandorganizationmodel')}, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype', verbose_name='Requesting Approval')),
+            ],
+            options={
+                'verbose_name': 'IFC Approval',
+                'verbose_name_plural': 'IFC Approvals',
+            },
+        ),
+    ]
@@ -9,6 +9,9 @@
 Django BIM Models Module
 ========================
 
+Django loads the models of the app from this module, which imports the IFC
+models of `models.ifc`.
+
 """
 
 
@@ -17,3 +20,4 @@ Django BIM Models Module
 # =============================================================================
 
 # Import | Local Modules
+from .ifc import *  # noqa F401,F403
@@ -9,6 +9,9 @@
 Django BIM IFC Models Module
 ============================
 
+This module imports the concrete IFC models, so that Django registers them
+with the app when it loads `django_bim.models`.
+
 """
 
 
@@ -17,3 +20,80 @@ Django BIM IFC Models Module
 # =============================================================================
 
 # Import | Local Modules
+from .actor import (
+    IfcActorRoleModel,
+    IfcAddressModel,
+    IfcOrganizationModel,
+    IfcPersonAndOrganizationModel,
+    IfcPersonModel,
+)
+from .approval import IfcApprovalModel
+from .geometry import (
+    IfcCartesianPoint,
+    IfcCartesianPointListModel,
+    IfcIndexedPolyCurveModel,
+    IfcLine,
+    IfcTriangulatedFaceSetModel,
+)
+from .grid import IfcGridAxisModel, IfcGridIntersectionModel, IfcGridModel
+from .model_ifc_application import IfcApplicationModel
+from .model_ifc_owner_history import IfcOwnerHistoryModel
+from .model_ifc_product import IfcProductModel
+from .model_ifc_product_representation import IfcProductRepresentation
+from .model_ifc_project import IfcProjectModel
+from .placement import (
+    IfcGridPlacementModel,
+    IfcLocalPlacementClosureModel,
+    IfcLocalPlacementModel,
+)
+from .representation import (
+    IfcRepresentationContextModel,
+    IfcRepresentationItemRelation,
+    IfcRepresentationModel,
+)
+from .revision import IfcProjectRevisionModel, IfcRevisionEntityModel
+from .unit import (
+    IfcSIUnitModel,
+    IfcUnitAssignment,
+    IfcUnitRelation,
+    LengthUnit,
+)
+
+
+# =============================================================================
+# Module Level Variables
+# =============================================================================
+
+__all__ = [
+    "IfcActorRoleModel",
+    "IfcAddressModel",
+    "IfcApplicationModel",
+    "IfcApprovalModel",
+    "IfcCartesianPoint",
+    "IfcCartesianPointListModel",
+    "IfcGridAxisModel",
+    "IfcGridIntersectionModel",
+    "IfcGridModel",
+    "IfcGridPlacementModel",
+    "IfcIndexedPolyCurveModel",
+    "IfcLine",
+    "IfcLocalPlacementClosureModel",
+    "IfcLocalPlacementModel",
+    "IfcOrganizationModel",
+    "IfcOwnerHistoryModel",
+    "IfcPersonAndOrganizationModel",
+    "IfcPersonModel",
+    "IfcProductModel",
+    "IfcProductRepresentation",
+    "IfcProjectModel",
+    "IfcProjectRevisionModel",
+    "IfcRepresentationContextModel",
+    "IfcRepresentationItemRelation",
+    "IfcRepresentationModel",
+    "IfcRevisionEntityModel",
+    "IfcSIUnitModel",
+    "IfcTriangulatedFaceSetModel",
+    "IfcUnitAssignment",
+    "IfcUnitRelation",
+    "LengthUnit",
+]
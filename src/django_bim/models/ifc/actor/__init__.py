@@ -17,3 +17,21 @@ Django BIM IFC Actor Models Module
 # =============================================================================
 
 # Import | Local Modules
+from .model_ifc_actor_role import IfcActorRoleModel
+from .model_ifc_address import IfcAddressModel
+from .model_ifc_organization import IfcOrganizationModel
+from .model_ifc_person import IfcPersonModel
+from .model_ifc_person_organization import IfcPersonAndOrganizationModel
+
+
+# =============================================================================
+# Module Level Variables
+# =============================================================================
+
+__all__ = [
+    "IfcActorRoleModel",
+    "IfcAddressModel",
+    "IfcOrganizationModel",
+    "IfcPersonAndOrganizationModel",
+    "IfcPersonModel",
+]
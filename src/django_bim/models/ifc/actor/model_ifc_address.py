@@ -27,11 +27,11 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 # Import | Local Modules
-from ...fields.model import (
+from ....fields.model import (
     IfcLabelField,
     IfcTextField,
 )
-from ...enums import IfcAddressTypeEnum
+from ....enums import IfcAddressTypeEnum
 
 
 # =============================================================================
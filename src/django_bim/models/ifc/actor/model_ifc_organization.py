@@ -32,7 +32,7 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 # Import | Local Modules
-from ...fields.model import (
+from ....fields.model import (
     IfcIdentifierField,
     IfcLabelField,
     IfcTextField,
@@ -98,7 +98,7 @@ class IfcOrganizationModel(models.Model):
     )
 
     roles = models.ManyToManyField(
-        "IfcRoleModel",
+        "IfcActorRoleModel",
         blank = True,
         verbose_name = _("Roles"),
         help_text = _(
@@ -127,7 +127,7 @@ class IfcOrganizationModel(models.Model):
         indexes = [
             models.Index(
                 fields = ["identifier"],
-                name = "idx_ifc_organization_identifier"
+                name = "idx_ifc_org_identifier"
             )
         ]
 
@@ -57,7 +57,7 @@ class IfcPersonModel(models.Model):
     Attributes:
         identifier (IfcIdentifierField): A unique and potentially nullable
             identifier for the person.
-        last_name (IfcLabelField): The individual's last name.
+        family_name (IfcLabelField): The individual's family name.
         first_name (IfcLabelField): The individual's first name.
         middle_names (IfcLabelField): Any middle names of the individual.
         prefix_titles (IfcLabelField): Titles preceding the name,
@@ -126,7 +126,7 @@ class IfcPersonModel(models.Model):
     )
 
     roles = models.ManyToManyField(
-        to="IfcRoleModel",
+        to="IfcActorRoleModel",
         blank=True,
         verbose_name=_(message="Roles"),
         help_text=_(
@@ -150,9 +150,9 @@ class IfcPersonModel(models.Model):
 
         verbose_name: str = _(message="IFC Person")
         verbose_name_plural: str = _(message="IFC Persons")
-        # Default ordering by last name then first name for easier navigation
+        # Default ordering by family name then first name for easier navigation
         ordering: list[str] = [
-            "last_name",
+            "family_name",
             "first_name",
         ]
 
@@ -167,7 +167,7 @@ class IfcPersonModel(models.Model):
             self.prefix_titles,
             self.first_name,
             self.middle_names,
-            self.last_name,
+            self.family_name,
             self.suffix_titles,
         ]
         # Efficiently concatenate non-empty name parts
@@ -29,6 +29,7 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 # Import | Local Modules
+from ...managers import StrRelatedManager
 
 
 # =============================================================================
@@ -59,8 +60,15 @@ class IfcPersonAndOrganizationModel(models.Model):
             is associated.
         roles (ManyToManyField): Specific roles the person fulfills within
             the organization.
+        STR_RELATED_FIELDS (tuple): The relations loaded with every row for
+            `__str__`, see `StrRelatedManager`.
     """
 
+    STR_RELATED_FIELDS: tuple[str, ...] = (
+        "person",
+        "organization",
+    )
+
     # Class | Model Fields
     # =========================================================================
 
@@ -83,7 +91,7 @@ class IfcPersonAndOrganizationModel(models.Model):
     )
 
     roles = models.ManyToManyField(
-        "IfcRoleModel",
+        "IfcActorRoleModel",
         blank=True,
         verbose_name=_(message="Roles"),
         help_text=_(
@@ -91,6 +99,8 @@ class IfcPersonAndOrganizationModel(models.Model):
         ),
     )
 
+    objects = StrRelatedManager()
+
     # Class | Model Meta Class
     # =========================================================================
 
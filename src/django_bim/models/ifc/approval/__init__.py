@@ -6,8 +6,8 @@
 # =============================================================================
 
 """
-Django BIM IFC Models Module
-============================
+Django BIM IFC Approval Models Module
+=====================================
 
 """
 
@@ -17,3 +17,13 @@ Django BIM IFC Models Module
 # =============================================================================
 
 # Import | Local Modules
+from .model_ifc_approval import IfcApprovalModel
+
+
+# =============================================================================
+# Module Level Variables
+# =============================================================================
+
+__all__ = [
+    "IfcApprovalModel",
+]
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC Approval Model Class
+=================================
+
+This module defines the IfcApprovalModel class, representing an IfcApproval
+of IFC4: the approval of an object, such as a design or a cost, requested
+by an actor and given by another. Both actors are IfcActorSelect relations,
+so listings resolve them with `prefetch_actors`:
+
+    approvals = prefetch_actors(IfcApprovalModel.objects.all())
+
+More information on IfcApproval can be found here:
+https://standards.buildingsmart.org/IFC/RELEASE/IFC4/ADD2_TC1/HTML/schema/ifcapprovalresource/lexical/ifcapproval.htm
+
+"""  # noqa E501
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+
+# Import | Libraries
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+# Import | Local Modules
+from ....fields.model import IfcIdentifierField, IfcLabelField, IfcTextField
+from ....fields.model.actor import IfcActorSelectField
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcApprovalModel(models.Model):
+    """
+    IFC Approval Model Class
+    ========================
+
+    Model representing an IfcApproval as defined in the IFC standard.
+
+    Attributes:
+        identifier (IfcIdentifierField): The identifier of the approval.
+        name (IfcLabelField): The name of the approval.
+        description (IfcTextField): A description of the approval.
+        time_of_approval (DateTimeField): When the approval was given.
+        status (IfcLabelField): The status of the approval, e.g.
+            `Approved` or `Requested`.
+        level (IfcLabelField): The level of the approval, e.g. `Draft`.
+        qualifier (IfcTextField): The conditions of the approval.
+        requesting_approval (IfcActorSelectField): The actor requesting the
+            approval.
+        giving_approval (IfcActorSelectField): The actor giving the
+            approval.
+
+    """
+
+    # Class | Model Fields
+    # =========================================================================
+
+    identifier = IfcIdentifierField(
+        blank = True,
+        null = True,
+        verbose_name = _("Identifier"),
+        help_text = _("The identifier of the approval."),
+    )
+
+    name = IfcLabelField(
+        blank = True,
+        null = True,
+        verbose_name = _("Name"),
+        help_text = _("The name of the approval."),
+    )
+
+    description = IfcTextField(
+        blank = True,
+        null = True,
+        verbose_name = _("Description"),
+        help_text = _("A description of the approval."),
+    )
+
+    time_of_approval = models.DateTimeField(
+        blank = True,
+        null = True,
+        verbose_name = _("Time of Approval"),
+        help_text = _("When the approval was given."),
+    )
+
+    status = IfcLabelField(
+        blank = True,
+        null = True,
+        verbose_name = _("Status"),
+        help_text = _("The status of the approval, e.g. Approved."),
+    )
+
+    level = IfcLabelField(
+        blank = True,
+        null = True,
+        verbose_name = _("Level"),
+        help_text = _("The level of the approval, e.g. Draft."),
+    )
+
+    qualifier = IfcTextField(
+        blank = True,
+        null = True,
+        verbose_name = _("Qualifier"),
+        help_text = _("The conditions of the approval."),
+    )
+
+    requesting_approval = IfcActorSelectField(
+        null = True,
+        verbose_name = _("Requesting Approval"),
+        help_text = _("The actor requesting the approval."),
+    )
+
+    giving_approval = IfcActorSelectField(
+        null = True,
+        verbose_name = _("Giving Approval"),
+        help_text = _("The actor giving the approval."),
+    )
+
+    # Class | Model Meta Class
+    # =========================================================================
+
+    class Meta:
+        """
+        Meta Class
+        ----------
+
+        """
+        verbose_name = _("IFC Approval")
+        verbose_name_plural = _("IFC Approvals")
+
+    # Class | Model Methods
+    # =========================================================================
+
+    def __str__(self) -> str:
+        """
+        String representation of the approval, without its actors.
+        """
+        label = self.name or self.identifier or "Approval"
+        return f"{label} ({self.status})" if self.status else label
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+__all__ = [
+    "IfcApprovalModel",
+]
@@ -9,7 +9,16 @@
 Django BIM IFC Geometry Models Module
 =====================================
 
+This module groups the models of the IFC geometry resource, including:
 
+- `IfcCartesianPoint`: A point defined by two or three coordinates.
+- `IfcCartesianPointListModel`: A packed list of points, the coordinates of
+    indexed poly curves and triangulated face sets.
+- `IfcIndexedPolyCurveModel`: A curve of line and arc segments through the
+    points of a point list.
+- `IfcLine`: A straight curve between two points.
+- `IfcTriangulatedFaceSetModel`: A mesh of triangles over the points of a
+    point list, with packed vertex indices.
 
 """
 
@@ -19,9 +28,11 @@ Django BIM IFC Geometry Models Module
 # =============================================================================
 
 # Import | Local Modules
-from .model_ifc_placement_grid import IfcGridPlacementModel
-from .model_ifc_placement_local import IfcLocalPlacementModel
-from .model_ifc_placement_object import IfcObjectPlacementModel
+from .model_ifc_cartesian_point import IfcCartesianPoint
+from .model_ifc_cartesian_point_list import IfcCartesianPointListModel
+from .model_ifc_geometry_curve_line import IfcLine
+from .model_ifc_indexed_poly_curve import IfcIndexedPolyCurveModel
+from .model_ifc_triangulated_face_set import IfcTriangulatedFaceSetModel
 
 
 # =============================================================================
@@ -29,7 +40,9 @@ from .model_ifc_placement_object import IfcObjectPlacementModel
 # =============================================================================
 
 __all__ = [
-    "IfcGridPlacementModel",
-    "IfcLocalPlacementModel",
-    "IfcObjectPlacementModel",
+    "IfcCartesianPoint",
+    "IfcCartesianPointListModel",
+    "IfcIndexedPolyCurveModel",
+    "IfcLine",
+    "IfcTriangulatedFaceSetModel",
 ]
@@ -6,10 +6,15 @@
 # =============================================================================
 
 """
-Provides IFC ... Model Class
-===================================
+Provides IFC Cartesian Point Model Class
+========================================
 
-For more information, refer to:
+This module defines the IfcCartesianPoint class, representing the
+IfcCartesianPoint entity of IFC, a point defined by its coordinates in a
+two or three dimensional cartesian coordinate system.
+
+More information on IfcCartesianPoint can be found here:
+https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcgeometryresource/lexical/ifccartesianpoint.htm
 
 """  # noqa E501
 
@@ -25,10 +30,8 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 # Import | Local Modules
-from ...fields.model import (
-    IfcLabelField,
-    IfcRoleTypeField,
-    IfcTextField,
+from ..representation.model_ifc_representation_item_geometric import (
+    IfcGeometricRepresentationItemModel,
 )
 
 
@@ -36,56 +39,76 @@ from ...fields.model import (
 # Classes
 # =============================================================================
 
-class IfcCartesianPoint(IfcRepresentationItem):
+class IfcCartesianPoint(IfcGeometricRepresentationItemModel):
     """
+    IFC Cartesian Point Model Class
+    ===============================
+
     Model representing an IfcCartesianPoint, which defines a point in 2D or
     3D space by its coordinates.
 
+    Attributes:
+        x (FloatField): The first coordinate.
+        y (FloatField): The second coordinate.
+        z (FloatField): The third coordinate, empty for 2D points.
+
     """
 
-    x = models.FloatField(verbose_name=_("X Coordinate"))
-    y = models.FloatField(verbose_name=_("Y Coordinate"))
-    z = models.FloatField(blank=True, null=True, verbose_name=_("Z Coordinate"), help_text=_("Z coordinate is optional for 3D points."))
+    # Class | Model Fields
+    # =========================================================================
+
+    x = models.FloatField(
+        verbose_name = _("X Coordinate"),
+    )
+
+    y = models.FloatField(
+        verbose_name = _("Y Coordinate"),
+    )
 
+    z = models.FloatField(
+        blank = True,
+        null = True,
+        verbose_name = _("Z Coordinate"),
+        help_text = _("Z coordinate is optional for 3D points."),
+    )
 
     # Class | Model Meta Class
     # =========================================================================
 
+    class Meta:
+        """
+        Meta Class
+        ----------
+
+        """
+        verbose_name = _("IFC Cartesian Point")
+        verbose_name_plural = _("IFC Cartesian Points")
+
     # Class | Model Methods
     # =========================================================================
 
     def __str__(self) -> str:
         """
+        Return the coordinates of the point.
         """
         if self.z is not None:
             return f"Point({self.x}, {self.y}, {self.z})"
         return f"Point({self.x}, {self.y})"
 
+    @property
+    def coordinates(self) -> tuple[float, ...]:
+        """
+        Return the coordinates of the point, two or three of them.
+        """
+        if self.z is None:
+            return (self.x, self.y)
+        return (self.x, self.y, self.z)
+
 
 # =============================================================================
 # Module Variables
 # =============================================================================
 
 __all__ = [
-    "IfcActorRoleModel",
+    "IfcCartesianPoint",
 ]
-
-
-
-class IfcCartesianPoint(IfcGeometricRepresentationItem):
-    """
-    Django model representing an IfcCartesianPoint, which is a type of IfcGeometricRepresentationItem.
-
-    Represents a point defined by its coordinates in a Cartesian coordinate system.
-
-    Attributes:
-        coordinates (JSONField): Coordinates of the point.
-    """
-
-    coordinates = models.JSONField(
-        verbose_name=_("Coordinates"),
-        help_text=_("JSON representation of the Cartesian coordinates of the point.")
-    )
-
-    def __str__(self):
-        return f"Cartesian Point: {self.coordinates}"
\ No newline at end of file
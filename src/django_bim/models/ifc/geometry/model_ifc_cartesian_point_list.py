@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC Cartesian Point List Model Class
+=============================================
+
+This module defines the IfcCartesianPointListModel class, representing the
+IfcCartesianPointList2D and IfcCartesianPointList3D entities of IFC4, the
+coordinate lists of indexed poly curves and triangulated face sets.
+
+All coordinates of a list are stored in one row, packed as little-endian
+float64 values (x, y[, z] per point) in a binary column, next to the number
+of points and their dimension. A mesh with a million vertices is one row
+instead of a million, and `as_array()` exposes the coordinates as a
+`(count, dimensions)` NumPy array reading the stored bytes without copying.
+
+More information on IfcCartesianPointList3D can be found here:
+https://standards.buildingsmart.org/IFC/RELEASE/IFC4/ADD2_TC1/HTML/schema/ifcgeometricmodelresource/lexical/ifccartesianpointlist3d.htm
+
+"""  # noqa E501
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import sys
+from array import array
+from itertools import chain
+from typing import Any, Sequence
+
+# Import | Libraries
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+# Coordinates are stored little-endian whatever the platform
+_SWAP_BYTES = sys.byteorder == "big"
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def pack_points(points: Sequence[Sequence[float]]) -> bytes:
+    """
+    Pack a sequence of points as little-endian float64 values.
+
+    Parameters:
+        points (Sequence[Sequence[float]]): Points of equal dimension.
+
+    Returns:
+        bytes: The packed coordinates.
+    """
+    values = array("d", chain.from_iterable(points))
+    if _SWAP_BYTES:
+        values.byteswap()
+    return values.tobytes()
+
+
+def unpack_points(
+    coordinates: bytes,
+    dimensions: int,
+) -> list[tuple[float, ...]]:
+    """
+    Unpack coordinates packed by `pack_points` into tuples, without NumPy.
+
+    Parameters:
+        coordinates (bytes): The packed coordinates.
+        dimensions (int): Coordinates per point.
+
+    Returns:
+        list: One tuple of `dimensions` floats per point.
+    """
+    values = memoryview(coordinates).cast("d")
+    if _SWAP_BYTES:
+        values = array("d", values)
+        values.byteswap()
+    return [
+        tuple(values[start:start + dimensions])
+        for start in range(0, len(values), dimensions)
+    ]
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcCartesianPointListModel(models.Model):
+    """
+    IFC Cartesian Point List Model Class
+    ====================================
+
+    Model representing an IfcCartesianPointList2D or
+    IfcCartesianPointList3D, an ordered list of points of the same dimension.
+
+    Attributes:
+        dimensions (PositiveSmallIntegerField): Coordinates per point, 2 or
+            3.
+        count (PositiveIntegerField): Number of points.
+        coordinates (BinaryField): The `count * dimensions` coordinates,
+            packed as little-endian float64 values.
+
+    """
+
+    # Class | Model Fields
+    # =========================================================================
+
+    dimensions = models.PositiveSmallIntegerField(
+        default = 3,
+        validators = [MinValueValidator(2), MaxValueValidator(3)],
+        verbose_name = _("Dimensions"),
+        help_text = _("Number of coordinates per point, 2 or 3."),
+    )
+
+    count = models.PositiveIntegerField(
+        default = 0,
+        verbose_name = _("Count"),
+        help_text = _("Number of points in the list."),
+    )
+
+    coordinates = models.BinaryField(
+        default = b"",
+        verbose_name = _("Coordinates"),
+        help_text = _(
+            "The coordinates of all points, packed as little-endian float64 values."  # noqa E501
+        ),
+    )
+
+    # Class | Model Meta Class
+    # =========================================================================
+
+    class Meta:
+        """
+        Meta Class
+        ----------
+
+        """
+        verbose_name = _("IFC Cartesian Point List")
+        verbose_name_plural = _("IFC Cartesian Point Lists")
+
+    # Class | Model Methods
+    # =========================================================================
+
+    def __str__(self) -> str:
+        """
+        String representation of the point list.
+        """
+        return f"Point List ({self.count} points, {self.dimensions}D)"
+
+    def __len__(self) -> int:
+        """
+        Return the number of points.
+        """
+        return self.count
+
+    @classmethod
+    def from_points(cls, points: Any) -> "IfcCartesianPointListModel":
+        """
+        Build an unsaved point list from points.
+
+        Parameters:
+            points (Any): A sequence of 2D or 3D points, or a NumPy array of
+                shape `(count, dimensions)`.
+
+        Returns:
+            IfcCartesianPointListModel: The point list.
+
+        Raises:
+            ValueError: If the points do not all have 2 or all 3
+                coordinates.
+        """
+        shape = getattr(points, "shape", None)
+        if shape is not None:
+            if len(shape) != 2 or shape[1] not in (2, 3):
+                raise ValueError(f"Expected (count, 2 or 3) points: {shape}.")
+            count, dimensions = shape
+            coordinates = points.astype("<f8", copy=False).tobytes()
+        else:
+            count = len(points)
+            dimensions = len(points[0]) if count else 3
+            if dimensions not in (2, 3) or any(
+                len(point) != dimensions for point in points
+            ):
+                raise ValueError(
+                    "Points must all have 2 or all 3 coordinates."
+                )
+            coordinates = pack_points(points)
+        return cls(
+            dimensions=int(dimensions),
+            count=int(count),
+            coordinates=coordinates,
+        )
+
+    def as_array(self):
+        """
+        Return the coordinates as a read-only NumPy array of shape
+        `(count, dimensions)`, sharing the memory of the stored bytes.
+
+        Returns:
+            numpy.ndarray: The coordinates.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        import numpy
+
+        return numpy.frombuffer(self.coordinates, dtype="<f8").reshape(
+            self.count, self.dimensions,
+        )
+
+    def points(self) -> list[tuple[float, ...]]:
+        """
+        Return the coordinates as a list of tuples, without NumPy.
+
+        Returns:
+            list: One tuple of `dimensions` floats per point.
+        """
+        return unpack_points(self.coordinates, self.dimensions)
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+__all__ = [
+    "IfcCartesianPointListModel",
+    "pack_points",
+    "unpack_points",
+]
@@ -1,20 +1,401 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC Line Model Class
+=============================
+
+This module defines the IfcLine class, a straight curve segment between a
+start and an end point.
+
+The end points are stored in typed float columns rather than JSON, next to
+the precomputed length and axis-aligned bounding box of the line, so lines
+are loaded without JSON decoding and can be filtered by location in the
+database (`IfcLine.objects.intersecting`). The columns are derived from the
+coordinates on `save()`; code writing lines in bulk calls `update_extent()`
+on each instance first.
+
+The former `start_point` and `end_point` JSON columns are kept, nullable,
+until their content has been copied: `copy_json_coordinates` does it in
+batches, from the `bim_line_coordinates` management command or from a data
+migration through `migrate_json_coordinates`:
+
+    migrations.RunPython(migrate_json_coordinates, migrations.RunPython.noop)
+
+More information on IfcLine can be found here:
+https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcgeometryresource/lexical/ifcline.htm
+
+"""  # noqa E501
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import math
+from typing import Optional, Sequence
+
+# Import | Libraries
+from django.db import models, router, transaction
+from django.utils.translation import gettext_lazy as _
+
+# Import | Local Modules
+from .model_ifc_geometry_curve import IfcCurve
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+# Typed coordinate columns, start point first
+COORDINATE_FIELDS = (
+    "start_x", "start_y", "start_z",
+    "end_x", "end_y", "end_z",
+)
+
+# Columns derived from the coordinates
+EXTENT_FIELDS = (
+    "length",
+    "min_x", "min_y", "min_z",
+    "max_x", "max_y", "max_z",
+)
+
+# Number of lines per query when copying the JSON coordinates
+_COPY_BATCH_SIZE = 1000
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def line_extent(
+    start: Sequence[Optional[float]],
+    end: Sequence[Optional[float]],
+) -> dict[str, Optional[float]]:
+    """
+    Compute the length and bounding box of a line.
+
+    Parameters:
+        start (Sequence[float]): The start point, `(x, y)` or `(x, y, z)`;
+            a `None` z makes the line 2D.
+        end (Sequence[float]): The end point.
+
+    Returns:
+        dict: The values of the `EXTENT_FIELDS`, the z bounds being `None`
+            for 2D lines.
+    """
+    dimensions = 3 if (
+        len(start) > 2 and len(end) > 2
+        and start[2] is not None and end[2] is not None
+    ) else 2
+    extent = {"length": math.dist(start[:dimensions], end[:dimensions])}
+    for axis, name in enumerate("xyz"):
+        inside = axis < dimensions
+        extent[f"min_{name}"] = min(start[axis], end[axis]) if inside else None
+        extent[f"max_{name}"] = max(start[axis], end[axis]) if inside else None
+    return extent
+
+
+def copy_json_coordinates(
+    model: Optional[type[models.Model]] = None,
+    batch_size: int = _COPY_BATCH_SIZE,
+    using: Optional[str] = None,
+) -> int:
+    """
+    Copy the legacy `start_point` and `end_point` JSON coordinates of lines
+    into the typed columns, and clear them.
+
+    Only reads and writes fields, so it also works on the historical model
+    of a data migration.
+
+    Parameters:
+        model (type): The line model, defaults to `IfcLine`.
+        batch_size (int): Lines per query.
+        using (str): The database alias.
+
+    Returns:
+        int: Number of lines converted.
+    """
+    model = model or IfcLine
+    using = using or router.db_for_write(model)
+    manager = model._default_manager.db_manager(using)
+    pending = manager.filter(
+        start_point__isnull=False, end_point__isnull=False,
+    ).order_by("pk")
+    converted = 0
+    while True:
+        with transaction.atomic(using=using):
+            lines = list(pending.only(
+                "pk", "start_point", "end_point",
+            )[:batch_size])
+            if not lines:
+                return converted
+            for line in lines:
+                start = _json_point(line.start_point)
+                end = _json_point(line.end_point)
+                for name, value in zip(COORDINATE_FIELDS, (*start, *end)):
+                    setattr(line, name, value)
+                for name, value in line_extent(start, end).items():
+                    setattr(line, name, value)
+                line.start_point = line.end_point = None
+            manager.bulk_update(
+                lines,
+                [*COORDINATE_FIELDS, *EXTENT_FIELDS,
+                 "start_point", "end_point"],
+            )
+        converted += len(lines)
+
+
+def migrate_json_coordinates(apps, schema_editor) -> None:
+    """
+    `RunPython` operation copying the JSON coordinates of the lines.
+    """
+    copy_json_coordinates(
+        apps.get_model(IfcLine._meta.app_label, IfcLine.__name__),
+        using=schema_editor.connection.alias,
+    )
+
+
+def _json_point(value: Sequence[float]) -> tuple[Optional[float], ...]:
+    """
+    Convert a JSON coordinate list to an `(x, y, z)` tuple, `z` being
+    `None` for 2D points.
+    """
+    coordinates = [float(coordinate) for coordinate in value]
+    if len(coordinates) not in (2, 3):
+        raise ValueError(f"Expected 2 or 3 coordinates: {value!r}.")
+    return (*coordinates, None)[:3]
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcLineQuerySet(models.QuerySet):
+    """
+    IFC Line QuerySet Class
+    =======================
+
+    QuerySet filtering lines on their stored bounding box.
+
+    """
+
+    def intersecting(
+        self,
+        minimum: Sequence[float],
+        maximum: Sequence[float],
+    ) -> "IfcLineQuerySet":
+        """
+        Filter the lines whose bounding box intersects a box. A 2D box
+        ignores the z bounds, and 2D lines match any z range.
+
+        Parameters:
+            minimum (Sequence[float]): The lower corner, `(x, y[, z])`.
+            maximum (Sequence[float]): The upper corner.
+
+        Returns:
+            IfcLineQuerySet: The filtered lines.
+        """
+        planar = models.Q(
+            min_x__lte=maximum[0], max_x__gte=minimum[0],
+            min_y__lte=maximum[1], max_y__gte=minimum[1],
+        )
+        if len(minimum) < 3:
+            return self.filter(planar)
+        return self.filter(planar, models.Q(
+            min_z__lte=maximum[2], max_z__gte=minimum[2],
+        ) | models.Q(min_z__isnull=True))
+
+
 class IfcLine(IfcCurve):
     """
-    Django model representing an IfcLine, which is a specific type of IfcCurve.
+    IFC Line Model Class
+    ====================
+
+    Model representing an IfcLine, a straight curve between two points.
 
     Attributes:
-        start_point (JSONField): Starting point of the line, stored as a JSON object.
-        end_point (JSONField): Ending point of the line, stored as a JSON object.
+        start_x, start_y, start_z (FloatField): The start point, `start_z`
+            being empty for 2D lines.
+        end_x, end_y, end_z (FloatField): The end point.
+        length (FloatField): The distance between the end points.
+        min_x, min_y, min_z, max_x, max_y, max_z (FloatField): The
+            bounding box of the line, the z bounds being empty for 2D lines.
+        start_point (JSONField): Legacy JSON start point, empty once copied
+            to the typed columns.
+        end_point (JSONField): Legacy JSON end point.
+        objects (IfcLineQuerySet): Manager with the location filters.
+
     """
 
+    # Class | Model Fields
+    # =========================================================================
+
+    start_x = models.FloatField(default = 0.0, verbose_name = _("Start X"))
+    start_y = models.FloatField(default = 0.0, verbose_name = _("Start Y"))
+    start_z = models.FloatField(
+        null = True,
+        blank = True,
+        verbose_name = _("Start Z"),
+        help_text = _("Empty for 2D lines."),
+    )
+    end_x = models.FloatField(default = 0.0, verbose_name = _("End X"))
+    end_y = models.FloatField(default = 0.0, verbose_name = _("End Y"))
+    end_z = models.FloatField(
+        null = True,
+        blank = True,
+        verbose_name = _("End Z"),
+        help_text = _("Empty for 2D lines."),
+    )
+
+    length = models.FloatField(
+        default = 0.0,
+        editable = False,
+        verbose_name = _("Length"),
+        help_text = _("Distance between the start and end points."),
+    )
+    min_x = models.FloatField(default = 0.0, editable = False)
+    min_y = models.FloatField(default = 0.0, editable = False)
+    min_z = models.FloatField(null = True, blank = True, editable = False)
+    max_x = models.FloatField(default = 0.0, editable = False)
+    max_y = models.FloatField(default = 0.0, editable = False)
+    max_z = models.FloatField(null = True, blank = True, editable = False)
+
     start_point = models.JSONField(
-        verbose_name=_("Start Point"),
-        help_text=_("JSON representation of the start point coordinates.")
+        null = True,
+        blank = True,
+        editable = False,
+        verbose_name = _("Start Point (legacy)"),
+        help_text = _(
+            "Former JSON start point, copied to the typed columns by copy_json_coordinates."  # noqa E501
+        ),
     )
     end_point = models.JSONField(
-        verbose_name=_("End Point"),
-        help_text=_("JSON representation of the end point coordinates.")
+        null = True,
+        blank = True,
+        editable = False,
+        verbose_name = _("End Point (legacy)"),
+        help_text = _(
+            "Former JSON end point, copied to the typed columns by copy_json_coordinates."  # noqa E501
+        ),
     )
 
-    def __str__(self):
-        return f"Line from {self.start_point} to {self.end_point}"
+    objects = IfcLineQuerySet.as_manager()
+
+    # Class | Model Meta Class
+    # =========================================================================
+
+    class Meta:
+        """
+        Meta Class
+        ----------
+
+        """
+        verbose_name = _("IFC Line")
+        verbose_name_plural = _("IFC Lines")
+        indexes = [
+            models.Index(
+                fields = ["min_x", "min_y"],
+                name = "idx_line_min_xy",
+            ),
+            models.Index(
+                fields = ["max_x", "max_y"],
+                name = "idx_line_max_xy",
+            ),
+        ]
+
+    # Class | Model Methods
+    # =========================================================================
+
+    def __str__(self) -> str:
+        """
+        String representation of the line.
+        """
+        return f"Line from {self.start()} to {self.end()}"
+
+    def save(self, *args, **kwargs) -> None:
+        """
+        Save the line with its length and bounding box.
+        """
+        self.update_extent()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, *EXTENT_FIELDS}
+        super().save(*args, **kwargs)
+
+    def start(self) -> tuple[float, ...]:
+        """
+        Return the start point, `(x, y)` or `(x, y, z)`.
+        """
+        return self._point(self.start_x, self.start_y, self.start_z)
+
+    def end(self) -> tuple[float, ...]:
+        """
+        Return the end point, `(x, y)` or `(x, y, z)`.
+        """
+        return self._point(self.end_x, self.end_y, self.end_z)
+
+    def set_points(
+        self,
+        start: Sequence[float],
+        end: Sequence[float],
+    ) -> None:
+        """
+        Set both end points and the derived columns.
+
+        Parameters:
+            start (Sequence[float]): The start point, `(x, y)` or
+                `(x, y, z)`.
+            end (Sequence[float]): The end point.
+        """
+        values = (*_json_point(start), *_json_point(end))
+        for name, value in zip(COORDINATE_FIELDS, values):
+            setattr(self, name, value)
+        self.update_extent()
+
+    def update_extent(self) -> None:
+        """
+        Recompute the length and bounding box from the coordinates.
+        """
+        extent = line_extent(
+            (self.start_x, self.start_y, self.start_z),
+            (self.end_x, self.end_y, self.end_z),
+        )
+        for name, value in extent.items():
+            setattr(self, name, value)
+
+    # Class | Helpers
+    # =========================================================================
+
+    def _point(
+        self,
+        x: float,
+        y: float,
+        z: Optional[float],
+    ) -> tuple[float, ...]:
+        """
+        Return a point without its z if the line is 2D.
+        """
+        if self.start_z is None or self.end_z is None:
+            return (x, y)
+        return (x, y, z)
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+__all__ = [
+    "COORDINATE_FIELDS",
+    "EXTENT_FIELDS",
+    "IfcLine",
+    "IfcLineQuerySet",
+    "copy_json_coordinates",
+    "line_extent",
+    "migrate_json_coordinates",
+]
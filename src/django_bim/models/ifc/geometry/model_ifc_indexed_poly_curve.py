@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC Indexed Poly Curve Model Class
+===========================================
+
+This module defines the IfcIndexedPolyCurveModel class, representing an
+IfcIndexedPolyCurve entity of IFC4: a curve through the points of an
+`IfcCartesianPointListModel`, made of line and arc segments addressing the
+points by their 1-based index.
+
+The points are shared with the packed point list rather than copied, and
+the segments are stored as a JSON list of `[kind, indices]` pairs, `kind`
+being `LINE` or `ARC` after the `IfcLineIndex` and `IfcArcIndex` types. A
+curve without segments runs through all points as one polyline.
+
+More information on IfcIndexedPolyCurve can be found here:
+https://standards.buildingsmart.org/IFC/RELEASE/IFC4/ADD2_TC1/HTML/schema/ifcgeometryresource/lexical/ifcindexedpolycurve.htm
+
+"""  # noqa E501
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+from typing import Optional
+
+# Import | Libraries
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+# Import | Local Modules
+from .model_ifc_cartesian_point_list import IfcCartesianPointListModel
+from .model_ifc_geometry_curve import IfcCurve
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+# Kinds of segments, after the `IfcSegmentIndexSelect` types
+LINE_SEGMENT = "LINE"
+ARC_SEGMENT = "ARC"
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcIndexedPolyCurveModel(IfcCurve):
+    """
+    IFC Indexed Poly Curve Model Class
+    ==================================
+
+    Model representing an IfcIndexedPolyCurve, a curve of line and arc
+    segments through the points of a point list.
+
+    Attributes:
+        points (ForeignKey): The point list of the curve.
+        segments (JSONField): The `[kind, indices]` pairs of the segments,
+            or `None` for a polyline through all points.
+        self_intersect (BooleanField): Whether the curve intersects itself,
+            if known.
+
+    """
+
+    # Class | Model Fields
+    # =========================================================================
+
+    points = models.ForeignKey(
+        IfcCartesianPointListModel,
+        on_delete = models.CASCADE,
+        related_name = "indexed_poly_curves",
+        verbose_name = _("Points"),
+        help_text = _("The point list of the curve."),
+    )
+
+    segments = models.JSONField(
+        null = True,
+        blank = True,
+        verbose_name = _("Segments"),
+        help_text = _(
+            "The kind and 1-based point indices of each segment, e.g. [\"LINE\", [1, 2]]."  # noqa E501
+        ),
+    )
+
+    self_intersect = models.BooleanField(
+        null = True,
+        blank = True,
+        verbose_name = _("Self Intersect"),
+        help_text = _("Whether the curve intersects itself, if known."),
+    )
+
+    # Class | Model Meta Class
+    # =========================================================================
+
+    class Meta:
+        """
+        Meta Class
+        ----------
+
+        """
+        verbose_name = _("IFC Indexed Poly Curve")
+        verbose_name_plural = _("IFC Indexed Poly Curves")
+
+    # Class | Model Methods
+    # =========================================================================
+
+    def __str__(self) -> str:
+        """
+        String representation of the curve.
+        """
+        if self.curve_name:
+            return self.curve_name
+        count = len(self.segments) if self.segments else 1
+        return f"Indexed Poly Curve ({count} segments)"
+
+    def segment_indices(self) -> list[tuple[str, list[int]]]:
+        """
+        Return the segments of the curve, a single line through all points
+        when none are stored.
+
+        Returns:
+            list: `(kind, indices)` pairs, with 1-based point indices.
+        """
+        if not self.segments:
+            return [(LINE_SEGMENT, list(range(1, self.points.count + 1)))]
+        return [(kind, list(indices)) for kind, indices in self.segments]
+
+    def vertices(self) -> list[tuple[float, ...]]:
+        """
+        Return the points the segments pass through, in curve order, the
+        points shared by consecutive segments once.
+
+        Returns:
+            list: One tuple of 2 or 3 floats per point.
+        """
+        points = self.points.points()
+        vertices: list[tuple[float, ...]] = []
+        last: Optional[int] = None
+        for segment in self.segment_indices():
+            for index in segment[1]:
+                if index != last:
+                    vertices.append(points[index - 1])
+                last = index
+        return vertices
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+__all__ = [
+    "ARC_SEGMENT",
+    "IfcIndexedPolyCurveModel",
+    "LINE_SEGMENT",
+]
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC Triangulated Face Set Model Class
+==============================================
+
+This module defines the IfcTriangulatedFaceSetModel class, representing an
+IfcTriangulatedFaceSet entity of IFC4: a mesh of triangles addressing the
+vertices of an `IfcCartesianPointListModel` by their 1-based index.
+
+Like the coordinates of the point list, the vertex indices of the triangles
+are stored in one row, packed as little-endian uint32 values (three per
+triangle) in a binary column, next to the number of triangles, so a mesh
+with a million faces is one row. `as_array()` exposes them as a
+`(face_count, 3)` NumPy array reading the stored bytes without copying. The
+optional normals are packed as float64 values, like coordinates, and the
+optional `PnIndex` list, which maps the indices of the triangles to the
+points of the list, as uint32 values.
+
+More information on IfcTriangulatedFaceSet can be found here:
+https://standards.buildingsmart.org/IFC/RELEASE/IFC4/ADD2_TC1/HTML/schema/ifcgeometricmodelresource/lexical/ifctriangulatedfaceset.htm
+
+"""  # noqa E501
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import sys
+from array import array
+from itertools import chain
+from typing import Sequence
+
+# Import | Libraries
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+# Import | Local Modules
+from .model_ifc_cartesian_point_list import IfcCartesianPointListModel
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+# Indices are stored little-endian whatever the platform
+_SWAP_BYTES = sys.byteorder == "big"
+
+# Array type code of 4-byte unsigned integers
+_INDEX_TYPE = "I" if array("I").itemsize == 4 else "L"
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def pack_indices(rows: Sequence[Sequence[int]]) -> bytes:
+    """
+    Pack rows of point indices as little-endian uint32 values.
+
+    Parameters:
+        rows (Sequence[Sequence[int]]): Rows of equal length, e.g. the
+            three vertex indices of each triangle.
+
+    Returns:
+        bytes: The packed indices.
+    """
+    values = array(_INDEX_TYPE, chain.from_iterable(rows))
+    if _SWAP_BYTES:
+        values.byteswap()
+    return values.tobytes()
+
+
+def pack_index_list(indices: Sequence[int]) -> bytes:
+    """
+    Pack a flat list of point indices, such as a `PnIndex`, as
+    little-endian uint32 values.
+
+    Parameters:
+        indices (Sequence[int]): The indices.
+
+    Returns:
+        bytes: The packed indices.
+    """
+    return pack_indices([indices])
+
+
+def unpack_indices(indices: bytes, width: int = 3) -> list[tuple[int, ...]]:
+    """
+    Unpack indices packed by `pack_indices` into tuples, without NumPy.
+
+    Parameters:
+        indices (bytes): The packed indices.
+        width (int): Indices per row.
+
+    Returns:
+        list: One tuple of `width` integers per row.
+    """
+    values = array(_INDEX_TYPE)
+    values.frombytes(bytes(indices))
+    if _SWAP_BYTES:
+        values.byteswap()
+    return [
+        tuple(values[start:start + width])
+        for start in range(0, len(values), width)
+    ]
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcTriangulatedFaceSetModel(models.Model):
+    """
+    IFC Triangulated Face Set Model Class
+    =====================================
+
+    Model representing an IfcTriangulatedFaceSet, a mesh of triangles over
+    the points of a point list.
+
+    Attributes:
+        coordinates (ForeignKey): The point list of the vertices.
+        normals (BinaryField): The normals, packed as little-endian float64
+            values, three per normal, or `None` if unset.
+        closed (BooleanField): Whether the mesh encloses a volume, if known.
+        face_count (PositiveIntegerField): Number of triangles.
+        coord_index (BinaryField): The three 1-based vertex indices of each
+            triangle, packed as little-endian uint32 values.
+        pn_index (BinaryField): The 1-based indices into the point list
+            that `coord_index` refers to, packed like it, or `None` if the
+            triangles index the point list directly.
+
+    """
+
+    # Class | Model Fields
+    # =========================================================================
+
+    coordinates = models.ForeignKey(
+        IfcCartesianPointListModel,
+        on_delete = models.CASCADE,
+        related_name = "triangulated_face_sets",
+        verbose_name = _("Coordinates"),
+        help_text = _("The point list of the vertices."),
+    )
+
+    normals = models.BinaryField(
+        null = True,
+        blank = True,
+        verbose_name = _("Normals"),
+        help_text = _(
+            "The normals, packed as little-endian float64 values, three per normal."  # noqa E501
+        ),
+    )
+
+    closed = models.BooleanField(
+        null = True,
+        blank = True,
+        verbose_name = _("Closed"),
+        help_text = _("Whether the mesh encloses a volume, if known."),
+    )
+
+    face_count = models.PositiveIntegerField(
+        default = 0,
+        verbose_name = _("Face Count"),
+        help_text = _("Number of triangles."),
+    )
+
+    coord_index = models.BinaryField(
+        default = b"",
+        verbose_name = _("Coordinate Index"),
+        help_text = _(
+            "The 1-based vertex indices of the triangles, packed as little-endian uint32 values."  # noqa E501
+        ),
+    )
+
+    pn_index = models.BinaryField(
+        null = True,
+        blank = True,
+        verbose_name = _("Point Index"),
+        help_text = _(
+            "The 1-based indices into the point list the triangles refer to, packed as little-endian uint32 values."  # noqa E501
+        ),
+    )
+
+    # Class | Model Meta Class
+    # =========================================================================
+
+    class Meta:
+        """
+        Meta Class
+        ----------
+
+        """
+        verbose_name = _("IFC Triangulated Face Set")
+        verbose_name_plural = _("IFC Triangulated Face Sets")
+
+    # Class | Model Methods
+    # =========================================================================
+
+    def __str__(self) -> str:
+        """
+        String representation of the face set.
+        """
+        return f"Triangulated Face Set ({self.face_count} faces)"
+
+    def __len__(self) -> int:
+        """
+        Return the number of triangles.
+        """
+        return self.face_count
+
+    def set_triangles(self, triangles: Sequence[Sequence[int]]) -> None:
+        """
+        Store the vertex indices of the triangles.
+
+        Parameters:
+            triangles (Sequence[Sequence[int]]): Three 1-based indices into
+                the coordinates per triangle.
+
+        Raises:
+            ValueError: If a triangle does not have three indices.
+        """
+        if any(len(triangle) != 3 for triangle in triangles):
+            raise ValueError("Triangles must have three vertex indices.")
+        self.coord_index = pack_indices(triangles)
+        self.face_count = len(triangles)
+
+    def as_array(self):
+        """
+        Return the vertex indices as a read-only NumPy array of shape
+        `(face_count, 3)`, sharing the memory of the stored bytes.
+
+        Returns:
+            numpy.ndarray: The 1-based vertex indices.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        import numpy
+
+        return numpy.frombuffer(self.coord_index, dtype="<u4").reshape(
+            self.face_count, 3,
+        )
+
+    def triangles(self) -> list[tuple[int, int, int]]:
+        """
+        Return the vertex indices as a list of tuples, without NumPy.
+
+        Returns:
+            list: Three 1-based vertex indices per triangle.
+        """
+        return unpack_indices(self.coord_index)
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+__all__ = [
+    "IfcTriangulatedFaceSetModel",
+    "pack_index_list",
+    "pack_indices",
+    "unpack_indices",
+]
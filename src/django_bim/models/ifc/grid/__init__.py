@@ -19,9 +19,9 @@ Django BIM IFC Grid Models Module
 # =============================================================================
 
 # Import | Local Modules
-from .model_ifc_placement_grid import IfcGridPlacementModel
-from .model_ifc_placement_local import IfcLocalPlacementModel
-from .model_ifc_placement_object import IfcObjectPlacementModel
+from .model_ifc_grid import IfcGridModel
+from .model_ifc_grid_axis import IfcGridAxisModel
+from .model_ifc_grid_intersection import IfcGridIntersectionModel
 
 
 # =============================================================================
@@ -29,7 +29,7 @@ from .model_ifc_placement_object import IfcObjectPlacementModel
 # =============================================================================
 
 __all__ = [
-    "IfcGridPlacementModel",
-    "IfcLocalPlacementModel",
-    "IfcObjectPlacementModel",
+    "IfcGridAxisModel",
+    "IfcGridIntersectionModel",
+    "IfcGridModel",
 ]
@@ -17,6 +17,12 @@ Grid systems are crucial in layout planning and are typically composed of two
 or three sets of parallel lines that intersect at defined points. This model
 supports both 2D and 3D grid systems by allowing an optional set of W axes.
 
+The number of axes in each set is stored on the grid (`u_axis_count` ...
+`w_axis_count`) and kept up to date by signals on the axis relations, so
+that the grid renders without querying its axes.
+`IfcGridModel.objects.update_axis_counts()` recomputes them, e.g. after
+bulk updates of the relations that bypass the signals.
+
 More information on IfcGrid can be found here:
 https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcproductextension/lexical/ifcgrid.htm
 
@@ -31,17 +37,64 @@ https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcproductextens
 
 # Import | Libraries
 from django.db import models
+from django.db.models.functions import Coalesce
+from django.db.models.signals import m2m_changed
 from django.utils.translation import gettext_lazy as _
 
 # Import | Grid Modules
-from ..model_ifc_product import IfcProductModel
+from ...managers import StrRelatedManager
+from ..model_ifc_product import IfcProductModel, IfcProductQuerySet
 from .model_ifc_grid_axis import IfcGridAxisModel
 
 
+# =============================================================================
+# Variables
+# =============================================================================
+
+# Axis sets of a grid, with the column counting their axes
+AXIS_COUNT_FIELDS = {
+    "u_axes": "u_axis_count",
+    "v_axes": "v_axis_count",
+    "w_axes": "w_axis_count",
+}
+
+
 # =============================================================================
 # Classes
 # =============================================================================
 
+class IfcGridQuerySet(IfcProductQuerySet):
+    """
+    IFC Grid QuerySet Class
+    =======================
+
+    QuerySet of grids, adding the maintenance of the axis counts to the
+    location filters of products.
+
+    """
+
+    def update_axis_counts(self) -> int:
+        """
+        Recompute the axis counts of the grids in one UPDATE.
+
+        Returns:
+            int: Number of grids updated.
+        """
+        counts = {}
+        for name, column in AXIS_COUNT_FIELDS.items():
+            field = self.model._meta.get_field(name)
+            grid = field.m2m_field_name()
+            axes = (
+                field.remote_field.through._default_manager
+                .filter(**{grid: models.OuterRef("pk")})
+                .values(grid)
+                .annotate(count=models.Count("pk"))
+                .values("count")
+            )
+            counts[column] = Coalesce(models.Subquery(axes), 0)
+        return self.update(**counts)
+
+
 class IfcGridModel(IfcProductModel):
     """
     IFC Grid Model Class
@@ -57,9 +110,14 @@ class IfcGridModel(IfcProductModel):
         v_axes (ManyToManyField): The set of V axes in the grid.
         w_axes (ManyToManyField): The set of W axes in the grid,
             optional for 3D grids.
+        u_axis_count, v_axis_count, w_axis_count (PositiveIntegerField):
+            The number of axes in each set, maintained on write.
+        objects (IfcGridQuerySet): Manager with the axis count maintenance.
 
     """
 
+    STR_RELATED_FIELDS = ()
+
     # Class | Model Fields
     # =========================================================================
 
@@ -85,6 +143,29 @@ class IfcGridModel(IfcProductModel):
         help_text=_("The W axes of the grid, optional for 3D grids."),
     )
 
+    u_axis_count = models.PositiveIntegerField(
+        default = 0,
+        editable = False,
+        verbose_name = _("U Axis Count"),
+        help_text = _("The number of U axes, maintained on write."),
+    )
+
+    v_axis_count = models.PositiveIntegerField(
+        default = 0,
+        editable = False,
+        verbose_name = _("V Axis Count"),
+        help_text = _("The number of V axes, maintained on write."),
+    )
+
+    w_axis_count = models.PositiveIntegerField(
+        default = 0,
+        editable = False,
+        verbose_name = _("W Axis Count"),
+        help_text = _("The number of W axes, maintained on write."),
+    )
+
+    objects = StrRelatedManager.from_queryset(IfcGridQuerySet)()
+
     # Class | Model Meta Class
     # =========================================================================
 
@@ -105,8 +186,70 @@ class IfcGridModel(IfcProductModel):
         Provides a string representation of the grid, typically for
         admin displays.
         """
-        grid_dimensions = "3D" if self.w_axes.exists() else "2D"
-        return f"{self.name} - {grid_dimensions} Grid"
+        return f"{self.name} - {self.dimensions}D Grid"
+
+    @property
+    def dimensions(self) -> int:
+        """
+        Return the dimensionality of the grid: 3 with W axes, otherwise 2.
+        """
+        return 3 if self.w_axis_count else 2
+
+
+# =============================================================================
+# Signals
+# =============================================================================
+
+def _update_axis_counts(
+    sender,
+    instance,
+    action,
+    reverse,
+    pk_set,
+    using=None,
+    **kwargs,
+):
+    """
+    Recompute the axis counts of the grids whose axes changed.
+    """
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            grids = IfcGridModel._default_manager.using(using)
+            grids.filter(pk=instance.pk).update_axis_counts()
+            instance.refresh_from_db(
+                using=using, fields=list(AXIS_COUNT_FIELDS.values()),
+            )
+        return
+    # An axis added to or removed from grids
+    name = next(
+        name for name in AXIS_COUNT_FIELDS
+        if getattr(IfcGridModel, name).through is sender
+    )
+    field = IfcGridModel._meta.get_field(name)
+    if action == "pre_clear":
+        # The grids of a cleared axis are unknown afterwards
+        instance._cleared_grids = set(
+            sender._default_manager.using(using)
+            .filter(**{field.m2m_reverse_field_name(): instance.pk})
+            .values_list(field.m2m_field_name(), flat=True)
+        )
+        return
+    if action == "post_clear":
+        pk_set = instance.__dict__.pop("_cleared_grids", ())
+    elif action not in ("post_add", "post_remove"):
+        return
+    if pk_set:
+        IfcGridModel._default_manager.using(using).filter(
+            pk__in=pk_set,
+        ).update_axis_counts()
+
+
+for _name in AXIS_COUNT_FIELDS:
+    m2m_changed.connect(
+        _update_axis_counts,
+        sender=getattr(IfcGridModel, _name).through,
+        dispatch_uid=f"django_bim_grid_axis_counts_{_name}",
+    )
 
 
 # =============================================================================
@@ -114,5 +257,7 @@ class IfcGridModel(IfcProductModel):
 # =============================================================================
 
 __all__ = [
+    "AXIS_COUNT_FIELDS",
     "IfcGridModel",
+    "IfcGridQuerySet",
 ]
@@ -9,7 +9,10 @@
 Provides IFC Grid Axis Model Class
 ==================================
 
-
+This module defines the IfcGridAxisModel class, one labelled axis of an
+IfcGrid, positioned by its axis curve in the coordinate system of the grid.
+The intersections of the axes of a grid are precomputed in
+`model_ifc_grid_intersection`.
 
 More information on IfcGrid can be found here:
 https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcgeometricconstraintresource/lexical/ifcgridaxis.htm
@@ -27,15 +30,15 @@ https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcgeometriccons
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-# Import | Grid Modules
-from .model_ifc_placement_object import IfcObjectPlacementModel
+# Import | Local Modules
+from ..geometry.model_ifc_geometry_curve_line import IfcLine
 
 
 # =============================================================================
 # Classes
 # =============================================================================
 
-class IfcGridAxisModel():
+class IfcGridAxisModel(models.Model):
     """
     IFC Grid Axis Model Class
     =========================
@@ -46,7 +49,8 @@ class IfcGridAxisModel():
 
     Attributes:
         axis_tag (CharField): The label or identifier for the axis.
-        axis_curve (ForeignKey): Optional curve geometry associated with the axis.
+        axis_curve (ForeignKey): Optional line of the axis, in the
+            coordinate system of the grid.
         same_sense (BooleanField): Indicates the direction of the grid axis in relation to its geometric representation.
     """
 
@@ -60,7 +64,7 @@ class IfcGridAxisModel():
         help_text=_("Label or identifier for the grid axis.")
     )
     axis_curve = models.ForeignKey(
-        IfcCurve,
+        IfcLine,
         on_delete=models.SET_NULL,
         null=True,
         blank=True,
@@ -74,8 +78,8 @@ class IfcGridAxisModel():
     #     help_text=_("Indicates if the grid axis has the same sense as the geometric representation.")
     # )
 
-    same_sense = IfcBooleanmdelField(
-        default = 1,
+    same_sense = models.BooleanField(
+        default = True,
         verbose_name=_("Same Sense"),
         help_text=_("Indicates if the grid axis has the same sense as the geometric representation.")
     )
@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC Grid Intersection Model Class
+==========================================
+
+This module defines a precomputed table of the intersections of the axes of
+each `IfcGridModel`: one row per pair of intersecting axes from different
+sets (U/V, U/W and V/W), keyed by (grid, u_tag, v_tag), with the
+coordinates of the intersection in the coordinate system of the grid.
+Resolving a grid placement such as "A1" is then a single indexed lookup
+instead of intersecting the axis curves.
+
+The rows are maintained incrementally through signals:
+- adding or removing axes of a grid recomputes the rows of those axes,
+- saving an axis, or the line of its curve, recomputes the rows of that
+  axis in every grid using it,
+- deleting an axis or a grid deletes its rows.
+`IfcGridIntersectionModel.rebuild` recomputes the rows of whole grids, e.g.
+after bulk updates that bypass the signals.
+
+Parallel axes have no intersection and no row. Only the typed coordinates
+of the axis lines are read; their z is ignored.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+from typing import Iterable, Optional, Union
+
+# Import | Libraries
+from django.db import models, router, transaction
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+
+# Import | Local Modules
+from ..geometry.model_ifc_geometry_curve_line import IfcLine
+from .model_ifc_grid import IfcGridModel
+from .model_ifc_grid_axis import IfcGridAxisModel
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+# Axis sets of a grid, and the pairs of sets that intersect
+AXIS_SETS = ("u_axes", "v_axes", "w_axes")
+AXIS_SET_PAIRS = (
+    ("u_axes", "v_axes"),
+    ("u_axes", "w_axes"),
+    ("v_axes", "w_axes"),
+)
+
+# Relative tolerance below which two axes count as parallel
+_PARALLEL_TOLERANCE = 1e-12
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def intersect_axes(
+    first: Optional[IfcLine],
+    second: Optional[IfcLine],
+) -> Optional[tuple[float, float]]:
+    """
+    Intersect the lines of two axes, extended beyond their end points.
+
+    Parameters:
+        first (IfcLine): The line of the first axis.
+        second (IfcLine): The line of the second axis.
+
+    Returns:
+        tuple: The `(x, y)` intersection, or `None` if an axis has no line
+            or the lines are parallel.
+    """
+    if first is None or second is None:
+        return None
+    rx, ry = first.end_x - first.start_x, first.end_y - first.start_y
+    sx, sy = second.end_x - second.start_x, second.end_y - second.start_y
+    cross = rx * sy - ry * sx
+    if abs(cross) <= _PARALLEL_TOLERANCE * (
+        (rx * rx + ry * ry) * (sx * sx + sy * sy)
+    ) ** 0.5:
+        return None
+    qx, qy = second.start_x - first.start_x, second.start_y - first.start_y
+    t = (qx * sy - qy * sx) / cross
+    return (first.start_x + t * rx, first.start_y + t * ry)
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcGridIntersectionQuerySet(models.QuerySet):
+    """
+    IFC Grid Intersection QuerySet Class
+    ====================================
+
+    QuerySet resolving grid locations.
+
+    """
+
+    def locate(
+        self,
+        grid: Union[models.Model, int],
+        u_tag: str,
+        v_tag: Optional[str] = None,
+    ) -> Optional[tuple[float, float]]:
+        """
+        Return the coordinates of an intersection, with one indexed query.
+
+        Parameters:
+            grid (IfcGridModel | int): The grid or its primary key.
+            u_tag (str): The tag of the first axis or, without `v_tag`, the
+                label of the intersection, e.g. "A1".
+            v_tag (str): The tag of the second axis.
+
+        Returns:
+            tuple: The `(x, y)` coordinates in the grid coordinate system,
+                or `None` if the axes do not intersect.
+        """
+        lookups = {"grid": getattr(grid, "pk", grid)}
+        if v_tag is None:
+            lookups["label"] = u_tag
+        else:
+            lookups.update(u_tag=u_tag, v_tag=v_tag)
+        return self.filter(**lookups).values_list("x", "y").first()
+
+
+class IfcGridIntersectionModel(models.Model):
+    """
+    IFC Grid Intersection Model Class
+    =================================
+
+    Model storing the intersection of two axes of a grid.
+
+    Attributes:
+        grid (ForeignKey): The grid.
+        u_axis (ForeignKey): The axis of the first set: U, or V for V/W
+            intersections.
+        v_axis (ForeignKey): The axis of the second set: V, or W for U/W
+            and V/W intersections.
+        u_tag (CharField): The tag of `u_axis`.
+        v_tag (CharField): The tag of `v_axis`.
+        label (CharField): The tags joined, e.g. "A1".
+        x (FloatField): The x coordinate in the grid coordinate system.
+        y (FloatField): The y coordinate in the grid coordinate system.
+        objects (IfcGridIntersectionQuerySet): Manager resolving locations.
+
+    """
+
+    # Class | Model Fields
+    # =========================================================================
+
+    grid = models.ForeignKey(
+        IfcGridModel,
+        on_delete = models.CASCADE,
+        related_name = "intersections",
+        verbose_name = _("Grid"),
+        help_text = _("The grid of the intersecting axes."),
+    )
+
+    u_axis = models.ForeignKey(
+        IfcGridAxisModel,
+        on_delete = models.CASCADE,
+        related_name = "+",
+        verbose_name = _("U Axis"),
+        help_text = _("The axis of the first set."),
+    )
+
+    v_axis = models.ForeignKey(
+        IfcGridAxisModel,
+        on_delete = models.CASCADE,
+        related_name = "+",
+        verbose_name = _("V Axis"),
+        help_text = _("The axis of the second set."),
+    )
+
+    u_tag = models.CharField(
+        max_length = 100,
+        verbose_name = _("U Tag"),
+        help_text = _("The tag of the axis of the first set."),
+    )
+
+    v_tag = models.CharField(
+        max_length = 100,
+        verbose_name = _("V Tag"),
+        help_text = _("The tag of the axis of the second set."),
+    )
+
+    label = models.CharField(
+        max_length = 200,
+        verbose_name = _("Label"),
+        help_text = _("The tags of both axes joined, such as 'A1'."),
+    )
+
+    x = models.FloatField(verbose_name = _("X Coordinate"))
+
+    y = models.FloatField(verbose_name = _("Y Coordinate"))
+
+    objects = IfcGridIntersectionQuerySet.as_manager()
+
+    # Class | Model Meta Class
+    # =========================================================================
+
+    class Meta:
+        """
+        Meta Class
+        ----------
+
+        """
+        verbose_name = _("IFC Grid Intersection")
+        verbose_name_plural = _("IFC Grid Intersections")
+        constraints = [
+            models.UniqueConstraint(
+                fields = ["grid", "u_tag", "v_tag"],
+                name = "uniq_grid_intersection_tags",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields = ["grid", "label"],
+                name = "idx_grid_intersection_label",
+            ),
+        ]
+
+    # Class | Model Methods
+    # =========================================================================
+
+    def __str__(self) -> str:
+        """
+        String representation of the intersection.
+        """
+        return f"{self.label} ({self.x}, {self.y})"
+
+    @classmethod
+    def update_axes(
+        cls,
+        grid: Union[models.Model, int],
+        axes: Iterable[int],
+        using: Optional[str] = None,
+    ) -> int:
+        """
+        Recompute the rows of some axes of a grid.
+
+        Parameters:
+            grid (IfcGridModel | int): The grid or its primary key.
+            axes (Iterable[int]): Primary keys of the axes, which may no
+                longer belong to the grid.
+            using (str): The database alias.
+
+        Returns:
+            int: Number of rows created.
+        """
+        using = using or router.db_for_write(cls)
+        grid = getattr(grid, "pk", grid)
+        axes = set(axes)
+        sets = _axis_sets(grid, using)
+        rows = [
+            row for row in _intersections(grid, sets)
+            if row.u_axis_id in axes or row.v_axis_id in axes
+        ]
+        manager = cls._default_manager.using(using)
+        with transaction.atomic(using=using):
+            manager.filter(
+                models.Q(u_axis__in=axes) | models.Q(v_axis__in=axes),
+                grid=grid,
+            ).delete()
+            manager.bulk_create(rows)
+        return len(rows)
+
+    @classmethod
+    def rebuild(
+        cls,
+        grids: Optional[Iterable[int]] = None,
+        using: Optional[str] = None,
+    ) -> int:
+        """
+        Recompute all the rows of grids.
+
+        Parameters:
+            grids (Iterable[int]): Primary keys of the grids, or `None` for
+                every grid.
+            using (str): The database alias.
+
+        Returns:
+            int: Number of rows created.
+        """
+        using = using or router.db_for_write(cls)
+        if grids is None:
+            grids = IfcGridModel._default_manager.using(using).values_list(
+                "pk", flat=True,
+            )
+        manager = cls._default_manager.using(using)
+        created = 0
+        with transaction.atomic(using=using):
+            for grid in list(grids):
+                manager.filter(grid=grid).delete()
+                rows = _intersections(grid, _axis_sets(grid, using))
+                manager.bulk_create(rows)
+                created += len(rows)
+        return created
+
+
+# =============================================================================
+# Functions | Helpers
+# =============================================================================
+
+def _axis_sets(grid: int, using: str) -> dict[str, list[IfcGridAxisModel]]:
+    """
+    Load the axes of a grid, with their lines, per set.
+    """
+    # The reverse relations of the axis sets are named after them
+    return {
+        name: list(
+            IfcGridAxisModel._default_manager.using(using)
+            .filter(**{name: grid})
+            .select_related("axis_curve")
+        )
+        for name in AXIS_SETS
+    }
+
+
+def _intersections(
+    grid: int,
+    sets: dict[str, list[IfcGridAxisModel]],
+) -> list[IfcGridIntersectionModel]:
+    """
+    Build the intersection rows of the axes of a grid.
+    """
+    rows = []
+    for first_set, second_set in AXIS_SET_PAIRS:
+        for first in sets[first_set]:
+            for second in sets[second_set]:
+                point = intersect_axes(first.axis_curve, second.axis_curve)
+                if point is None:
+                    continue
+                rows.append(IfcGridIntersectionModel(
+                    grid_id=grid,
+                    u_axis=first,
+                    v_axis=second,
+                    u_tag=first.axis_tag,
+                    v_tag=second.axis_tag,
+                    label=f"{first.axis_tag}{second.axis_tag}",
+                    x=point[0],
+                    y=point[1],
+                ))
+    return rows
+
+
+def _update_axis_everywhere(axis: int, using: Optional[str]) -> None:
+    """
+    Recompute the rows of an axis in every grid using it.
+    """
+    grids = set()
+    for name in AXIS_SETS:
+        grids.update(
+            IfcGridModel._default_manager.using(using)
+            .filter(**{name: axis})
+            .values_list("pk", flat=True)
+        )
+    for grid in grids:
+        IfcGridIntersectionModel.update_axes(grid, [axis], using=using)
+
+
+# =============================================================================
+# Signals
+# =============================================================================
+
+@receiver(post_save, sender=IfcGridAxisModel)
+def _update_saved_axis(sender, instance, raw=False, using=None, **kwargs):
+    """
+    Recompute the intersections of a saved axis.
+    """
+    if not raw:
+        _update_axis_everywhere(instance.pk, using)
+
+
+@receiver(post_save, sender=IfcLine)
+def _update_saved_line(sender, instance, raw=False, using=None, **kwargs):
+    """
+    Recompute the intersections of the axes whose line was saved.
+    """
+    if raw:
+        return
+    axes = IfcGridAxisModel._default_manager.using(using).filter(
+        axis_curve=instance,
+    ).values_list("pk", flat=True)
+    for axis in axes:
+        _update_axis_everywhere(axis, using)
+
+
+def _update_grid_axes(
+    sender,
+    instance,
+    action,
+    reverse,
+    pk_set,
+    using=None,
+    **kwargs,
+):
+    """
+    Recompute the intersections of axes added to or removed from a grid.
+    """
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        if action == "post_clear":
+            IfcGridIntersectionModel.rebuild([instance.pk], using=using)
+        else:
+            IfcGridIntersectionModel.update_axes(instance, pk_set, using=using)
+        return
+    # An axis added to or removed from grids
+    if action == "post_clear":
+        # The grids it was removed from are unknown once cleared
+        IfcGridIntersectionModel._default_manager.using(using).filter(
+            models.Q(u_axis=instance) | models.Q(v_axis=instance),
+        ).delete()
+        _update_axis_everywhere(instance.pk, using)
+        return
+    for grid in pk_set:
+        IfcGridIntersectionModel.update_axes(grid, [instance.pk], using=using)
+
+
+for _name in AXIS_SETS:
+    m2m_changed.connect(
+        _update_grid_axes,
+        sender=getattr(IfcGridModel, _name).through,
+        dispatch_uid=f"django_bim_grid_intersections_{_name}",
+    )
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+__all__ = [
+    "AXIS_SETS",
+    "IfcGridIntersectionModel",
+    "IfcGridIntersectionQuerySet",
+    "intersect_axes",
+]
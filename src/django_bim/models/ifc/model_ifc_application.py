@@ -36,6 +36,7 @@ from ...fields.model import (
     IfcIdentifierField,
     IfcLabelField,
 )
+from ..managers import StrRelatedManager
 
 
 # =============================================================================
@@ -71,9 +72,15 @@ class IfcApplicationModel(models.Model):
         application_identifier (IfcIdentifierField): A unique identifier for
             the application, often as a UUID.
         version (IfcLabelField): The software version detail.
+        STR_RELATED_FIELDS (tuple): The relations loaded with every row for
+            `__str__`, see `StrRelatedManager`.
 
     """
 
+    STR_RELATED_FIELDS = (
+        "application_developer",
+    )
+
     # Class | Model Fields
     # =========================================================================
 
@@ -111,6 +118,8 @@ class IfcApplicationModel(models.Model):
         help_text = _("The version of the application software."),
     )
 
+    objects = StrRelatedManager()
+
     # Class | Model Meta Class
     # =========================================================================
 
@@ -37,6 +37,7 @@ from ...enums import (
     IfcChangeActionEnum,
     IfcStateEnum,
 )
+from ..managers import StrRelatedManager
 
 
 # =============================================================================
@@ -69,9 +70,35 @@ class IfcOwnerHistoryModel(models.Model):
             deleted).
         state (CharField): State of the entity at the last modification.
         application (ForeignKey): Application used for the modification.
+        interning_key (CharField): Hash of the fields in `INTERNING_FIELDS`
+            for rows shared through interning (see
+            `django_bim.io.step.StepRowInterner`), or null.
+        INTERNING_FIELDS (tuple): The fields that identify an owner history
+            when identical rows are merged on import.
+        STR_RELATED_FIELDS (tuple): The relations loaded with every row for
+            `__str__`, see `StrRelatedManager`.
+
+    Note:
+        Interned rows are shared by every entity with the same owner
+        history, so they should not be edited in place.
 
     """
 
+    INTERNING_FIELDS = (
+        "creation_user",
+        "modification_user",
+        "application",
+        "change_action",
+        "state",
+        "creation_date",
+        "last_modified_date",
+    )
+
+    STR_RELATED_FIELDS = (
+        "creation_user__person",
+        "creation_user__organization",
+    )
+
     # Class | Model Fields
     # =========================================================================
 
@@ -120,7 +147,8 @@ class IfcOwnerHistoryModel(models.Model):
     state = models.CharField(
         max_length = 50,
         choices = IfcStateEnum.choices(),
-        # default = IfcStateEnum.NOTDEFINED.name,
+        null = True,
+        blank = True,
         verbose_name = _("State"),
         help_text = _(
             "The state of the entity at the last modification time."
@@ -139,6 +167,20 @@ class IfcOwnerHistoryModel(models.Model):
         )
     )
 
+    interning_key = models.CharField(
+        max_length = 32,
+        unique = True,
+        null = True,
+        blank = True,
+        editable = False,
+        verbose_name = _("Interning Key"),
+        help_text = _(
+            "Hash identifying rows shared between entities with the same owner history."  # noqa E501
+        )
+    )
+
+    objects = StrRelatedManager()
+
     # Class | Model Meta Class
     # =========================================================================
 
@@ -159,6 +201,11 @@ class IfcOwnerHistoryModel(models.Model):
                 fields = ["modification_user"],
                 name = "idx_modification_user",
             ),
+            # Incremental sync scans "modified since" ranges in key order
+            models.Index(
+                fields = ["last_modified_date", "id"],
+                name = "idx_last_modified_date",
+            ),
         ]
 
     # Class | Model Methods
@@ -168,7 +215,7 @@ class IfcOwnerHistoryModel(models.Model):
         """
         """
         creation_time = self.creation_date.strftime('%Y-%m-%d %H:%M:%S')
-        return f"{self.creation_user.username if self.creation_user else 'Unknown User'} on {creation_time}"  # noqa E501
+        return f"{self.creation_user or 'Unknown User'} on {creation_time}"
 
 
 # =============================================================================
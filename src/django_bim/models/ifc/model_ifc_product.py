@@ -6,10 +6,50 @@
 # =============================================================================
 
 """
-Provides IFC ... Model Class
-===================================
+Provides IFC Product Model Class
+================================
 
-For more information, refer to:
+This module defines the IfcProductModel class, representing an IfcProduct,
+the supertype of everything with a placement and a shape.
+
+Every product, and so every subclass, stores its axis-aligned bounding box
+in world coordinates (`min_x` ... `max_z`), computed from the bounding box
+of its shape in its own coordinate system (`local_bounds`) and the world
+transform of its `object_placement`. The box is recomputed when the product
+is saved, and when placements are saved or their world transforms
+recomputed, along with the digests of the products they place; after
+products were written in bulk,
+`IfcProductModel.objects.filter(...).update_world_bounds()` recomputes it.
+
+`IfcProductModel.objects.intersecting(minimum, maximum)` filters the
+products whose box intersects a box, in the database, through the native
+spatial index the migrations create:
+- a GiST index on `box(point(min_x, min_y), point(max_x, max_y))` on
+  PostgreSQL,
+- an R*Tree virtual table kept up to date by triggers on SQLite.
+Other databases, or SQLite builds without the R*Tree module, compare the
+indexed columns. The `bim_spatial_index` management command recreates and
+refills the index.
+
+Products form a tree through `container`, the spatial structure element
+or product they belong to, down from the products of a `project` (e.g.
+its sites). Each product stores a rollup of its digest and of the nested
+rollups of the products it contains (`rollup_digest`), and each project
+one of its digest and of the nested rollups of its top-level products, so
+two revisions of a subtree are equal when their rollups are. Saving or
+deleting a product adds the difference of its rollup to its ancestors,
+level by level;
+`update_digests()` does the same for the changed rows of a queryset,
+`move_products()` moves products between containers without saving them,
+e.g. on import, and `rebuild_rollups()` recomputes every rollup, e.g.
+after `update()` calls changed the containers.
+
+The digest of a product hashes the world transform of its placement, so
+when placements are saved, or their world transforms recomputed, the
+digests of the products they place are updated along with the rollups.
+
+More information on IfcProduct can be found here:
+https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifckernel/lexical/ifcproduct.htm
 
 """  # noqa E501
 
@@ -19,57 +59,788 @@ For more information, refer to:
 # =============================================================================
 
 # Import | Standard Library
+from collections import defaultdict
+from typing import Any, Iterable, Optional, Sequence, Union
 
 # Import | Libraries
-from django.db import models
+from django.apps import apps
+from django.db import connections, models, router
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_delete
 from django.utils.translation import gettext_lazy as _
 
 # Import | Local Modules
-from ...fields.model import (
-    IfcLabelField,
-    IfcRoleTypeField,
-    IfcTextField,
+from ...utils.bounds import (
+    Bounds,
+    bounds_of,
+    pack_bounds,
+    transform_bounds,
+    unpack_bounds,
+)
+from ...utils.digest import (
+    DIGEST_MODULUS,
+    add_digests,
+    nest_digest,
+    subtract_digests,
 )
+from ...utils.matrix import IDENTITY
+from ..managers import StrRelatedManager
+from .model_ifc_object import IfcObjectModel
+from .model_ifc_root import IfcRootModel, IfcRootQuerySet
+from .model_ifc_product_representation import IfcProductRepresentation
+from .placement.model_ifc_placement_local import (
+    IfcLocalPlacementModel,
+    placements_changed,
+)
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+# World bounding box columns, in `django_bim.utils.bounds` order
+BOUNDS_FIELDS = ("min_x", "min_y", "min_z", "max_x", "max_y", "max_z")
+
+# Number of products per query when updating bounding boxes
+_BOUNDS_BATCH_SIZE = 1000
+
+# Whether the native spatial index exists, per database alias
+_SPATIAL_INDEXES: dict[str, bool] = {}
+
+# Number of values per `__in` query, below the SQLite variable limit
+_LOOKUP_BATCH_SIZE = 900
+
+# Deepest container tree `propagate_rollups` walks before assuming a cycle
+_MAX_CONTAINER_DEPTH = 256
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def create_spatial_index(using: Optional[str] = None) -> Optional[str]:
+    """
+    Create the native spatial index of the product bounding boxes, if the
+    database has one, and fill it. Safe to run again.
+
+    Parameters:
+        using (str): The database alias.
+
+    Returns:
+        str: The kind of index created, or `None` if the database has no
+            native spatial index.
+    """
+    connection = connections[using or router.db_for_write(IfcProductModel)]
+    table, pk, columns = _spatial_columns(connection)
+    if connection.vendor == "postgresql":
+        statements = [
+            f"CREATE INDEX IF NOT EXISTS "
+            f"{connection.ops.quote_name(_spatial_index_name('gist'))} "
+            f"ON {table} USING gist ({_postgresql_box(columns)})",
+        ]
+        kind = "GiST index"
+    elif connection.vendor == "sqlite" and _sqlite_has_rtree(connection):
+        statements = _sqlite_rtree_statements(
+            connection.ops.quote_name, table, pk, columns,
+        )
+        kind = "R*Tree table"
+    else:
+        return None
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+    _SPATIAL_INDEXES[connection.alias] = True
+    return kind
+
+
+def drop_spatial_index(using: Optional[str] = None) -> None:
+    """
+    Drop the native spatial index of the product bounding boxes, if any.
+
+    Parameters:
+        using (str): The database alias.
+    """
+    connection = connections[using or router.db_for_write(IfcProductModel)]
+    quote = connection.ops.quote_name
+    if connection.vendor == "postgresql":
+        statements = [
+            f"DROP INDEX IF EXISTS {quote(_spatial_index_name('gist'))}",
+        ]
+    elif connection.vendor == "sqlite":
+        statements = [
+            f"DROP TRIGGER IF EXISTS "
+            f"{quote(_spatial_index_name(f'rtree_{event}'))}"
+            for event in ("insert", "update", "delete")
+        ]
+        statements.append(
+            f"DROP TABLE IF EXISTS {quote(_spatial_index_name('rtree'))}"
+        )
+    else:
+        return
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+    _SPATIAL_INDEXES[connection.alias] = False
+
+
+def propagate_rollups(
+    products: dict[int, int],
+    projects: Optional[dict[int, int]] = None,
+    using: Optional[str] = None,
+) -> None:
+    """
+    Add differences to the rollups of products and of their ancestors, up
+    to their projects, with two queries per level of the container tree.
+    Each updated rollup passes the difference of its nested digest on to
+    its container, or project.
+
+    Parameters:
+        products (dict): Differences per product primary key.
+        projects (dict): Differences per project primary key.
+        using (str): The database alias.
+    """
+    using = using or router.db_for_write(IfcProductModel)
+    manager = IfcProductModel._default_manager.using(using)
+    projects = defaultdict(int, projects or {})
+    deltas = _nonzero(products)
+    depth = 0
+    while deltas:
+        depth += 1
+        if depth > _MAX_CONTAINER_DEPTH:
+            raise ValueError("The containers of the products form a cycle.")
+        parents = defaultdict(int)
+        rollups = []
+        for pk, container, project, rollup in _in_batches(
+            manager.select_related(None),
+            list(deltas),
+            ("container", "project", "rollup_digest"),
+        ):
+            updated = _add_delta(rollup, deltas[pk])
+            rollups.append((updated, pk))
+            delta = _nested_delta(updated, rollup)
+            if container is not None:
+                parents[container] += delta
+            elif project is not None:
+                projects[project] += delta
+        _store_rollups(IfcProductModel, using, rollups)
+        deltas = _nonzero(parents)
+    deltas = _nonzero(projects)
+    if deltas:
+        project_model = _project_model()
+        _store_rollups(project_model, using, [
+            (_add_delta(rollup, deltas[pk]), pk)
+            for pk, rollup in _in_batches(
+                project_model._default_manager.using(using),
+                list(deltas),
+                ("rollup_digest",),
+            )
+        ])
+
+
+def move_products(
+    containers: dict[int, tuple[Optional[int], Optional[int]]],
+    using: Optional[str] = None,
+) -> int:
+    """
+    Move products to other containers, or to the top level of projects,
+    without saving them, and move their rollups along: the nested rollup
+    of each moved product is subtracted from its former ancestors and
+    added to its new ones.
+
+    Parameters:
+        containers (dict): The `(container, project)` primary keys per
+            product primary key, one of them being `None`.
+        using (str): The database alias.
+
+    Returns:
+        int: Number of products moved.
+    """
+    using = using or router.db_for_write(IfcProductModel)
+    products, projects = defaultdict(int), defaultdict(int)
+    moved = []
+    for pk, container, project, rollup in _in_batches(
+        IfcProductModel._default_manager.using(using).select_related(None),
+        list(containers),
+        ("container", "project", "rollup_digest"),
+    ):
+        if (container, project) == containers[pk]:
+            continue
+        _add_member(products, projects, container, project, rollup, -1)
+        _add_member(products, projects, *containers[pk], rollup, 1)
+        moved.append((*containers[pk], pk))
+    if moved:
+        connection = connections[using]
+        quote = connection.ops.quote_name
+        meta = IfcProductModel._meta
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"UPDATE {quote(meta.db_table)} "
+                f"SET {quote(meta.get_field('container').column)} = %s, "
+                f"{quote(meta.get_field('project').column)} = %s "
+                f"WHERE {quote(meta.pk.column)} = %s",
+                moved,
+            )
+    propagate_rollups(products, projects, using=using)
+    return len(moved)
+
+
+def rebuild_rollups(using: Optional[str] = None) -> int:
+    """
+    Recompute the rollups of every product and project from the digests,
+    e.g. after products were moved with `update()`.
+
+    Parameters:
+        using (str): The database alias.
+
+    Returns:
+        int: Number of products and projects whose rollup changed.
+    """
+    using = using or router.db_for_write(IfcProductModel)
+    rows = {
+        pk: (container, project, digest, rollup)
+        for pk, container, project, digest, rollup in (
+            IfcProductModel._default_manager.using(using)
+            .select_related(None)
+            .values_list(
+                "pk", "container", "project", "digest", "rollup_digest",
+            )
+            .iterator()
+        )
+    }
+    rollups = _tree_rollups(rows)
+    project_rollups = defaultdict(list)
+    for pk, (container, project, _digest, _rollup) in rows.items():
+        if container is None and project is not None and pk in rollups:
+            project_rollups[project].append(nest_digest(rollups[pk]))
+    product_changes = [
+        (rollup, pk) for pk, rollup in rollups.items()
+        if rollup != rows[pk][3]
+    ]
+    project_model = _project_model()
+    project_changes = []
+    for pk, digest, rollup in (
+        project_model._default_manager.using(using)
+        .values_list("pk", "digest", "rollup_digest")
+        .iterator()
+    ):
+        expected = add_digests(digest, *project_rollups[pk])
+        if expected != rollup:
+            project_changes.append((expected, pk))
+    _store_rollups(IfcProductModel, using, product_changes)
+    _store_rollups(project_model, using, project_changes)
+    return len(product_changes) + len(project_changes)
+
+
+# Functions | Helpers
+# =============================================================================
+
+def _project_model() -> type[models.Model]:
+    """
+    Return the project model, resolved from the `project` relation.
+    """
+    return IfcProductModel._meta.get_field("project").related_model
+
+
+def _tree_rollups(
+    rows: dict[int, tuple[Optional[int], Optional[int], str, str]],
+) -> dict[int, str]:
+    """
+    Return the rollups of products from their `(container, project,
+    digest, rollup)` rows, children before their containers. The products
+    of cycles are left out.
+    """
+    children = defaultdict(list)
+    for pk, row in rows.items():
+        if row[0] in rows:
+            children[row[0]].append(pk)
+    rollups: dict[int, str] = {}
+    for root, row in rows.items():
+        if row[0] in rows:
+            continue
+        stack = [(root, False)]
+        while stack:
+            pk, expanded = stack.pop()
+            if expanded:
+                rollups[pk] = add_digests(
+                    rows[pk][2],
+                    *(nest_digest(rollups[child]) for child in children[pk]),
+                )
+                continue
+            stack.append((pk, True))
+            stack.extend((child, False) for child in children[pk])
+    return rollups
+
+
+def _nonzero(deltas: dict[int, int]) -> dict[int, int]:
+    """
+    Return the differences that change a rollup.
+    """
+    deltas = {
+        pk: delta % DIGEST_MODULUS
+        for pk, delta in deltas.items()
+        if pk is not None
+    }
+    return {pk: delta for pk, delta in deltas.items() if delta}
+
+
+def _add_delta(rollup: Optional[str], delta: int) -> str:
+    """
+    Return a rollup with a difference added.
+    """
+    return add_digests(rollup, format(delta, "032x"))
+
+
+def _nested_delta(rollup: Optional[str], previous: Optional[str]) -> int:
+    """
+    Return the difference of the nested digests of two rollups.
+    """
+    return (
+        int(nest_digest(rollup) or "0", 16)
+        - int(nest_digest(previous) or "0", 16)
+    )
+
+
+def _batches(pks: list[int]) -> Iterable[list[int]]:
+    """
+    Split primary keys into batches for `__in` lookups.
+    """
+    for start in range(0, len(pks), _LOOKUP_BATCH_SIZE):
+        yield pks[start:start + _LOOKUP_BATCH_SIZE]
+
+
+def _in_batches(
+    queryset: models.QuerySet,
+    pks: list[int],
+    fields: tuple[str, ...],
+) -> Iterable[tuple]:
+    """
+    Yield the primary key and fields of rows, with one query per batch.
+    """
+    for start in range(0, len(pks), _LOOKUP_BATCH_SIZE):
+        yield from queryset.filter(
+            pk__in=pks[start:start + _LOOKUP_BATCH_SIZE],
+        ).values_list("pk", *fields)
+
+
+def _store_rollups(
+    model: type[models.Model],
+    using: str,
+    rollups: list[tuple[str, int]],
+) -> None:
+    """
+    Store `(rollup, pk)` pairs, with one prepared UPDATE per row.
+    """
+    if not rollups:
+        return
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    meta = model._meta.get_field("rollup_digest").model._meta
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"UPDATE {quote(meta.db_table)} "
+            f"SET {quote(meta.get_field('rollup_digest').column)} = %s "
+            f"WHERE {quote(meta.pk.column)} = %s",
+            rollups,
+        )
+
+
+def _spatial_index_name(suffix: str) -> str:
+    """
+    Return the name of the spatial index or table.
+    """
+    return f"{IfcProductModel._meta.db_table}_{suffix}"
+
+
+def _spatial_columns(connection: Any) -> tuple[str, str, dict[str, str]]:
+    """
+    Return the quoted table, primary key and bounding box column names.
+    """
+    quote = connection.ops.quote_name
+    meta = IfcProductModel._meta
+    return (
+        quote(meta.db_table),
+        quote(meta.pk.column),
+        {
+            name: quote(meta.get_field(name).column)
+            for name in BOUNDS_FIELDS
+        },
+    )
+
+
+def _has_spatial_index(connection: Any) -> bool:
+    """
+    Return whether the native spatial index exists, looking the R*Tree
+    table up once per database.
+    """
+    if connection.vendor == "postgresql":
+        # The `&&` filter stays correct without the index
+        return True
+    if connection.vendor != "sqlite":
+        return False
+    exists = _SPATIAL_INDEXES.get(connection.alias)
+    if exists is None:
+        exists = (
+            _spatial_index_name("rtree")
+            in connection.introspection.table_names()
+        )
+        _SPATIAL_INDEXES[connection.alias] = exists
+    return exists
+
+
+def _sqlite_has_rtree(connection: Any) -> bool:
+    """
+    Return whether SQLite was built with the R*Tree module.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA compile_options")
+        return ("ENABLE_RTREE",) in cursor.fetchall()
+
+
+def _postgresql_box(columns: dict[str, str]) -> str:
+    """
+    Return the 2D `box` expression of the bounding box columns.
+    """
+    return (
+        f"box(point({columns['min_x']}, {columns['min_y']}), "
+        f"point({columns['max_x']}, {columns['max_y']}))"
+    )
+
+
+def _sqlite_rtree_statements(
+    quote: Any,
+    table: str,
+    pk: str,
+    columns: dict[str, str],
+) -> list[str]:
+    """
+    Return the statements creating and filling the R*Tree table, and the
+    triggers mirroring the bounding box columns into it.
+    """
+    rtree = quote(_spatial_index_name("rtree"))
+    insert, update, delete = (
+        quote(_spatial_index_name(f"rtree_{event}"))
+        for event in ("insert", "update", "delete")
+    )
+    # R*Tree columns pair each minimum with its maximum
+    order = ("min_x", "max_x", "min_y", "max_y", "min_z", "max_z")
+    values = ", ".join(columns[name] for name in order)
+    new = ", ".join(f"NEW.{columns[name]}" for name in order)
+    present = f"{columns['min_x']} IS NOT NULL"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {rtree} "
+        f"USING rtree(id, {', '.join(order)})",
+        f"CREATE TRIGGER IF NOT EXISTS {insert} "
+        f"AFTER INSERT ON {table} WHEN NEW.{present} BEGIN "
+        f"INSERT INTO {rtree} VALUES (NEW.{pk}, {new}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {update} "
+        f"AFTER UPDATE OF {values} ON {table} BEGIN "
+        f"DELETE FROM {rtree} WHERE id = OLD.{pk}; "
+        f"INSERT INTO {rtree} SELECT NEW.{pk}, {new} "
+        f"WHERE NEW.{present}; END",
+        f"CREATE TRIGGER IF NOT EXISTS {delete} "
+        f"AFTER DELETE ON {table} BEGIN "
+        f"DELETE FROM {rtree} WHERE id = OLD.{pk}; END",
+        f"INSERT OR REPLACE INTO {rtree} "
+        f"SELECT {pk}, {values} FROM {table} WHERE {present}",
+    ]
 
 
 # =============================================================================
 # Classes
 # =============================================================================
 
-https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifckernel/lexical/ifcproduct.htm
+class IfcProductQuerySet(IfcRootQuerySet):
+    """
+    IFC Product QuerySet Class
+    ==========================
+
+    QuerySet filtering products on their world bounding box, and updating
+    their rollups with their digests.
+
+    """
+
+    def of_project(
+        self,
+        project: Union[models.Model, int],
+    ) -> "IfcProductQuerySet":
+        """
+        Filter the products of a project: its top-level products and the
+        products they contain, at any depth, with a recursive common table
+        expression.
+
+        Parameters:
+            project (IfcProjectModel | int): The project or its primary key.
+
+        Returns:
+            IfcProductQuerySet: The filtered products.
+        """
+        quote = connections[self.db].ops.quote_name
+        meta = IfcProductModel._meta
+        table = quote(meta.db_table)
+        pk = quote(meta.pk.column)
+        container = quote(meta.get_field("container").column)
+        owner = quote(meta.get_field("project").column)
+        return self.filter(pk__in=RawSQL(
+            f"WITH RECURSIVE tree (id) AS ("
+            f"SELECT {pk} FROM {table} "
+            f"WHERE {owner} = %s AND {container} IS NULL "
+            f"UNION "
+            f"SELECT child.{pk} FROM {table} child "
+            f"INNER JOIN tree ON child.{container} = tree.id"
+            f") SELECT id FROM tree",
+            (getattr(project, "pk", project),),
+        ))
+
+    def intersecting(
+        self,
+        minimum: Sequence[float],
+        maximum: Sequence[float],
+    ) -> "IfcProductQuerySet":
+        """
+        Filter the products whose world bounding box intersects a box.
+        Products without a bounding box never match.
+
+        Parameters:
+            minimum (Sequence[float]): The lower corner, `(x, y)` to ignore
+                heights, or `(x, y, z)`.
+            maximum (Sequence[float]): The upper corner.
+
+        Returns:
+            IfcProductQuerySet: The filtered products.
+        """
+        lookups = {}
+        for axis, name in zip(range(len(minimum)), "xyz"):
+            lookups[f"min_{name}__lte"] = maximum[axis]
+            lookups[f"max_{name}__gte"] = minimum[axis]
+        queryset = self.filter(**lookups)
+        connection = connections[self.db]
+        if not _has_spatial_index(connection):
+            return queryset
+        # The index narrows the candidates, the column lookups stay exact
+        # (the R*Tree stores rounded 32-bit bounds)
+        table, pk, columns = _spatial_columns(connection)
+        if connection.vendor == "postgresql":
+            return queryset.filter(pk__in=RawSQL(
+                f"SELECT {pk} FROM {table} WHERE {_postgresql_box(columns)} "
+                f"&& box(point(%s, %s), point(%s, %s))",
+                (minimum[0], minimum[1], maximum[0], maximum[1]),
+            ))
+        bounds = [
+            value
+            for axis in range(len(minimum))
+            for value in (maximum[axis], minimum[axis])
+        ]
+        where = " AND ".join(
+            f"min_{name} <= %s AND max_{name} >= %s"
+            for name in "xyz"[:len(minimum)]
+        )
+        rtree = connection.ops.quote_name(_spatial_index_name("rtree"))
+        return queryset.filter(pk__in=RawSQL(
+            f"SELECT id FROM {rtree} WHERE {where}", bounds,
+        ))
+
+    def update_world_bounds(
+        self,
+        batch_size: int = _BOUNDS_BATCH_SIZE,
+    ) -> int:
+        """
+        Recompute the world bounding boxes of the products, e.g. after they
+        were written in bulk, with one query per batch for the placements.
+
+        Parameters:
+            batch_size (int): Products per query.
 
-class IfcProductModel(IfcObjectDefinition):
+        Returns:
+            int: Number of products updated.
+        """
+        updated = 0
+        products = self.select_related(None).only(
+            "pk", "local_bounds", "object_placement",
+        )
+        batch = []
+        for product in products.iterator(chunk_size=batch_size):
+            batch.append(product)
+            if len(batch) == batch_size:
+                updated += self._update_bounds_batch(batch)
+                batch = []
+        if batch:
+            updated += self._update_bounds_batch(batch)
+        return updated
+
+    # Class | Helpers
+    # =========================================================================
+
+    def _update_bounds_batch(self, products: list) -> int:
+        """
+        Recompute and store the world bounding boxes of loaded products.
+        """
+        transforms = dict(
+            IfcLocalPlacementModel._default_manager.using(self.db)
+            .filter(pk__in={
+                product.object_placement_id for product in products
+            })
+            .values_list("pk", "world_transform")
+        )
+        for product in products:
+            product._set_world_bounds(
+                transforms.get(product.object_placement_id, IDENTITY),
+            )
+        # One prepared UPDATE per row scales linearly, unlike the CASE
+        # expressions of `bulk_update`; the columns live in the table of
+        # IfcProductModel whichever subclass is queried
+        connection = connections[self.db]
+        table, pk, columns = _spatial_columns(connection)
+        assignments = ", ".join(
+            f"{columns[name]} = %s" for name in BOUNDS_FIELDS
+        )
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"UPDATE {table} SET {assignments} WHERE {pk} = %s",
+                [
+                    (
+                        *(getattr(product, name) for name in BOUNDS_FIELDS),
+                        product.pk,
+                    )
+                    for product in products
+                ],
+            )
+        return len(products)
+
+    def _digests_changed(self, changed: list[tuple[Any, Any]]) -> None:
+        """
+        Add the differences of the digests to the rollups of the products
+        and of their ancestors.
+        """
+        deltas = defaultdict(int)
+        for product, previous in changed:
+            deltas[product.pk] += (
+                int(product.digest, 16) - int(previous or "0", 16)
+            )
+        propagate_rollups(deltas, using=self.db)
+
+
+class IfcProductModel(IfcObjectModel):
     """
-    Django model representing an IfcProduct as defined in the IFC standard.
+    IFC Product Model Class
+    =======================
 
-    IfcProduct is the base class for all physical elements that have a physical manifestation
-    and can be spatially located and oriented.
+    Model representing an IfcProduct as defined in the IFC standard.
+
+    IfcProduct is the base class for all physical elements that have a
+    physical manifestation and can be spatially located and oriented.
 
     Attributes:
-        object_placement (ForeignKey): Specifies the placement of the product in space.
-        representation (ForeignKey): Links to the geometric and/or topological representation of the product.
+        object_placement (ForeignKey): Specifies the placement of the
+            product in space.
+        representation (ForeignKey): Links to the geometric and/or
+            topological representation of the product.
+        local_bounds (BinaryField): The packed bounding box of the shape in
+            the coordinate system of the placement, see
+            `django_bim.utils.bounds`.
+        min_x, min_y, min_z, max_x, max_y, max_z (FloatField): The world
+            bounding box, empty when `local_bounds` is.
+        container (ForeignKey): The product containing the product.
+        project (ForeignKey): The project of a top-level product.
+        rollup_digest (CharField): The combined digests of the product and
+            of the nested rollups of the products it contains, see
+            `django_bim.utils.digest`.
+        objects (IfcProductQuerySet): Manager with the location filters,
+            loading `STR_RELATED_FIELDS` with every row.
+        STR_RELATED_FIELDS (tuple): The relations loaded with every row for
+            `__str__`, see `StrRelatedManager`.
+
     """
 
+    # The placement renders its parent placement
+    STR_RELATED_FIELDS = (
+        "object_placement__relative_placement",
+        "representation",
+    )
+
+    # The tree is hashed into the rollups, not into the digests
+    HASH_EXCLUDED_FIELDS = (
+        *IfcRootModel.HASH_EXCLUDED_FIELDS,
+        "container",
+        "project",
+    )
+
+    # Class | Model Fields
+    # =========================================================================
+
     object_placement = models.ForeignKey(
-        IfcObjectPlacement,
-        on_delete=models.SET_NULL,
-        null=True,
-        blank=True,
-        verbose_name=_("Object Placement"),
-        help_text=_("Specifies the placement of the product in space.")
+        IfcLocalPlacementModel,
+        on_delete = models.SET_NULL,
+        null = True,
+        blank = True,
+        verbose_name = _("Object Placement"),
+        help_text = _("Specifies the placement of the product in space."),
     )
 
     representation = models.ForeignKey(
         IfcProductRepresentation,
-        on_delete=models.SET_NULL,
-        null=True,
-        blank=True,
-        verbose_name=_("Representation"),
-        help_text=_(
-            "Links to the geometric and/or topological representation of the product."
-        )
+        on_delete = models.SET_NULL,
+        null = True,
+        blank = True,
+        verbose_name = _("Representation"),
+        help_text = _(
+            "Links to the geometric and/or topological representation of the product."  # noqa E501
+        ),
+    )
+
+    local_bounds = models.BinaryField(
+        null = True,
+        blank = True,
+        editable = False,
+        verbose_name = _("Local Bounds"),
+        help_text = _(
+            "Bounding box of the shape in the coordinate system of the placement."  # noqa E501
+        ),
     )
 
+    min_x = models.FloatField(null = True, blank = True, editable = False)
+    min_y = models.FloatField(null = True, blank = True, editable = False)
+    min_z = models.FloatField(null = True, blank = True, editable = False)
+    max_x = models.FloatField(null = True, blank = True, editable = False)
+    max_y = models.FloatField(null = True, blank = True, editable = False)
+    max_z = models.FloatField(null = True, blank = True, editable = False)
+
+    container = models.ForeignKey(
+        "self",
+        on_delete = models.SET_NULL,
+        null = True,
+        blank = True,
+        related_name = "contained_products",
+        verbose_name = _("Container"),
+        help_text = _(
+            "The spatial structure element or product containing the product, e.g. the storey of a wall."  # noqa E501
+        ),
+    )
+
+    project = models.ForeignKey(
+        "IfcProjectModel",
+        on_delete = models.SET_NULL,
+        null = True,
+        blank = True,
+        related_name = "products",
+        verbose_name = _("Project"),
+        help_text = _(
+            "The project of a product without container, e.g. of a site."
+        ),
+    )
+
+    rollup_digest = models.CharField(
+        max_length = 32,
+        null = True,
+        blank = True,
+        editable = False,
+        verbose_name = _("Rollup Digest"),
+        help_text = _(
+            "Combined digests of the product and of the products it contains."  # noqa E501
+        ),
+    )
+
+    objects = StrRelatedManager.from_queryset(IfcProductQuerySet)()
+
     # Class | Model Meta Class
     # =========================================================================
 
@@ -81,11 +852,209 @@ class IfcProductModel(IfcObjectDefinition):
         """
         verbose_name = _("IFC Product")
         verbose_name_plural = _("IFC Products")
+        indexes = [
+            models.Index(
+                fields = ["min_x", "min_y"],
+                name = "idx_product_min_xy",
+            ),
+            models.Index(
+                fields = ["max_x", "max_y"],
+                name = "idx_product_max_xy",
+            ),
+        ]
+
+    # Class | Model Methods
+    # =========================================================================
 
     def __str__(self) -> str:
         """
         """
-        return f"{self.name} - Placement: {self.object_placement}, Representation: {self.representation}"
+        return f"{self.name} - Placement: {self.object_placement}, Representation: {self.representation}"  # noqa E501
+
+    def save(self, *args, **kwargs) -> None:
+        """
+        Save the product with its world bounding box and rollup, and update
+        the rollups of its previous and current ancestors.
+        """
+        stored = None
+        if not self._state.adding:
+            stored = (
+                IfcProductModel._default_manager
+                .using(self._state.db)
+                .select_related(None)
+                .filter(pk=self.pk)
+                .values_list(
+                    "digest", "rollup_digest", "container", "project",
+                )
+                .first()
+            )
+        self.update_world_bounds()
+        self.update_digest()
+        # The stored rollup holds the current rollups of the children
+        self.rollup_digest = add_digests(
+            self.digest,
+            stored and stored[1] and subtract_digests(stored[1], stored[0]),
+        )
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {
+                *update_fields, *BOUNDS_FIELDS, "rollup_digest",
+            }
+        super().save(*args, **kwargs)
+        products, projects = defaultdict(int), defaultdict(int)
+        if stored is not None:
+            _add_member(products, projects, *stored[2:], stored[1], -1)
+        _add_member(
+            products, projects,
+            self.container_id, self.project_id, self.rollup_digest, 1,
+        )
+        propagate_rollups(products, projects, using=self._state.db)
+
+    def set_local_bounds(
+        self,
+        points: Optional[Iterable[Sequence[float]]],
+    ) -> None:
+        """
+        Set the local bounding box from the points of the shape, e.g. the
+        vertices of its representation items, and update the world box.
+
+        Parameters:
+            points (Iterable[Sequence[float]]): The points, in the
+                coordinate system of the placement, or `None` to clear
+                the box.
+        """
+        bounds = None if points is None else bounds_of(points)
+        self.local_bounds = None if bounds is None else pack_bounds(bounds)
+        self.update_world_bounds()
+
+    def world_bounds(self) -> Optional[Bounds]:
+        """
+        Return the stored world bounding box.
+
+        Returns:
+            Bounds: The box, or `None`.
+        """
+        if self.min_x is None:
+            return None
+        return tuple(getattr(self, name) for name in BOUNDS_FIELDS)
+
+    def update_world_bounds(self) -> None:
+        """
+        Recompute the world bounding box from the local bounding box and
+        the world transform of the placement.
+        """
+        transform = None
+        if self.object_placement_id is not None:
+            transform = (
+                IfcLocalPlacementModel._default_manager
+                .using(self._state.db)
+                .filter(pk=self.object_placement_id)
+                .values_list("world_transform", flat=True)
+                .first()
+            )
+        self._set_world_bounds(transform or IDENTITY)
+
+    # Class | Helpers
+    # =========================================================================
+
+    def _set_world_bounds(self, transform: Sequence[float]) -> None:
+        """
+        Set the world bounding box from a placement world transform.
+        """
+        local = unpack_bounds(self.local_bounds)
+        bounds = (
+            transform_bounds(local, transform) if local is not None
+            else (None,) * len(BOUNDS_FIELDS)
+        )
+        for name, value in zip(BOUNDS_FIELDS, bounds):
+            setattr(self, name, value)
+
+
+# =============================================================================
+# Signals
+# =============================================================================
+
+def _add_member(
+    products: dict[int, int],
+    projects: dict[int, int],
+    container: Optional[int],
+    project: Optional[int],
+    rollup: Optional[str],
+    sign: int,
+) -> None:
+    """
+    Add or subtract the nested rollup of a product to the difference of
+    its container, or of its project without container.
+    """
+    if not rollup:
+        return
+    delta = sign * int(nest_digest(rollup), 16)
+    if container is not None:
+        products[container] += delta
+    elif project is not None:
+        projects[project] += delta
+
+
+def _remove_rollup(sender, instance, using=None, **kwargs):
+    """
+    Subtract the rollup of a deleted product from its ancestors. Products
+    deleted together with their container stop at the deleted container.
+    """
+    products, projects = defaultdict(int), defaultdict(int)
+    _add_member(
+        products, projects,
+        instance.container_id, instance.project_id,
+        instance.rollup_digest, -1,
+    )
+    propagate_rollups(products, projects, using=using)
+
+
+post_delete.connect(
+    _remove_rollup,
+    sender=IfcProductModel,
+    dispatch_uid="django_bim_product_rollups",
+)
+
+
+def _update_placed_products(sender, placements, using=None, **kwargs):
+    """
+    Recompute the world bounding boxes and the digests of the products
+    placed by changed placements, whose digests hash their world
+    transforms, and update the rollups of their ancestors. Each product is
+    hashed with the model of its subclass, e.g. a grid with `IfcGridModel`.
+    """
+    manager = IfcProductModel._default_manager.using(using)
+    products = [
+        pk
+        for batch in _batches(list(placements))
+        for pk in manager.filter(object_placement__in=batch)
+        .values_list("pk", flat=True)
+    ]
+    for batch in _batches(products):
+        manager.filter(
+            pk__in=batch, local_bounds__isnull=False,
+        ).update_world_bounds()
+    subclasses = sorted(
+        (
+            model for model in apps.get_models()
+            if issubclass(model, IfcProductModel)
+        ),
+        key=lambda model: -len(model._meta.get_parent_list()),
+    )
+    for model in subclasses:
+        found = set()
+        for batch in _batches(products):
+            rows = model._default_manager.using(using).filter(pk__in=batch)
+            found.update(rows.values_list("pk", flat=True))
+            rows.update_digests()
+        products = [pk for pk in products if pk not in found]
+
+
+placements_changed.connect(
+    _update_placed_products,
+    sender=IfcLocalPlacementModel,
+    dispatch_uid="django_bim_product_placements",
+)
 
 
 # =============================================================================
@@ -93,5 +1062,12 @@ class IfcProductModel(IfcObjectDefinition):
 # =============================================================================
 
 __all__ = [
+    "BOUNDS_FIELDS",
     "IfcProductModel",
+    "IfcProductQuerySet",
+    "create_spatial_index",
+    "drop_spatial_index",
+    "move_products",
+    "propagate_rollups",
+    "rebuild_rollups",
 ]
@@ -6,10 +6,14 @@
 # =============================================================================
 
 """
-Provides IFC ... Model Class
-===================================
+Provides IFC Product Representation Model Class
+===============================================
+
+This module defines the IfcProductRepresentation class, the set of
+representations of a product, written as an IfcProductDefinitionShape.
 
 For more information, refer to:
+https://standards.buildingsmart.org/IFC/RELEASE/IFC4/ADD2_TC1/HTML/link/ifcproductrepresentation.htm
 
 """  # noqa E501
 
@@ -27,9 +31,9 @@ from django.utils.translation import gettext_lazy as _
 # Import | Local Modules
 from ...fields.model import (
     IfcLabelField,
-    IfcRoleTypeField,
     IfcTextField,
 )
+from .representation.model_ifc_representation import IfcRepresentationModel
 
 
 # =============================================================================
@@ -37,8 +41,67 @@ from ...fields.model import (
 # =============================================================================
 
 class IfcProductRepresentation(models.Model):
-    # Simple representation for product representation details
-    details = models.TextField(verbose_name=_("Representation Details"))
+    """
+    IFC Product Representation Model Class
+    ======================================
+
+    Model representing an IfcProductRepresentation as defined in the IFC
+    standard: the representations of a product, e.g. its body and axis.
+
+    Attributes:
+        name (IfcLabelField): The name of the product representation.
+        description (IfcTextField): The description of the product
+            representation.
+        representations (ManyToManyField): The representations, each in
+            its own context.
+
+    """
+
+    # Class | Model Fields
+    # =========================================================================
+
+    name = IfcLabelField(
+        null = True,
+        blank = True,
+        verbose_name = _("Name"),
+        help_text = _("The name of the product representation."),
+    )
+
+    description = IfcTextField(
+        null = True,
+        blank = True,
+        verbose_name = _("Description"),
+        help_text = _("The description of the product representation."),
+    )
+
+    representations = models.ManyToManyField(
+        IfcRepresentationModel,
+        blank = True,
+        related_name = "product_representations",
+        verbose_name = _("Representations"),
+        help_text = _("The representations of the product."),
+    )
+
+    # Class | Model Meta Class
+    # =========================================================================
+
+    class Meta:
+        """
+        Meta Class
+        ----------
+
+        """
+        verbose_name = _("IFC Product Representation")
+        verbose_name_plural = _("IFC Product Representations")
+
+    # Class | Model Methods
+    # =========================================================================
+
+    def __str__(self) -> str:
+        """
+        Return the name of the product representation.
+        """
+        return f"{self.name or _('Product Representation')} {self.pk}"
 
 
 # =============================================================================
@@ -46,5 +109,5 @@ class IfcProductRepresentation(models.Model):
 # =============================================================================
 
 __all__ = [
-    "IfcActorRoleModel",
+    "IfcProductRepresentation",
 ]
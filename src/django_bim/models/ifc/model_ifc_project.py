@@ -9,6 +9,11 @@
 Provides IFC Project Model Class
 ================================
 
+The rollup of a project (`rollup_digest`) combines its digest with the
+nested rollups of its top-level products, see `model_ifc_product`. Two
+revisions of a project, e.g. in two databases, are compared with
+`changed_products`, which only descends into the products whose rollups
+differ.
 
 For detailed specifications, see:
 https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifckernel/lexical/ifcproject.htm
@@ -21,31 +26,59 @@ https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifckernel/lexica
 # =============================================================================
 
 # Import | Standard Library
+from collections import defaultdict
+from typing import Any, Iterator
 # from uuid import uuid4
-# from typing import Any, Dict, List
 
 # Import | Libraries
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 # Import | Local Modules
+from ...utils.digest import add_digests, subtract_digests
 from .model_ifc_object_definition import IfcObjectDefinitionModel
+from .model_ifc_product import propagate_rollups
+from .model_ifc_root import IfcRootQuerySet
 from ...fields.model import (
     IfcLabelField,
 )
-from .model_ifc_unit_assignment import IfcUnitAssignment
-from .model_ifc_representation_context import IfcRepresentationContextModel
+from .representation.model_ifc_representation_context import (
+    IfcRepresentationContextModel,
+)
+from .unit.model_ifc_unit_assignment import IfcUnitAssignment
 
 
 # =============================================================================
 # Variables
 # =============================================================================
 
+# Number of values per `__in` query, below the SQLite variable limit
+_LOOKUP_BATCH_SIZE = 900
+
 
 # =============================================================================
 # Classes
 # =============================================================================
 
+class IfcProjectQuerySet(IfcRootQuerySet):
+    """
+    IFC Project QuerySet Class
+    ==========================
+
+    QuerySet updating the rollups of projects with their digests.
+
+    """
+
+    def _digests_changed(self, changed: list[tuple[Any, Any]]) -> None:
+        """
+        Add the differences of the digests to the rollups of the projects.
+        """
+        propagate_rollups({}, {
+            project.pk: int(project.digest, 16) - int(previous or "0", 16)
+            for project, previous in changed
+        }, using=self.db)
+
+
 class IfcProjectModel(IfcObjectDefinitionModel):
     """
     IFC Project Model Class
@@ -65,6 +98,10 @@ class IfcProjectModel(IfcObjectDefinitionModel):
         units_in_context (ForeignKey): The units used in this project.
         representation_contexts (ManyToManyField): Contexts that define the
             geometric representation.
+        rollup_digest (CharField): The combined digests of the project and
+            of its products.
+        objects (IfcProjectQuerySet): Manager updating the rollups with
+            the digests.
     """
 
     # Class | Model Fields
@@ -103,6 +140,19 @@ class IfcProjectModel(IfcObjectDefinitionModel):
         ),
     )
 
+    rollup_digest = models.CharField(
+        max_length = 32,
+        null = True,
+        blank = True,
+        editable = False,
+        verbose_name = _("Rollup Digest"),
+        help_text = _(
+            "Combined digests of the project and of its products."
+        ),
+    )
+
+    objects = IfcProjectQuerySet.as_manager()
+
     # Class | Model Meta Class
     # =========================================================================
 
@@ -123,6 +173,136 @@ class IfcProjectModel(IfcObjectDefinitionModel):
         """
         return f"{self.long_name} - Phase: {self.phase}"
 
+    def save(self, *args, **kwargs) -> None:
+        """
+        Save the project with its rollup.
+        """
+        stored = None
+        if not self._state.adding:
+            stored = (
+                IfcProjectModel._default_manager
+                .using(self._state.db)
+                .filter(pk=self.pk)
+                .values_list("digest", "rollup_digest")
+                .first()
+            )
+        self.update_digest()
+        # The stored rollup holds the current rollups of the products
+        self.rollup_digest = add_digests(
+            self.digest,
+            stored and stored[1] and subtract_digests(stored[1], stored[0]),
+        )
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "rollup_digest"}
+        super().save(*args, **kwargs)
+
+    def changed_products(self, other: "IfcProjectModel") -> Iterator[str]:
+        """
+        Compare the products of two revisions of the project, e.g. loaded
+        from two databases, matching them by `global_id`.
+
+        The tree is walked level by level, with two queries per level, and
+        only below the products whose rollups differ: equal rollups prove
+        equal subtrees.
+
+        Parameters:
+            other (IfcProjectModel): The other revision.
+
+        Yields:
+            str: The global ids of the products whose digests differ, and
+                of the roots of the subtrees only one revision contains.
+        """
+        if self.rollup_digest == other.rollup_digest:
+            return
+        product_model = self._meta.get_field("products").related_model
+        sides = [
+            product_model._default_manager.using(project._state.db)
+            .select_related(None)
+            for project in (self, other)
+        ]
+        levels = [
+            {None: self._top_level(sides[0], self.pk)},
+            {None: self._top_level(sides[1], other.pk)},
+        ]
+        while True:
+            pairs = []
+            for key in levels[0].keys() | levels[1].keys():
+                yield from self._compare(
+                    levels[0].get(key, {}), levels[1].get(key, {}), pairs,
+                )
+            if not pairs:
+                return
+            levels = [
+                self._contained(sides[0], [pair[0] for pair in pairs]),
+                self._contained(sides[1], [pair[1] for pair in pairs]),
+            ]
+            # Key the children of both sides by the container of this side
+            containers = {other_pk: pk for pk, other_pk in pairs}
+            levels[1] = {
+                containers[key]: products
+                for key, products in levels[1].items()
+            }
+
+    # Class | Helpers
+    # =========================================================================
+
+    @staticmethod
+    def _compare(
+        products: dict[str, tuple],
+        others: dict[str, tuple],
+        pairs: list[tuple[int, int]],
+    ) -> Iterator[str]:
+        """
+        Yield the global ids of the products of one container that differ
+        between the revisions, and add the `(pk, other_pk)` pairs of the
+        products whose rollups differ to `pairs`.
+        """
+        for global_id in products.keys() | others.keys():
+            if global_id not in products or global_id not in others:
+                yield global_id
+                continue
+            pk, digest, rollup = products[global_id]
+            other_pk, other_digest, other_rollup = others[global_id]
+            if rollup == other_rollup:
+                continue
+            if digest != other_digest:
+                yield global_id
+            pairs.append((pk, other_pk))
+
+    @staticmethod
+    def _top_level(
+        products: models.QuerySet,
+        project: int,
+    ) -> dict[str, tuple]:
+        """
+        Return the products of a project without container, by global id.
+        """
+        return {
+            global_id: (pk, digest, rollup)
+            for pk, global_id, digest, rollup in products.filter(
+                project=project, container__isnull=True,
+            ).values_list("pk", "global_id", "digest", "rollup_digest")
+        }
+
+    @staticmethod
+    def _contained(
+        products: models.QuerySet,
+        containers: list[int],
+    ) -> dict[int, dict[str, tuple]]:
+        """
+        Return the products of containers, by container and global id.
+        """
+        contained = defaultdict(dict)
+        for start in range(0, len(containers), _LOOKUP_BATCH_SIZE):
+            for pk, container, global_id, digest, rollup in products.filter(
+                container__in=containers[start:start + _LOOKUP_BATCH_SIZE],
+            ).values_list(
+                "pk", "container", "global_id", "digest", "rollup_digest",
+            ):
+                contained[container][global_id] = (pk, digest, rollup)
+        return contained
+
 
 # =============================================================================
 # Module Variables
@@ -130,4 +310,5 @@ class IfcProjectModel(IfcObjectDefinitionModel):
 
 __all__ = [
     "IfcProjectModel",
+    "IfcProjectQuerySet",
 ]
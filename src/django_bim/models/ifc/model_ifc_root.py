@@ -23,6 +23,22 @@ subtypes of IfcRoot, are not supposed to be independent entities.
 
 https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifckernel/lexical/ifcroot.htm
 
+Every entity stores two hashes, see `django_bim.utils.digest`:
+- `content_hash`, of its own attribute values, which the incremental STEP
+  import compares to decide whether a row matched by `global_id` changed,
+- `digest`, of its `content_hash` and of the rows it references (e.g. the
+  placement and representation of a product), so it also changes when a
+  referenced row does.
+Both are computed when the entity is saved; after rows were written in
+bulk, or referenced rows changed, `Model.objects.filter(...)
+.update_digests()` recomputes them.
+
+Entities imported from a file also store `reference_hash`, the hash of the
+entities they reference in the file, directly or indirectly, which the
+incremental import compares along with `content_hash`: relations are not
+part of `content_hash`, and the referenced rows of a new revision are new
+rows.
+
 """  # noqa E501
 
 
@@ -31,11 +47,13 @@ https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifckernel/lexica
 # =============================================================================
 
 # Import | Standard Library
+from typing import Any, Iterator
 # from uuid import uuid4
 # from typing import Any, Dict, List
 
 # Import | Libraries
-from django.db import models
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.db import connections, models
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
@@ -45,17 +63,118 @@ from ...fields.model import (
     IfcLabelField,
     IfcTextField,
 )
+from ...utils.digest import hash_values, row_digest, scalar_fields
 
 
 # =============================================================================
 # Variables
 # =============================================================================
 
+# Number of rows per query when updating digests
+_DIGEST_BATCH_SIZE = 1000
+
 
 # =============================================================================
 # Classes
 # =============================================================================
 
+class IfcRootQuerySet(models.QuerySet):
+    """
+    IFC Root QuerySet Class
+    =======================
+
+    QuerySet recomputing the hashes of rooted entities in bulk.
+
+    """
+
+    def update_digests(self, batch_size: int = _DIGEST_BATCH_SIZE) -> int:
+        """
+        Recompute the content hashes and digests of the entities, e.g.
+        after they were written in bulk or their referenced rows changed,
+        with one query per batch for the entities and their references.
+
+        Parameters:
+            batch_size (int): Entities per query.
+
+        Returns:
+            int: Number of entities whose digest changed.
+        """
+        references = [
+            field.name for field in self.model.digest_references()
+        ]
+        entities = self.select_related(None)
+        if references:
+            entities = entities.select_related(*references)
+        updated = 0
+        batch = []
+        for entity in entities.iterator(chunk_size=batch_size):
+            batch.append(entity)
+            if len(batch) == batch_size:
+                updated += self._update_digests_batch(batch)
+                batch = []
+        if batch:
+            updated += self._update_digests_batch(batch)
+        return updated
+
+    # Class | Helpers
+    # =========================================================================
+
+    def _update_digests_batch(self, entities: list) -> int:
+        """
+        Recompute and store the hashes of loaded entities.
+        """
+        changed = []
+        for entity in entities:
+            previous = entity.digest
+            content_hash = entity.content_hash
+            entity.update_digest()
+            if (
+                entity.digest != previous
+                or entity.content_hash != content_hash
+            ):
+                changed.append((entity, previous))
+        if changed:
+            self._write_columns(
+                ("content_hash", "digest"),
+                [entity for entity, _ in changed],
+            )
+            self._digests_changed(changed)
+        return len(changed)
+
+    def _digests_changed(self, changed: list[tuple[Any, Any]]) -> None:
+        """
+        Hook called with the entities whose digest changed and their
+        previous digests, e.g. to update rollups.
+        """
+
+    def _write_columns(self, names: tuple[str, ...], entities: list) -> None:
+        """
+        Store columns of loaded entities, with one prepared UPDATE per row,
+        which scales linearly, unlike the CASE expressions of
+        `bulk_update`.
+        """
+        connection = connections[self.db]
+        quote = connection.ops.quote_name
+        fields = [self.model._meta.get_field(name) for name in names]
+        # Inherited columns live in the table of the declaring model
+        meta = fields[0].model._meta
+        assignments = ", ".join(
+            f"{quote(field.column)} = %s" for field in fields
+        )
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"UPDATE {quote(meta.db_table)} SET {assignments} "
+                f"WHERE {quote(meta.pk.column)} = %s",
+                [
+                    (
+                        *(getattr(entity, field.attname) for field in fields),
+                        entity.pk,
+                    )
+                    for entity in entities
+                ],
+            )
+
+
 class IfcRootModel(models.Model):
     """
     IFC Root Model Class
@@ -72,12 +191,26 @@ class IfcRootModel(models.Model):
         description (IfcTextField): A description of the IFC entity.
         owner_history (ForeignKey): A link to the ownership history of the
             entity.
+        content_hash (CharField): Hash of the attribute values of the
+            entity, see `compute_content_hash`.
+        digest (CharField): Hash of the content hash and the referenced
+            rows, see `compute_digest`.
+        reference_hash (CharField): Hash of the entities the entity
+            referenced in the file it was last imported from, directly or
+            indirectly, see `django_bim.io.step.StepImporter`.
+        HASH_EXCLUDED_FIELDS (tuple): Fields and relations left out of the
+            hashes.
 
     Note:
         This class is not meant to be instantiated directly.
 
     """
 
+    HASH_EXCLUDED_FIELDS = (
+        "global_id",
+        "owner_history",
+    )
+
     # Class | Model Fields
     # =========================================================================
 
@@ -100,15 +233,46 @@ class IfcRootModel(models.Model):
     )
 
     owner_history = models.ForeignKey(
-        "IfcOwnerHistory",
+        "IfcOwnerHistoryModel",
         on_delete = models.SET_NULL,
         null = True,
         blank = True,
-        related_name = "owned_entities",
+        related_name = "owned_%(class)ss",
         verbose_name = _("owner history"),
         help_text = _("Ownership history of the object."),
     )
 
+    content_hash = models.CharField(
+        max_length = 32,
+        null = True,
+        blank = True,
+        editable = False,
+        verbose_name = _("content hash"),
+        help_text = _("Hash of the attribute values of the entity."),
+    )
+
+    digest = models.CharField(
+        max_length = 32,
+        null = True,
+        blank = True,
+        editable = False,
+        verbose_name = _("digest"),
+        help_text = _(
+            "Hash of the attribute values of the entity and of the rows it references."  # noqa E501
+        ),
+    )
+
+    reference_hash = models.CharField(
+        max_length = 32,
+        null = True,
+        blank = True,
+        editable = False,
+        verbose_name = _("reference hash"),
+        help_text = _(
+            "Hash of the entities referenced in the last imported file."
+        ),
+    )
+
     # Class | Model Meta Class
     # =========================================================================
 
@@ -135,6 +299,143 @@ class IfcRootModel(models.Model):
         """
         return reverse('ifc_entity_detail', kwargs={'pk': self.pk})
 
+    def save(self, *args, **kwargs) -> None:
+        """
+        Save the entity with its content hash and digest.
+        """
+        self.update_digest()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {
+                *update_fields, "content_hash", "digest",
+            }
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def content_hash_fields(cls) -> list[models.Field]:
+        """
+        Return the fields hashed into `content_hash`: the scalar fields
+        without `HASH_EXCLUDED_FIELDS` and the columns the models maintain
+        themselves (`editable=False`), such as the hashes or the world
+        bounding boxes. Relations are left out, as their keys differ
+        between imports of the same entity.
+
+        Returns:
+            list: The hashed fields, in declaration order.
+        """
+        return scalar_fields(cls, cls.HASH_EXCLUDED_FIELDS, derived=False)
+
+    @classmethod
+    def digest_references(cls) -> list[models.Field]:
+        """
+        Return the foreign keys whose rows are hashed into `digest`: the
+        concrete foreign keys without `HASH_EXCLUDED_FIELDS`, such as the
+        owner history, which records who changed the entity rather than
+        what it is.
+
+        Returns:
+            list: The foreign keys, in declaration order.
+        """
+        return [
+            field for field in cls._meta.concrete_fields
+            if field.many_to_one
+            and not field.primary_key
+            and field.name not in cls.HASH_EXCLUDED_FIELDS
+        ]
+
+    def compute_content_hash(self) -> str:
+        """
+        Return the hash of the attribute values of the entity.
+
+        The values are normalised with `get_prep_value`, as for the keys of
+        `django_bim.io.step.StepRowInterner`, then canonicalised.
+
+        Returns:
+            str: A 32-character hexadecimal hash.
+        """
+        return row_digest(self, self.content_hash_fields())
+
+    def compute_digest(self) -> str:
+        """
+        Return the hash of the content hash of the entity and of the rows
+        it references, see `reference_digests`.
+
+        Returns:
+            str: A 32-character hexadecimal hash.
+        """
+        return hash_values((
+            ("content_hash", self.content_hash),
+            *sorted(self.reference_digests().items()),
+        ))
+
+    def reference_digests(self) -> dict[str, str]:
+        """
+        Return the hashes of the rows the entity references: their digest
+        for rooted entities, the hash of the scalar values of the
+        referenced model, derived ones included, for others (e.g. the world
+        transform of a placement, which follows its whole chain of relative
+        placements), along with the rows their generic relation tables
+        link (e.g. the units of a unit assignment).
+
+        Returns:
+            dict: The hashes by foreign key name, without the empty keys.
+        """
+        references = {}
+        for field in self.digest_references():
+            if getattr(self, field.attname) is None:
+                continue
+            row = getattr(self, field.name)
+            references[field.name] = (
+                row.digest if isinstance(row, IfcRootModel)
+                else _linked_row_digest(row)
+            )
+        return references
+
+    def update_digest(self) -> None:
+        """
+        Recompute the content hash and the digest.
+        """
+        self.content_hash = self.compute_content_hash()
+        self.digest = self.compute_digest()
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def _linked_row_digest(row: models.Model) -> str:
+    """
+    Return the hash of the scalar values of a referenced row and of the
+    rows its generic relation tables link it to, in any order. Rows
+    without links hash their scalar values only.
+    """
+    digest = row_digest(row, scalar_fields(type(row)))
+    linked = sorted(
+        row_digest(target, scalar_fields(type(target)))
+        for target in _linked_rows(row)
+    )
+    if not linked:
+        return digest
+    return hash_values((digest, *linked))
+
+
+def _linked_rows(row: models.Model) -> Iterator[models.Model]:
+    """
+    Yield the rows a row is linked to through generic relation tables,
+    such as the units of a unit assignment through `unit_relations`.
+    """
+    for relation in type(row)._meta.related_objects:
+        if not relation.one_to_many:
+            continue
+        for field in relation.related_model._meta.private_fields:
+            if not isinstance(field, GenericForeignKey):
+                continue
+            links = getattr(row, relation.get_accessor_name())
+            for link in links.prefetch_related(field.name):
+                target = getattr(link, field.name)
+                if target is not None:
+                    yield target
+
 
 # =============================================================================
 # Module Variables
@@ -142,4 +443,5 @@ class IfcRootModel(models.Model):
 
 __all__ = [
     "IfcRootModel",
+    "IfcRootQuerySet",
 ]
@@ -18,6 +18,8 @@ strategies, including:
     typical in layout and architectural planning.
 - `IfcLocalPlacementModel`: Manages local placement definitions, allowing
     objects to be placed relative to other objects.
+- `IfcLocalPlacementClosureModel`: Optional closure table of the local
+    placement hierarchy, for indexed subtree queries.
 - `IfcObjectPlacementModel`: Serves as the abstract base class for defining
     the general placement logic used by all specific placement models.
 
@@ -32,6 +34,7 @@ within Django, adhering to the IFC standards.
 # =============================================================================
 
 # Import | Local Modules
+from .model_ifc_placement_closure import IfcLocalPlacementClosureModel
 from .model_ifc_placement_grid import IfcGridPlacementModel
 from .model_ifc_placement_local import IfcLocalPlacementModel
 from .model_ifc_placement_object import IfcObjectPlacementModel
@@ -43,6 +46,7 @@ from .model_ifc_placement_object import IfcObjectPlacementModel
 
 __all__ = [
     "IfcGridPlacementModel",
+    "IfcLocalPlacementClosureModel",
     "IfcLocalPlacementModel",
     "IfcObjectPlacementModel",
 ]
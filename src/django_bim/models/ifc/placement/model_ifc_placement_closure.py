@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC Local Placement Closure Model Class
+================================================
+
+This module defines an optional closure table for the hierarchy of
+`IfcLocalPlacementModel`: one row per (ancestor, descendant) pair, with the
+number of levels between them, including a depth 0 row per placement. With
+it, "everything under this placement" is a single indexed join instead of a
+walk of the hierarchy.
+
+The table is maintained when the `DJANGO_BIM_PLACEMENT_CLOSURE` setting is
+enabled:
+- saving a placement through the ORM updates the rows of its subtree
+  (signals),
+- the STEP importer adds the rows of the placements it created,
+- the `bim_placement_closure` management command rebuilds the whole table,
+  e.g. after enabling the setting on existing data or after bulk updates.
+
+While enabled, `descendants_of`, `ancestors_of` and `depth` of
+`IfcLocalPlacementModel.objects` read the closure table rather than
+walking the hierarchy with a recursive query.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+from typing import Iterable, Optional
+
+# Import | Libraries
+from django.db import connections, models, router, transaction
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+
+# Import | Local Modules
+from .model_ifc_placement_local import (
+    IfcLocalPlacementModel,
+    placement_closure_enabled,
+)
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+# Paths longer than this are cut, so corrupt cyclic hierarchies terminate
+MAX_PLACEMENT_DEPTH = 1000
+
+# Number of placements per INSERT or DELETE statement
+_INSERT_BATCH_SIZE = 500
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcLocalPlacementClosureModel(models.Model):
+    """
+    IFC Local Placement Closure Model Class
+    =======================================
+
+    Model storing the transitive closure of the `relative_placement`
+    hierarchy of local placements.
+
+    Attributes:
+        ancestor (ForeignKey): The enclosing placement.
+        descendant (ForeignKey): The placement nested, at any depth, under
+            `ancestor`, or `ancestor` itself.
+        depth (PositiveIntegerField): Number of levels between the two
+            placements, 0 for the row linking a placement to itself.
+
+    """
+
+    # Class | Model Fields
+    # =========================================================================
+
+    ancestor = models.ForeignKey(
+        IfcLocalPlacementModel,
+        on_delete = models.CASCADE,
+        related_name = "descendant_links",
+        verbose_name = _("Ancestor"),
+        help_text = _("The enclosing placement."),
+    )
+
+    descendant = models.ForeignKey(
+        IfcLocalPlacementModel,
+        on_delete = models.CASCADE,
+        related_name = "ancestor_links",
+        verbose_name = _("Descendant"),
+        help_text = _("The placement nested under the ancestor."),
+    )
+
+    depth = models.PositiveIntegerField(
+        verbose_name = _("Depth"),
+        help_text = _("Number of levels between the two placements."),
+    )
+
+    # Class | Model Meta Class
+    # =========================================================================
+
+    class Meta:
+        """
+        Meta Class
+        ----------
+
+        """
+        verbose_name = _("IFC Local Placement Closure")
+        verbose_name_plural = _("IFC Local Placement Closures")
+        constraints = [
+            models.UniqueConstraint(
+                fields = ["ancestor", "descendant"],
+                name = "uniq_placement_closure",
+            ),
+        ]
+        indexes = [
+            # Subtree queries filter on the ancestor and join descendants
+            models.Index(
+                fields = ["ancestor", "depth", "descendant"],
+                name = "idx_placement_closure_subtree",
+            ),
+        ]
+
+    # Class | Model Methods
+    # =========================================================================
+
+    def __str__(self) -> str:
+        """
+        String representation of the closure row.
+        """
+        return (
+            f"Placement {self.descendant_id} under {self.ancestor_id} "
+            f"(depth {self.depth})"
+        )
+
+    @classmethod
+    def add_placements(
+        cls,
+        placements: Optional[Iterable[int]] = None,
+        using: Optional[str] = None,
+    ) -> int:
+        """
+        Insert the rows linking placements to themselves and to all their
+        ancestors, walking up the hierarchy in the database.
+
+        The placements must not have closure rows yet, but their ancestors
+        do not need any.
+
+        Parameters:
+            placements (Iterable[int]): Primary keys of the placements, or
+                `None` for every placement.
+            using (str): The database alias.
+
+        Returns:
+            int: Number of rows inserted.
+        """
+        using = using or router.db_for_write(cls)
+        if placements is None:
+            return cls._insert_paths(None, using)
+        placements = list(placements)
+        inserted = 0
+        for start in range(0, len(placements), _INSERT_BATCH_SIZE):
+            inserted += cls._insert_paths(
+                placements[start:start + _INSERT_BATCH_SIZE],
+                using,
+            )
+        return inserted
+
+    @classmethod
+    def move_subtree(cls, placement: int, using: Optional[str] = None) -> int:
+        """
+        Recompute the rows of a placement and its descendants after its
+        relative placement changed.
+
+        Parameters:
+            placement (int): Primary key of the moved placement.
+            using (str): The database alias.
+
+        Returns:
+            int: Number of rows inserted.
+        """
+        using = using or router.db_for_write(cls)
+        manager = cls._default_manager.using(using)
+        subtree = list(
+            manager.filter(ancestor=placement).values_list(
+                "descendant", flat=True,
+            )
+        ) or [placement]
+        with transaction.atomic(using=using):
+            for start in range(0, len(subtree), _INSERT_BATCH_SIZE):
+                manager.filter(
+                    descendant__in=subtree[start:start + _INSERT_BATCH_SIZE],
+                ).delete()
+            return cls.add_placements(subtree, using=using)
+
+    @classmethod
+    def rebuild(cls, using: Optional[str] = None) -> int:
+        """
+        Replace the whole table with the closure of the current hierarchy.
+
+        Parameters:
+            using (str): The database alias.
+
+        Returns:
+            int: Number of rows inserted.
+        """
+        using = using or router.db_for_write(cls)
+        with transaction.atomic(using=using):
+            cls._default_manager.using(using).all().delete()
+            return cls.add_placements(None, using=using)
+
+    # Class | Helpers
+    # =========================================================================
+
+    @classmethod
+    def _insert_paths(
+        cls,
+        placements: Optional[list[int]],
+        using: str,
+    ) -> int:
+        """
+        Insert the upward paths of placements with a single recursive
+        `INSERT ... SELECT`.
+        """
+        connection = connections[using]
+        quote = connection.ops.quote_name
+        meta = cls._meta
+        table = quote(meta.db_table)
+        columns = ", ".join(
+            quote(meta.get_field(name).column)
+            for name in ("ancestor", "descendant", "depth")
+        )
+        placement_meta = IfcLocalPlacementModel._meta
+        placement_table = quote(placement_meta.db_table)
+        pk = quote(placement_meta.pk.column)
+        parent = quote(placement_meta.get_field("relative_placement").column)
+        if placements is None:
+            where, parameters = "", []
+        else:
+            where = f" WHERE {pk} IN ({', '.join(['%s'] * len(placements))})"
+            parameters = list(placements)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) "
+                f"WITH RECURSIVE path (descendant, ancestor, depth) AS ("
+                f"SELECT {pk}, {pk}, 0 FROM {placement_table}{where} "
+                f"UNION ALL "
+                f"SELECT path.descendant, placement.{parent}, path.depth + 1 "
+                f"FROM path INNER JOIN {placement_table} placement "
+                f"ON placement.{pk} = path.ancestor "
+                f"WHERE placement.{parent} IS NOT NULL AND path.depth < %s"
+                f") SELECT ancestor, descendant, depth FROM path",
+                [*parameters, MAX_PLACEMENT_DEPTH],
+            )
+            return cursor.rowcount
+
+
+# =============================================================================
+# Signals
+# =============================================================================
+
+@receiver(pre_save, sender=IfcLocalPlacementModel)
+def _check_placement_cycle(sender, instance, raw=False, using=None, **kwargs):
+    """
+    Refuse to place a placement relative to one of its own descendants.
+    """
+    if (
+        raw
+        or not placement_closure_enabled()
+        or instance._state.adding
+        or instance.relative_placement_id is None
+    ):
+        return
+    if IfcLocalPlacementClosureModel._default_manager.using(using).filter(
+        ancestor=instance.pk,
+        descendant=instance.relative_placement_id,
+    ).exists():
+        raise ValueError(
+            f"Placement {instance.pk} cannot be relative to its own "
+            f"descendant {instance.relative_placement_id}."
+        )
+
+
+@receiver(post_save, sender=IfcLocalPlacementModel)
+def _update_placement_closure(
+    sender,
+    instance,
+    created=False,
+    raw=False,
+    using=None,
+    **kwargs,
+):
+    """
+    Add the rows of a new placement, or move the rows of a placement whose
+    relative placement changed.
+    """
+    if raw or not placement_closure_enabled():
+        return
+    closure = IfcLocalPlacementClosureModel
+    if created:
+        closure.add_placements([instance.pk], using=using)
+        return
+    manager = closure._default_manager.using(using)
+    parent = (
+        manager.filter(descendant=instance.pk, depth=1)
+        .values_list("ancestor", flat=True)
+        .first()
+    )
+    if parent != instance.relative_placement_id or (
+        parent is None and not manager.filter(descendant=instance.pk).exists()
+    ):
+        closure.move_subtree(instance.pk, using=using)
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+__all__ = [
+    "IfcLocalPlacementClosureModel",
+    "MAX_PLACEMENT_DEPTH",
+]
@@ -9,7 +9,9 @@
 Provides IFC Grid Placement Model Class
 =======================================
 
-
+This module defines the IfcGridPlacementModel class, placing objects at an
+intersection of the axes of a grid, e.g. "A1". `location()` resolves it
+through the precomputed intersections of `model_ifc_grid_intersection`.
 
 More information on IfcGridPlacement can be found here:
 https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcgeometricconstraintresource/lexical/ifcgridplacement.htm
@@ -22,14 +24,15 @@ https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcgeometriccons
 # =============================================================================
 
 # Import | Standard Library
+from typing import Optional
 
 # Import | Libraries
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-# Import | Grid Modules
+# Import | Local Modules
+from ...managers import StrRelatedManager
 from .model_ifc_placement_object import IfcObjectPlacementModel
-from .model_ifc_grid import IfcGridModel
 
 
 # =============================================================================
@@ -50,17 +53,28 @@ class IfcGridPlacementModel(IfcObjectPlacementModel):
         grid (ForeignKey): The grid used for this placement.
         placement_location (CharField): Descriptive location within the grid,
             e.g., intersection name or axis identifier.
+        u_tag (CharField): The tag of the first axis of the intersection.
+        v_tag (CharField): The tag of the second axis of the intersection.
+        STR_RELATED_FIELDS (tuple): The relations loaded with every row for
+            `__str__`, see `StrRelatedManager`.
     """
 
+    STR_RELATED_FIELDS = (
+        "grid",
+    )
+
     # Class | Model Fields
     # =========================================================================
 
-    # grid = models.ForeignKey(
-    #     IfcGridModel,
-    #     on_delete = models.CASCADE,
-    #     verbose_name = _("Grid"),
-    #     help_text = _("The grid used for this placement.")
-    # )
+    # Referenced by name, the grid module depends on the placements
+    grid = models.ForeignKey(
+        "IfcGridModel",
+        on_delete = models.CASCADE,
+        null = True,
+        blank = True,
+        verbose_name = _("Grid"),
+        help_text = _("The grid used for this placement."),
+    )
 
     placement_location = models.CharField(
         max_length = 255,
@@ -70,13 +84,57 @@ class IfcGridPlacementModel(IfcObjectPlacementModel):
         ),
     )
 
+    u_tag = models.CharField(
+        max_length = 100,
+        blank = True,
+        verbose_name = _("U Tag"),
+        help_text = _(
+            "Tag of the first axis of the intersection, if not given by the location."  # noqa E501
+        ),
+    )
+
+    v_tag = models.CharField(
+        max_length = 100,
+        blank = True,
+        verbose_name = _("V Tag"),
+        help_text = _(
+            "Tag of the second axis of the intersection, if not given by the location."  # noqa E501
+        ),
+    )
+
+    objects = StrRelatedManager()
+
     # Class | Model Methods
     # =========================================================================
 
     def __str__(self) -> str:
         """
         """
-        return f"{self.grid.name} at {self.placement_location}"
+        return f"{self.grid.name if self.grid else None} at {self.placement_location}"  # noqa E501
+
+    def location(self) -> Optional[tuple[float, float]]:
+        """
+        Return the coordinates of the placement in the coordinate system of
+        the grid, with one indexed lookup of the precomputed intersections:
+        by axis tags if set, otherwise by the placement location as label.
+
+        Returns:
+            tuple: The `(x, y)` coordinates, or `None` if the grid has no
+                such intersection.
+        """
+        # Imported here, the grid module depends on the placements
+        from ..grid.model_ifc_grid_intersection import (
+            IfcGridIntersectionModel,
+        )
+
+        if self.grid_id is None:
+            return None
+        manager = IfcGridIntersectionModel._default_manager.using(
+            self._state.db,
+        )
+        if self.u_tag and self.v_tag:
+            return manager.locate(self.grid_id, self.u_tag, self.v_tag)
+        return manager.locate(self.grid_id, self.placement_location)
 
 
 # =============================================================================
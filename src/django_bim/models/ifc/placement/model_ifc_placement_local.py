@@ -15,6 +15,22 @@ used to define the placement of objects relative to the placement of other
 objects, allowing hierarchical structuring of spatial object placement
 within a project.
 
+Every placement stores its world transform, the product of the transforms
+along its `relative_placement` chain, so `world_matrix()` answers without
+walking the chain. The world transform is recomputed when a placement is
+saved, and, if it changed, for the subtree of placements relative to it,
+one chunk of a level at a time, depth first, with one prepared UPDATE per
+row. Code writing placements in bulk (`bulk_create`, `update`) calls
+`update_world_transforms` afterwards. Both send
+`placements_changed` with the placements they wrote, so the products
+placed by them can follow.
+
+The manager walks the hierarchy in the database: `descendants_of`,
+`ancestors_of`, `with_ancestors`, `with_descendants` and `depth` compile to
+a single `WITH RECURSIVE` query, which PostgreSQL, SQLite and MySQL 8
+support, or to a join with the closure table of `model_ifc_placement_closure`
+when the `DJANGO_BIM_PLACEMENT_CLOSURE` setting is enabled.
+
 More information on IfcLocalPlacement can be found here:
 https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcgeometricconstraintresource/lexical/ifclocalplacement.htm
 
@@ -26,19 +42,226 @@ https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcgeometriccons
 # =============================================================================
 
 # Import | Standard Library
+from typing import Iterable, Optional, Union
 
 # Import | Libraries
-from django.db import models
+from django.conf import settings
+from django.db import connections, models
+from django.db.models.expressions import RawSQL
+from django.dispatch import Signal
 from django.utils.translation import gettext_lazy as _
 
 # Import | Local Modules
+from ....fields.model.field_model_ifc_transform import IfcTransformField
+from ....utils.matrix import IDENTITY, Matrix, multiply
+from ...managers import StrRelatedManager
 from .model_ifc_placement_object import IfcObjectPlacementModel
 
 
+# =============================================================================
+# Variables
+# =============================================================================
+
+# Number of parent placements per `relative_placement__in` query
+_LEVEL_BATCH_SIZE = 900
+
+# Sent with the primary keys of the saved placements and of the placements
+# whose world transform was recomputed, and the database alias
+placements_changed = Signal()
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def placement_closure_enabled() -> bool:
+    """
+    Return whether the placement closure table is maintained and used.
+
+    Returns:
+        bool: The value of the `DJANGO_BIM_PLACEMENT_CLOSURE` setting.
+    """
+    return getattr(settings, "DJANGO_BIM_PLACEMENT_CLOSURE", False)
+
+
 # =============================================================================
 # Classes
 # =============================================================================
 
+class IfcLocalPlacementQuerySet(models.QuerySet):
+    """
+    IFC Local Placement QuerySet Class
+    ==================================
+
+    QuerySet walking the `relative_placement` hierarchy with recursive
+    common table expressions, so a subtree or a chain of any size is
+    fetched in one round trip. `UNION` (rather than `UNION ALL`) makes the
+    recursion stop on cycles in corrupt hierarchies. With the closure table
+    enabled, the same methods are a join with its indexed rows instead.
+
+    """
+
+    def descendants_of(
+        self,
+        placement: Union[models.Model, int],
+        include_self: bool = False,
+    ) -> "IfcLocalPlacementQuerySet":
+        """
+        Filter the placements nested, at any depth, under a placement.
+
+        Parameters:
+            placement (IfcLocalPlacementModel | int): The placement or its
+                primary key.
+            include_self (bool): Whether to include the placement itself.
+
+        Returns:
+            IfcLocalPlacementQuerySet: The filtered placements.
+        """
+        if placement_closure_enabled():
+            return self.filter(
+                ancestor_links__ancestor=self._pk(placement),
+                ancestor_links__depth__gte=0 if include_self else 1,
+            )
+        table, pk, parent = self._columns()
+        start = pk if include_self else parent
+        return self.filter(pk__in=RawSQL(
+            f"WITH RECURSIVE tree (id) AS ("
+            f"SELECT {pk} FROM {table} WHERE {start} = %s "
+            f"UNION "
+            f"SELECT child.{pk} FROM {table} child "
+            f"INNER JOIN tree ON child.{parent} = tree.id"
+            f") SELECT id FROM tree",
+            (self._pk(placement),),
+        ))
+
+    def ancestors_of(
+        self,
+        placement: Union[models.Model, int],
+        include_self: bool = False,
+    ) -> "IfcLocalPlacementQuerySet":
+        """
+        Filter the placements a placement is relative to, up to the root.
+
+        Parameters:
+            placement (IfcLocalPlacementModel | int): The placement or its
+                primary key.
+            include_self (bool): Whether to include the placement itself.
+
+        Returns:
+            IfcLocalPlacementQuerySet: The filtered placements.
+        """
+        if placement_closure_enabled():
+            return self.filter(
+                descendant_links__descendant=self._pk(placement),
+                descendant_links__depth__gte=0 if include_self else 1,
+            )
+        table, pk, parent = self._columns()
+        start = pk if include_self else parent
+        return self.filter(pk__in=RawSQL(
+            f"WITH RECURSIVE chain (id) AS ("
+            f"SELECT {start} FROM {table} WHERE {pk} = %s "
+            f"UNION "
+            f"SELECT placement.{parent} FROM {table} placement "
+            f"INNER JOIN chain ON placement.{pk} = chain.id"
+            f") SELECT id FROM chain WHERE id IS NOT NULL",
+            (self._pk(placement),),
+        ))
+
+    def with_ancestors(self) -> "IfcLocalPlacementQuerySet":
+        """
+        Return the placements of the queryset together with the placements
+        they are relative to, up to their roots.
+
+        Returns:
+            IfcLocalPlacementQuerySet: The placements and their ancestors.
+        """
+        placements = self.select_related(None).values("pk")
+        manager = self.model._default_manager.db_manager(self.db)
+        if placement_closure_enabled():
+            return manager.filter(
+                pk__in=self.model._meta.get_field("descendant_links")
+                .related_model._default_manager.filter(
+                    descendant__in=placements,
+                ).values("ancestor"),
+            )
+        table, pk, parent = self._columns()
+        sql, params = placements.query.sql_with_params()
+        return manager.filter(pk__in=RawSQL(
+            f"WITH RECURSIVE chain (id) AS ("
+            f"SELECT {pk} FROM {table} WHERE {pk} IN ({sql}) "
+            f"UNION "
+            f"SELECT placement.{parent} FROM {table} placement "
+            f"INNER JOIN chain ON placement.{pk} = chain.id"
+            f") SELECT id FROM chain WHERE id IS NOT NULL",
+            params,
+        ))
+
+    def with_descendants(self) -> "IfcLocalPlacementQuerySet":
+        """
+        Return the placements of the queryset together with the placements
+        nested, at any depth, under them.
+
+        Returns:
+            IfcLocalPlacementQuerySet: The placements and their descendants.
+        """
+        placements = self.select_related(None).values("pk")
+        manager = self.model._default_manager.db_manager(self.db)
+        if placement_closure_enabled():
+            return manager.filter(
+                pk__in=self.model._meta.get_field("ancestor_links")
+                .related_model._default_manager.filter(
+                    ancestor__in=placements,
+                ).values("descendant"),
+            )
+        table, pk, parent = self._columns()
+        sql, params = placements.query.sql_with_params()
+        return manager.filter(pk__in=RawSQL(
+            f"WITH RECURSIVE tree (id) AS ("
+            f"SELECT {pk} FROM {table} WHERE {pk} IN ({sql}) "
+            f"UNION "
+            f"SELECT child.{pk} FROM {table} child "
+            f"INNER JOIN tree ON child.{parent} = tree.id"
+            f") SELECT id FROM tree",
+            params,
+        ))
+
+    def depth(self, placement: Union[models.Model, int]) -> int:
+        """
+        Return the number of placements a placement is nested under, 0 for
+        a placement without relative placement.
+
+        Parameters:
+            placement (IfcLocalPlacementModel | int): The placement or its
+                primary key.
+
+        Returns:
+            int: The depth of the placement.
+        """
+        return self.ancestors_of(placement).count()
+
+    # Class | Helpers
+    # =========================================================================
+
+    def _columns(self) -> tuple[str, str, str]:
+        """
+        Return the quoted table, primary key and parent column names.
+        """
+        quote = connections[self.db].ops.quote_name
+        meta = self.model._meta
+        return (
+            quote(meta.db_table),
+            quote(meta.pk.column),
+            quote(meta.get_field("relative_placement").column),
+        )
+
+    @staticmethod
+    def _pk(placement: Union[models.Model, int]) -> int:
+        """
+        Return the primary key of a placement given as instance or key.
+        """
+        return getattr(placement, "pk", placement)
+
+
 class IfcLocalPlacementModel(IfcObjectPlacementModel):
     """
     IFC Local Placement Model Class
@@ -56,9 +279,22 @@ class IfcLocalPlacementModel(IfcObjectPlacementModel):
             IfcLocalPlacementModel to which this object's placement is
             relative. This allows constructing a hierarchy of object
             placements.
+        relative_transform (IfcTransformField): The 4x4 transform of the
+            placement relative to `relative_placement`, or to the world
+            coordinate system if there is none.
+        world_transform (IfcTransformField): The materialised 4x4 transform
+            of the placement in the world coordinate system.
+        objects (IfcLocalPlacementQuerySet): Manager with the hierarchy
+            queries, loading `STR_RELATED_FIELDS` with every row.
+        STR_RELATED_FIELDS (tuple): The relations loaded with every row for
+            `__str__`, see `StrRelatedManager`.
 
     """
 
+    STR_RELATED_FIELDS = (
+        "relative_placement",
+    )
+
     # Class | Model Fields
     # =========================================================================
 
@@ -74,6 +310,24 @@ class IfcLocalPlacementModel(IfcObjectPlacementModel):
         ),
     )
 
+    relative_transform = IfcTransformField(
+        default = IDENTITY,
+        verbose_name = _("Relative Transform"),
+        help_text = _(
+            "The 4x4 transform relative to the relative placement."
+        ),
+    )
+
+    world_transform = IfcTransformField(
+        default = IDENTITY,
+        verbose_name = _("World Transform"),
+        help_text = _(
+            "The 4x4 transform in world coordinates, maintained on save."
+        ),
+    )
+
+    objects = StrRelatedManager.from_queryset(IfcLocalPlacementQuerySet)()
+
     # Class | Model Methods
     # =========================================================================
 
@@ -85,6 +339,177 @@ class IfcLocalPlacementModel(IfcObjectPlacementModel):
         relative_info = f"relative to: {self.relative_placement.placement_id}" if self.relative_placement else "with no relative placement"  # noqa E501
         return f"Local Placement ID {self.id} ({relative_info})"
 
+    def save(self, *args, **kwargs) -> None:
+        """
+        Save the placement with its world transform, then update the world
+        transforms of the placements relative to it if it changed.
+        """
+        previous = None if self._state.adding else self.world_transform
+        self.world_transform = self.compute_world_transform()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "world_transform"}
+        super().save(*args, **kwargs)
+        placements_changed.send(
+            sender=type(self),
+            placements=[self.pk],
+            using=self._state.db,
+        )
+        if previous is not None and previous != self.world_transform:
+            self._propagate_world_transforms(
+                [(self.pk, self.world_transform)],
+                using=self._state.db,
+            )
+
+    def world_matrix(self) -> Matrix:
+        """
+        Return the world transform without querying the database.
+
+        Returns:
+            Matrix: The row-major 4x4 transform, see
+                `django_bim.utils.matrix`.
+        """
+        return self.world_transform
+
+    def compute_world_transform(self) -> Matrix:
+        """
+        Compute the world transform from the stored world transform of the
+        relative placement and the relative transform.
+
+        Returns:
+            Matrix: The world transform.
+        """
+        local = self.relative_transform or IDENTITY
+        if self.relative_placement_id is None:
+            return tuple(local)
+        parent = (
+            type(self)._default_manager
+            .using(self._state.db)
+            .filter(pk=self.relative_placement_id)
+            .values_list("world_transform", flat=True)
+            .first()
+        )
+        return multiply(parent or IDENTITY, local)
+
+    @classmethod
+    def update_world_transforms(
+        cls,
+        roots: Optional[Iterable[int]] = None,
+        using: Optional[str] = None,
+    ) -> int:
+        """
+        Recompute the world transforms of placement subtrees.
+
+        Roots nested, at any depth, under other roots are reached through
+        the subtrees of those, so every placement is updated once and after
+        the placement it is relative to.
+
+        Parameters:
+            roots (Iterable[int]): Primary keys of the placements whose
+                subtrees are updated, or `None` for every placement.
+            using (str): The database alias.
+
+        Returns:
+            int: Number of placements updated.
+        """
+        manager = cls._default_manager.db_manager(using)
+        if roots is None:
+            placements = manager.filter(relative_placement__isnull=True)
+        else:
+            roots = set(roots)
+            nested = manager.filter(
+                relative_placement__in=roots,
+            ).with_descendants().filter(pk__in=roots)
+            placements = manager.filter(pk__in=roots).exclude(pk__in=nested)
+        pks = list(placements.values_list("pk", flat=True))
+        updated = 0
+        for start in range(0, len(pks), _LEVEL_BATCH_SIZE):
+            level = [
+                (pk, multiply(parent or IDENTITY, relative or IDENTITY))
+                for pk, relative, parent in manager.filter(
+                    pk__in=pks[start:start + _LEVEL_BATCH_SIZE],
+                ).values_list(
+                    "pk",
+                    "relative_transform",
+                    "relative_placement__world_transform",
+                )
+            ]
+            cls._write_world_transforms(level, manager.db)
+            updated += len(level)
+            updated += cls._propagate_world_transforms(level, manager.db)
+        return updated
+
+    # Class | Helpers
+    # =========================================================================
+
+    @classmethod
+    def _propagate_world_transforms(
+        cls,
+        parents: list[tuple[int, Matrix]],
+        using: Optional[str] = None,
+    ) -> int:
+        """
+        Recompute the world transforms below the given placements, one
+        chunk of a level of the hierarchy at a time, depth first, so only
+        the chunks of the path being walked are held, and return the
+        number of updated placements.
+        """
+        manager = cls._default_manager.db_manager(using)
+        # Guards against cycles in corrupt hierarchies
+        visited = {pk for pk, _ in parents}
+        stack = [parents]
+        updated = 0
+        while stack:
+            transforms = dict(stack.pop())
+            children = [
+                (pk, multiply(transforms[parent], relative or IDENTITY))
+                for pk, parent, relative in manager.filter(
+                    relative_placement__in=list(transforms),
+                ).values_list(
+                    "pk", "relative_placement", "relative_transform",
+                )
+                if pk not in visited
+            ]
+            for start in range(0, len(children), _LEVEL_BATCH_SIZE):
+                level = children[start:start + _LEVEL_BATCH_SIZE]
+                cls._write_world_transforms(level, manager.db)
+                visited.update(pk for pk, _ in level)
+                stack.append(level)
+            updated += len(children)
+        return updated
+
+    @classmethod
+    def _write_world_transforms(
+        cls,
+        transforms: list[tuple[int, Matrix]],
+        using: str,
+    ) -> None:
+        """
+        Store the world transforms of placements, with one prepared UPDATE
+        per row, which scales linearly, unlike the CASE expressions of
+        `bulk_update`, and send `placements_changed`.
+        """
+        if not transforms:
+            return
+        connection = connections[using]
+        quote = connection.ops.quote_name
+        field = cls._meta.get_field("world_transform")
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"UPDATE {quote(cls._meta.db_table)} "
+                f"SET {quote(field.column)} = %s "
+                f"WHERE {quote(cls._meta.pk.column)} = %s",
+                [
+                    (field.get_db_prep_value(transform, connection), pk)
+                    for pk, transform in transforms
+                ],
+            )
+        placements_changed.send(
+            sender=cls,
+            placements=[pk for pk, _ in transforms],
+            using=using,
+        )
+
 
 # =============================================================================
 # Module Variables
@@ -92,4 +517,7 @@ class IfcLocalPlacementModel(IfcObjectPlacementModel):
 
 __all__ = [
     "IfcLocalPlacementModel",
+    "IfcLocalPlacementQuerySet",
+    "placement_closure_enabled",
+    "placements_changed",
 ]
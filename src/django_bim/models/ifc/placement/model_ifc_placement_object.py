@@ -28,7 +28,6 @@ from django.utils.translation import gettext_lazy as _
 # Import | Local Modules
 from ....fields.model import (
     IfcLabelField,
-    IfcRoleTypeField,
     IfcTextField,
 )
 
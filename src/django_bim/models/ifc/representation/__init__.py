@@ -22,8 +22,12 @@ Django BIM IFC Representation Models Module
 from .model_ifc_representation import IfcRepresentationModel
 from .model_ifc_representation_context import IfcRepresentationContextModel
 from .model_ifc_representation_item import IfcRepresentationItemModel
-from .model_ifc_representation_item_geometric import IfcGeometricRepresentationItemModel
-from .model_ifc_representation_map import IfcGeometricRepresentationMapModel
+from .model_ifc_representation_item_geometric import (
+    IfcGeometricRepresentationItemModel,
+)
+from .model_ifc_representation_item_relation import (
+    IfcRepresentationItemRelation,
+)
 
 
 # =============================================================================
@@ -34,6 +38,6 @@ __all__ = [
     "IfcRepresentationModel",
     "IfcRepresentationContextModel",
     "IfcRepresentationItemModel",
+    "IfcRepresentationItemRelation",
     "IfcGeometricRepresentationItemModel",
-    "IfcGeometricRepresentationMapModel",
 ]
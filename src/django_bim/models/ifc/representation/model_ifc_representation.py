@@ -21,8 +21,7 @@ https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcrepresentatio
 # =============================================================================
 
 # Import | Standard Library
-# from uuid import uuid4
-# from typing import Any, Dict, List
+from typing import Any
 
 # Import | Libraries
 from django.db import models
@@ -31,7 +30,6 @@ from django.utils.translation import gettext_lazy as _
 
 # Import | Local Modules
 from .model_ifc_representation_context import IfcRepresentationContextModel
-from .model_ifc_representation_item import IfcRepresentationItemModel
 
 
 # =============================================================================
@@ -60,7 +58,10 @@ class IfcRepresentationModel(models.Model):
             representation, e.g., 'Body', 'Axis'.
         representation_type (CharField): The type of the representation,
             e.g., 'Mesh', 'Solid'.
-        items (ManyToManyField): Items that are part of this representation.
+
+    The items of the representation, rows of any representation item model,
+    are linked through `IfcRepresentationItemRelation` (`item_relations`).
+
     """
 
     # Class | Model Fields
@@ -94,13 +95,6 @@ class IfcRepresentationModel(models.Model):
             "The type of the representation, such as 'Mesh', 'Solid', or 'Curve'."  # noqa E501
         ),
     )
-    items = models.ManyToManyField(
-        IfcRepresentationItemModel,
-        verbose_name = _("Items"),
-        help_text = _(
-            "Geometric or spatial items included in this representation."
-        ),
-    )
 
     # Class | Model Meta Class
     # =========================================================================
@@ -122,6 +116,18 @@ class IfcRepresentationModel(models.Model):
         """
         return f"{self.representation_identifier} - {self.representation_type}"
 
+    def items(self) -> list[Any]:
+        """
+        Return the items of the representation.
+
+        Returns:
+            list: The item rows, of any representation item model.
+        """
+        return [
+            relation.item
+            for relation in self.item_relations.prefetch_related("item")
+        ]
+
 
 # =============================================================================
 # Module Variables
@@ -29,9 +29,11 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 # Import | Local Modules
-from ...fields.model import (
+from ....fields.model import (
     IfcLabelField,
 )
+from ....fields.model.field_model_ifc_transform import IfcTransformField
+from ....utils.matrix import IDENTITY
 
 
 # =============================================================================
@@ -63,8 +65,11 @@ class IfcRepresentationContextModel(models.Model):
             (e.g., Plan, Elevation).
         context_type (models.CharField): Describes the context further
             (e.g., 2D, 3D).
-        coordinate_space_dimension (models.IntegerField): The dimensionality
-            of the coordinate system (typically 2 or 3).
+        world_coordinate_system (IfcTransformField): The 4x4 transform of
+            the coordinate system of the context, in which the placements
+            without relative placement are located.
+        precision (FloatField): The precision of the coordinates of the
+            geometric representations in the context, if given.
 
     """
 
@@ -89,6 +94,23 @@ class IfcRepresentationContextModel(models.Model):
         ),
     )
 
+    world_coordinate_system = IfcTransformField(
+        default = IDENTITY,
+        verbose_name = _("World Coordinate System"),
+        help_text = _(
+            "The 4x4 transform of the coordinate system of the context."
+        ),
+    )
+
+    precision = models.FloatField(
+        blank = True,
+        null = True,
+        verbose_name = _("Precision"),
+        help_text = _(
+            "The precision of the coordinates of the geometric representations in the context."  # noqa E501
+        ),
+    )
+
     # coordinate_space_dimension = models.IntegerField(
     #     default=3,
     #     verbose_name=_("Coordinate Space Dimension"),
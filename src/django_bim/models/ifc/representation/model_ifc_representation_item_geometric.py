@@ -93,5 +93,5 @@ class IfcGeometricRepresentationItemModel(models.Model):
 # =============================================================================
 
 __all__ = [
-    "IfcGeometricRepresentationItem",
+    "IfcGeometricRepresentationItemModel",
 ]
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC Representation Item Relation Model Class
+=====================================================
+
+This module defines the IfcRepresentationItemRelation class, which links an
+`IfcRepresentationModel` to each of its items, whatever their model.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+
+# Import | Libraries
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+# Import | Local Modules
+from ...managers import StrRelatedManager
+from .model_ifc_representation import IfcRepresentationModel
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcRepresentationItemRelation(models.Model):
+    """
+    IFC Representation Item Relation Model Class
+    ============================================
+
+    Model linking an `IfcRepresentationModel` to one of its items.
+
+    Attributes:
+        representation (ForeignKey): The representation.
+        content_type (ForeignKey): The model of the item.
+        object_id (PositiveBigIntegerField): The primary key of the item.
+        item (GenericForeignKey): The item.
+        STR_RELATED_FIELDS (tuple): The relations loaded with every row for
+            `__str__`, see `StrRelatedManager`.
+
+    """
+
+    STR_RELATED_FIELDS = (
+        "item",
+    )
+
+    # Class | Model Fields
+    # =========================================================================
+
+    representation = models.ForeignKey(
+        IfcRepresentationModel,
+        on_delete = models.CASCADE,
+        related_name = "item_relations",
+        verbose_name = _("Representation"),
+    )
+
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete = models.CASCADE,
+    )
+
+    object_id = models.PositiveBigIntegerField()
+
+    item = GenericForeignKey("content_type", "object_id")
+
+    objects = StrRelatedManager()
+
+    # Class | Model Meta Class
+    # =========================================================================
+
+    class Meta:
+        """
+        Meta Class
+        ----------
+
+        """
+        verbose_name = _("IFC Representation Item Relation")
+        verbose_name_plural = _("IFC Representation Item Relations")
+        indexes = [
+            models.Index(fields=["content_type", "object_id"]),
+        ]
+
+    # Class | Model Methods
+    # =========================================================================
+
+    def __str__(self) -> str:
+        """
+        Return the item.
+        """
+        return f"{self.item}"
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+__all__ = [
+    "IfcRepresentationItemRelation",
+]
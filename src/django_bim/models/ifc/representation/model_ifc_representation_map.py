@@ -25,9 +25,8 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 # Import | Local Modules
-from ...fields.model import (
+from ....fields.model import (
     IfcLabelField,
-    IfcRoleTypeField,
     IfcTextField,
 )
 
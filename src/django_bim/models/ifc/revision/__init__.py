@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM IFC Revision Models Module
+=====================================
+
+This module contains the models storing revisions of a project, which
+`django_bim.diff` compares:
+
+- `IfcProjectRevisionModel`: A stored revision of a project.
+- `IfcRevisionEntityModel`: The hashes and attribute values of an entity
+    in a revision.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Local Modules
+from .model_ifc_project_revision import IfcProjectRevisionModel
+from .model_ifc_revision_entity import IfcRevisionEntityModel
+
+
+# =============================================================================
+# Module Level Variables
+# =============================================================================
+
+__all__ = [
+    "IfcProjectRevisionModel",
+    "IfcRevisionEntityModel",
+]
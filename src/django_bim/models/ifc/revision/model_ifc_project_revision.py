@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC Project Revision Model Class
+=========================================
+
+This module defines the IfcProjectRevisionModel class, a stored revision
+of a project: the hashes and attribute values of the project and of every
+product of its container tree at one point in time, e.g. after each
+upload, in `IfcRevisionEntityModel` rows.
+
+The live tables hold a single revision of each entity, as `global_id` is
+unique; revisions keep the earlier states, so `django_bim.diff` can
+compare any two of them in the database.
+
+The hashes of a revision are computed when it is captured, from the
+attributes and referenced rows it stores, rather than copied from the
+`content_hash` and `digest` columns, which `update()` calls or moved
+placements may have left stale. The rollup of a revision combines the
+hashes of its entities with their global ids and containers, so equal
+rollups prove equal revisions.
+
+Usage:
+    revision = IfcProjectRevisionModel.capture(project, label="Tuesday")
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import itertools
+from typing import Any, Iterable, Iterator
+
+# Import | Libraries
+from django.apps import apps
+from django.db import models, transaction
+from django.utils.translation import gettext_lazy as _
+
+# Import | Local Modules
+from ....utils.digest import (
+    EMPTY_DIGEST,
+    add_digests,
+    canonical,
+    hash_values,
+)
+from ..model_ifc_project import IfcProjectModel
+from .model_ifc_revision_entity import IfcRevisionEntityModel
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+# Number of entities per query when storing a revision
+_CAPTURE_BATCH_SIZE = 1000
+
+# Number of values per `__in` query, below the SQLite variable limit
+_LOOKUP_BATCH_SIZE = 900
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcProjectRevisionModel(models.Model):
+    """
+    IFC Project Revision Model Class
+    ================================
+
+    Model storing a revision of a project.
+
+    Attributes:
+        project (ForeignKey): The project.
+        label (CharField): A label of the revision, e.g. of the upload.
+        created_at (DateTimeField): When the revision was stored.
+        rollup_digest (CharField): The combination of the stored
+            entities; revisions with equal rollups are equal.
+        entity_count (PositiveIntegerField): Number of entities stored.
+
+    """
+
+    # Class | Model Fields
+    # =========================================================================
+
+    project = models.ForeignKey(
+        IfcProjectModel,
+        on_delete = models.CASCADE,
+        related_name = "revisions",
+        verbose_name = _("Project"),
+        help_text = _("The project of the revision."),
+    )
+
+    label = models.CharField(
+        max_length = 255,
+        blank = True,
+        default = "",
+        verbose_name = _("Label"),
+        help_text = _("A label of the revision, e.g. of the upload."),
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add = True,
+        verbose_name = _("Created At"),
+        help_text = _("When the revision was stored."),
+    )
+
+    rollup_digest = models.CharField(
+        max_length = 32,
+        null = True,
+        blank = True,
+        editable = False,
+        verbose_name = _("Rollup Digest"),
+        help_text = _(
+            "The rollup of the project when the revision was stored."
+        ),
+    )
+
+    entity_count = models.PositiveIntegerField(
+        default = 0,
+        editable = False,
+        verbose_name = _("Entity Count"),
+        help_text = _("Number of entities stored in the revision."),
+    )
+
+    # Class | Model Meta Class
+    # =========================================================================
+
+    class Meta:
+        """
+        Meta Class
+        ----------
+
+        """
+        verbose_name = _("IFC Project Revision")
+        verbose_name_plural = _("IFC Project Revisions")
+        ordering = ["created_at"]
+
+    # Class | Model Methods
+    # =========================================================================
+
+    def __str__(self) -> str:
+        """
+        String representation of the revision.
+        """
+        return (
+            f"Revision {self.pk} of project {self.project_id}: {self.label}"
+        )
+
+    @classmethod
+    def capture(
+        cls,
+        project: IfcProjectModel,
+        label: str = "",
+        batch_size: int = _CAPTURE_BATCH_SIZE,
+    ) -> "IfcProjectRevisionModel":
+        """
+        Store the current state of a project and of its products, walking
+        the container tree level by level.
+
+        Parameters:
+            project (IfcProjectModel): The project.
+            label (str): A label of the revision.
+            batch_size (int): Entities per query.
+
+        Returns:
+            IfcProjectRevisionModel: The stored revision.
+        """
+        using = project._state.db
+        with transaction.atomic(using=using):
+            revision = cls._default_manager.using(using).create(
+                project = project,
+                label = label,
+            )
+            entities = IfcRevisionEntityModel._default_manager.using(using)
+            rollup = EMPTY_DIGEST
+            batch = []
+            for entity, container in revision._tree(project, batch_size):
+                batch.append(revision._entity(entity, container))
+                if len(batch) == batch_size:
+                    rollup = revision._store(entities, batch, rollup)
+                    batch = []
+            if batch:
+                rollup = revision._store(entities, batch, rollup)
+            revision.rollup_digest = rollup
+            revision.save(update_fields=["entity_count", "rollup_digest"])
+        return revision
+
+    # Class | Helpers
+    # =========================================================================
+
+    @classmethod
+    def _tree(
+        cls,
+        project: IfcProjectModel,
+        batch_size: int,
+    ) -> Iterator[tuple[Any, str]]:
+        """
+        Yield the project and its products with the global ids of their
+        containers, one level of the container tree at a time.
+
+        Products are yielded as rows of their most derived model, e.g.
+        `IfcGridModel`, so that the attributes of the subclasses are stored.
+        """
+        yield project, ""
+        using = project._state.db
+        model = project._meta.get_field("products").related_model
+        products = model._default_manager.using(using)
+        size = min(batch_size, _LOOKUP_BATCH_SIZE)
+        level = {}
+        for chunk in _chunks(
+            products.filter(project=project, container__isnull=True)
+            .values_list("pk", flat=True)
+            .iterator(chunk_size=batch_size),
+            size,
+        ):
+            for product in cls._products(model, chunk, using):
+                level[product.pk] = product.global_id
+                yield product, ""
+        while level:
+            containers, level = level, {}
+            pks = list(containers)
+            for start in range(0, len(pks), _LOOKUP_BATCH_SIZE):
+                for chunk in _chunks(
+                    products.filter(
+                        container__in=pks[start:start + _LOOKUP_BATCH_SIZE],
+                    )
+                    .values_list("pk", flat=True)
+                    .iterator(chunk_size=batch_size),
+                    size,
+                ):
+                    for product in cls._products(model, chunk, using):
+                        level[product.pk] = product.global_id
+                        yield product, containers[product.container_id]
+
+    @staticmethod
+    def _products(model: type, pks: list[int], using: str) -> list[Any]:
+        """
+        Return the products of primary keys as rows of their most derived
+        model, with one query per model, in the order of `pks`.
+        """
+        # Most derived models first, the rows left over are of `model`
+        subclasses = sorted(
+            (
+                subclass for subclass in apps.get_models()
+                if issubclass(subclass, model)
+            ),
+            key=lambda subclass: -len(subclass._meta.get_parent_list()),
+        )
+        rows = {}
+        for subclass in subclasses:
+            missing = [pk for pk in pks if pk not in rows]
+            if not missing:
+                break
+            for row in (
+                subclass._default_manager.using(using)
+                .select_related(None)
+                .select_related(*(
+                    field.name for field in subclass.digest_references()
+                ))
+                .filter(pk__in=missing)
+            ):
+                rows[row.pk] = row
+        return [rows[pk] for pk in pks if pk in rows]
+
+    def _entity(self, entity: Any, container: str) -> IfcRevisionEntityModel:
+        """
+        Return the revision row of a rooted entity, with its hashes
+        computed from the stored attributes and referenced rows.
+        """
+        attributes = {
+            field.name: canonical(
+                field.get_prep_value(getattr(entity, field.attname))
+            )
+            for field in entity.content_hash_fields()
+        }
+        references = entity.reference_digests()
+        content_hash = entity.compute_content_hash()
+        attributes.update(references)
+        return IfcRevisionEntityModel(
+            revision = self,
+            global_id = entity.global_id,
+            container = container,
+            content_hash = content_hash,
+            digest = hash_values((
+                ("content_hash", content_hash),
+                *sorted(references.items()),
+            )),
+            owner_history_id = entity.owner_history_id,
+            attributes = attributes,
+        )
+
+    def _store(
+        self,
+        entities: models.Manager,
+        batch: list[IfcRevisionEntityModel],
+        rollup: str,
+    ) -> str:
+        """
+        Write a batch of revision rows and return the rollup with them.
+        """
+        entities.bulk_create(batch)
+        self.entity_count += len(batch)
+        return add_digests(rollup, *(
+            hash_values((entity.global_id, entity.digest, entity.container))
+            for entity in batch
+        ))
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def _chunks(values: Iterable[int], size: int) -> Iterator[list[int]]:
+    """
+    Yield lists of at most `size` values.
+    """
+    iterator = iter(values)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+__all__ = [
+    "IfcProjectRevisionModel",
+]
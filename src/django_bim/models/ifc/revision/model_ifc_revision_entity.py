@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC Revision Entity Model Class
+========================================
+
+This module defines the IfcRevisionEntityModel class, the state of one
+rooted entity in a stored project revision, see
+`IfcProjectRevisionModel`.
+
+The rows of a revision are unique and indexed by `global_id`, so the
+`django_bim.diff` set operations between two revisions read both sides in
+index order.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+
+# Import | Libraries
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+# Import | Local Modules
+from ..model_ifc_owner_history import IfcOwnerHistoryModel
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcRevisionEntityModel(models.Model):
+    """
+    IFC Revision Entity Model Class
+    ===============================
+
+    Model storing the hashes and attribute values of an entity in a project
+    revision.
+
+    Attributes:
+        revision (ForeignKey): The revision.
+        global_id (CharField): The global id of the entity.
+        container (CharField): The global id of the product containing the
+            entity, empty for the project and its top-level products.
+        content_hash (CharField): The content hash of the entity.
+        digest (CharField): The digest of the entity.
+        owner_history (ForeignKey): The owner history of the entity when
+            the revision was stored.
+        attributes (JSONField): The canonical attribute values and the
+            hashes of the referenced rows, by name.
+
+    """
+
+    # Class | Model Fields
+    # =========================================================================
+
+    revision = models.ForeignKey(
+        "IfcProjectRevisionModel",
+        on_delete = models.CASCADE,
+        related_name = "entities",
+        verbose_name = _("Revision"),
+        help_text = _("The revision the entity belongs to."),
+    )
+
+    global_id = models.CharField(
+        max_length = 22,
+        verbose_name = _("Global ID"),
+        help_text = _("The global id of the entity."),
+    )
+
+    container = models.CharField(
+        max_length = 22,
+        blank = True,
+        default = "",
+        verbose_name = _("Container"),
+        help_text = _(
+            "The global id of the product containing the entity, empty at the top level."  # noqa E501
+        ),
+    )
+
+    content_hash = models.CharField(
+        max_length = 32,
+        blank = True,
+        default = "",
+        verbose_name = _("Content Hash"),
+        help_text = _("The content hash of the entity."),
+    )
+
+    digest = models.CharField(
+        max_length = 32,
+        blank = True,
+        default = "",
+        verbose_name = _("Digest"),
+        help_text = _("The digest of the entity."),
+    )
+
+    owner_history = models.ForeignKey(
+        IfcOwnerHistoryModel,
+        on_delete = models.SET_NULL,
+        null = True,
+        blank = True,
+        related_name = "+",
+        verbose_name = _("Owner History"),
+        help_text = _(
+            "The owner history of the entity when the revision was stored."
+        ),
+    )
+
+    attributes = models.JSONField(
+        default = dict,
+        blank = True,
+        verbose_name = _("Attributes"),
+        help_text = _(
+            "The canonical attribute values and the hashes of the referenced rows."  # noqa E501
+        ),
+    )
+
+    # Class | Model Meta Class
+    # =========================================================================
+
+    class Meta:
+        """
+        Meta Class
+        ----------
+
+        """
+        verbose_name = _("IFC Revision Entity")
+        verbose_name_plural = _("IFC Revision Entities")
+        constraints = [
+            models.UniqueConstraint(
+                fields = ["revision", "global_id"],
+                name = "uniq_revision_entity",
+            ),
+        ]
+
+    # Class | Model Methods
+    # =========================================================================
+
+    def __str__(self) -> str:
+        """
+        String representation of the revision entity.
+        """
+        return f"{self.global_id} in revision {self.revision_id}"
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+__all__ = [
+    "IfcRevisionEntityModel",
+]
@@ -17,3 +17,21 @@ Django BIM IFC Unit Models Module
 # =============================================================================
 
 # Import | Local Modules
+from .model_ifc_unit import IfcUnit
+from .model_ifc_unit_assignment import IfcUnitAssignment
+from .model_ifc_unit_length import LengthUnit
+from .model_ifc_unit_relation import IfcUnitRelation
+from .model_ifc_unit_si import IfcSIUnitModel
+
+
+# =============================================================================
+# Module Level Variables
+# =============================================================================
+
+__all__ = [
+    "IfcSIUnitModel",
+    "IfcUnit",
+    "IfcUnitAssignment",
+    "IfcUnitRelation",
+    "LengthUnit",
+]
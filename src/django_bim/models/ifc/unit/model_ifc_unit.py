@@ -6,10 +6,14 @@
 # =============================================================================
 
 """
-Provides IFC ... Model Class
-===================================
+Provides IFC Unit Model Class
+=============================
+
+This module defines the abstract IfcUnit class, the base of the units of
+measurement assigned to a project.
 
 For more information, refer to:
+https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcmeasureresource/lexical/ifcunit.htm
 
 """  # noqa E501
 
@@ -25,48 +29,55 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 # Import | Local Modules
-from ...fields.model import (
-    IfcLabelField,
-    IfcRoleTypeField,
-    IfcTextField,
-)
 
 
 # =============================================================================
 # Classes
 # =============================================================================
 
-https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcmeasureresource/lexical/ifcunit.htm
-
-from django.db import models
-from django.utils.translation import gettext_lazy as _
-
 class IfcUnit(models.Model):
     """
-    Abstract Django model representing an IfcUnit, as defined in the IFC 2x3 standard.
-    
-    This is an abstract model that serves as a base for different types of units of measurement
-    used within an IFC model, such as length, area, volume, and more.
+    IFC Unit Model Class
+    ====================
+
+    Abstract Django model representing an IfcUnit, as defined in the IFC 2x3
+    standard.
+
+    This is an abstract model that serves as a base for different types of
+    units of measurement used within an IFC model, such as length, area,
+    volume, and more.
 
     Attributes:
-        unit_type (CharField): The type of the unit, e.g., LENGTHUNIT, AREAUNIT, etc.
+        unit_type (CharField): The type of the unit, e.g., LENGTHUNIT,
+            AREAUNIT, etc.
+
     """
 
     # Enum or Choices for unit types could be defined here if needed
     UNIT_TYPES = (
-        ('LENGTHUNIT', _('Length Unit')),
-        ('AREAUNIT', _('Area Unit')),
-        ('VOLUMEUNIT', _('Volume Unit')),
-        ('COUNTUNIT', _('Count Unit')),
-        ('WEIGHTUNIT', _('Weight Unit')),
-        ('TIMEUNIT', _('Time Unit')),
+        ("LENGTHUNIT", _("Length Unit")),
+        ("AREAUNIT", _("Area Unit")),
+        ("VOLUMEUNIT", _("Volume Unit")),
+        ("COUNTUNIT", _("Count Unit")),
+        ("WEIGHTUNIT", _("Weight Unit")),
+        ("TIMEUNIT", _("Time Unit")),
+        ("MASSUNIT", _("Mass Unit")),
+        ("PLANEANGLEUNIT", _("Plane Angle Unit")),
+        ("SOLIDANGLEUNIT", _("Solid Angle Unit")),
+        ("THERMODYNAMICTEMPERATUREUNIT", _("Thermodynamic Temperature Unit")),
+        ("ELECTRICCURRENTUNIT", _("Electric Current Unit")),
+        ("LUMINOUSINTENSITYUNIT", _("Luminous Intensity Unit")),
+        ("AMOUNTOFSUBSTANCEUNIT", _("Amount Of Substance Unit")),
     )
 
+    # Class | Model Fields
+    # =========================================================================
+
     unit_type = models.CharField(
-        max_length=50,
-        choices=UNIT_TYPES,
-        verbose_name=_("Unit Type"),
-        help_text=_("Specifies the type of unit of measure.")
+        max_length = 50,
+        choices = UNIT_TYPES,
+        verbose_name = _("Unit Type"),
+        help_text = _("Specifies the type of unit of measure."),
     )
 
     # Class | Model Meta Class
@@ -78,13 +89,14 @@ class IfcUnit(models.Model):
         ----------
 
         """
-        abstract = True  # This makes sure the class is not created as a table in the database
+        abstract = True
 
     # Class | Model Methods
     # =========================================================================
 
     def __str__(self) -> str:
         """
+        Return the type of the unit.
         """
         return f"{self.get_unit_type_display()}"
 
@@ -94,5 +106,5 @@ class IfcUnit(models.Model):
 # =============================================================================
 
 __all__ = [
-    "IfcActorRoleModel",
+    "IfcUnit",
 ]
@@ -6,10 +6,15 @@
 # =============================================================================
 
 """
-Provides IFC ... Model Class
-===================================
+Provides IFC Unit Assignment Model Class
+========================================
+
+This module defines the IfcUnitAssignment class, the set of units used
+across a project. The units themselves are linked through
+`IfcUnitRelation`, as they can be rows of any unit model.
 
 For more information, refer to:
+https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcmeasureresource/lexical/ifcunitassignment.htm
 
 """  # noqa E501
 
@@ -19,44 +24,32 @@ For more information, refer to:
 # =============================================================================
 
 # Import | Standard Library
+from typing import Any
 
 # Import | Libraries
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 # Import | Local Modules
-from ...fields.model import (
-    IfcLabelField,
-    IfcRoleTypeField,
-    IfcTextField,
-)
 
 
 # =============================================================================
 # Classes
 # =============================================================================
 
-https://standards.buildingsmart.org/IFC/RELEASE/IFC2x3/TC1/HTML/ifcmeasureresource/lexical/ifcunitassignment.htm
-
-from django.db import models
-from django.contrib.contenttypes.fields import GenericRelation
-from django.contrib.contenttypes.models import ContentType
-from django.utils.translation import gettext_lazy as _
-
 class IfcUnitAssignment(models.Model):
     """
-    Model representing an IfcUnitAssignment as defined in the IFC 2x3 standard.
+    IFC Unit Assignment Model Class
+    ===============================
 
-    This model is used to define the units of measurement used across a project, relating to various specific unit types.
-    """
+    Model representing an IfcUnitAssignment as defined in the IFC 2x3
+    standard.
+
+    This model is used to define the units of measurement used across a
+    project, relating to various specific unit types through
+    `unit_relations`.
 
-    # Generic relation to associate any type of IfcUnit
-    units = GenericRelation(
-        'IfcUnitRelation',
-        related_query_name='unit_assignments',
-        verbose_name=_("Units"),
-        help_text=_("Collection of units used throughout the project.")
-    )
+    """
 
     # Class | Model Meta Class
     # =========================================================================
@@ -67,20 +60,35 @@ class IfcUnitAssignment(models.Model):
         ----------
 
         """
+        verbose_name = _("IFC Unit Assignment")
+        verbose_name_plural = _("IFC Unit Assignments")
 
     # Class | Model Methods
     # =========================================================================
 
     def __str__(self) -> str:
         """
+        Return the identifier of the assignment.
         """
         return f"Unit Assignment {self.pk}"
 
+    def units(self) -> list[Any]:
+        """
+        Return the assigned units.
+
+        Returns:
+            list: The unit rows, of any unit model.
+        """
+        return [
+            relation.unit
+            for relation in self.unit_relations.prefetch_related("unit")
+        ]
+
 
 # =============================================================================
 # Module Variables
 # =============================================================================
 
 __all__ = [
-    "IfcActorRoleModel",
+    "IfcUnitAssignment",
 ]
@@ -6,12 +6,13 @@
 # =============================================================================
 
 """
-Provides IFC ... Model Class
-===================================
+Provides IFC Length Unit Model Class
+====================================
 
-For more information, refer to:
+This module defines the LengthUnit class, a named unit of length such as
+the metre or the millimetre.
 
-"""  # noqa E501
+"""
 
 
 # =============================================================================
@@ -25,11 +26,7 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 # Import | Local Modules
-from ...fields.model import (
-    IfcLabelField,
-    IfcRoleTypeField,
-    IfcTextField,
-)
+from .model_ifc_unit import IfcUnit
 
 
 # =============================================================================
@@ -38,16 +35,34 @@ from ...fields.model import (
 
 class LengthUnit(IfcUnit):
     """
-    Concrete model representing a specific type of IfcUnit for length measurements.
+    Length Unit Model Class
+    =======================
+
+    Concrete model representing a specific type of IfcUnit for length
+    measurements.
 
     Attributes:
-        unit_name (CharField): The name of the length unit, e.g., meter, millimeter.
+        unit_name (CharField): The name of the length unit, e.g., meter,
+            millimeter.
+
     """
 
+    # Class | Model Fields
+    # =========================================================================
+
+    unit_type = models.CharField(
+        max_length = 50,
+        choices = IfcUnit.UNIT_TYPES,
+        default = "LENGTHUNIT",
+        editable = False,
+        verbose_name = _("Unit Type"),
+        help_text = _("Specifies the type of unit of measure."),
+    )
+
     unit_name = models.CharField(
-        max_length=100,
-        verbose_name=_("Unit Name"),
-        help_text=_("Name of the length unit, e.g., meter, millimeter.")
+        max_length = 100,
+        verbose_name = _("Unit Name"),
+        help_text = _("Name of the length unit, e.g., meter, millimeter."),
     )
 
     # Class | Model Meta Class
@@ -67,13 +82,15 @@ class LengthUnit(IfcUnit):
 
     def __str__(self) -> str:
         """
+        Return the name of the unit.
         """
         return f"{self.unit_name}"
 
+
 # =============================================================================
 # Module Variables
 # =============================================================================
 
 __all__ = [
-    "IfcActorRoleModel",
+    "LengthUnit",
 ]
@@ -6,12 +6,13 @@
 # =============================================================================
 
 """
-Provides IFC ... Model Class
-===================================
+Provides IFC Unit Relation Model Class
+======================================
 
-For more information, refer to:
+This module defines the IfcUnitRelation class, which links an
+`IfcUnitAssignment` to each of its units, whatever their model.
 
-"""  # noqa E501
+"""
 
 
 # =============================================================================
@@ -21,35 +22,61 @@ For more information, refer to:
 # Import | Standard Library
 
 # Import | Libraries
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 # Import | Local Modules
-from ...fields.model import (
-    IfcLabelField,
-    IfcRoleTypeField,
-    IfcTextField,
-)
+from ...managers import StrRelatedManager
+from .model_ifc_unit_assignment import IfcUnitAssignment
 
 
 # =============================================================================
 # Classes
 # =============================================================================
 
-from django.db import models
-from django.contrib.contenttypes.fields import GenericRelation
-from django.contrib.contenttypes.models import ContentType
-from django.utils.translation import gettext_lazy as _
-
 class IfcUnitRelation(models.Model):
     """
-    Model to facilitate a GenericRelation from IfcUnitAssignment to various IfcUnit models
+    IFC Unit Relation Model Class
+    =============================
+
+    Model linking an `IfcUnitAssignment` to one of its units.
+
+    Attributes:
+        assignment (ForeignKey): The unit assignment.
+        content_type (ForeignKey): The model of the unit.
+        object_id (PositiveBigIntegerField): The primary key of the unit.
+        unit (GenericForeignKey): The unit.
+        STR_RELATED_FIELDS (tuple): The relations loaded with every row for
+            `__str__`, see `StrRelatedManager`.
+
     """
-    object_id = models.PositiveIntegerField()
-    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
-    unit = GenericRelation('IfcUnit', related_query_name='unit_relations')
 
-    content_object = GenericForeignKey('content_type', 'object_id')
+    STR_RELATED_FIELDS = (
+        "unit",
+    )
+
+    # Class | Model Fields
+    # =========================================================================
+
+    assignment = models.ForeignKey(
+        IfcUnitAssignment,
+        on_delete = models.CASCADE,
+        related_name = "unit_relations",
+        verbose_name = _("Unit Assignment"),
+    )
+
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete = models.CASCADE,
+    )
+
+    object_id = models.PositiveBigIntegerField()
+
+    unit = GenericForeignKey("content_type", "object_id")
+
+    objects = StrRelatedManager()
 
     # Class | Model Meta Class
     # =========================================================================
@@ -60,14 +87,20 @@ class IfcUnitRelation(models.Model):
         ----------
 
         """
+        verbose_name = _("IFC Unit Relation")
+        verbose_name_plural = _("IFC Unit Relations")
+        indexes = [
+            models.Index(fields=["content_type", "object_id"]),
+        ]
 
     # Class | Model Methods
     # =========================================================================
 
     def __str__(self) -> str:
         """
+        Return the unit.
         """
-        return f"{self.content_object}"
+        return f"{self.unit}"
 
 
 # =============================================================================
@@ -75,5 +108,5 @@ class IfcUnitRelation(models.Model):
 # =============================================================================
 
 __all__ = [
-    "IfcActorRoleModel",
+    "IfcUnitRelation",
 ]
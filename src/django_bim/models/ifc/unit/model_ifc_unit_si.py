@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC SI Unit Model Class
+================================
+
+This module defines the IfcSIUnitModel class, a unit of the International
+System of Units, optionally with a decimal prefix, such as the millimetre.
+
+For more information, refer to:
+https://standards.buildingsmart.org/IFC/RELEASE/IFC4/ADD2_TC1/HTML/link/ifcsiunit.htm
+
+"""  # noqa E501
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+
+# Import | Libraries
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+# Import | Local Modules
+from ....enums import IfcSIPrefix, IfcSIUnitName
+from .model_ifc_unit import IfcUnit
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcSIUnitModel(IfcUnit):
+    """
+    IFC SI Unit Model Class
+    =======================
+
+    Model representing an IfcSIUnit as defined in the IFC standard.
+
+    Attributes:
+        prefix (CharField): The decimal prefix of the unit, e.g. MILLI, or
+            empty for the unit itself.
+        name (CharField): The name of the SI unit, e.g. METRE.
+
+    """
+
+    # Class | Model Fields
+    # =========================================================================
+
+    prefix = models.CharField(
+        max_length = 10,
+        choices = IfcSIPrefix.choices(),
+        null = True,
+        blank = True,
+        verbose_name = _("Prefix"),
+        help_text = _("The decimal prefix of the unit, e.g. MILLI."),
+    )
+
+    name = models.CharField(
+        max_length = 50,
+        choices = IfcSIUnitName.choices(),
+        verbose_name = _("Name"),
+        help_text = _("The name of the SI unit, e.g. METRE."),
+    )
+
+    # Class | Model Meta Class
+    # =========================================================================
+
+    class Meta:
+        """
+        Meta Class
+        ----------
+
+        """
+        verbose_name = _("IFC SI Unit")
+        verbose_name_plural = _("IFC SI Units")
+
+    # Class | Model Methods
+    # =========================================================================
+
+    def __str__(self) -> str:
+        """
+        Return the prefixed name of the unit, e.g. MILLIMETRE.
+        """
+        return f"{self.prefix or ''}{self.name}"
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+__all__ = [
+    "IfcSIUnitModel",
+]
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides Model Manager Classes
+==============================
+
+This module defines the managers shared by the IFC models.
+
+`StrRelatedManager` loads the relations that a model's `__str__` follows,
+as listed in its `STR_RELATED_FIELDS`, together with the rows: foreign keys
+through `select_related`, generic foreign keys through `prefetch_related`.
+Rendering a list of instances, e.g. in the admin or in a select widget,
+then costs a constant number of queries instead of one or more per row.
+
+Usage:
+    class IfcExampleModel(models.Model):
+        STR_RELATED_FIELDS = ("owner", "owner__organization")
+
+        objects = StrRelatedManager()
+
+Models with their own QuerySet combine both with
+`StrRelatedManager.from_queryset(IfcExampleQuerySet)()`.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Libraries
+from django.db import models
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class StrRelatedManager(models.Manager):
+    """
+    String Related Manager Class
+    ============================
+
+    Default manager loading the relations listed in the model's
+    `STR_RELATED_FIELDS` with every queryset.
+
+    Querysets that defer these relations, e.g. with `only()`, have to drop
+    them first with `select_related(None)`.
+
+    """
+
+    def get_queryset(self) -> models.QuerySet:
+        """
+        Return the queryset with the relations used by `__str__` loaded.
+
+        Returns:
+            QuerySet: The queryset of the manager.
+        """
+        queryset = super().get_queryset()
+        related, prefetched = [], []
+        for name in getattr(self.model, "STR_RELATED_FIELDS", ()):
+            field = self.model._meta.get_field(name.split("__")[0])
+            # Generic foreign keys have no related model to join
+            if field.is_relation and field.related_model is None:
+                prefetched.append(name)
+            else:
+                related.append(name)
+        if related:
+            queryset = queryset.select_related(*related)
+        if prefetched:
+            queryset = queryset.prefetch_related(*prefetched)
+        return queryset
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+__all__ = [
+    "StrRelatedManager",
+]
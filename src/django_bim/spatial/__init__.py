@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Spatial Module
+=========================
+
+This module provides in-process spatial indexes over the bounding boxes
+stored on the products, for work that needs many spatial queries in a row,
+such as clash detection. NumPy is an optional dependency, installed with
+the `geometry` extra.
+
+Available Classes:
+- PackedRTree: An STR-packed, array-backed R-tree with box, nearest
+  neighbour and self-join queries.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Local Modules
+from .rtree import PackedRTree
+
+
+# =============================================================================
+# Module Level Variables
+# =============================================================================
+
+__all__ = [
+    "PackedRTree",
+]
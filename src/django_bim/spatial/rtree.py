@@ -0,0 +1,401 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides Packed R-Tree Class
+============================
+
+An immutable R-tree over axis-aligned bounding boxes, bulk-loaded with the
+Sort-Tile-Recursive (STR) algorithm and stored as a few NumPy arrays per
+level instead of node objects. It answers the candidate queries of clash
+detection without comparing every pair of elements:
+- `query(box)`: the items intersecting a box,
+- `nearest(point, k)`: the `k` items closest to a point,
+- `self_join()`: every pair of intersecting items.
+
+Queries walk the tree one level at a time with vectorised NumPy operations
+over all the nodes still in play. The tree is a plain object of arrays, so
+it pickles compactly and can be cached between runs, e.g. with Django's
+cache framework or a file:
+
+    >>> tree = PackedRTree.from_products(IfcProductModel.objects.filter(...))
+    >>> pickle.dump(tree, file)
+
+Boxes use the `django_bim.utils.bounds` order,
+`(min_x, min_y, min_z, max_x, max_y, max_z)`.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import heapq
+from typing import Any, Sequence
+
+# Import | Libraries
+from django.db import models
+
+try:
+    import numpy
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "django_bim.spatial requires NumPy, install the 'geometry' extra."
+    ) from error
+
+# Import | Local Modules
+from ..models.ifc.model_ifc_product import BOUNDS_FIELDS
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+# Default number of children per node
+DEFAULT_NODE_CAPACITY = 16
+
+# Maximum number of item pairs tested at once by `self_join`
+_PAIR_CHUNK_SIZE = 1 << 21
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def _overlaps(boxes: Any, box: Any) -> Any:
+    """
+    Return which boxes intersect a box, touching boxes included.
+    """
+    return (
+        (boxes[:, :3] <= box[3:]).all(axis=1)
+        & (boxes[:, 3:] >= box[:3]).all(axis=1)
+    )
+
+
+def _overlaps_pairwise(a: Any, b: Any) -> Any:
+    """
+    Return which boxes of `a` intersect the box of `b` at the same index.
+    """
+    return (
+        (a[:, :3] <= b[:, 3:]).all(axis=1)
+        & (b[:, :3] <= a[:, 3:]).all(axis=1)
+    )
+
+
+def _expand(starts: Any, ends: Any) -> tuple[Any, Any]:
+    """
+    Expand `[start, end)` ranges into the concatenation of their indices,
+    and the index of the range each one comes from.
+    """
+    counts = ends - starts
+    owners = numpy.repeat(numpy.arange(len(starts)), counts)
+    offsets = numpy.cumsum(counts) - counts
+    indices = (
+        numpy.arange(counts.sum())
+        - numpy.repeat(offsets, counts)
+        + numpy.repeat(starts, counts)
+    )
+    return indices, owners
+
+
+def _str_order(boxes: Any, capacity: int) -> Any:
+    """
+    Return the Sort-Tile-Recursive order of boxes: sorted by x centre into
+    vertical slabs, each sorted by y into slices, each sorted by z, so
+    consecutive runs of `capacity` boxes are spatially compact.
+    """
+    count = len(boxes)
+    if not count:
+        return numpy.arange(0)
+    centres = (boxes[:, :3] + boxes[:, 3:]) / 2.0
+    nodes = -(-count // capacity)
+    slices = max(1, round(nodes ** (1.0 / 3.0)))
+    order = numpy.argsort(centres[:, 0], kind="stable")
+    # Slab and run sizes are whole nodes, so no node straddles two
+    slab_nodes = -(-nodes // slices)
+    slab = slab_nodes * capacity
+    run = -(-slab_nodes // slices) * capacity
+    for start in range(0, count, slab):
+        part = order[start:start + slab]
+        part = part[numpy.argsort(centres[part, 1], kind="stable")]
+        for inner in range(0, len(part), run):
+            piece = part[inner:inner + run]
+            part[inner:inner + run] = piece[
+                numpy.argsort(centres[piece, 2], kind="stable")
+            ]
+        order[start:start + slab] = part
+    return order
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class PackedRTree:
+    """
+    Packed R-Tree Class
+    ===================
+
+    An STR-packed R-tree over the bounding boxes of items identified by
+    integers, typically product primary keys.
+
+    Attributes:
+        ids (numpy.ndarray): The item identifiers, in leaf order.
+        boxes (numpy.ndarray): The `(n, 6)` item boxes, in leaf order.
+        capacity (int): The maximum number of children per node.
+        levels (list): Per level, from the leaves up, a tuple of the
+            `(m, 6)` node boxes and the `[start, end)` ranges of their
+            children in the level below (the items for the leaves).
+
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[int],
+        boxes: Any,
+        capacity: int = DEFAULT_NODE_CAPACITY,
+    ) -> None:
+        """
+        Bulk-load the tree.
+
+        Parameters:
+            ids (Sequence[int]): The item identifiers.
+            boxes (Any): The `(n, 6)` item boxes.
+            capacity (int): The maximum number of children per node, at
+                least 2.
+
+        Raises:
+            ValueError: If the boxes are not `(n, 6)` or do not match the
+                identifiers.
+        """
+        if capacity < 2:
+            raise ValueError(f"Node capacity must be at least 2: {capacity}.")
+        ids = numpy.asarray(ids, dtype=numpy.int64)
+        boxes = numpy.asarray(boxes, dtype=numpy.float64).reshape(-1, 6)
+        if len(ids) != len(boxes):
+            raise ValueError(
+                f"Got {len(ids)} identifiers for {len(boxes)} boxes."
+            )
+        order = _str_order(boxes, capacity)
+        self.ids = ids[order]
+        self.boxes = boxes[order]
+        self.capacity = capacity
+        self.levels = []
+        level = self.boxes
+        while len(level) > 1 or not self.levels:
+            starts = numpy.arange(0, len(level), capacity)
+            ends = numpy.minimum(starts + capacity, len(level))
+            nodes = numpy.empty((len(starts), 6))
+            if len(level):
+                nodes[:, :3] = numpy.minimum.reduceat(level[:, :3], starts)
+                nodes[:, 3:] = numpy.maximum.reduceat(level[:, 3:], starts)
+            # Nodes are packed in STR order too, each keeping its range
+            order = _str_order(nodes, capacity)
+            nodes, starts, ends = nodes[order], starts[order], ends[order]
+            self.levels.append((nodes, starts, ends))
+            level = nodes
+
+    def __len__(self) -> int:
+        """
+        Return the number of items.
+        """
+        return len(self.ids)
+
+    @classmethod
+    def from_products(
+        cls,
+        queryset: models.QuerySet,
+        capacity: int = DEFAULT_NODE_CAPACITY,
+    ) -> "PackedRTree":
+        """
+        Bulk-load the world bounding boxes of products, with one query.
+        Products without a bounding box are left out.
+
+        Parameters:
+            queryset (QuerySet): `IfcProductModel` rows, or rows of one of
+                its subclasses.
+            capacity (int): The maximum number of children per node.
+
+        Returns:
+            PackedRTree: The tree, identifying items by primary key.
+        """
+        rows = list(
+            queryset.filter(min_x__isnull=False)
+            .order_by()
+            .values_list("pk", *BOUNDS_FIELDS)
+        )
+        return cls(
+            [row[0] for row in rows],
+            [row[1:] for row in rows],
+            capacity,
+        )
+
+    def query(self, box: Sequence[float]) -> Any:
+        """
+        Return the items whose box intersects a box.
+
+        Parameters:
+            box (Sequence[float]): The box, or `(min_x, min_y, max_x,
+                max_y)` to ignore heights.
+
+        Returns:
+            numpy.ndarray: The identifiers of the items.
+        """
+        box = self._box(box)
+        top = len(self.levels) - 1
+        hits = numpy.flatnonzero(_overlaps(self.levels[top][0], box))
+        for level in range(top, 0, -1):
+            _, starts, ends = self.levels[level]
+            children, _ = _expand(starts[hits], ends[hits])
+            below = self.levels[level - 1][0]
+            hits = children[_overlaps(below[children], box)]
+        _, starts, ends = self.levels[0]
+        items, _ = _expand(starts[hits], ends[hits])
+        return self.ids[items[_overlaps(self.boxes[items], box)]]
+
+    def nearest(self, point: Sequence[float], k: int = 1) -> Any:
+        """
+        Return the `k` items closest to a point, by distance between the
+        point and their box, nearest first.
+
+        Parameters:
+            point (Sequence[float]): The point, `(x, y)` or `(x, y, z)`.
+            k (int): The number of items.
+
+        Returns:
+            numpy.ndarray: The identifiers of the items.
+        """
+        point = numpy.asarray(point, dtype=numpy.float64)
+        # Entries are (distance, level, index), level -1 being an item
+        top = len(self.levels) - 1
+        nodes, _, _ = self.levels[top]
+        queue = [
+            (distance, top, index)
+            for index, distance in enumerate(self._distances(nodes, point))
+        ]
+        heapq.heapify(queue)
+        found = []
+        while queue and len(found) < k:
+            _, level, index = heapq.heappop(queue)
+            if level < 0:
+                found.append(index)
+                continue
+            _, starts, ends = self.levels[level]
+            children = numpy.arange(starts[index], ends[index])
+            below = self.levels[level - 1][0] if level else self.boxes
+            for child, distance in zip(
+                children.tolist(),
+                self._distances(below[children], point).tolist(),
+            ):
+                heapq.heappush(queue, (distance, level - 1, child))
+        return self.ids[numpy.asarray(found, dtype=numpy.int64)]
+
+    def self_join(self) -> Any:
+        """
+        Return every pair of distinct items whose boxes intersect.
+
+        Returns:
+            numpy.ndarray: An `(m, 2)` array of identifier pairs, each pair
+                once.
+        """
+        # The root, if any, is paired with itself
+        top = len(self.levels) - 1
+        first = second = numpy.arange(len(self.levels[top][0]))
+        # Descend with the pairs of intersecting nodes of each level
+        for level in range(top, 0, -1):
+            nodes, starts, ends = self.levels[level]
+            first, second = self._child_pairs(
+                first, second, nodes, starts, ends, self.levels[level - 1][0],
+            )
+        nodes, starts, ends = self.levels[0]
+        pairs = []
+        counts = (ends[first] - starts[first]) * (
+            ends[second] - starts[second]
+        )
+        bounds = numpy.searchsorted(
+            numpy.cumsum(counts),
+            numpy.arange(_PAIR_CHUNK_SIZE, counts.sum(), _PAIR_CHUNK_SIZE),
+        )
+        for chunk_first, chunk_second in zip(
+            numpy.split(first, bounds), numpy.split(second, bounds),
+        ):
+            items_first, items_second = self._child_pairs(
+                chunk_first, chunk_second, nodes, starts, ends, self.boxes,
+                distinct=True,
+            )
+            pairs.append(numpy.column_stack((
+                self.ids[items_first], self.ids[items_second],
+            )))
+        if not pairs:
+            return numpy.empty((0, 2), dtype=numpy.int64)
+        return numpy.concatenate(pairs)
+
+    # Class | Helpers
+    # =========================================================================
+
+    @staticmethod
+    def _box(box: Sequence[float]) -> Any:
+        """
+        Return a query box as an array of six values.
+        """
+        box = numpy.asarray(box, dtype=numpy.float64)
+        if len(box) == 4:
+            box = numpy.array([
+                box[0], box[1], -numpy.inf, box[2], box[3], numpy.inf,
+            ])
+        if box.shape != (6,):
+            raise ValueError(f"Expected a box of 4 or 6 values: {box}.")
+        return box
+
+    @staticmethod
+    def _distances(boxes: Any, point: Any) -> Any:
+        """
+        Return the distances between a point and boxes, 0 inside them. A
+        2D point ignores heights.
+        """
+        dimensions = len(point)
+        gaps = numpy.maximum(
+            boxes[:, :dimensions] - point, 0.0,
+        ) + numpy.maximum(point - boxes[:, 3:3 + dimensions], 0.0)
+        return numpy.sqrt((gaps * gaps).sum(axis=1))
+
+    @staticmethod
+    def _child_pairs(
+        first: Any,
+        second: Any,
+        nodes: Any,
+        starts: Any,
+        ends: Any,
+        boxes: Any,
+        distinct: bool = False,
+    ) -> tuple[Any, Any]:
+        """
+        Expand pairs of nodes into the pairs of their intersecting
+        children. A node paired with itself yields each child pair once,
+        and, if `distinct` is false, each child paired with itself.
+        """
+        children_first, owners = _expand(starts[first], ends[first])
+        first, second = first[owners], second[owners]
+        # Children outside the other node cannot intersect its children
+        keep = _overlaps_pairwise(boxes[children_first], nodes[second])
+        children_first = children_first[keep]
+        first, second = first[keep], second[keep]
+        same = first == second
+        children_second, owners = _expand(starts[second], ends[second])
+        children_first, same = children_first[owners], same[owners]
+        keep = ~same | (
+            children_first < children_second if distinct
+            else children_first <= children_second
+        )
+        children_first = children_first[keep]
+        children_second = children_second[keep]
+        keep = _overlaps_pairwise(
+            boxes[children_first], boxes[children_second],
+        )
+        return children_first[keep], children_second[keep]
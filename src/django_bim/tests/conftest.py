@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Test Configuration
+=============================
+
+Sets Django up for pytest, so the `django.test.TestCase` classes of this
+package run with `python -m pytest` as well as with `django test`.
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import os
+
+# Import | Libraries
+import django
+import pytest
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_bim.tests.settings")
+django.setup()
+
+from django.test.runner import DiscoverRunner  # noqa E402
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture(scope="session", autouse=True)
+def django_test_environment():
+    """
+    Create the test databases once for the session.
+    """
+    runner = DiscoverRunner(verbosity=0, interactive=False)
+    runner.setup_test_environment()
+    old_config = runner.setup_databases()
+    yield
+    runner.teardown_databases(old_config)
+    runner.teardown_test_environment()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Test Settings
+========================
+
+Minimal settings to run the test suite against an in-memory SQLite database:
+
+    python -m pytest
+    python -m django test django_bim.tests --settings=django_bim.tests.settings
+
+"""
+
+
+# =============================================================================
+# Settings
+# =============================================================================
+
+SECRET_KEY = "django-bim-tests"
+
+INSTALLED_APPS = [
+    "django.contrib.contenttypes",
+    "django_bim",
+]
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    },
+}
+
+USE_TZ = True
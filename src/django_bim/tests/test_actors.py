@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Actor Select Tests
+=============================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+
+# Import | Libraries
+from django.contrib.contenttypes.models import ContentType
+from django.core.signals import request_started
+from django.db import models
+from django.test import TestCase
+
+# Import | Local Modules
+from .. import apps as django_bim_apps
+from ..fields.model.actor import prefetch_actors
+from ..models import (
+    IfcApprovalModel,
+    IfcOrganizationModel,
+    IfcPersonAndOrganizationModel,
+    IfcPersonModel,
+)
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+# Approvals of each kind of requesting actor
+ROWS = 5
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class ActorSelectTests(TestCase):
+    """
+    Approvals requested by persons and by persons of organizations, and
+    given by organizations.
+    """
+
+    def setUp(self):
+        organization = IfcOrganizationModel.objects.create(name="Acme")
+        for number in range(ROWS):
+            person = IfcPersonModel.objects.create(family_name=f"P{number}")
+            user = IfcPersonAndOrganizationModel.objects.create(
+                person=person,
+                organization=organization,
+            )
+            for actor in (person, user):
+                IfcApprovalModel.objects.create(
+                    name=f"Approval {number}",
+                    requesting_approval=actor,
+                    giving_approval=organization,
+                )
+
+    def test_actors_are_prefetched_per_model(self):
+        ContentType.objects.get_for_models(
+            IfcOrganizationModel,
+            IfcPersonAndOrganizationModel,
+            IfcPersonModel,
+        )
+        # The approvals, the persons and the persons of organizations of
+        # the requesting actors, and the organizations giving them
+        with self.assertNumQueries(4):
+            approvals = prefetch_actors(IfcApprovalModel.objects.all())
+            rendered = [
+                (str(approval.requesting_approval),
+                 str(approval.giving_approval))
+                for approval in approvals
+            ]
+        self.assertEqual(len(rendered), 2 * ROWS)
+        self.assertEqual(
+            {type(approval.requesting_approval) for approval in approvals},
+            {IfcPersonModel, IfcPersonAndOrganizationModel},
+        )
+
+    def test_object_ids_are_big_integers(self):
+        for name in ("requesting_approval", "giving_approval"):
+            field = IfcApprovalModel._meta.get_field(f"{name}_object_id")
+            self.assertIsInstance(field, models.PositiveBigIntegerField)
+        approval = IfcApprovalModel.objects.create(
+            name="Big",
+            requesting_approval_content_type=(
+                ContentType.objects.get_for_model(IfcPersonModel)
+            ),
+            requesting_approval_object_id=2 ** 40,
+        )
+        approval.refresh_from_db()
+        self.assertEqual(approval.requesting_approval_object_id, 2 ** 40)
+
+    def test_content_types_are_warmed_on_the_first_request_only(self):
+        request_started.connect(
+            django_bim_apps._warm_on_first_request,
+            dispatch_uid=django_bim_apps._FIRST_REQUEST_UID,
+        )
+        ContentType.objects.clear_cache()
+        with self.assertNumQueries(1):
+            request_started.send(sender=None)
+        ContentType.objects.clear_cache()
+        with self.assertNumQueries(0):
+            request_started.send(sender=None)
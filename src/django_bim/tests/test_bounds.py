@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Bounding Box Tests
+=============================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+
+# Import | Libraries
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+# Import | Local Modules
+from ..models import IfcLocalPlacementModel, IfcProductModel
+from ..models.ifc.model_ifc_product import (
+    create_spatial_index,
+    drop_spatial_index,
+)
+from .test_placement import translation
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+UNIT_CUBE = ((0.0, 0.0, 0.0), (1.0, 1.0, 1.0))
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class WorldBoundsTests(TestCase):
+    """
+    The world boxes of a unit cube placed at `a <- b`, of one placed at
+    `a`, and of a product without shape.
+    """
+
+    def setUp(self):
+        self.a = IfcLocalPlacementModel.objects.create(
+            placement_id="a",
+            relative_transform=translation(10.0, 0.0, 0.0),
+        )
+        self.b = IfcLocalPlacementModel.objects.create(
+            placement_id="b",
+            relative_placement=self.a,
+            relative_transform=translation(0.0, 5.0, 0.0),
+        )
+        self.inner = self.product("Inner", self.b, UNIT_CUBE)
+        self.outer = self.product("Outer", self.a, UNIT_CUBE)
+        self.empty = self.product("Empty", self.a, None)
+
+    def product(self, name, placement, points) -> IfcProductModel:
+        """
+        Create a product with the bounding box of some points.
+        """
+        product = IfcProductModel(name=name, object_placement=placement)
+        product.set_local_bounds(points)
+        product.save()
+        return product
+
+    def bounds(self, product: IfcProductModel) -> tuple:
+        """
+        Return the world box of a product, read back.
+        """
+        product.refresh_from_db()
+        return product.world_bounds()
+
+    def names(self, minimum, maximum) -> tuple[set[str], list[str]]:
+        """
+        Return the names of the products intersecting a box, and the SQL
+        of the query.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            names = set(
+                IfcProductModel.objects.intersecting(minimum, maximum)
+                .values_list("name", flat=True)
+            )
+        return names, [query["sql"] for query in queries.captured_queries]
+
+    def test_boxes_follow_the_placements(self):
+        self.assertEqual(
+            self.bounds(self.inner),
+            (10.0, 5.0, 0.0, 11.0, 6.0, 1.0),
+        )
+        self.assertIsNone(self.bounds(self.empty))
+
+    def test_saving_a_placement_moves_the_boxes_it_places(self):
+        self.a.relative_transform = translation(20.0, 0.0, 0.0)
+        self.a.save()
+        self.assertEqual(
+            self.bounds(self.inner),
+            (20.0, 5.0, 0.0, 21.0, 6.0, 1.0),
+        )
+        self.assertEqual(
+            self.bounds(self.outer),
+            (20.0, 0.0, 0.0, 21.0, 1.0, 1.0),
+        )
+        self.assertIsNone(self.bounds(self.empty))
+
+    def test_recomputed_transforms_move_the_boxes(self):
+        # Bulk writes leave the world transforms as they were
+        IfcLocalPlacementModel.objects.filter(pk=self.b.pk).update(
+            relative_transform=translation(0.0, 7.0, 0.0),
+        )
+        IfcLocalPlacementModel.update_world_transforms(roots=[self.b.pk])
+        self.assertEqual(
+            self.bounds(self.inner),
+            (10.0, 7.0, 0.0, 11.0, 8.0, 1.0),
+        )
+
+    def test_intersecting_goes_through_the_index(self):
+        names, queries = self.names((10.5, 5.5), (12.0, 12.0))
+        self.assertEqual(names, {"Inner"})
+        self.assertIn("_rtree", queries[-1])
+        names, _queries = self.names((10.5, 0.5, 2.0), (12.0, 12.0, 3.0))
+        self.assertEqual(names, set())
+
+    def test_intersecting_compares_the_columns_without_the_index(self):
+        drop_spatial_index()
+        self.addCleanup(create_spatial_index)
+        names, queries = self.names((10.5, 0.5), (10.6, 5.5))
+        self.assertEqual(names, {"Inner", "Outer"})
+        self.assertNotIn("_rtree", queries[-1])
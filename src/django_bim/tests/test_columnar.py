@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Columnar Export Tests
+================================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+# Import | Libraries
+from django.core.management import call_command
+from django.test import TestCase
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+# Import | Local Modules
+from ..models import (
+    IfcGridModel,
+    IfcLocalPlacementModel,
+    IfcProductModel,
+    IfcProjectModel,
+)
+from ..utils.matrix import IDENTITY
+from .test_step_import import SMALL_IFC
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+@unittest.skipIf(pyarrow is None, "PyArrow is not installed.")
+class ColumnarExportTests(TestCase):
+    """
+    The Arrow schemas of the IFC tables and the files written from the
+    project of `small.ifc` with a grid and a proxy in it.
+    """
+
+    def setUp(self):
+        call_command("bim_import", SMALL_IFC, stdout=io.StringIO())
+        self.project = IfcProjectModel.objects.get()
+        self.grid = IfcGridModel.objects.create(
+            name="Grid",
+            project=self.project,
+        )
+        self.proxy = IfcProductModel.objects.create(
+            name="Proxy",
+            container=self.grid,
+            object_placement=IfcLocalPlacementModel.objects.first(),
+        )
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_schemas_follow_the_fields(self):
+        from ..io.columnar import ColumnarTable, columnar_models
+
+        for model in columnar_models():
+            table = ColumnarTable(model)
+            self.assertEqual(
+                table.schema.names,
+                [column.name for column in table.columns],
+            )
+            self.assertEqual(
+                table.schema.metadata[b"django_bim.table"].decode(),
+                model._meta.db_table,
+            )
+            self.assertFalse(
+                table.schema.field(model._meta.pk.attname).nullable,
+            )
+
+    def test_rooted_foreign_keys_are_followed_by_global_ids(self):
+        from ..io.columnar import ColumnarTable
+
+        schema = ColumnarTable(IfcProductModel).schema
+        names = schema.names
+        self.assertEqual(
+            names[names.index("project_id") + 1],
+            "project_global_id",
+        )
+        self.assertEqual(
+            schema.field("container_global_id").type,
+            pyarrow.string(),
+        )
+        self.assertEqual(
+            ColumnarTable(IfcLocalPlacementModel).schema
+            .field("world_transform").type,
+            pyarrow.list_(pyarrow.float64(), 16),
+        )
+
+    def test_parquet_and_arrow_files(self):
+        import pyarrow.ipc
+        import pyarrow.parquet
+
+        from ..io.columnar import ARROW, PARQUET, export_columnar
+
+        for file_format, read in (
+            (PARQUET, pyarrow.parquet.read_table),
+            (ARROW, lambda path: pyarrow.ipc.open_file(path).read_all()),
+        ):
+            path = os.path.join(self.directory, f"products.{file_format}")
+            self.assertEqual(
+                export_columnar(IfcProductModel, path, file_format),
+                2,
+            )
+            rows = {
+                row["name"]: row for row in read(path).to_pylist()
+            }
+            self.assertEqual(
+                rows["Grid"]["project_global_id"],
+                self.project.global_id,
+            )
+            self.assertEqual(
+                rows["Proxy"]["container_global_id"],
+                self.grid.global_id,
+            )
+
+    def test_every_table_is_written(self):
+        import pyarrow.ipc
+
+        from ..io.columnar import ARROW, columnar_models, export_columnar
+
+        for model in columnar_models():
+            path = os.path.join(
+                self.directory, f"{model._meta.db_table}.{ARROW}",
+            )
+            rows = export_columnar(model, path, ARROW, batch_size=2)
+            self.assertEqual(
+                rows,
+                model._base_manager.count(),
+                model._meta.label,
+            )
+        placements = pyarrow.ipc.open_file(os.path.join(
+            self.directory,
+            f"{IfcLocalPlacementModel._meta.db_table}.{ARROW}",
+        )).read_all()
+        self.assertIn(
+            list(IDENTITY),
+            placements.column("world_transform").to_pylist(),
+        )
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Digest Tests
+=======================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import io
+
+# Import | Libraries
+from django.core.management import call_command
+from django.test import TestCase
+
+# Import | Local Modules
+from ..models import (
+    IfcGridModel,
+    IfcLocalPlacementModel,
+    IfcProductModel,
+    IfcProjectModel,
+    IfcSIUnitModel,
+)
+from ..models.ifc.model_ifc_product import rebuild_rollups
+from .test_step_import import SMALL_IFC
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class DigestTests(TestCase):
+    """
+    The digests and rollups of the project of `small.ifc` with two grids
+    and a proxy in the first one.
+    """
+
+    def setUp(self):
+        call_command("bim_import", SMALL_IFC, stdout=io.StringIO())
+        self.project = IfcProjectModel.objects.get()
+        self.first = IfcGridModel.objects.create(
+            name="First",
+            project=self.project,
+        )
+        self.second = IfcGridModel.objects.create(
+            name="Second",
+            project=self.project,
+        )
+        self.proxy = IfcProductModel.objects.create(
+            name="Proxy",
+            container=self.first,
+        )
+
+    def rollup(self) -> str:
+        """
+        Return the stored rollup of the project.
+        """
+        self.project.refresh_from_db()
+        return self.project.rollup_digest
+
+    def test_digest_follows_the_attributes(self):
+        digest = self.proxy.digest
+        self.proxy.description = "Changed"
+        self.proxy.save()
+        self.assertNotEqual(self.proxy.digest, digest)
+        self.proxy.description = None
+        self.proxy.save()
+        self.assertEqual(self.proxy.digest, digest)
+
+    def test_moving_a_product_changes_the_rollup(self):
+        rollup = self.rollup()
+        self.proxy.container = self.second
+        self.proxy.save()
+        self.assertNotEqual(self.rollup(), rollup)
+        self.proxy.container = self.first
+        self.proxy.save()
+        self.assertEqual(self.rollup(), rollup)
+
+    def test_deleting_a_product_restores_the_rollup(self):
+        rollup = self.rollup()
+        added = IfcProductModel.objects.create(
+            name="Added",
+            container=self.second,
+        )
+        self.assertNotEqual(self.rollup(), rollup)
+        added.delete()
+        self.assertEqual(self.rollup(), rollup)
+
+    def test_incremental_rollups_match_a_rebuild(self):
+        self.proxy.container = self.second
+        self.proxy.name = "Moved"
+        self.proxy.save()
+        rollup = self.rollup()
+        rollups = dict(
+            IfcProductModel.objects.values_list("pk", "rollup_digest"),
+        )
+        IfcProductModel.objects.update(rollup_digest=None)
+        IfcProjectModel.objects.update(rollup_digest=None)
+        rebuild_rollups()
+        self.assertEqual(self.rollup(), rollup)
+        self.assertEqual(
+            dict(IfcProductModel.objects.values_list("pk", "rollup_digest")),
+            rollups,
+        )
+
+    def test_update_digests_after_bulk_updates(self):
+        rollup = self.rollup()
+        IfcProductModel.objects.filter(pk=self.proxy.pk).update(
+            name="Renamed",
+        )
+        self.assertEqual(self.rollup(), rollup)
+        self.assertEqual(
+            IfcProductModel.objects.filter(pk=self.proxy.pk)
+            .update_digests(),
+            1,
+        )
+        self.assertNotEqual(self.rollup(), rollup)
+
+    def test_moving_a_parent_placement_changes_the_digests(self):
+        parent = IfcLocalPlacementModel.objects.create(placement_id="parent")
+        child = IfcLocalPlacementModel.objects.create(
+            placement_id="child",
+            relative_placement=parent,
+        )
+        self.proxy.object_placement = child
+        self.proxy.save()
+        digest, rollup = self.proxy.digest, self.rollup()
+        parent.relative_transform = (
+            1.0, 0.0, 0.0, 5.0,
+            0.0, 1.0, 0.0, 0.0,
+            0.0, 0.0, 1.0, 0.0,
+            0.0, 0.0, 0.0, 1.0,
+        )
+        parent.save()
+        self.proxy.refresh_from_db()
+        self.assertNotEqual(self.proxy.digest, digest)
+        self.assertNotEqual(self.rollup(), rollup)
+        parent.relative_transform = IfcLocalPlacementModel().relative_transform
+        parent.save()
+        self.proxy.refresh_from_db()
+        self.assertEqual(self.proxy.digest, digest)
+        self.assertEqual(self.rollup(), rollup)
+
+    def test_project_digest_follows_the_units(self):
+        digest = self.project.digest
+        IfcSIUnitModel.objects.update(prefix="CENTI")
+        IfcProjectModel.objects.update_digests()
+        self.project.refresh_from_db()
+        self.assertNotEqual(self.project.digest, digest)
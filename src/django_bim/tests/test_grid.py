@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Grid Tests
+=====================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Libraries
+from django.test import TestCase
+
+# Import | Local Modules
+from ..models import (
+    IfcGridAxisModel,
+    IfcGridIntersectionModel,
+    IfcGridModel,
+    IfcGridPlacementModel,
+    IfcLine,
+)
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def make_axis(tag: str, start: tuple, end: tuple) -> IfcGridAxisModel:
+    """
+    Create an axis along a new 2D line.
+    """
+    line = IfcLine()
+    line.set_points(start, end)
+    line.save()
+    return IfcGridAxisModel.objects.create(axis_tag=tag, axis_curve=line)
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class GridIntersectionTests(TestCase):
+    """
+    The intersections of a grid follow its axes and their lines.
+    """
+
+    def setUp(self):
+        self.grid = IfcGridModel.objects.create(name="Grid")
+        self.a = make_axis("A", (0.0, -10.0), (0.0, 10.0))
+        self.b = make_axis("B", (5.0, -10.0), (5.0, 10.0))
+        self.one = make_axis("1", (-10.0, 2.0), (10.0, 2.0))
+        self.grid.u_axes.add(self.a, self.b)
+        self.grid.v_axes.add(self.one)
+
+    def test_axes_are_intersected(self):
+        self.assertEqual(self.grid.intersections.count(), 2)
+        self.assertEqual(
+            IfcGridIntersectionModel.objects.locate(self.grid, "B", "1"),
+            (5.0, 2.0),
+        )
+        self.assertEqual(
+            IfcGridIntersectionModel.objects.locate(self.grid, "A1"),
+            (0.0, 2.0),
+        )
+
+    def test_axis_counts_are_maintained(self):
+        self.grid.refresh_from_db()
+        self.assertEqual(self.grid.u_axis_count, 2)
+        self.assertEqual(self.grid.v_axis_count, 1)
+        self.assertEqual(self.grid.dimensions, 2)
+
+    def test_parallel_axes_do_not_intersect(self):
+        parallel = make_axis("2", (-10.0, 4.0), (10.0, 4.0))
+        self.grid.u_axes.add(parallel)
+        self.assertIsNone(
+            IfcGridIntersectionModel.objects.locate(self.grid, "2", "1")
+        )
+
+    def test_moving_a_line_moves_its_intersections(self):
+        line = self.one.axis_curve
+        line.set_points((-10.0, 3.0), (10.0, 3.0))
+        line.save()
+        self.assertEqual(
+            IfcGridIntersectionModel.objects.locate(self.grid, "B1"),
+            (5.0, 3.0),
+        )
+
+    def test_removing_an_axis_removes_its_intersections(self):
+        self.grid.u_axes.remove(self.b)
+        self.assertEqual(
+            list(self.grid.intersections.values_list("label", flat=True)),
+            ["A1"],
+        )
+
+    def test_grid_placement_location(self):
+        placement = IfcGridPlacementModel.objects.create(
+            placement_id="placement",
+            grid=self.grid,
+            placement_location="B1",
+        )
+        self.assertEqual(placement.location(), (5.0, 2.0))
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM GUID Tests
+=====================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import uuid
+from unittest import mock
+
+# Import | Libraries
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+
+# Import | Local Modules
+from ..fields.model import IfcGloballyUniqueIdField, trusted_guids
+from ..models import IfcProductModel
+from ..utils import validate_ifc_guid
+from ..utils.guid import (
+    from_uuid,
+    new,
+    new_default,
+    new_many,
+    to_uuid,
+    validate_many,
+)
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+UUID = uuid.UUID("6ba7b810-9dad-41d1-80b4-00c04fd430c8")
+
+GUID = from_uuid(UUID)
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class BinaryGuidFieldTests(SimpleTestCase):
+    """
+    The binary storage mode of `IfcGloballyUniqueIdField`.
+    """
+
+    def test_values_round_trip_as_16_bytes(self):
+        field = IfcGloballyUniqueIdField(binary=True)
+        stored = field.get_db_prep_value(GUID, connection)
+        self.assertEqual(stored, UUID.bytes)
+        self.assertEqual(
+            field.from_db_value(stored, None, connection),
+            GUID,
+        )
+        # PostgreSQL returns `uuid.UUID` values
+        self.assertEqual(field.from_db_value(UUID, None, connection), GUID)
+        self.assertIsNone(field.from_db_value(None, None, connection))
+
+    def test_text_mode_stores_the_guid(self):
+        field = IfcGloballyUniqueIdField(binary=False)
+        self.assertEqual(field.get_db_prep_value(GUID, connection), GUID)
+        self.assertEqual(field.db_type(connection), "varchar(22)")
+
+    def test_column_types(self):
+        field = IfcGloballyUniqueIdField(binary=True)
+        self.assertEqual(field.db_type(connection), "blob")
+        for vendor, db_type in (
+            ("postgresql", "uuid"),
+            ("mysql", "binary(16)"),
+        ):
+            with self.subTest(vendor=vendor):
+                other = type("Connection", (), {"vendor": vendor})()
+                self.assertEqual(field.db_type(other), db_type)
+
+    def test_invalid_values_are_rejected(self):
+        field = IfcGloballyUniqueIdField(binary=True)
+        with self.assertRaises(ValidationError):
+            field.get_db_prep_value("not a guid", connection)
+
+    def test_deconstruct_keeps_the_storage_mode(self):
+        for binary in (False, True):
+            with self.subTest(binary=binary):
+                field = IfcGloballyUniqueIdField(binary=binary)
+                _name, path, args, kwargs = field.deconstruct()
+                self.assertEqual(
+                    path,
+                    "django_bim.fields.model.field_model_ifc_guid."
+                    "IfcGloballyUniqueIdField",
+                )
+                self.assertEqual(kwargs["binary"], binary)
+                for option in ("max_length", "unique", "validators"):
+                    self.assertNotIn(option, kwargs)
+                rebuilt = IfcGloballyUniqueIdField(*args, **kwargs)
+                self.assertEqual(rebuilt.binary, binary)
+                self.assertTrue(rebuilt.unique)
+                self.assertEqual(rebuilt.max_length, 22)
+
+    @override_settings(DJANGO_BIM_BINARY_GUIDS=True)
+    def test_setting_selects_the_binary_mode(self):
+        self.assertTrue(IfcGloballyUniqueIdField().binary)
+        self.assertFalse(IfcGloballyUniqueIdField(binary=False).binary)
+
+
+class GuidCodecTests(SimpleTestCase):
+    """
+    The table-driven GUID codec of `django_bim.utils.guid`.
+    """
+
+    def test_known_values(self):
+        self.assertEqual(from_uuid(uuid.UUID(int=0)), "0" * 22)
+        largest = "3" + "$" * 21
+        self.assertEqual(from_uuid(uuid.UUID(int=2 ** 128 - 1)), largest)
+        self.assertEqual(to_uuid(largest).int, 2 ** 128 - 1)
+
+    def test_uuids_round_trip(self):
+        for value in (UUID, *(uuid.uuid4() for _ in range(100))):
+            guid = from_uuid(value)
+            validate_ifc_guid(guid)
+            self.assertEqual(to_uuid(guid), value)
+
+    def test_invalid_guids_are_rejected(self):
+        for guid in ("0" * 21, "0" * 23, "0" * 21 + "-", "4" + "0" * 21):
+            with self.subTest(guid=guid):
+                with self.assertRaises(ValueError):
+                    to_uuid(guid)
+
+    def test_new_guids_encode_version_4_uuids(self):
+        guids = [new(), new_default(), *new_many(1000)]
+        self.assertEqual(len(set(guids)), len(guids))
+        validate_many(guids)
+        for guid in guids:
+            value = to_uuid(guid)
+            self.assertEqual(value.version, 4)
+            self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_validate_many_reports_the_invalid_value(self):
+        validate_many([])
+        validate_many(iter([GUID, "0" * 22]))
+        for values in (
+            [GUID, "short"],
+            [GUID, GUID[:11] + "\n" + GUID[12:]],
+            [GUID, None],
+            ["4" + "0" * 21],
+        ):
+            with self.subTest(values=values):
+                with self.assertRaises(ValidationError) as raised:
+                    validate_many(values)
+                self.assertEqual(
+                    raised.exception.params["value"],
+                    values[-1],
+                )
+
+
+class TrustedGuidTests(TestCase):
+    """
+    The per-value validation of `IfcGloballyUniqueIdField`, skipped inside
+    `trusted_guids()`.
+    """
+
+    def setUp(self):
+        self.field = IfcProductModel._meta.get_field("global_id")
+
+    def test_values_are_validated_by_default(self):
+        with self.assertRaises(ValidationError):
+            self.field.get_prep_value("not a guid")
+        with self.assertRaises(ValidationError):
+            self.field.to_python("not a guid")
+
+    def test_trusted_values_skip_the_validation(self):
+        with mock.patch(
+            "django_bim.fields.model.field_model_ifc_guid.validate_ifc_guid",
+        ) as validate:
+            with trusted_guids():
+                IfcProductModel.objects.bulk_create([
+                    IfcProductModel(name=f"Product {number}")
+                    for number in range(3)
+                ])
+                guids = list(
+                    IfcProductModel.objects.values_list("global_id", flat=True)
+                )
+                found = IfcProductModel.objects.filter(global_id__in=guids)
+            self.assertEqual(found.count(), 3)
+            validate.assert_not_called()
+            self.field.get_prep_value(guids[0])
+            validate.assert_called_once_with(guids[0])
+
+    def test_full_clean_stays_strict(self):
+        project = IfcProductModel(global_id="not a guid", name="Product")
+        with trusted_guids():
+            self.assertEqual(
+                self.field.get_prep_value("not a guid"),
+                "not a guid",
+            )
+            with self.assertRaises(ValidationError) as raised:
+                project.full_clean()
+        self.assertIn("global_id", raised.exception.message_dict)
+
+    def test_the_block_is_left_on_errors(self):
+        with self.assertRaises(RuntimeError):
+            with trusted_guids():
+                raise RuntimeError
+        with self.assertRaises(ValidationError):
+            self.field.get_prep_value("not a guid")
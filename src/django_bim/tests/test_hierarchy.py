@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Placement Hierarchy Tests
+====================================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import io
+
+# Import | Libraries
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+# Import | Local Modules
+from ..models import IfcLocalPlacementClosureModel, IfcLocalPlacementModel
+from .test_placement import translation
+from .test_step_import import PRODUCTS_IFC
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class PlacementHierarchyTests(TestCase):
+    """
+    The hierarchy queries on the trees `a <- b <- c`, `a <- d` and `e`.
+    """
+
+    def setUp(self):
+        self.placements = {}
+        for placement_id, parent in (
+            ("a", None),
+            ("b", "a"),
+            ("c", "b"),
+            ("d", "a"),
+            ("e", None),
+        ):
+            self.placements[placement_id] = (
+                IfcLocalPlacementModel.objects.create(
+                    placement_id=placement_id,
+                    relative_placement=self.placements.get(parent),
+                    relative_transform=translation(1.0, 0.0, 0.0),
+                )
+            )
+
+    def ids(self, placements) -> set[str]:
+        """
+        Return the placement ids of a queryset.
+        """
+        return set(placements.values_list("placement_id", flat=True))
+
+    def test_descendants(self):
+        placements = IfcLocalPlacementModel.objects
+        a, b = self.placements["a"], self.placements["b"]
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                self.ids(placements.descendants_of(a)),
+                {"b", "c", "d"},
+            )
+        self.assertEqual(
+            self.ids(placements.descendants_of(b.pk, include_self=True)),
+            {"b", "c"},
+        )
+        self.assertEqual(self.ids(placements.descendants_of(b.pk)), {"c"})
+        self.assertEqual(
+            self.ids(placements.descendants_of(self.placements["e"])),
+            set(),
+        )
+
+    def test_ancestors(self):
+        placements = IfcLocalPlacementModel.objects
+        c = self.placements["c"]
+        with self.assertNumQueries(1):
+            self.assertEqual(self.ids(placements.ancestors_of(c)), {"a", "b"})
+        self.assertEqual(
+            self.ids(placements.ancestors_of(c.pk, include_self=True)),
+            {"a", "b", "c"},
+        )
+        self.assertEqual(
+            self.ids(placements.ancestors_of(self.placements["a"])),
+            set(),
+        )
+
+    def test_depth(self):
+        depths = {
+            placement_id: IfcLocalPlacementModel.objects.depth(placement)
+            for placement_id, placement in self.placements.items()
+        }
+        self.assertEqual(depths, {"a": 0, "b": 1, "c": 2, "d": 1, "e": 0})
+
+    def test_querysets_are_chainable(self):
+        a = self.placements["a"]
+        self.assertEqual(
+            self.ids(
+                IfcLocalPlacementModel.objects.exclude(placement_id="c")
+                .descendants_of(a).order_by("placement_id")
+            ),
+            {"b", "d"},
+        )
+        self.assertEqual(
+            self.ids(
+                IfcLocalPlacementModel.objects
+                .filter(placement_id__in=["c", "e"]).with_ancestors()
+            ),
+            {"a", "b", "c", "e"},
+        )
+
+
+class PlacementCycleTests(TestCase):
+    """
+    The hierarchy queries on the corrupt cycle `a <- b <- a`.
+    """
+
+    def setUp(self):
+        self.a = IfcLocalPlacementModel.objects.create(placement_id="a")
+        self.b = IfcLocalPlacementModel.objects.create(
+            placement_id="b",
+            relative_placement=self.a,
+        )
+        # As left behind by a corrupt import
+        IfcLocalPlacementModel.objects.filter(pk=self.a.pk).update(
+            relative_placement=self.b,
+        )
+
+    def test_recursion_stops_on_cycles(self):
+        placements = IfcLocalPlacementModel.objects
+        self.assertEqual(
+            set(placements.descendants_of(self.a)),
+            {self.a, self.b},
+        )
+        self.assertEqual(
+            set(placements.ancestors_of(self.b)),
+            {self.a, self.b},
+        )
+        self.assertEqual(placements.depth(self.a), 2)
+
+
+@override_settings(DJANGO_BIM_PLACEMENT_CLOSURE=True)
+class ClosureHierarchyTests(PlacementHierarchyTests):
+    """
+    The hierarchy queries, answered by the closure table.
+    """
+
+    def test_queries_join_the_closure_table(self):
+        table = IfcLocalPlacementClosureModel._meta.db_table
+        with CaptureQueriesContext(connection) as queries:
+            self.ids(IfcLocalPlacementModel.objects.descendants_of(
+                self.placements["a"],
+            ))
+        (query,) = queries.captured_queries
+        self.assertIn(table, query["sql"])
+        self.assertNotIn("RECURSIVE", query["sql"])
+
+
+@override_settings(DJANGO_BIM_PLACEMENT_CLOSURE=True)
+class ClosureTableTests(TestCase):
+    """
+    The closure table of the trees `a <- b <- c`, `a <- d` and `e`, kept up
+    to date as placements are saved.
+    """
+
+    def setUp(self):
+        self.placements = {}
+        for placement_id, parent in (
+            ("a", None),
+            ("b", "a"),
+            ("c", "b"),
+            ("d", "a"),
+            ("e", None),
+        ):
+            self.placements[placement_id] = (
+                IfcLocalPlacementModel.objects.create(
+                    placement_id=placement_id,
+                    relative_placement=self.placements.get(parent),
+                )
+            )
+
+    def rows(self) -> set[tuple[str, str, int]]:
+        """
+        Return the closure rows as placement ids and depths.
+        """
+        return set(IfcLocalPlacementClosureModel.objects.values_list(
+            "ancestor__placement_id",
+            "descendant__placement_id",
+            "depth",
+        ))
+
+    def test_new_placements_are_linked_to_their_ancestors(self):
+        self.assertEqual(self.rows(), {
+            ("a", "a", 0), ("b", "b", 0), ("c", "c", 0), ("d", "d", 0),
+            ("e", "e", 0),
+            ("a", "b", 1), ("b", "c", 1), ("a", "c", 2), ("a", "d", 1),
+        })
+
+    def test_moved_subtrees_follow_their_placement(self):
+        b = self.placements["b"]
+        b.relative_placement = self.placements["e"]
+        b.save()
+        self.assertEqual(self.rows(), {
+            ("a", "a", 0), ("b", "b", 0), ("c", "c", 0), ("d", "d", 0),
+            ("e", "e", 0),
+            ("e", "b", 1), ("b", "c", 1), ("e", "c", 2), ("a", "d", 1),
+        })
+        b.relative_placement = None
+        b.save()
+        self.assertEqual(
+            IfcLocalPlacementModel.objects.depth(self.placements["c"]),
+            1,
+        )
+
+    def test_other_saves_keep_the_rows(self):
+        rows = self.rows()
+        c = self.placements["c"]
+        c.relative_transform = translation(1.0, 0.0, 0.0)
+        with CaptureQueriesContext(connection) as queries:
+            c.save()
+        self.assertEqual(self.rows(), rows)
+        self.assertFalse(any(
+            "DELETE" in query["sql"] for query in queries.captured_queries
+        ))
+
+    def test_cycles_are_refused(self):
+        a = self.placements["a"]
+        a.relative_placement = self.placements["c"]
+        with self.assertRaises(ValueError):
+            a.save()
+        a.refresh_from_db()
+        self.assertIsNone(a.relative_placement)
+
+    def test_command_rebuilds_the_table(self):
+        rows = self.rows()
+        IfcLocalPlacementClosureModel.objects.all().delete()
+        stdout = io.StringIO()
+        call_command("bim_placement_closure", stdout=stdout)
+        self.assertIn("Rebuilt 9 closure rows", stdout.getvalue())
+        self.assertEqual(self.rows(), rows)
+
+    @override_settings(DJANGO_BIM_PLACEMENT_CLOSURE=False)
+    def test_command_warns_when_the_table_is_disabled(self):
+        stdout = io.StringIO()
+        call_command("bim_placement_closure", stdout=stdout)
+        self.assertIn(
+            "DJANGO_BIM_PLACEMENT_CLOSURE is disabled",
+            stdout.getvalue(),
+        )
+
+    def test_imported_placements_are_linked(self):
+        IfcLocalPlacementModel.objects.all().delete()
+        call_command("bim_import", PRODUCTS_IFC, stdout=io.StringIO())
+        root = IfcLocalPlacementModel.objects.get(relative_placement=None)
+        child = IfcLocalPlacementModel.objects.get(relative_placement=root)
+        self.assertEqual(
+            set(IfcLocalPlacementClosureModel.objects.values_list(
+                "ancestor", "descendant", "depth",
+            )),
+            {
+                (root.pk, root.pk, 0),
+                (child.pk, child.pk, 0),
+                (root.pk, child.pk, 1),
+            },
+        )
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM ifcJSON Tests
+========================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import io
+import json
+import os
+import shutil
+import tempfile
+
+# Import | Libraries
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+# Import | Local Modules
+from ..io.ifcjson import (
+    export_ifcjson,
+    export_ifcjson_response,
+    import_ifcjson,
+)
+from ..io.step import export_project_response
+from ..models import (
+    IfcCartesianPointListModel,
+    IfcGridModel,
+    IfcIndexedPolyCurveModel,
+    IfcProductModel,
+    IfcProjectModel,
+    IfcTriangulatedFaceSetModel,
+)
+from .test_step_import import INDEXED_IFC, SMALL_IFC
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class IfcJsonTests(TestCase):
+    """
+    The ifcJSON export and import of the project of `small.ifc`.
+    """
+
+    def setUp(self):
+        call_command("bim_import", SMALL_IFC, stdout=io.StringIO())
+        self.project = IfcProjectModel.objects.get()
+
+    def export(self) -> list[dict]:
+        """
+        Export the project as newline-delimited JSON and return its
+        entities.
+        """
+        stream = io.StringIO()
+        export_ifcjson(self.project, stream, lines=True)
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    def add_products(self, count: int) -> IfcGridModel:
+        """
+        Add a grid with `count` products in it to the project.
+        """
+        grid = IfcGridModel.objects.create(name="Grid", project=self.project)
+        for number in range(count):
+            IfcProductModel.objects.create(
+                name=f"Proxy {number}",
+                container=grid,
+            )
+        return grid
+
+    def test_export_then_import_gives_an_equal_rollup(self):
+        rollup_digest = self.project.rollup_digest
+        self.assertTrue(rollup_digest)
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "small.json")
+        with open(path, "w", encoding="utf-8") as stream:
+            export_ifcjson(self.project, stream)
+        global_id = self.project.global_id
+        self.project.delete()
+        import_ifcjson(path)
+        project = IfcProjectModel.objects.get()
+        self.assertEqual(project.global_id, global_id)
+        self.assertEqual(project.rollup_digest, rollup_digest)
+
+    def test_rooted_references_use_global_ids(self):
+        grid = self.add_products(2)
+        relating = {
+            entity["relatingObject"]["ref"]
+            for entity in self.export()
+            if entity["type"] == "IfcRelAggregates"
+        }
+        self.assertEqual(relating, {self.project.global_id, grid.global_id})
+
+    def test_rooted_references_are_joined(self):
+        self.add_products(1)
+        with CaptureQueriesContext(connection) as few:
+            self.export()
+        self.add_products(20)
+        with CaptureQueriesContext(connection) as many:
+            self.export()
+        self.assertEqual(len(many), len(few))
+
+    def test_download_names_are_escaped(self):
+        for response in (
+            export_ifcjson_response(self.project, filename='a "b".json'),
+            export_project_response(self.project, filename='a "b".ifc'),
+        ):
+            self.assertRegex(
+                response["Content-Disposition"],
+                r'^attachment; filename="a \\"b\\"\.\w+"$',
+            )
+
+
+class IndexedGeometryIfcJsonTests(TestCase):
+    """
+    The ifcJSON export and import of the indexed geometry of
+    `indexed.ifc`.
+    """
+
+    def test_segments_and_triangles_round_trip(self):
+        call_command("bim_import", INDEXED_IFC, stdout=io.StringIO())
+        project = IfcProjectModel.objects.get()
+        stream = io.StringIO()
+        export_ifcjson(project, stream, lines=True)
+        entities = {
+            entity["type"]: entity
+            for entity in map(json.loads, stream.getvalue().splitlines())
+        }
+        self.assertEqual(
+            entities["IfcIndexedPolyCurve"]["segments"][1],
+            {"type": "IfcArcIndex", "value": [3, 4, 5]},
+        )
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "indexed.json")
+        with open(path, "w", encoding="utf-8") as target:
+            target.write(stream.getvalue())
+        project.delete()
+        IfcCartesianPointListModel.objects.all().delete()
+        import_ifcjson(path)
+        self.assertEqual(
+            IfcIndexedPolyCurveModel.objects.get().segment_indices(),
+            [("LINE", [1, 2, 3]), ("ARC", [3, 4, 5]), ("LINE", [5, 1])],
+        )
+        self.assertEqual(
+            IfcTriangulatedFaceSetModel.objects.get().triangles(),
+            [(1, 2, 3), (1, 3, 4)],
+        )
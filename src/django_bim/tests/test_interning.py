@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Interning Tests
+==========================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import datetime
+import io
+import os
+import shutil
+import tempfile
+
+# Import | Libraries
+from django.core.management import call_command
+from django.test import TestCase
+
+# Import | Local Modules
+from ..io.step import StepRowInterner
+from ..models import IfcOwnerHistoryModel, IfcProductModel
+from .test_step_import import PRODUCTS_IFC
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+# 2023-11-14T22:13:20Z
+EPOCH = 1700000000
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class StepRowInternerTests(TestCase):
+    """
+    Owner histories interned by their change action and creation date.
+    """
+
+    def setUp(self):
+        self.interner = StepRowInterner(
+            IfcOwnerHistoryModel,
+            ("change_action", "creation_date"),
+        )
+
+    def history(self, action: str, date=EPOCH) -> IfcOwnerHistoryModel:
+        """
+        Return an unsaved owner history.
+        """
+        return IfcOwnerHistoryModel(
+            change_action=action,
+            creation_date=date,
+            last_modified_date=date,
+        )
+
+    def test_keys_use_the_prepared_values(self):
+        moment = datetime.datetime.fromtimestamp(
+            EPOCH,
+            tz=datetime.timezone.utc,
+        )
+        key = self.interner.key(self.history("ADDED"))
+        self.assertEqual(len(key), 32)
+        self.assertEqual(self.interner.key(self.history("ADDED", moment)), key)
+        self.assertNotEqual(self.interner.key(self.history("MODIFIED")), key)
+
+    def test_identical_rows_are_created_once(self):
+        histories = [
+            self.history(action)
+            for action in ("ADDED", "MODIFIED", "ADDED", "ADDED")
+        ]
+        pks = self.interner.intern(histories)
+        self.assertEqual(IfcOwnerHistoryModel.objects.count(), 2)
+        self.assertEqual(pks[0], pks[2])
+        self.assertEqual(pks[0], pks[3])
+        self.assertNotEqual(pks[0], pks[1])
+        self.assertEqual([history.pk for history in histories], pks)
+        self.assertEqual((self.interner.created, self.interner.reused), (2, 2))
+
+    def test_later_batches_reuse_the_cached_rows(self):
+        (added,) = self.interner.intern([self.history("ADDED")])
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                self.interner.intern([self.history("ADDED")]),
+                [added],
+            )
+        self.assertEqual((self.interner.created, self.interner.reused), (1, 1))
+
+    def test_evicted_keys_are_looked_up(self):
+        interner = StepRowInterner(
+            IfcOwnerHistoryModel,
+            ("change_action", "creation_date"),
+            cache_size=1,
+        )
+        (added,) = interner.intern([self.history("ADDED")])
+        interner.intern([self.history("MODIFIED")])
+        with self.assertNumQueries(1):
+            self.assertEqual(interner.intern([self.history("ADDED")]), [added])
+        # Rows created by another interner, e.g. an earlier import
+        self.assertEqual(
+            self.interner.intern([self.history("ADDED")]),
+            [added],
+        )
+        self.assertEqual(IfcOwnerHistoryModel.objects.count(), 2)
+
+
+class OwnerHistoryImportTests(TestCase):
+    """
+    The owner histories of `products.ifc`: one for the added entities and
+    one for the modified wall.
+    """
+
+    def test_identical_owner_histories_share_a_row(self):
+        call_command("bim_import", PRODUCTS_IFC, stdout=io.StringIO())
+        histories = IfcOwnerHistoryModel.objects.all()
+        self.assertEqual(
+            sorted(history.change_action for history in histories),
+            ["ADDED", "MODIFIED"],
+        )
+        self.assertTrue(all(history.interning_key for history in histories))
+        added = IfcOwnerHistoryModel.objects.get(change_action="ADDED")
+        self.assertEqual(
+            set(
+                IfcProductModel.objects.exclude(name="Wall")
+                .values_list("owner_history", flat=True)
+            ),
+            {added.pk},
+        )
+
+    def test_duplicate_owner_histories_are_merged(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "products.ifc")
+        with open(PRODUCTS_IFC, encoding="ascii") as source:
+            text = source.read()
+        # The wall gets its own copy of the owner history of the others
+        with open(path, "w", encoding="ascii") as target:
+            target.write(text.replace(
+                "#16=IFCOWNERHISTORY(#3,#4,$,.MODIFIED.,1700000500,",
+                "#16=IFCOWNERHISTORY(#3,#4,$,.ADDED.,1700000000,",
+            ))
+        stdout = io.StringIO()
+        call_command("bim_import", path, stdout=stdout)
+        self.assertIn(
+            "django_bim.IfcOwnerHistoryModel: 1\n",
+            stdout.getvalue(),
+        )
+        history = IfcOwnerHistoryModel.objects.get()
+        self.assertEqual(
+            set(IfcProductModel.objects.values_list(
+                "owner_history",
+                flat=True,
+            )),
+            {history.pk},
+        )
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Line Tests
+=====================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import io
+
+# Import | Libraries
+from django.core.management import call_command
+from django.test import TestCase
+
+# Import | Local Modules
+from ..models import IfcLine
+from ..models.ifc.geometry.model_ifc_geometry_curve_line import line_extent
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class LineColumnTests(TestCase):
+    """
+    The typed end point columns of a 3D line and a 2D line, and the extent
+    derived from them.
+    """
+
+    def setUp(self):
+        self.line = IfcLine()
+        self.line.set_points((3.0, 4.0, 0.0), (0.0, 0.0, 12.0))
+        self.line.save()
+        self.flat_line = IfcLine()
+        self.flat_line.set_points((0.0, 10.0), (5.0, 10.0))
+        self.flat_line.save()
+
+    def intersecting(self, minimum, maximum) -> set[int]:
+        """
+        Return the primary keys of the lines intersecting a box.
+        """
+        return set(
+            IfcLine.objects.intersecting(minimum, maximum)
+            .values_list("pk", flat=True)
+        )
+
+    def test_extent_is_stored(self):
+        self.line.refresh_from_db()
+        self.assertEqual(self.line.start(), (3.0, 4.0, 0.0))
+        self.assertEqual(self.line.length, 13.0)
+        self.assertEqual(
+            (self.line.min_z, self.line.max_x, self.line.max_z),
+            (0.0, 3.0, 12.0),
+        )
+        self.flat_line.refresh_from_db()
+        self.assertEqual(self.flat_line.end(), (5.0, 10.0))
+        self.assertEqual(self.flat_line.length, 5.0)
+        self.assertIsNone(self.flat_line.min_z)
+
+    def test_saving_updated_fields_updates_the_extent(self):
+        self.line.end_x = 3.0
+        self.line.end_y = 4.0
+        self.line.save(update_fields=["end_x", "end_y"])
+        self.line.refresh_from_db()
+        self.assertEqual(self.line.length, 12.0)
+        self.assertEqual((self.line.min_x, self.line.max_x), (3.0, 3.0))
+
+    def test_line_extent(self):
+        self.assertEqual(
+            line_extent((0.0, 0.0, None), (3.0, 4.0, 5.0)),
+            {
+                "length": 5.0,
+                "min_x": 0.0, "min_y": 0.0, "min_z": None,
+                "max_x": 3.0, "max_y": 4.0, "max_z": None,
+            },
+        )
+
+    def test_intersecting(self):
+        line, flat_line = self.line.pk, self.flat_line.pk
+        self.assertEqual(self.intersecting((1.0, 1.0), (2.0, 2.0)), {line})
+        self.assertEqual(
+            self.intersecting((4.0, 9.0), (6.0, 11.0)),
+            {flat_line},
+        )
+        # 2D lines match any z range
+        self.assertEqual(
+            self.intersecting((0.0, 0.0, 20.0), (10.0, 10.0, 30.0)),
+            {flat_line},
+        )
+        self.assertEqual(
+            self.intersecting((0.0, 0.0, 5.0), (10.0, 10.0, 6.0)),
+            {line, flat_line},
+        )
+
+
+class LineCoordinatesCommandTests(TestCase):
+    """
+    The `bim_line_coordinates` command on lines with JSON end points.
+    """
+
+    def setUp(self):
+        IfcLine.objects.bulk_create([
+            IfcLine(start_point=[0, 0, 0], end_point=[3, 4, 0]),
+            IfcLine(start_point=[1, 1], end_point=[1, 3]),
+            IfcLine(start_point=[0, 0, 0], end_point=[0, 0, 2]),
+        ])
+        self.converted = IfcLine()
+        self.converted.set_points((7.0, 7.0), (8.0, 8.0))
+        self.converted.save()
+
+    def convert(self) -> str:
+        """
+        Run `bim_line_coordinates` in batches of two lines.
+        """
+        stdout = io.StringIO()
+        call_command(
+            "bim_line_coordinates", "--batch-size", "2", stdout=stdout,
+        )
+        return stdout.getvalue()
+
+    def test_json_points_are_copied_and_cleared(self):
+        self.assertIn("Converted 3 lines", self.convert())
+        lines = list(IfcLine.objects.order_by("pk"))
+        self.assertEqual(
+            [(line.start(), line.end(), line.length) for line in lines],
+            [
+                ((0.0, 0.0, 0.0), (3.0, 4.0, 0.0), 5.0),
+                ((1.0, 1.0), (1.0, 3.0), 2.0),
+                ((0.0, 0.0, 0.0), (0.0, 0.0, 2.0), 2.0),
+                ((7.0, 7.0), (8.0, 8.0), 2.0 ** 0.5),
+            ],
+        )
+        self.assertFalse(IfcLine.objects.filter(
+            start_point__isnull=False,
+        ).exists())
+        self.assertEqual(lines[1].max_y, 3.0)
+        self.assertIsNone(lines[1].max_z)
+
+    def test_conversion_can_be_resumed(self):
+        self.convert()
+        self.assertIn("Converted 0 lines", self.convert())
+
+    def test_invalid_points_are_rejected(self):
+        IfcLine.objects.bulk_create([
+            IfcLine(start_point=[0], end_point=[1, 1]),
+        ])
+        with self.assertRaises(ValueError):
+            self.convert()
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Manager Tests
+========================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import io
+
+# Import | Libraries
+from django.apps import apps
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+# Import | Local Modules
+from ..models import (
+    IfcApplicationModel,
+    IfcCartesianPoint,
+    IfcGridModel,
+    IfcGridPlacementModel,
+    IfcLocalPlacementModel,
+    IfcOrganizationModel,
+    IfcOwnerHistoryModel,
+    IfcPersonAndOrganizationModel,
+    IfcPersonModel,
+    IfcProductModel,
+    IfcRepresentationItemRelation,
+)
+from .test_step_import import PRODUCTS_IFC, SMALL_IFC
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+ROWS = 3
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class StrRelatedManagerTests(TestCase):
+    """
+    Rendering a list of rows with `str()` costs one query, whatever the
+    number of rows.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        parent = IfcLocalPlacementModel.objects.create(placement_id="root")
+        for index in range(ROWS):
+            organization = IfcOrganizationModel.objects.create(
+                name=f"Organization {index}",
+            )
+            user = IfcPersonAndOrganizationModel.objects.create(
+                person=IfcPersonModel.objects.create(
+                    identifier=f"person-{index}",
+                    family_name=f"Person {index}",
+                ),
+                organization=organization,
+            )
+            IfcApplicationModel.objects.create(
+                application_developer=organization,
+                application_full_name=f"Application {index}",
+                application_identifier=f"app-{index}",
+                version="1.0",
+            )
+            IfcOwnerHistoryModel.objects.create(creation_user=user)
+            placement = IfcLocalPlacementModel.objects.create(
+                placement_id=f"placement-{index}",
+                relative_placement=parent,
+            )
+            grid = IfcGridModel.objects.create(name=f"Grid {index}")
+            IfcGridPlacementModel.objects.create(
+                grid=grid,
+                placement_id=f"grid-placement-{index}",
+                placement_location="A1",
+            )
+            IfcProductModel.objects.create(
+                name=f"Product {index}",
+                object_placement=placement,
+            )
+
+    def test_every_model(self):
+        call_command("bim_import", SMALL_IFC, stdout=io.StringIO())
+        call_command("bim_import", PRODUCTS_IFC, stdout=io.StringIO())
+        relation = IfcRepresentationItemRelation.objects.get()
+        IfcRepresentationItemRelation.objects.create(
+            representation=relation.representation,
+            item=IfcCartesianPoint.objects.exclude(pk=relation.object_id)
+            .first(),
+        )
+        for model in apps.get_app_config("django_bim").get_models():
+            with self.subTest(model=model._meta.label):
+                with CaptureQueriesContext(connection) as one:
+                    [str(row) for row in model.objects.all()[:1]]
+                with CaptureQueriesContext(connection) as every:
+                    [str(row) for row in model.objects.all()]
+                self.assertEqual(len(every), len(one))
+
+    def assertConstantQueries(self, model):
+        with self.assertNumQueries(1):
+            rendered = [str(row) for row in model.objects.all()]
+        self.assertGreaterEqual(len(rendered), ROWS)
+
+    def test_person_and_organization(self):
+        self.assertConstantQueries(IfcPersonAndOrganizationModel)
+
+    def test_application(self):
+        self.assertConstantQueries(IfcApplicationModel)
+
+    def test_owner_history(self):
+        self.assertConstantQueries(IfcOwnerHistoryModel)
+
+    def test_local_placement(self):
+        self.assertConstantQueries(IfcLocalPlacementModel)
+
+    def test_grid(self):
+        self.assertConstantQueries(IfcGridModel)
+
+    def test_grid_placement(self):
+        self.assertConstantQueries(IfcGridPlacementModel)
+
+    def test_product(self):
+        self.assertConstantQueries(IfcProductModel)
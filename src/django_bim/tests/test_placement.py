@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Placement Tests
+==========================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import io
+from unittest import mock
+
+# Import | Libraries
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+# Import | Local Modules
+from ..models import (
+    IfcLocalPlacementModel,
+    IfcProductModel,
+    IfcProjectModel,
+    IfcRepresentationContextModel,
+)
+from ..models.ifc.placement import model_ifc_placement_local
+from ..utils.matrix import IDENTITY, placement_axes, placement_matrix
+from .test_step_export import export_entities, of_type
+from .test_step_import import SMALL_IFC
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def translation(x: float, y: float, z: float) -> tuple:
+    """
+    Return the matrix of a translation.
+    """
+    return placement_matrix((x, y, z))
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class WorldTransformTests(TestCase):
+    """
+    The world transforms of a chain of placements `a <- b <- c`.
+    """
+
+    def setUp(self):
+        self.a = IfcLocalPlacementModel.objects.create(
+            placement_id="a",
+            relative_transform=translation(1.0, 0.0, 0.0),
+        )
+        self.b = IfcLocalPlacementModel.objects.create(
+            placement_id="b",
+            relative_placement=self.a,
+            relative_transform=translation(0.0, 2.0, 0.0),
+        )
+        self.c = IfcLocalPlacementModel.objects.create(
+            placement_id="c",
+            relative_placement=self.b,
+            relative_transform=translation(0.0, 0.0, 3.0),
+        )
+
+    def location(self, placement: IfcLocalPlacementModel) -> tuple:
+        """
+        Return the world location of a placement, read back.
+        """
+        placement.refresh_from_db()
+        return placement_axes(placement.world_matrix())[0]
+
+    def test_save_updates_subtree(self):
+        self.assertEqual(self.location(self.c), (1.0, 2.0, 3.0))
+        self.a.relative_transform = translation(5.0, 0.0, 0.0)
+        self.a.save()
+        self.assertEqual(self.location(self.c), (5.0, 2.0, 3.0))
+
+    def test_nested_roots_are_updated_after_their_ancestors(self):
+        # Bulk writes leave the world transforms as they were
+        IfcLocalPlacementModel.objects.filter(pk=self.a.pk).update(
+            relative_transform=translation(5.0, 0.0, 0.0),
+        )
+        updated = IfcLocalPlacementModel.update_world_transforms(
+            roots=[self.c.pk, self.a.pk],
+        )
+        self.assertEqual(updated, 3)
+        self.assertEqual(self.location(self.b), (5.0, 2.0, 0.0))
+        self.assertEqual(self.location(self.c), (5.0, 2.0, 3.0))
+
+    def test_levels_are_written_in_chunks(self):
+        children = [
+            IfcLocalPlacementModel.objects.create(
+                placement_id=f"child {number}",
+                relative_placement=self.c,
+                relative_transform=translation(float(number), 0.0, 0.0),
+            )
+            for number in range(5)
+        ]
+        IfcLocalPlacementModel.objects.filter(pk=self.a.pk).update(
+            relative_transform=translation(5.0, 0.0, 0.0),
+        )
+        with mock.patch.object(
+            model_ifc_placement_local, "_LEVEL_BATCH_SIZE", 2,
+        ), CaptureQueriesContext(connection) as queries:
+            updated = IfcLocalPlacementModel.update_world_transforms()
+        self.assertEqual(updated, 8)
+        for number, child in enumerate(children):
+            self.assertEqual(
+                self.location(child),
+                (5.0 + number, 2.0, 3.0),
+            )
+        self.assertFalse(any(
+            "CASE" in query["sql"] for query in queries.captured_queries
+        ))
+
+    def test_descendants_include_the_placements(self):
+        self.assertEqual(
+            set(
+                IfcLocalPlacementModel.objects.filter(pk=self.b.pk)
+                .with_descendants().values_list("placement_id", flat=True)
+            ),
+            {"b", "c"},
+        )
+
+
+class ImportedPlacementTests(TestCase):
+    """
+    The transforms read from the axis placements of `small.ifc`.
+    """
+
+    def setUp(self):
+        call_command("bim_import", SMALL_IFC, stdout=io.StringIO())
+
+    def test_relative_and_world_transforms_are_imported(self):
+        child = IfcLocalPlacementModel.objects.get(
+            relative_placement__isnull=False,
+        )
+        self.assertEqual(
+            child.relative_transform,
+            translation(1000.0, 0.0, 0.0),
+        )
+        self.assertEqual(
+            placement_axes(child.world_matrix())[0],
+            (1000.0, 0.0, 0.0),
+        )
+
+    def test_transforms_are_exported(self):
+        project = IfcProjectModel.objects.get()
+        IfcProductModel.objects.create(
+            project=project,
+            object_placement=IfcLocalPlacementModel.objects.get(
+                relative_placement__isnull=False,
+            ),
+        )
+        entities = export_entities(project)
+        self.assertIn(
+            "(1000.,0.,0.)",
+            of_type(entities, "IFCCARTESIANPOINT"),
+        )
+        self.assertEqual(
+            IfcRepresentationContextModel.objects.get()
+            .world_coordinate_system,
+            IDENTITY,
+        )
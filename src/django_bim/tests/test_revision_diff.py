@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Revision Diff Tests
+==============================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import io
+
+# Import | Libraries
+from django.core.management import call_command
+from django.test import TestCase
+
+# Import | Local Modules
+from ..diff import diff_revisions
+from ..models import (
+    IfcGridModel,
+    IfcLocalPlacementModel,
+    IfcProductModel,
+    IfcProjectModel,
+    IfcProjectRevisionModel,
+)
+from .test_step_import import SMALL_IFC
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class RevisionDiffTests(TestCase):
+    """
+    The changes between two revisions of the project of `small.ifc` with
+    a grid and a proxy it contains.
+    """
+
+    def setUp(self):
+        call_command("bim_import", SMALL_IFC, stdout=io.StringIO())
+        self.project = IfcProjectModel.objects.get()
+        self.grid = IfcGridModel.objects.create(
+            name="Grid",
+            project=self.project,
+        )
+        self.proxy = IfcProductModel.objects.create(
+            name="Proxy",
+            container=self.grid,
+        )
+        self.old = IfcProjectRevisionModel.capture(self.project)
+
+    def capture(self) -> dict:
+        """
+        Store a revision and return its changes by global id.
+        """
+        new = IfcProjectRevisionModel.capture(self.project)
+        return {
+            change.global_id: change
+            for change in diff_revisions(self.old, new)
+        }
+
+    def test_equal_revisions_have_no_changes(self):
+        self.assertEqual(self.old.entity_count, 3)
+        self.assertEqual(self.capture(), {})
+
+    def test_products_are_stored_as_their_subclass(self):
+        entities = dict(IfcProjectRevisionModel._tree(self.project, 1))
+        self.assertEqual(
+            {type(entity) for entity in entities},
+            {IfcProjectModel, IfcGridModel, IfcProductModel},
+        )
+        self.assertEqual(entities[self.grid], "")
+        self.assertEqual(entities[self.proxy], self.grid.global_id)
+
+    def test_modified_attributes(self):
+        self.proxy.name = "Renamed"
+        self.proxy.save()
+        changes = self.capture()
+        self.assertEqual(list(changes), [self.proxy.global_id])
+        self.assertEqual(changes[self.proxy.global_id].action, "MODIFIED")
+        self.assertEqual(
+            changes[self.proxy.global_id].changes["name"],
+            ("Proxy", "Renamed"),
+        )
+
+    def test_added_and_removed_products(self):
+        self.proxy.delete()
+        added = IfcProductModel.objects.create(
+            name="Added",
+            project=self.project,
+        )
+        changes = self.capture()
+        self.assertEqual(changes[added.global_id].action, "ADDED")
+        self.assertEqual(changes[self.proxy.global_id].action, "DELETED")
+
+    def test_hashes_are_computed_when_captured(self):
+        IfcProductModel.objects.filter(pk=self.proxy.pk).update(
+            name="Renamed",
+        )
+        changes = self.capture()
+        self.assertEqual(
+            changes[self.proxy.global_id].changes["name"],
+            ("Proxy", "Renamed"),
+        )
+
+    def test_moved_root_placements(self):
+        root = IfcLocalPlacementModel.objects.create(placement_id="root")
+        self.proxy.object_placement = IfcLocalPlacementModel.objects.create(
+            placement_id="child",
+            relative_placement=root,
+        )
+        self.proxy.save()
+        self.old = IfcProjectRevisionModel.capture(self.project)
+        IfcLocalPlacementModel.objects.filter(pk=root.pk).update(
+            relative_transform=(
+                1.0, 0.0, 0.0, 5.0,
+                0.0, 1.0, 0.0, 0.0,
+                0.0, 0.0, 1.0, 0.0,
+                0.0, 0.0, 0.0, 1.0,
+            ),
+        )
+        IfcLocalPlacementModel.update_world_transforms([root.pk])
+        changes = self.capture()
+        self.assertEqual(list(changes), [self.proxy.global_id])
+        self.assertIn(
+            "object_placement", changes[self.proxy.global_id].changes,
+        )
+
+    def test_import_captures_only_the_imported_projects(self):
+        IfcProjectRevisionModel.objects.all().delete()
+        call_command(
+            "bim_import", SMALL_IFC, "--incremental", "--revision", "Again",
+            stdout=io.StringIO(),
+        )
+        self.project.refresh_from_db()
+        other = IfcProjectModel.objects.create(
+            name="Other",
+            owner_history=self.project.owner_history,
+            units_in_context=self.project.units_in_context,
+        )
+        call_command(
+            "bim_import", SMALL_IFC, "--incremental", "--revision", "Later",
+            stdout=io.StringIO(),
+        )
+        self.assertEqual(
+            list(IfcProjectRevisionModel.objects.values_list(
+                "project", "label",
+            )),
+            [(self.project.pk, "Again"), (self.project.pk, "Later")],
+        )
+        self.assertFalse(other.revisions.exists())
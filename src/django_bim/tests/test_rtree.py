@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM R-Tree Tests
+=======================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import pickle
+from unittest import TestCase as UnitTestCase, mock
+
+# Import | Libraries
+import numpy
+from django.test import TestCase
+
+# Import | Local Modules
+from ..models import IfcLocalPlacementModel, IfcProductModel
+from ..spatial import PackedRTree
+from ..spatial import rtree
+from .test_placement import translation
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+# Random boxes compared against brute force
+ITEMS = 500
+
+# Small nodes, so the trees have several levels
+CAPACITY = 4
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def random_boxes(count: int, seed: int = 0) -> numpy.ndarray:
+    """
+    Return `(count, 6)` boxes of size 0 to 5 in a 100 x 100 x 10 volume.
+    """
+    generator = numpy.random.default_rng(seed)
+    minimum = generator.uniform(0.0, 100.0, (count, 3))
+    minimum[:, 2] /= 10.0
+    return numpy.hstack((
+        minimum,
+        minimum + generator.uniform(0.0, 5.0, (count, 3)),
+    ))
+
+
+def overlapping(boxes: numpy.ndarray, box: numpy.ndarray) -> numpy.ndarray:
+    """
+    Return which boxes intersect a box, by brute force.
+    """
+    return (
+        (boxes[:, :3] <= box[3:]).all(axis=1)
+        & (boxes[:, 3:] >= box[:3]).all(axis=1)
+    )
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class PackedRTreeTests(UnitTestCase):
+    """
+    Queries on random boxes, identified by their index plus 1000, checked
+    against brute force.
+    """
+
+    def setUp(self):
+        self.boxes = random_boxes(ITEMS)
+        self.ids = numpy.arange(ITEMS) + 1000
+        self.tree = PackedRTree(self.ids, self.boxes, CAPACITY)
+
+    def test_levels_cover_their_children(self):
+        self.assertEqual(len(self.tree), ITEMS)
+        self.assertGreater(len(self.tree.levels), 3)
+        self.assertEqual(len(self.tree.levels[-1][0]), 1)
+        below = self.tree.boxes
+        for nodes, starts, ends in self.tree.levels:
+            self.assertTrue(((ends - starts) <= CAPACITY).all())
+            for node, start, end in zip(nodes, starts, ends):
+                self.assertTrue((node[:3] <= below[start:end, :3]).all())
+                self.assertTrue((node[3:] >= below[start:end, 3:]).all())
+            below = nodes
+
+    def test_query_matches_brute_force(self):
+        for box in random_boxes(50, seed=1):
+            expected = self.ids[overlapping(self.boxes, box)]
+            self.assertEqual(
+                sorted(self.tree.query(box).tolist()),
+                sorted(expected.tolist()),
+            )
+
+    def test_2d_queries_ignore_heights(self):
+        box = numpy.array([10.0, 10.0, -1e9, 30.0, 30.0, 1e9])
+        self.assertEqual(
+            sorted(self.tree.query((10.0, 10.0, 30.0, 30.0)).tolist()),
+            sorted(self.ids[overlapping(self.boxes, box)].tolist()),
+        )
+        with self.assertRaises(ValueError):
+            self.tree.query((0.0, 0.0, 1.0))
+
+    def test_nearest_matches_brute_force(self):
+        point = numpy.array([50.0, 50.0, 5.0])
+        gaps = numpy.maximum.reduce((
+            self.boxes[:, :3] - point,
+            point - self.boxes[:, 3:],
+            numpy.zeros((ITEMS, 3)),
+        ))
+        distances = numpy.sqrt((gaps ** 2).sum(axis=1))
+        nearest = self.tree.nearest(point, k=10)
+        self.assertEqual(len(nearest), 10)
+        self.assertEqual(
+            numpy.sort(distances[nearest - 1000]).tolist(),
+            distances[nearest - 1000].tolist(),
+        )
+        self.assertAlmostEqual(
+            distances[nearest[-1] - 1000],
+            numpy.sort(distances)[9],
+        )
+
+    def test_self_join_matches_brute_force(self):
+        expected = {
+            (int(self.ids[first]), int(self.ids[second]))
+            for first in range(ITEMS)
+            for second in numpy.flatnonzero(
+                overlapping(self.boxes, self.boxes[first]),
+            ).tolist()
+            if first < second
+        }
+        # Tiny chunks, so the leaf pairs are tested in many passes
+        with mock.patch.object(rtree, "_PAIR_CHUNK_SIZE", 64):
+            pairs = self.tree.self_join()
+        found = {tuple(sorted(pair)) for pair in pairs.tolist()}
+        self.assertEqual(len(found), len(pairs))
+        self.assertEqual(found, expected)
+
+    def test_trees_pickle(self):
+        copy = pickle.loads(pickle.dumps(self.tree))
+        box = (20.0, 20.0, 0.0, 40.0, 40.0, 10.0)
+        self.assertEqual(
+            copy.query(box).tolist(),
+            self.tree.query(box).tolist(),
+        )
+
+    def test_empty_and_invalid_trees(self):
+        tree = PackedRTree([], numpy.empty((0, 6)))
+        self.assertEqual(len(tree), 0)
+        self.assertEqual(tree.query((0.0, 0.0, 1.0, 1.0)).tolist(), [])
+        self.assertEqual(tree.nearest((0.0, 0.0)).tolist(), [])
+        self.assertEqual(tree.self_join().shape, (0, 2))
+        with self.assertRaises(ValueError):
+            PackedRTree([1, 2], self.boxes[:1])
+        with self.assertRaises(ValueError):
+            PackedRTree([1], self.boxes[:1], capacity=1)
+
+
+class ProductRTreeTests(TestCase):
+    """
+    A tree over the world boxes of two overlapping unit cubes placed at
+    x = 0 and x = 0.5, one at x = 10, and a product without shape.
+    """
+
+    def setUp(self):
+        self.products = {}
+        for name, x, points in (
+            ("A", 0.0, ((0.0, 0.0, 0.0), (1.0, 1.0, 1.0))),
+            ("B", 0.5, ((0.0, 0.0, 0.0), (1.0, 1.0, 1.0))),
+            ("C", 10.0, ((0.0, 0.0, 0.0), (1.0, 1.0, 1.0))),
+            ("Empty", 0.0, None),
+        ):
+            product = IfcProductModel(
+                name=name,
+                object_placement=IfcLocalPlacementModel.objects.create(
+                    placement_id=name,
+                    relative_transform=translation(x, 0.0, 0.0),
+                ),
+            )
+            product.set_local_bounds(points)
+            product.save()
+            self.products[name] = product.pk
+
+    def test_products_are_loaded_with_one_query(self):
+        with self.assertNumQueries(1):
+            tree = PackedRTree.from_products(IfcProductModel.objects.all())
+        self.assertEqual(len(tree), 3)
+        self.assertEqual(
+            sorted(tree.query((9.0, 0.0, 11.0, 1.0)).tolist()),
+            [self.products["C"]],
+        )
+        (pair,) = tree.self_join().tolist()
+        self.assertEqual(
+            sorted(pair),
+            sorted([self.products["A"], self.products["B"]]),
+        )
+        self.assertEqual(
+            tree.nearest((8.0, 0.5, 0.5)).tolist(),
+            [self.products["C"]],
+        )
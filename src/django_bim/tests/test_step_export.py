@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM STEP Export Tests
+============================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import io
+import re
+
+# Import | Libraries
+from django.core.management import call_command
+from django.test import TestCase
+
+# Import | Local Modules
+from ..io.step import export_project
+from ..models import (
+    IfcCartesianPoint,
+    IfcGridModel,
+    IfcLocalPlacementModel,
+    IfcProductModel,
+    IfcProjectModel,
+)
+from .test_grid import make_axis
+from .test_step_import import INDEXED_IFC, PRODUCTS_IFC, SMALL_IFC
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+ENTITY = re.compile(r"^#(\d+)=(\w+)\((.*)\);$")
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def export_entities(project: IfcProjectModel) -> dict[int, tuple[str, str]]:
+    """
+    Export a project and return its entities as `#id` to
+    `(entity type, parameters)`.
+    """
+    stream = io.StringIO()
+    export_project(project, stream)
+    entities = {}
+    for line in stream.getvalue().splitlines():
+        match = ENTITY.match(line)
+        if match:
+            entities[int(match[1])] = (match[2], match[3])
+    return entities
+
+
+def of_type(entities: dict, entity_type: str) -> list[str]:
+    """
+    Return the parameters of the entities of a type.
+    """
+    return [
+        parameters for kind, parameters in entities.values()
+        if kind == entity_type
+    ]
+
+
+def references(parameters: str) -> list[int]:
+    """
+    Return the `#ids` referenced in parameters.
+    """
+    return [int(step_id) for step_id in re.findall(r"#(\d+)", parameters)]
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class StepExportTests(TestCase):
+    """
+    The IFC-SPF export of an imported project with a grid and a proxy.
+    """
+
+    def setUp(self):
+        call_command("bim_import", SMALL_IFC, stdout=io.StringIO())
+        self.project = IfcProjectModel.objects.get()
+        placement = IfcLocalPlacementModel.objects.get(
+            relative_placement__isnull=False,
+        )
+        self.grid = IfcGridModel.objects.create(
+            name="Grid",
+            project=self.project,
+            object_placement=placement,
+        )
+        self.grid.u_axes.add(make_axis("A", (0.0, 0.0), (0.0, 10.0)))
+        self.grid.v_axes.add(make_axis("1", (0.0, 0.0), (10.0, 0.0)))
+        IfcProductModel.objects.create(name="Proxy", container=self.grid)
+        # Rows of no project are left out of the export
+        IfcLocalPlacementModel.objects.create(placement_id="orphan")
+        IfcCartesianPoint.objects.create(x=5.0, y=5.0, z=5.0)
+        self.entities = export_entities(self.project)
+
+    def test_every_reference_is_written(self):
+        for kind, parameters in self.entities.values():
+            for step_id in references(parameters):
+                self.assertIn(step_id, self.entities, kind)
+            self.assertNotIn("()", parameters, kind)
+
+    def test_units_are_assigned(self):
+        self.assertEqual(
+            of_type(self.entities, "IFCSIUNIT"),
+            ["*,.LENGTHUNIT.,.MILLI.,.METRE."],
+        )
+        (units,) = of_type(self.entities, "IFCUNITASSIGNMENT")
+        self.assertEqual(len(references(units)), 1)
+
+    def test_placements_have_axis_placements(self):
+        placements = of_type(self.entities, "IFCLOCALPLACEMENT")
+        self.assertEqual(len(placements), 2)
+        for parameters in placements:
+            relative = references(parameters.rsplit(",", 1)[1])
+            self.assertEqual(
+                self.entities[relative[0]][0],
+                "IFCAXIS2PLACEMENT3D",
+            )
+        (context,) = of_type(
+            self.entities,
+            "IFCGEOMETRICREPRESENTATIONCONTEXT",
+        )
+        system = references(context)
+        self.assertEqual(self.entities[system[0]][0], "IFCAXIS2PLACEMENT3D")
+
+    def test_points_of_other_rows_are_left_out(self):
+        self.assertNotIn(
+            "(5.,5.,5.)",
+            of_type(self.entities, "IFCCARTESIANPOINT"),
+        )
+
+    def test_products_are_aggregated(self):
+        (grid,) = of_type(self.entities, "IFCGRID")
+        self.assertTrue(grid.endswith(",$,$"))
+        self.assertEqual(len(of_type(self.entities, "IFCGRIDAXIS")), 2)
+        self.assertEqual(len(of_type(self.entities, "IFCPOLYLINE")), 2)
+        self.assertEqual(
+            len(of_type(self.entities, "IFCBUILDINGELEMENTPROXY")),
+            1,
+        )
+        relating = sorted(
+            self.entities[references(parameters)[-2]][0]
+            for parameters in of_type(self.entities, "IFCRELAGGREGATES")
+        )
+        self.assertEqual(relating, ["IFCGRID", "IFCPROJECT"])
+
+
+class ProductExportTests(TestCase):
+    """
+    The IFC-SPF export of the project of `products.ifc`, whose wall has an
+    owner history of its own.
+    """
+
+    def setUp(self):
+        call_command("bim_import", PRODUCTS_IFC, stdout=io.StringIO())
+        self.entities = export_entities(IfcProjectModel.objects.get())
+
+    def test_owner_histories_of_products_are_written(self):
+        for kind, parameters in self.entities.values():
+            for step_id in references(parameters):
+                self.assertIn(step_id, self.entities, kind)
+        self.assertEqual(
+            sorted(
+                parameters.split(",")[3]
+                for parameters in of_type(self.entities, "IFCOWNERHISTORY")
+            ),
+            [".ADDED.", ".MODIFIED."],
+        )
+        (wall,) = (
+            parameters
+            for parameters in of_type(
+                self.entities, "IFCBUILDINGELEMENTPROXY",
+            )
+            if "'Wall'" in parameters
+        )
+        self.assertIn(".MODIFIED.", self.entities[references(wall)[0]][1])
+
+    def test_context_precision_is_kept(self):
+        (context,) = of_type(
+            self.entities,
+            "IFCGEOMETRICREPRESENTATIONCONTEXT",
+        )
+        self.assertEqual(context.split(",")[3], "1.E-05")
+
+
+class IndexedGeometryExportTests(TestCase):
+    """
+    The IFC-SPF export of the indexed geometry of `indexed.ifc`.
+    """
+
+    def setUp(self):
+        call_command("bim_import", INDEXED_IFC, stdout=io.StringIO())
+        self.entities = export_entities(IfcProjectModel.objects.get())
+
+    def test_segments_are_typed(self):
+        (curve,) = of_type(self.entities, "IFCINDEXEDPOLYCURVE")
+        self.assertRegex(
+            curve,
+            r"^#\d+,\(IFCLINEINDEX\(\(1,2,3\)\),IFCARCINDEX\(\(3,4,5\)\),"
+            r"IFCLINEINDEX\(\(5,1\)\)\),\.F\.$",
+        )
+        self.assertEqual(
+            self.entities[references(curve)[0]][0],
+            "IFCCARTESIANPOINTLIST2D",
+        )
+
+    def test_triangles_are_written(self):
+        (face_set,) = of_type(self.entities, "IFCTRIANGULATEDFACESET")
+        self.assertRegex(
+            face_set,
+            r"^#\d+,\$,\.F\.,\(\(1,2,3\),\(1,3,4\)\),\$$",
+        )
+        self.assertEqual(
+            self.entities[references(face_set)[0]][0],
+            "IFCCARTESIANPOINTLIST3D",
+        )
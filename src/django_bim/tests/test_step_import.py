@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM STEP Import Tests
+============================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import io
+import os
+import shutil
+import tempfile
+
+# Import | Libraries
+from django.apps import apps
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+
+# Import | Local Modules
+from ..models import (
+    IfcCartesianPoint,
+    IfcCartesianPointListModel,
+    IfcGridIntersectionModel,
+    IfcGridModel,
+    IfcIndexedPolyCurveModel,
+    IfcLocalPlacementModel,
+    IfcOrganizationModel,
+    IfcPersonModel,
+    IfcProductModel,
+    IfcProjectModel,
+    IfcRepresentationContextModel,
+    IfcRepresentationModel,
+    IfcSIUnitModel,
+    IfcTriangulatedFaceSetModel,
+)
+from ..io.step import StepEntityIndex, StepImporter
+from ..io.step.step_index import PAGE_SIZE
+from ..models.ifc.model_ifc_product import rebuild_rollups
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+SMALL_IFC = os.path.join(DATA, "small.ifc")
+
+PRODUCTS_IFC = os.path.join(DATA, "products.ifc")
+
+INDEXED_IFC = os.path.join(DATA, "indexed.ifc")
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class BimImportCommandTests(TestCase):
+    """
+    The `bim_import` command on a small IFC4 file.
+    """
+
+    def import_small(self, *args: str, path: str = SMALL_IFC) -> str:
+        """
+        Run `bim_import` on `small.ifc` and return its output.
+        """
+        stdout = io.StringIO()
+        call_command("bim_import", path, *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def edited_small(self, old: str, new: str) -> str:
+        """
+        Return the path of a copy of `small.ifc` with some text replaced.
+        """
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "small.ifc")
+        with open(SMALL_IFC, encoding="ascii") as source:
+            text = source.read()
+        self.assertIn(old, text)
+        with open(path, "w", encoding="ascii") as target:
+            target.write(text.replace(old, new))
+        return path
+
+    def test_import_creates_project(self):
+        self.import_small()
+        project = IfcProjectModel.objects.get()
+        self.assertEqual(project.global_id, "0YvctVUKr0kugbFTf53O9L")
+        self.assertEqual(project.name, "Small")
+        self.assertEqual(project.owner_history.change_action, "ADDED")
+        self.assertIsNotNone(project.units_in_context)
+        self.assertEqual(project.representation_contexts.count(), 1)
+        self.assertTrue(project.digest)
+
+    def test_import_creates_geometry(self):
+        self.import_small()
+        self.assertEqual(
+            sorted(
+                point.coordinates for point in IfcCartesianPoint.objects.all()
+            ),
+            [(0.0, 0.0, 0.0), (1000.0, 0.0, 0.0)],
+        )
+        self.assertEqual(
+            IfcCartesianPointListModel.objects.get().points(),
+            [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0)],
+        )
+        child = IfcLocalPlacementModel.objects.get(
+            relative_placement__isnull=False,
+        )
+        self.assertIsNone(child.relative_placement.relative_placement)
+
+    def test_incremental_import_keeps_unchanged_rows(self):
+        self.import_small("--incremental")
+        project = IfcProjectModel.objects.get()
+        output = self.import_small("--incremental")
+        self.assertIn("Left 1 entities unchanged.", output)
+        self.assertEqual(IfcProjectModel.objects.get().pk, project.pk)
+
+    def test_full_import_stores_no_reference_hashes(self):
+        self.import_small()
+        self.assertIsNone(IfcProjectModel.objects.get().reference_hash)
+        output = self.import_small("--incremental")
+        self.assertIn("Left 0 entities unchanged, 1 modified.", output)
+        self.assertTrue(IfcProjectModel.objects.get().reference_hash)
+
+    def test_incremental_import_detects_changed_references(self):
+        self.import_small()
+        path = self.edited_small(".MILLI.", ".CENTI.")
+        output = self.import_small("--incremental", path=path)
+        self.assertIn("Left 0 entities unchanged, 1 modified.", output)
+        project = IfcProjectModel.objects.get()
+        self.assertEqual(project.owner_history.change_action, "MODIFIED")
+        self.assertEqual(
+            [unit.prefix for unit in project.units_in_context.units()],
+            ["CENTI"],
+        )
+        self.assertEqual(IfcSIUnitModel.objects.count(), 1)
+        self.assertEqual(IfcRepresentationContextModel.objects.count(), 1)
+        self.assertEqual(IfcOrganizationModel.objects.count(), 1)
+
+    def test_actors_of_other_projects_are_not_rewritten(self):
+        self.import_small()
+        person = IfcPersonModel.objects.get()
+        IfcPersonModel.objects.filter(pk=person.pk).update(
+            family_name="Kept",
+        )
+        call_command("bim_import", PRODUCTS_IFC, stdout=io.StringIO())
+        person.refresh_from_db()
+        self.assertEqual(person.family_name, "Kept")
+        self.assertEqual(IfcPersonModel.objects.count(), 1)
+
+    def test_incremental_import_leaves_other_projects(self):
+        self.import_small()
+        other = IfcProjectModel.objects.create(
+            name="Other",
+            owner_history=IfcProjectModel.objects.get().owner_history,
+            units_in_context=IfcProjectModel.objects.get().units_in_context,
+        )
+        self.import_small("--incremental")
+        other.refresh_from_db()
+        self.assertEqual(other.owner_history.change_action, "ADDED")
+
+
+class ProductImportTests(TestCase):
+    """
+    The products of `products.ifc`: a site, a building, a wall with a
+    shape and a grid, related by aggregation and containment.
+    """
+
+    def setUp(self):
+        call_command("bim_import", PRODUCTS_IFC, stdout=io.StringIO())
+        self.project = IfcProjectModel.objects.get()
+        self.products = {
+            product.name: product
+            for product in IfcProductModel.objects.all()
+        }
+
+    def test_products_are_imported(self):
+        self.assertEqual(
+            sorted(self.products),
+            ["Building", "Grid", "Site", "Wall"],
+        )
+        wall = self.products["Wall"]
+        self.assertEqual(wall.global_id, "3OMprlRaLQ6gLtNkjXw1dY")
+        self.assertEqual(wall.object_type, "Partition")
+        self.assertEqual(wall.owner_history.change_action, "MODIFIED")
+        self.assertEqual(
+            wall.object_placement.world_matrix()[3],
+            1000.0,
+        )
+        self.assertEqual(wall.representation.name, "Shape")
+        self.assertEqual(
+            [
+                representation.representation_identifier
+                for representation in wall.representation.representations.all()
+            ],
+            ["Body"],
+        )
+        self.assertTrue(all(
+            product.digest for product in self.products.values()
+        ))
+
+    def test_relationships_become_containers(self):
+        site = self.products["Site"]
+        self.assertEqual(site.project, self.project)
+        self.assertIsNone(site.container)
+        self.assertEqual(self.products["Building"].container, site)
+        for name in ("Wall", "Grid"):
+            self.assertEqual(
+                self.products[name].container,
+                self.products["Building"],
+            )
+        self.assertEqual(
+            IfcProductModel.objects.of_project(self.project).count(),
+            4,
+        )
+        self.assertEqual(rebuild_rollups(), 0)
+
+    def test_grid_axes_and_polylines(self):
+        grid = IfcGridModel.objects.get()
+        self.assertEqual((grid.u_axis_count, grid.v_axis_count), (1, 1))
+        axis = grid.u_axes.get()
+        self.assertEqual(axis.axis_tag, "A")
+        self.assertEqual(
+            (axis.axis_curve.start(), axis.axis_curve.end()),
+            ((0.0, 0.0), (0.0, 10000.0)),
+        )
+        self.assertEqual(axis.axis_curve.length, 10000.0)
+        intersection = IfcGridIntersectionModel.objects.get(grid=grid)
+        self.assertEqual(
+            (intersection.label, intersection.x, intersection.y),
+            ("A1", 0.0, 5000.0),
+        )
+
+    def test_incremental_import_keeps_the_tree(self):
+        rollup = IfcProjectModel.objects.get().rollup_digest
+        # The first incremental import stores the reference hashes
+        call_command(
+            "bim_import", PRODUCTS_IFC, "--incremental",
+            stdout=io.StringIO(),
+        )
+        stdout = io.StringIO()
+        call_command(
+            "bim_import", PRODUCTS_IFC, "--incremental", stdout=stdout,
+        )
+        self.assertIn("Left 5 entities unchanged.", stdout.getvalue())
+        self.assertEqual(IfcProjectModel.objects.get().rollup_digest, rollup)
+
+
+class IndexedGeometryImportTests(TestCase):
+    """
+    The indexed poly curve and triangulated face set of `indexed.ifc`.
+    """
+
+    def setUp(self):
+        call_command("bim_import", INDEXED_IFC, stdout=io.StringIO())
+
+    def test_segments_keep_their_kind(self):
+        curve = IfcIndexedPolyCurveModel.objects.get()
+        self.assertEqual(curve.points.dimensions, 2)
+        self.assertIs(curve.self_intersect, False)
+        self.assertEqual(
+            curve.segment_indices(),
+            [("LINE", [1, 2, 3]), ("ARC", [3, 4, 5]), ("LINE", [5, 1])],
+        )
+        self.assertEqual(
+            curve.vertices(),
+            [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (2.0, 2.0), (0.0, 2.0),
+             (0.0, 0.0)],
+        )
+        axis = IfcRepresentationModel.objects.get(
+            representation_identifier="Axis",
+        )
+        self.assertEqual(axis.item_relations.get().item, curve)
+
+    def test_triangles_are_packed(self):
+        face_set = IfcTriangulatedFaceSetModel.objects.get()
+        self.assertEqual(face_set.coordinates.count, 4)
+        self.assertEqual(len(face_set), 2)
+        self.assertIs(face_set.closed, False)
+        self.assertIsNone(face_set.normals)
+        self.assertIsNone(face_set.pn_index)
+        self.assertEqual(face_set.triangles(), [(1, 2, 3), (1, 3, 4)])
+        self.assertEqual(
+            face_set.as_array().tolist(),
+            [[1, 2, 3], [1, 3, 4]],
+        )
+
+
+class ParallelImportTests(TestCase):
+    """
+    Imports of `products.ifc` parsed in worker processes.
+    """
+
+    def snapshot(self) -> tuple:
+        """
+        Return the number of rows per model and the digests and rollups of
+        the rooted entities.
+        """
+        return (
+            {
+                model._meta.label: model._base_manager.count()
+                for model in apps.get_app_config("django_bim").get_models()
+            },
+            sorted(
+                IfcProductModel.objects.values_list(
+                    "global_id", "digest", "rollup_digest",
+                )
+            ),
+            sorted(
+                IfcProjectModel.objects.values_list(
+                    "global_id", "digest", "rollup_digest",
+                )
+            ),
+        )
+
+    def test_workers_import_as_a_serial_run(self):
+        with transaction.atomic():
+            entities = StepImporter(PRODUCTS_IFC).run().entities
+            serial = self.snapshot()
+            transaction.set_rollback(True)
+        result = StepImporter(PRODUCTS_IFC, workers=2, chunk_size=256).run()
+        self.assertEqual(result.entities, entities)
+        self.assertEqual(self.snapshot(), serial)
+
+
+class StepEntityIndexTests(TestCase):
+    """
+    The paged `#id` index of the importer.
+    """
+
+    def test_sparse_ids_allocate_their_pages_only(self):
+        index = StepEntityIndex()
+        index.update([3, 10 ** 9], "IFCWALL", [1, 2])
+        index.set(10 ** 9 + 1, "IFCSLAB", 3)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(list(index), [3, 10 ** 9, 10 ** 9 + 1])
+        self.assertEqual(index.get(10 ** 9), 2)
+        self.assertEqual(index.entity_type(10 ** 9 + 1), "IFCSLAB")
+        self.assertIsNone(index.get(4))
+        self.assertNotIn(-1, index)
+        self.assertEqual(index.nbytes, 2 * PAGE_SIZE * (8 + 2))
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM STEP Reader Tests
+============================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+# Import | Libraries
+
+# Import | Local Modules
+from ..io.step import parse_step_arguments
+from ..io.step.step_parser import StepReference
+from ..io.step.step_reader import iter_step_entities, split_step_data
+from .test_step_import import PRODUCTS_IFC
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+TRICKY_IFC = """ISO-10303-21;
+HEADER;
+FILE_SCHEMA(('IFC4'));
+ENDSEC;
+DATA;
+#1=IFCPERSON('a;b','It''s',$,$,$,$,$,$);
+#2 = ifcOrganization($,'Acme',$,$,$);
+#3=(IFCA()IFCB());
+#10=IFCPERSONANDORGANIZATION(#1,#2,$);
+ENDSEC;
+END-ISO-10303-21;
+"""
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class StepReaderTests(TestCase):
+    """
+    The memory-mapped reader on a file with quoted `;` and doubled quotes,
+    lower-case types and a complex instance.
+    """
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "tricky.ifc")
+        with open(self.path, "w", encoding="ascii") as target:
+            target.write(TRICKY_IFC)
+
+    def test_instances_are_views_of_the_mapping(self):
+        entities = [
+            (entity.step_id, entity.entity_type, entity.arguments)
+            for entity in iter_step_entities(self.path)
+        ]
+        self.assertEqual(
+            [(step_id, entity_type) for step_id, entity_type, _ in entities],
+            [
+                (1, "IFCPERSON"),
+                (2, "IFCORGANIZATION"),
+                (10, "IFCPERSONANDORGANIZATION"),
+            ],
+        )
+        arguments = entities[0][2]
+        self.assertIsInstance(arguments, memoryview)
+        self.assertEqual(
+            parse_step_arguments(arguments)[:2],
+            ["a;b", "It's"],
+        )
+
+    def test_other_types_are_skipped(self):
+        entities = list(iter_step_entities(
+            self.path,
+            entity_types={b"IFCPERSONANDORGANIZATION"},
+        ))
+        self.assertEqual([entity.step_id for entity in entities], [10])
+        self.assertEqual(
+            parse_step_arguments(entities[0].arguments),
+            [StepReference(1), StepReference(2), None],
+        )
+
+    def test_only_wanted_attributes_are_decoded(self):
+        (person,) = iter_step_entities(self.path, entity_types={b"IFCPERSON"})
+        self.assertEqual(
+            parse_step_arguments(person.arguments, {1}),
+            [None, "It's"],
+        )
+
+    def test_ranges_read_every_instance_once(self):
+        whole = [
+            (entity.step_id, entity.arguments.tobytes())
+            for entity in iter_step_entities(PRODUCTS_IFC)
+        ]
+        ranges = split_step_data(PRODUCTS_IFC, 200)
+        self.assertGreater(len(ranges), 1)
+        pieces = [
+            (entity.step_id, entity.arguments.tobytes())
+            for start, end in ranges
+            for entity in iter_step_entities(PRODUCTS_IFC, start, end)
+        ]
+        self.assertEqual(pieces, whole)
+
+    def test_files_without_data_are_rejected(self):
+        empty = os.path.join(os.path.dirname(self.path), "empty.ifc")
+        open(empty, "wb").close()
+        with self.assertRaises(ValueError):
+            list(iter_step_entities(empty))
+        with open(self.path, "w", encoding="ascii") as target:
+            target.write("ISO-10303-21;\nHEADER;\nENDSEC;\n")
+        with self.assertRaises(ValueError):
+            list(iter_step_entities(self.path))
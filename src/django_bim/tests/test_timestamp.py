@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Timestamp Tests
+==========================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import datetime
+
+# Import | Libraries
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase, override_settings
+
+# Import | Local Modules
+from ..fields.model import IfcTimestampField
+from ..models import IfcOwnerHistoryModel
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+UTC = datetime.timezone.utc
+
+# 2024-01-01T00:00:00Z
+EPOCH = 1704067200
+
+MOMENT = datetime.datetime(2024, 1, 1, tzinfo=UTC)
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class TimestampFieldTests(TestCase):
+    """
+    Owner histories created, modified, and looked up by their timestamps.
+    """
+
+    def history(self, day: int) -> IfcOwnerHistoryModel:
+        """
+        Create an owner history created and modified on a day of 2024.
+        """
+        moment = MOMENT + datetime.timedelta(days=day)
+        return IfcOwnerHistoryModel.objects.create(
+            creation_date=moment,
+            last_modified_date=moment,
+        )
+
+    def test_values_are_stored_as_epoch_seconds(self):
+        field = IfcOwnerHistoryModel._meta.get_field("creation_date")
+        self.assertEqual(field.get_internal_type(), "BigIntegerField")
+        self.assertEqual(field.get_prep_value(MOMENT), EPOCH)
+        self.assertEqual(field.get_prep_value(EPOCH), EPOCH)
+        self.assertIsNone(field.get_prep_value(None))
+        self.history(0)
+        self.assertEqual(
+            IfcOwnerHistoryModel.objects.values_list(
+                "creation_date",
+                flat=True,
+            ).get(),
+            MOMENT,
+        )
+
+    def test_values_are_read_as_aware_utc_datetimes(self):
+        field = IfcTimestampField()
+        for value in (EPOCH, str(EPOCH)):
+            with self.subTest(value=value):
+                moment = field.to_python(value)
+                self.assertEqual(moment, MOMENT)
+                self.assertEqual(moment.tzinfo, UTC)
+        self.assertEqual(field.from_db_value(EPOCH, None, connection), MOMENT)
+        self.assertIsNone(field.from_db_value(None, None, connection))
+        self.assertIs(field.to_python(MOMENT), MOMENT)
+        with self.assertRaises(ValidationError):
+            field.to_python("yesterday")
+
+    @override_settings(TIME_ZONE="Europe/Berlin")
+    def test_naive_datetimes_are_read_in_the_default_time_zone(self):
+        field = IfcTimestampField()
+        self.assertEqual(
+            field.get_prep_value(datetime.datetime(2024, 1, 1, 1)),
+            EPOCH,
+        )
+
+    def test_lookups_accept_datetimes(self):
+        histories = [self.history(day) for day in range(5)]
+        modified = IfcOwnerHistoryModel.objects.order_by(
+            "last_modified_date",
+            "id",
+        )
+        self.assertEqual(
+            list(modified.filter(
+                last_modified_date__gte=MOMENT + datetime.timedelta(days=3),
+            )),
+            histories[3:],
+        )
+        self.assertEqual(
+            list(modified.filter(last_modified_date__range=(
+                MOMENT + datetime.timedelta(days=1),
+                MOMENT + datetime.timedelta(days=2),
+            ))),
+            histories[1:3],
+        )
+        self.assertEqual(
+            list(modified.filter(last_modified_date__in=[MOMENT, EPOCH])),
+            histories[:1],
+        )
+
+    def test_automatic_dates_keep_explicit_values(self):
+        imported = self.history(0)
+        imported.refresh_from_db()
+        self.assertEqual(imported.creation_date, MOMENT)
+        self.assertEqual(imported.last_modified_date, MOMENT)
+        bulk = IfcOwnerHistoryModel.objects.bulk_create([
+            IfcOwnerHistoryModel(
+                creation_date=MOMENT,
+                last_modified_date=MOMENT,
+            ),
+        ])
+        bulk[0].refresh_from_db()
+        self.assertEqual(bulk[0].last_modified_date, MOMENT)
+
+    def test_automatic_dates_default_to_now(self):
+        created = IfcOwnerHistoryModel.objects.create()
+        self.assertGreater(created.creation_date, MOMENT)
+        self.assertGreater(created.last_modified_date, MOMENT)
+        history = self.history(0)
+        history.save()
+        history.refresh_from_db()
+        self.assertEqual(history.creation_date, MOMENT)
+        self.assertGreater(history.last_modified_date, MOMENT)
+
+    def test_deconstruct_keeps_the_automatic_options(self):
+        for options in ({}, {"auto_now": True}, {"auto_now_add": True}):
+            with self.subTest(options=options):
+                field = IfcTimestampField(**options)
+                _name, _path, args, kwargs = field.deconstruct()
+                self.assertNotIn("editable", kwargs)
+                self.assertNotIn("blank", kwargs)
+                for option in ("auto_now", "auto_now_add"):
+                    self.assertEqual(
+                        kwargs.get(option, False),
+                        options.get(option, False),
+                    )
+                rebuilt = IfcTimestampField(*args, **kwargs)
+                self.assertEqual(rebuilt.editable, not options)
+
+    def test_forms_edit_a_date_and_time(self):
+        field = IfcTimestampField()
+        self.assertIsInstance(field.formfield(), forms.DateTimeField)
+        self.assertEqual(field.validators, [])
+
+    def test_modified_since_is_indexed(self):
+        indexes = {
+            index.name: index.fields
+            for index in IfcOwnerHistoryModel._meta.indexes
+        }
+        self.assertEqual(
+            indexes["idx_last_modified_date"],
+            ["last_modified_date", "id"],
+        )
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Django BIM Coordinate Transform Tests
+=====================================
+
+"""
+
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Import | Standard Library
+import math
+
+# Import | Libraries
+import numpy
+from django.test import SimpleTestCase, TestCase
+
+# Import | Local Modules
+from ..geometry import (
+    compose,
+    gather_coordinates,
+    map_conversion,
+    scaling,
+    transform_points,
+    transform_queryset,
+    translation,
+)
+from ..models import (
+    IfcCartesianPoint,
+    IfcCartesianPointListModel,
+    IfcLine,
+    IfcLocalPlacementModel,
+)
+from ..utils.matrix import placement_matrix
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class TransformMathTests(SimpleTestCase):
+    """
+    The transform matrices and their application to arrays of points.
+    """
+
+    def assertPoints(self, points, expected):
+        """
+        Assert that points are close to the expected coordinates.
+        """
+        numpy.testing.assert_allclose(points, expected, atol=1e-9)
+
+    def test_compose_applies_the_transforms_in_order(self):
+        point = [[1.0, 2.0, 3.0]]
+        self.assertPoints(
+            transform_points(point, translation(10.0, 0.0), scaling(2.0)),
+            [[22.0, 4.0, 6.0]],
+        )
+        self.assertPoints(
+            transform_points(point, scaling(2.0), translation(10.0, 0.0)),
+            [[12.0, 4.0, 6.0]],
+        )
+        numpy.testing.assert_array_equal(compose(), numpy.identity(4))
+
+    def test_placement_matrices_are_accepted(self):
+        # A quarter turn about z, then 5 along x
+        placement = placement_matrix((5.0, 0.0, 0.0), None, (0.0, 1.0, 0.0))
+        self.assertPoints(
+            transform_points([[1.0, 0.0, 0.0]], placement),
+            [[5.0, 1.0, 0.0]],
+        )
+        self.assertPoints(
+            transform_points([[1.0, 0.0, 0.0]], numpy.array(placement)),
+            [[5.0, 1.0, 0.0]],
+        )
+
+    def test_map_conversion(self):
+        conversion = map_conversion(
+            1000.0, 2000.0, 50.0,
+            x_axis_abscissa=0.0,
+            x_axis_ordinate=1.0,
+            scale=0.5,
+        )
+        self.assertPoints(
+            transform_points([[2.0, 0.0, 4.0], [0.0, 2.0, 0.0]], conversion),
+            [[1000.0, 2001.0, 52.0], [999.0, 2000.0, 50.0]],
+        )
+        # The axis need not be normalised
+        half = math.sqrt(0.5)
+        self.assertPoints(
+            map_conversion(0.0, 0.0, 0.0, 3.0, 3.0)[:2, :2],
+            [[half, -half], [half, half]],
+        )
+
+    def test_2d_points_stay_2d(self):
+        self.assertPoints(
+            transform_points([[1.0, 2.0]], translation(1.0, 1.0, 5.0)),
+            [[2.0, 3.0]],
+        )
+
+    def test_invalid_shapes_are_rejected(self):
+        for points, transform in (
+            ([1.0, 2.0, 3.0], numpy.identity(4)),
+            ([[1.0, 2.0, 3.0, 4.0]], numpy.identity(4)),
+            ([[1.0, 2.0, 3.0]], numpy.identity(3)),
+        ):
+            with self.subTest(points=points, transform=transform.shape):
+                with self.assertRaises(ValueError):
+                    transform_points(points, transform)
+
+
+class TransformQuerysetTests(TestCase):
+    """
+    Points, lines and point lists, some 2D, moved 1000 along x and scaled
+    from millimetres to metres.
+    """
+
+    def setUp(self):
+        self.placement = IfcLocalPlacementModel.objects.create(
+            placement_id="origin",
+            relative_transform=placement_matrix((1000.0, 0.0, 0.0)),
+        )
+        self.point = IfcCartesianPoint.objects.create(x=0.0, y=500.0, z=250.0)
+        self.flat_point = IfcCartesianPoint.objects.create(x=0.0, y=500.0)
+        self.line = IfcLine()
+        self.line.set_points((0.0, 0.0, 0.0), (2000.0, 0.0, 0.0))
+        self.line.save()
+        self.flat_line = IfcLine()
+        self.flat_line.set_points((0.0, 0.0), (0.0, 1000.0))
+        self.flat_line.save()
+        self.point_list = IfcCartesianPointListModel.from_points(
+            [(0.0, 0.0), (1000.0, 1000.0), (2000.0, 0.0)],
+        )
+        self.point_list.save()
+
+    def test_coordinates_are_gathered_with_one_query(self):
+        with self.assertNumQueries(1):
+            gathered = gather_coordinates(
+                IfcCartesianPointListModel.objects.all(),
+            )
+        self.assertEqual(gathered.pks, [self.point_list.pk])
+        self.assertEqual(gathered.offsets.tolist(), [0, 3])
+        self.assertEqual(gathered.dimensions.tolist(), [2])
+        self.assertEqual(
+            [block.tolist() for block in gathered.split()],
+            [[[0.0, 0.0], [1000.0, 1000.0], [2000.0, 0.0]]],
+        )
+
+    def test_points_are_written_back(self):
+        points = IfcCartesianPoint.objects.filter(
+            pk__in=[self.point.pk, self.flat_point.pk],
+        ).order_by("pk")
+        transform_queryset(points, self.placement, scaling(0.001), save=True)
+        self.point.refresh_from_db()
+        self.flat_point.refresh_from_db()
+        self.assertEqual(
+            (self.point.x, self.point.y, self.point.z),
+            (1.0, 0.5, 0.25),
+        )
+        self.assertEqual(
+            (self.flat_point.x, self.flat_point.y, self.flat_point.z),
+            (1.0, 0.5, None),
+        )
+
+    def test_lines_keep_their_extent(self):
+        transform_queryset(
+            IfcLine.objects.all(),
+            self.placement,
+            scaling(0.001),
+            save=True,
+        )
+        self.line.refresh_from_db()
+        self.assertEqual(self.line.start(), (1.0, 0.0, 0.0))
+        self.assertEqual(self.line.end(), (3.0, 0.0, 0.0))
+        self.assertEqual(self.line.length, 2.0)
+        self.flat_line.refresh_from_db()
+        self.assertEqual(self.flat_line.end(), (1.0, 1.0))
+        self.assertEqual(
+            (self.flat_line.min_x, self.flat_line.max_y, self.flat_line.max_z),
+            (1.0, 1.0, None),
+        )
+
+    def test_point_lists_are_repacked(self):
+        transformed = transform_queryset(
+            IfcCartesianPointListModel.objects.all(),
+            translation(0.0, 0.0, 10.0),
+            save=True,
+        )
+        # 2D lists stay in the z = 0 plane
+        self.assertEqual(transformed.points[:, 2].tolist(), [0.0, 0.0, 0.0])
+        self.point_list.refresh_from_db()
+        self.assertEqual(self.point_list.dimensions, 2)
+        self.assertEqual(
+            self.point_list.points(),
+            [(0.0, 0.0), (1000.0, 1000.0), (2000.0, 0.0)],
+        )
+
+    def test_unsaved_transforms_leave_the_rows(self):
+        transformed = transform_queryset(
+            IfcCartesianPoint.objects.filter(pk=self.point.pk),
+            scaling(2.0),
+        )
+        self.assertEqual(transformed.points.tolist(), [[0.0, 1000.0, 500.0]])
+        self.point.refresh_from_db()
+        self.assertEqual(self.point.y, 500.0)
+
+    def test_other_models_are_rejected(self):
+        with self.assertRaises(TypeError):
+            gather_coordinates(IfcLocalPlacementModel.objects.all())
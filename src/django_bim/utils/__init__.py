@@ -20,6 +20,12 @@ Available Functions:
   Base64 requirement of IfcGloballyUniqueId, ensuring it is suitable for use
   as an IFC GUID.
 
+Available Modules:
+- guid: Creates IFC GUIDs, converts them to and from `uuid.UUID` and
+  validates them in batches.
+- bounds: Computes, transforms and packs axis-aligned bounding boxes.
+- digest: Hashes canonicalised values and combines digests into rollups.
+
 """
 
 
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides Axis-Aligned Bounding Box Functions
+============================================
+
+A bounding box is a flat tuple `(min_x, min_y, min_z, max_x, max_y, max_z)`,
+the order of the bounding box columns of the models. Boxes are packed as
+six little-endian float64 values when stored in a binary column.
+
+Available Functions:
+- bounds_of: Returns the bounding box of points.
+- transform_bounds: Returns the bounding box of a transformed box.
+- intersects: Returns whether two boxes intersect.
+- pack_bounds: Packs a box into bytes.
+- unpack_bounds: Unpacks a box packed by `pack_bounds`.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import struct
+from typing import Iterable, Optional, Sequence
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "Bounds",
+    "bounds_of",
+    "intersects",
+    "pack_bounds",
+    "transform_bounds",
+    "unpack_bounds",
+]
+
+Bounds = tuple[float, ...]
+
+_BOUNDS_STRUCT = struct.Struct("<6d")
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def bounds_of(points: Iterable[Sequence[float]]) -> Optional[Bounds]:
+    """
+    Return the bounding box of points, 2D points lying in the z = 0 plane.
+
+    Parameters:
+        points (Iterable[Sequence[float]]): The points.
+
+    Returns:
+        Bounds: The box, or `None` if there are no points.
+    """
+    coordinates = [
+        (point[0], point[1], point[2] if len(point) > 2 else 0.0)
+        for point in points
+    ]
+    if not coordinates:
+        return None
+    xs, ys, zs = zip(*coordinates)
+    return (
+        float(min(xs)), float(min(ys)), float(min(zs)),
+        float(max(xs)), float(max(ys)), float(max(zs)),
+    )
+
+
+def transform_bounds(
+    bounds: Sequence[float],
+    matrix: Sequence[float],
+) -> Bounds:
+    """
+    Return the bounding box of a box transformed by a row-major 4x4 matrix
+    (see `django_bim.utils.matrix`), without transforming its eight
+    corners: each output axis sums the smaller and the larger products of
+    the matrix row with the input extents.
+
+    Parameters:
+        bounds (Sequence[float]): The box.
+        matrix (Sequence[float]): The transform.
+
+    Returns:
+        Bounds: The transformed box.
+    """
+    minimum = []
+    maximum = []
+    for row in (0, 4, 8):
+        low = high = matrix[row + 3]
+        for axis in range(3):
+            a = matrix[row + axis] * bounds[axis]
+            b = matrix[row + axis] * bounds[axis + 3]
+            low += min(a, b)
+            high += max(a, b)
+        minimum.append(low)
+        maximum.append(high)
+    return (*minimum, *maximum)
+
+
+def intersects(a: Sequence[float], b: Sequence[float]) -> bool:
+    """
+    Return whether two boxes intersect, touching boxes included.
+
+    Parameters:
+        a (Sequence[float]): The first box.
+        b (Sequence[float]): The second box.
+
+    Returns:
+        bool: Whether the boxes intersect.
+    """
+    return all(
+        a[axis] <= b[axis + 3] and b[axis] <= a[axis + 3]
+        for axis in range(3)
+    )
+
+
+def pack_bounds(bounds: Sequence[float]) -> bytes:
+    """
+    Pack a box as six little-endian float64 values.
+
+    Parameters:
+        bounds (Sequence[float]): The box.
+
+    Returns:
+        bytes: The packed box.
+    """
+    return _BOUNDS_STRUCT.pack(*bounds)
+
+
+def unpack_bounds(data: Optional[bytes]) -> Optional[Bounds]:
+    """
+    Unpack a box packed by `pack_bounds`.
+
+    Parameters:
+        data (bytes): The packed box, or `None`.
+
+    Returns:
+        Bounds: The box, or `None`.
+    """
+    if data is None:
+        return None
+    return _BOUNDS_STRUCT.unpack(bytes(data))
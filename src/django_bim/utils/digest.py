@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides Content Digest Functions
+=================================
+
+A digest is a 32-character hexadecimal blake2b hash of canonicalised
+values, so equal contents give equal digests whatever the database, the
+process or the primary keys:
+- floats are written with `repr`, and `-0.0` as `0.0`,
+- bytes (e.g. packed transforms) are written in hexadecimal,
+- dates and times are written in ISO 8601,
+- JSON values are written with sorted keys.
+
+Rollups combine digests by addition modulo 2**128, a multiset hash: the
+rollup of a set does not depend on the order of its members, and a change
+of one member changes it by the difference of the member's digests, so
+the rollups of the ancestors of a changed row are updated without reading
+its siblings. Nested rollups are added through `nest_digest`, a hash of
+the member's rollup, so the rollup of a tree also changes when a member
+moves between containers.
+
+Available Functions:
+- canonical: Returns the canonical form of a value.
+- hash_values: Returns the digest of a sequence of values.
+- scalar_fields: Returns the fields of a model hashed into a digest.
+- row_digest: Returns the digest of the scalar values of a row.
+- add_digests: Returns the combination of digests.
+- subtract_digests: Returns the difference of two digests.
+- nest_digest: Returns the digest of a rollup nested in another one.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import datetime
+import hashlib
+import json
+from decimal import Decimal
+from typing import Any, Iterable, Optional
+
+# Import | Libraries
+from django.db import models
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "DIGEST_MODULUS",
+    "EMPTY_DIGEST",
+    "add_digests",
+    "canonical",
+    "hash_values",
+    "nest_digest",
+    "row_digest",
+    "scalar_fields",
+    "subtract_digests",
+]
+
+DIGEST_SIZE = 16
+
+DIGEST_MODULUS = 1 << (8 * DIGEST_SIZE)
+
+# The rollup of an empty set
+EMPTY_DIGEST = "0" * (2 * DIGEST_SIZE)
+
+# Hashed fields per model and exclusions, see `scalar_fields`
+_SCALAR_FIELDS: dict[tuple[type, tuple[str, ...]], list] = {}
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def canonical(value: Any) -> Any:
+    """
+    Return the canonical form of a value, as hashed by `hash_values`.
+
+    Parameters:
+        value (Any): A database value, e.g. from `get_prep_value`.
+
+    Returns:
+        Any: `None`, a bool, an int, or a string.
+    """
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return repr(value + 0.0)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value.normalize())
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return str(value)
+
+
+def hash_values(values: Iterable[Any]) -> str:
+    """
+    Return the digest of a sequence of values.
+
+    Parameters:
+        values (Iterable): The values, canonicalised with `canonical`;
+            tuples of names and values keep their names apart.
+
+    Returns:
+        str: A 32-character hexadecimal digest.
+    """
+    return hashlib.blake2b(
+        repr(tuple(canonical(value) for value in values)).encode("utf-8"),
+        digest_size=DIGEST_SIZE,
+    ).hexdigest()
+
+
+def scalar_fields(
+    model: type[models.Model],
+    excluded: tuple[str, ...] = (),
+    derived: bool = True,
+) -> list[models.Field]:
+    """
+    Return the fields of a model hashed by `row_digest`: the concrete
+    fields that are neither relations, whose keys differ between databases,
+    nor primary or unique keys, which identify rather than describe a row.
+
+    Parameters:
+        model (type): The model.
+        excluded (tuple): Names of further fields to leave out.
+        derived (bool): Whether to keep the fields maintained by the model
+            itself (`editable=False`).
+
+    Returns:
+        list: The fields, in declaration order.
+    """
+    key = (model, excluded, derived)
+    fields = _SCALAR_FIELDS.get(key)
+    if fields is None:
+        fields = [
+            field for field in model._meta.concrete_fields
+            if not field.is_relation
+            and not field.primary_key
+            and not field.unique
+            and (derived or field.editable)
+            and field.name not in excluded
+        ]
+        _SCALAR_FIELDS[key] = fields
+    return fields
+
+
+def row_digest(
+    instance: Optional[models.Model],
+    fields: Optional[list[models.Field]] = None,
+) -> Optional[str]:
+    """
+    Return the digest of the scalar values of a row.
+
+    Parameters:
+        instance (Model): The row, or `None`.
+        fields (list): The fields to hash, by default `scalar_fields`.
+
+    Returns:
+        str: The digest, or `None` without a row.
+    """
+    if instance is None:
+        return None
+    if fields is None:
+        fields = scalar_fields(type(instance))
+    return hash_values(
+        (field.attname, field.get_prep_value(getattr(instance, field.attname)))
+        for field in fields
+    )
+
+
+def add_digests(*digests: Optional[str]) -> str:
+    """
+    Return the combination of digests, ignoring the missing ones.
+
+    Returns:
+        str: The sum of the digests modulo 2**128, in hexadecimal.
+    """
+    total = sum(int(digest, 16) for digest in digests if digest)
+    return format(total % DIGEST_MODULUS, "032x")
+
+
+def subtract_digests(digest: Optional[str], other: Optional[str]) -> str:
+    """
+    Return the difference of two digests, ignoring the missing ones.
+
+    Returns:
+        str: The digest that `add_digests` combines with `other` into
+            `digest`.
+    """
+    total = int(digest or EMPTY_DIGEST, 16) - int(other or EMPTY_DIGEST, 16)
+    return format(total % DIGEST_MODULUS, "032x")
+
+
+def nest_digest(rollup: Optional[str]) -> Optional[str]:
+    """
+    Return the digest a rollup adds to the rollup of its container.
+
+    Hashing the rollup, rather than adding it as is, keeps the structure
+    of the tree: the rollups of two containers exchanging a member change,
+    and so do the rollups above them.
+
+    Parameters:
+        rollup (str): The rollup of the member, or `None`.
+
+    Returns:
+        str: The digest, or `None` without a rollup.
+    """
+    if not rollup:
+        return None
+    return hash_values(("rollup", rollup))
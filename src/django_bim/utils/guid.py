@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides IFC GUID Functions
+===========================
+
+An IfcGloballyUniqueId is a 128-bit UUID written as 22 characters of the IFC
+base64 alphabet (`0-9`, `A-Z`, `a-z`, `_` and `$`, in that order). The first
+character only carries the two most significant bits, so it is always one of
+`0` to `3`.
+
+This module creates, converts and validates IFC GUIDs. Conversions work on
+the 128-bit integer directly and go through lookup tables of all 4096
+two-character pairs, so a GUID is encoded or decoded with a dozen table
+lookups instead of 22 rounds of base64 arithmetic, and batches skip the
+`uuid.UUID` objects entirely.
+
+Available Functions:
+- new: Returns a new random (version 4) GUID.
+- new_many: Returns a list of new random GUIDs.
+- new_default: Default callable of `IfcGloballyUniqueIdField`, serving
+  GUIDs from a pool refilled with `new_many`.
+- to_uuid / from_uuid: Convert between GUIDs and `uuid.UUID`.
+- validate_many: Validates a batch of GUIDs with a single regex scan.
+
+For more information, refer to:
+https://technical.buildingsmart.org/resources/ifcimplementationguidance/ifc-guid/
+
+"""  # noqa E501
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import os
+import re
+import uuid
+from typing import Iterable
+
+# Import | Libraries
+
+# Import | Local Modules
+from .validate_ifc_guid import validate_ifc_guid
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "IFC_GUID_ALPHABET",
+    "IFC_GUID_LENGTH",
+    "from_uuid",
+    "new",
+    "new_default",
+    "new_many",
+    "to_uuid",
+    "validate_many",
+]
+
+IFC_GUID_ALPHABET = (
+    "0123456789"
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    "abcdefghijklmnopqrstuvwxyz"
+    "_$"
+)
+
+IFC_GUID_LENGTH = 22
+
+# Character -> 6-bit value, and 12-bit value <-> two characters
+_DIGITS: dict[str, int] = {
+    character: index for index, character in enumerate(IFC_GUID_ALPHABET)
+}
+_PAIRS: tuple[str, ...] = tuple(
+    high + low for high in IFC_GUID_ALPHABET for low in IFC_GUID_ALPHABET
+)
+_PAIR_VALUES: dict[str, int] = {
+    pair: index for index, pair in enumerate(_PAIRS)
+}
+
+# Version 4 / RFC 4122 variant bits, applied to random 128-bit integers
+_VERSION_MASK = ~((0xF000 << 64) | (0xC000 << 48))
+_VERSION_BITS = (0x4000 << 64) | (0x8000 << 48)
+
+# One scan validates a whole batch joined by newlines, see `validate_many`
+_BATCH_PATTERN = re.compile(r"(?:[0-3][0-9A-Za-z_$]{21}\n)*")
+
+# GUIDs served by `new_default`, refilled in batches of `_POOL_SIZE`
+_POOL_SIZE = 1024
+_pool: list[str] = []
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def _encode(number: int) -> str:
+    """
+    Encode a 128-bit integer as a GUID: two single characters for the top
+    8 bits, then ten pairs of 12 bits.
+    """
+    pairs = _PAIRS
+    return "".join((
+        IFC_GUID_ALPHABET[number >> 126],
+        IFC_GUID_ALPHABET[(number >> 120) & 0x3F],
+        pairs[(number >> 108) & 0xFFF],
+        pairs[(number >> 96) & 0xFFF],
+        pairs[(number >> 84) & 0xFFF],
+        pairs[(number >> 72) & 0xFFF],
+        pairs[(number >> 60) & 0xFFF],
+        pairs[(number >> 48) & 0xFFF],
+        pairs[(number >> 36) & 0xFFF],
+        pairs[(number >> 24) & 0xFFF],
+        pairs[(number >> 12) & 0xFFF],
+        pairs[number & 0xFFF],
+    ))
+
+
+def _decode(guid: str) -> int:
+    """
+    Decode a GUID into its integer, the inverse of `_encode`.
+    """
+    pairs = _PAIR_VALUES
+    return (
+        _DIGITS[guid[0]] << 126
+        | _DIGITS[guid[1]] << 120
+        | pairs[guid[2:4]] << 108
+        | pairs[guid[4:6]] << 96
+        | pairs[guid[6:8]] << 84
+        | pairs[guid[8:10]] << 72
+        | pairs[guid[10:12]] << 60
+        | pairs[guid[12:14]] << 48
+        | pairs[guid[14:16]] << 36
+        | pairs[guid[16:18]] << 24
+        | pairs[guid[18:20]] << 12
+        | pairs[guid[20:22]]
+    )
+
+
+def to_uuid(guid: str) -> uuid.UUID:
+    """
+    Convert a 22-character IFC GUID to a UUID.
+
+    Parameters:
+        guid (str): The IFC GUID.
+
+    Returns:
+        uuid.UUID: The UUID encoded by the GUID.
+
+    Raises:
+        ValueError: If the value is not a valid IFC GUID.
+    """
+    if len(guid) != IFC_GUID_LENGTH:
+        raise ValueError(f"{guid!r} is not a 22-character IFC GUID.")
+    try:
+        number = _decode(guid)
+    except KeyError:
+        raise ValueError(f"{guid!r} is not a valid IFC GUID.") from None
+    if number >> 128:
+        raise ValueError(f"{guid!r} exceeds 128 bits.")
+    return uuid.UUID(int=number)
+
+
+def from_uuid(value: uuid.UUID) -> str:
+    """
+    Convert a UUID to its 22-character IFC GUID.
+
+    Parameters:
+        value (uuid.UUID): The UUID.
+
+    Returns:
+        str: The IFC GUID.
+    """
+    return _encode(value.int)
+
+
+def new() -> str:
+    """
+    Return a new random IFC GUID.
+
+    Returns:
+        str: A GUID encoding a version 4 UUID.
+    """
+    return _encode(uuid.uuid4().int)
+
+
+def new_many(count: int) -> list[str]:
+    """
+    Return a batch of new random IFC GUIDs.
+
+    The random bytes of the whole batch are read at once and encoded
+    without creating `uuid.UUID` objects.
+
+    Parameters:
+        count (int): Number of GUIDs to create.
+
+    Returns:
+        list: GUIDs encoding version 4 UUIDs.
+    """
+    data = os.urandom(16 * count)
+    from_bytes = int.from_bytes
+    return [
+        _encode(
+            from_bytes(data[offset:offset + 16], "big")
+            & _VERSION_MASK
+            | _VERSION_BITS
+        )
+        for offset in range(0, 16 * count, 16)
+    ]
+
+
+def new_default() -> str:
+    """
+    Return a new GUID from a pool refilled in batches with `new_many`.
+
+    Used as the default of `IfcGloballyUniqueIdField`, so creating many
+    instances (e.g. for `bulk_create`) costs a list pop per row.
+
+    Returns:
+        str: A new random GUID.
+    """
+    while True:
+        try:
+            return _pool.pop()
+        except IndexError:
+            _pool.extend(new_many(_POOL_SIZE))
+
+
+def validate_many(values: Iterable[str]) -> None:
+    """
+    Validate a batch of IFC GUIDs.
+
+    The values are joined by newlines and checked with a single regular
+    expression scan. As every valid line is exactly 23 characters long, the
+    length of the joined text also rules out values with embedded newlines.
+    Only when the batch is invalid are the values checked one by one, to
+    report the first invalid value.
+
+    Parameters:
+        values (Iterable[str]): The GUIDs to validate.
+
+    Raises:
+        ValidationError: If any value is not a valid IFC GUID.
+    """
+    values = values if isinstance(values, (list, tuple)) else list(values)
+    try:
+        text = "\n".join(values) + "\n"
+    except TypeError:
+        text = ""
+    if (
+        len(text) == (IFC_GUID_LENGTH + 1) * len(values)
+        and _BATCH_PATTERN.fullmatch(text)
+    ):
+        return
+    for value in values:
+        validate_ifc_guid(value)
+
+
+# =============================================================================
+# Module Variables
+# =============================================================================
+
+# A forked process must not hand out the GUIDs pooled by its parent
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_pool.clear)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides 4x4 Transformation Matrix Functions
+============================================
+
+Placements are combined as homogeneous 4x4 matrices. A matrix is a flat
+tuple of 16 floats in row-major order, which is also the order in which
+`IfcTransformField` packs it, so stored matrices need no reshaping.
+
+Available Functions:
+- multiply: Returns the product of two matrices.
+- placement_axes: Returns the location and axes of a placement matrix.
+- placement_matrix: Returns the matrix of a location and axes.
+
+"""
+
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import math
+from typing import Optional, Sequence
+
+# Import | Libraries
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Variables
+# =============================================================================
+
+__all__: list[str] = [
+    "IDENTITY",
+    "Matrix",
+    "multiply",
+    "placement_axes",
+    "placement_matrix",
+]
+
+Vector = tuple[float, float, float]
+
+Matrix = tuple[float, ...]
+
+IDENTITY: Matrix = (
+    1.0, 0.0, 0.0, 0.0,
+    0.0, 1.0, 0.0, 0.0,
+    0.0, 0.0, 1.0, 0.0,
+    0.0, 0.0, 0.0, 1.0,
+)
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+def multiply(a: Sequence[float], b: Sequence[float]) -> Matrix:
+    """
+    Return the product `a @ b` of two row-major 4x4 matrices.
+
+    Applied to a point, the result transforms by `b` first, then by `a`, so
+    the world transform of a placement is `multiply(parent_world, local)`.
+
+    Parameters:
+        a (Sequence[float]): The left matrix.
+        b (Sequence[float]): The right matrix.
+
+    Returns:
+        Matrix: The product.
+    """
+    return tuple(
+        a[row] * b[column]
+        + a[row + 1] * b[column + 4]
+        + a[row + 2] * b[column + 8]
+        + a[row + 3] * b[column + 12]
+        for row in (0, 4, 8, 12)
+        for column in (0, 1, 2, 3)
+    )
+
+
+def placement_axes(matrix: Sequence[float]) -> tuple[Vector, Vector, Vector]:
+    """
+    Return the location, Z axis and X axis of a placement matrix, the
+    `Location`, `Axis` and `RefDirection` of an `IfcAxis2Placement3D`.
+
+    Parameters:
+        matrix (Sequence[float]): The row-major 4x4 transform.
+
+    Returns:
+        tuple: The `(location, axis, ref_direction)` vectors.
+    """
+    return (
+        (matrix[3], matrix[7], matrix[11]),
+        (matrix[2], matrix[6], matrix[10]),
+        (matrix[0], matrix[4], matrix[8]),
+    )
+
+
+def placement_matrix(
+    location: Sequence[float],
+    axis: Optional[Sequence[float]] = None,
+    ref_direction: Optional[Sequence[float]] = None,
+) -> Matrix:
+    """
+    Return the placement matrix of an `IfcAxis2Placement3D`, the inverse of
+    `placement_axes`.
+
+    As in the IFC schema, the Z axis defaults to `(0, 0, 1)` and the X axis
+    to `(1, 0, 0)`, the X axis is projected onto the plane normal to the Z
+    axis, and both are normalised. Two-dimensional locations lie at `z = 0`.
+
+    Parameters:
+        location (Sequence[float]): The origin.
+        axis (Sequence[float]): The direction of the Z axis.
+        ref_direction (Sequence[float]): The direction of the X axis.
+
+    Returns:
+        Matrix: The row-major 4x4 transform.
+    """
+    z = _normalise(axis or (0.0, 0.0, 1.0), (0.0, 0.0, 1.0))
+    x = _pad(ref_direction or (1.0, 0.0, 0.0))
+    if abs(_dot(_normalise(x, z), z)) > 1.0 - 1e-9:
+        # Parallel to the Z axis, the reference direction is ignored
+        x = (1.0, 0.0, 0.0) if abs(z[0]) < 0.9 else (0.0, 1.0, 0.0)
+    scale = _dot(x, z)
+    x = _normalise(tuple(x[i] - scale * z[i] for i in range(3)), x)
+    y = (
+        z[1] * x[2] - z[2] * x[1],
+        z[2] * x[0] - z[0] * x[2],
+        z[0] * x[1] - z[1] * x[0],
+    )
+    origin = _pad(location)
+    return (
+        x[0], y[0], z[0], origin[0],
+        x[1], y[1], z[1], origin[1],
+        x[2], y[2], z[2], origin[2],
+        0.0, 0.0, 0.0, 1.0,
+    )
+
+
+def _pad(vector: Sequence[float]) -> Vector:
+    """
+    Return a 2D or 3D vector as a 3D vector of floats.
+    """
+    values = [float(value) for value in vector[:3]]
+    return tuple(values + [0.0] * (3 - len(values)))
+
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    """
+    Return the dot product of two 3D vectors.
+    """
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _normalise(vector: Sequence[float], default: Vector) -> Vector:
+    """
+    Return a vector scaled to unit length, or `default` for a null vector.
+    """
+    vector = _pad(vector)
+    length = math.sqrt(_dot(vector, vector))
+    if length == 0.0:
+        return default
+    return tuple(value / length for value in vector)
@@ -40,6 +40,9 @@ __all__: list[str] = [
     "validate_ifc_guid",
 ]
 
+# A 22-character IFC GUID; the first character only encodes 2 bits
+IFC_GUID_PATTERN = re.compile(r"[0-3][0-9A-Za-z_$]{21}")
+
 
 # =============================================================================
 # Functions
@@ -52,7 +55,8 @@ def validate_ifc_guid(value) -> None:
     ============================
 
     Validates that the given value conforms to the 22-character Base64
-    requirement of IfcGloballyUniqueId.
+    requirement of IfcGloballyUniqueId, using the IFC alphabet (`0-9`,
+    `A-Z`, `a-z`, `_`, `$`) in which the first character encodes 2 bits.
 
     Parameters:
         value (str): The string to validate as an IFC Globally Unique
@@ -62,14 +66,8 @@ def validate_ifc_guid(value) -> None:
         ValidationError: If the string does not conform to the expected format.
     """
 
-    # Define the regex pattern for a Base64 encoded string of 22 characters
-    pattern = r"^[A-Za-z0-9+/]{22}$"
-
     # Check if the provided value matches the pattern
-    if not isinstance(value, str) or not re.match(
-        pattern=pattern,
-        string=value,
-    ):
+    if not isinstance(value, str) or not IFC_GUID_PATTERN.fullmatch(value):
         raise ValidationError(
             message=_(
                 message="'%(value)s' is not a valid 22-character Base64 encoded string."